@@ -10,9 +10,9 @@ from led_controller_fixed import LEDControllerFixed
 import config
 
 class AnimalSequenceAnimation:
-    def __init__(self):
-        """Initialize the animal sequence animation."""
-        self.led = LEDControllerFixed()
+    def __init__(self, led=None):
+        """Initialize the animal sequence animation (on led, default a new LEDControllerFixed)."""
+        self.led = led or LEDControllerFixed()
         self.width = config.TOTAL_WIDTH  # 32
         self.height = config.TOTAL_HEIGHT  # 48
         
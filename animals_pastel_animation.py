@@ -7,9 +7,9 @@ Total duration: 60 seconds
 """
 
 import time
-import math
 import numpy as np
 from led_controller_exact import LEDControllerExact
+from indexed_frame import IndexedFrame
 import config
 
 class AnimalsPastelAnimation:
@@ -449,20 +449,6 @@ class AnimalsPastelAnimation:
         
         return buffer
     
-    def blend_buffers(self, buffer1, buffer2, blend_factor):
-        """Blend two buffers together (0.0 = buffer1, 1.0 = buffer2)."""
-        result = np.zeros_like(buffer1)
-        for y in range(self.height):
-            for x in range(self.width):
-                c1 = buffer1[y, x]
-                c2 = buffer2[y, x]
-                blended = tuple(
-                    int(c1[i] * (1 - blend_factor) + c2[i] * blend_factor)
-                    for i in range(3)
-                )
-                result[y, x] = blended
-        return result
-    
     def run_animation(self):
         """Run the complete 60-second animal animation with smooth blending."""
         animals = [
@@ -484,12 +470,16 @@ class AnimalsPastelAnimation:
         
         # Pre-render all animals at full intensity for blending
         print("🎨 Pre-rendering animals...")
-        animal_buffers = []
+        animal_frames = []
         for animal_name, draw_func in animals:
             buffer = self.render_animal_to_buffer(draw_func, 1.0)
-            animal_buffers.append(buffer)
+            animal_frames.append(IndexedFrame.from_rgb(buffer))
             print(f"  ✓ {animal_name.capitalize()} rendered")
         
+        # Crossfades between neighbours are palette blends: transitions[i] goes from animal i to i + 1
+        transitions = [IndexedFrame.crossfade(first, second)
+                       for first, second in zip(animal_frames, animal_frames[1:])]
+        
         print("▶️ Starting animation loop...")
         
         # Single unified loop for smooth transitions
@@ -509,12 +499,8 @@ class AnimalsPastelAnimation:
             animal_start_time = animal_index * self.animal_duration
             elapsed_animal = elapsed_total - animal_start_time
             
-            # Clear display
-            self.led.clear()
-            
-            current_buffer = animal_buffers[animal_index]
-            prev_buffer = animal_buffers[animal_index - 1] if animal_index > 0 else None
-            next_buffer = animal_buffers[animal_index + 1] if animal_index < len(animals) - 1 else None
+            current_frame = animal_frames[animal_index]
+            frame = current_frame
             
             # Fade in (first 1 second of current animal)
             if elapsed_animal < self.fade_in_duration:
@@ -523,23 +509,13 @@ class AnimalsPastelAnimation:
                 fade_in_intensity = 1.0 - (1.0 - fade_progress) ** 2
                 
                 # During fade in, blend with previous animal if it exists
-                if prev_buffer is not None:
+                if animal_index > 0:
                     # Previous animal fades out as current fades in
-                    prev_fade = 1.0 - fade_in_intensity
-                    blended = self.blend_buffers(prev_buffer, current_buffer, fade_in_intensity)
-                    
-                    # Draw blended result
-                    for y in range(self.height):
-                        for x in range(self.width):
-                            color = blended[y, x]
-                            self.led.set_pixel(x, y, tuple(int(c) for c in color))
+                    frame = transitions[animal_index - 1]
+                    frame.set_mix(fade_in_intensity)
                 else:
                     # First animal, just fade in
-                    for y in range(self.height):
-                        for x in range(self.width):
-                            color = current_buffer[y, x]
-                            faded_color = tuple(int(c * fade_in_intensity) for c in color)
-                            self.led.set_pixel(x, y, faded_color)
+                    current_frame.set_level(fade_in_intensity)
             
             # Fade out (last 1 second) - blend with next animal if it exists
             elif elapsed_animal >= self.animal_duration - self.fade_out_duration:
@@ -548,34 +524,21 @@ class AnimalsPastelAnimation:
                 fade_out_intensity = fade_progress ** 2
                 current_fade = 1.0 - fade_out_intensity
                 
-                if next_buffer is not None:
+                if animal_index < len(animals) - 1:
                     # Next animal starts fading in as current fades out
                     # Both fades happen simultaneously over the 1-second transition
                     next_fade_intensity = 1.0 - (1.0 - fade_progress) ** 2
-                    
-                    # Blend current (fading out) and next (fading in)
-                    blended = self.blend_buffers(current_buffer, next_buffer, next_fade_intensity)
-                    
-                    # Draw blended result
-                    for y in range(self.height):
-                        for x in range(self.width):
-                            color = blended[y, x]
-                            self.led.set_pixel(x, y, tuple(int(c) for c in color))
+                    frame = transitions[animal_index]
+                    frame.set_mix(next_fade_intensity)
                 else:
                     # Last animal, just fade out
-                    for y in range(self.height):
-                        for x in range(self.width):
-                            color = current_buffer[y, x]
-                            faded_color = tuple(int(c * current_fade) for c in color)
-                            self.led.set_pixel(x, y, faded_color)
+                    current_frame.set_level(current_fade)
             
             # Full display (middle period)
             else:
-                # Draw current animal at full intensity
-                for y in range(self.height):
-                    for x in range(self.width):
-                        color = current_buffer[y, x]
-                        self.led.set_pixel(x, y, tuple(int(c) for c in color))
+                current_frame.set_level(1.0)
+            
+            self.led.set_indexed_frame(frame.indices, frame.palette())
             
             # Show frame
             self.led.show()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Application Logging
+Levels, key=value fields, per-call-site rate limiting and a non-blocking
+queue handler, so render and input threads never wait on log I/O
+
+setup_logging() sends all records through a bounded queue to a listener
+thread that does the actual writing (to stdout, i.e. journald under
+led-display.service). If the queue is full the record is dropped and
+counted rather than blocking. Each call site (file and line) may log at
+most config.LOG_RATE_LIMIT records per second, with bursts up to
+config.LOG_RATE_BURST; the next record that gets through reports how many
+were suppressed.
+
+With config.LOG_ROUTE_PRINTS, existing print() calls become log records
+too: each line keeps its call site for rate limiting, and lines starting
+with ❌ or ⚠️ are logged as errors and warnings.
+
+New code should use a logger with fields:
+    log = get_logger(__name__)
+    log.info("Playing audio", animation='truck', file='truck.mp3')
+"""
+
+import sys
+import time
+import atexit
+import queue
+import logging
+import threading
+import logging.handlers
+import config
+
+_FIELD_KWARGS = ('exc_info', 'stack_info', 'stacklevel', 'extra')
+MAX_PARTIAL_LINE = 4096  # Characters written without a newline before they are logged anyway
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """Logger whose extra keyword arguments become key=value fields."""
+
+    def __init__(self, logger):
+        super().__init__(logger, {})
+
+    def process(self, msg, kwargs):
+        fields = {key: kwargs.pop(key) for key in list(kwargs) if key not in _FIELD_KWARGS}
+        if fields:
+            kwargs.setdefault('extra', {})['fields'] = fields
+        return msg, kwargs
+
+
+def get_logger(name):
+    """Return a StructuredLogger for a module."""
+    return StructuredLogger(logging.getLogger(name))
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Formats records as 'time LEVEL name: message key=value ...'."""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s %(name)s: %(message)s', '%H:%M:%S')
+
+    def format(self, record):
+        line = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            line += ' ' + ' '.join(f'{key}={value!r}' if isinstance(value, str) and ' ' in value
+                                   else f'{key}={value}' for key, value in fields.items())
+        return line
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per call site (file, line); counts what it suppresses."""
+
+    def __init__(self, rate=None, burst=None):
+        super().__init__()
+        self.rate = config.LOG_RATE_LIMIT if rate is None else rate
+        self.burst = config.LOG_RATE_BURST if burst is None else burst
+        self.sites = {}  # (pathname, lineno) -> [tokens, last_time, suppressed]
+        self.lock = threading.Lock()
+        self.suppressed_total = 0
+
+    def filter(self, record):
+        if not self.rate:
+            return True
+        now = time.monotonic()
+        key = (record.pathname, record.lineno)
+        with self.lock:
+            site = self.sites.get(key)
+            if site is None:
+                site = self.sites[key] = [self.burst, now, 0]
+            site[0] = min(self.burst, site[0] + (now - site[1]) * self.rate)
+            site[1] = now
+            if site[0] < 1 and record.levelno < logging.ERROR:
+                site[2] += 1
+                self.suppressed_total += 1
+                return False
+            site[0] -= 1
+            suppressed, site[2] = site[2], 0
+        if suppressed:
+            fields = dict(getattr(record, 'fields', None) or {})
+            fields['suppressed'] = suppressed
+            record.fields = fields
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops (and counts) records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        # Format the message now, the fields travel with the record
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_text = logging.Formatter().formatException(record.exc_info) if record.exc_info else None
+        record.exc_info = None
+        return record
+
+
+class PrintToLog:
+    """Stand-in for sys.stdout that turns print() lines into log records from the print's call site."""
+
+    def __init__(self, logger, stream):
+        self.logger = logger
+        self.stream = stream  # Original stream, for anything that needs a real file
+        self.local = threading.local()
+
+    def write(self, text):
+        caller = sys._getframe(1)
+        buffer = getattr(self.local, 'buffer', '') + text
+        *lines, self.local.buffer = buffer.split('\n')
+        if len(self.local.buffer) > MAX_PARTIAL_LINE:
+            # Writes that never end a line (progress bars, escape codes) mustn't pile up
+            lines.append(self.local.buffer)
+            self.local.buffer = ''
+        for line in lines:
+            if line.strip():
+                self._emit(line, caller)
+        return len(text)
+
+    def _emit(self, line, caller):
+        stripped = line.lstrip()
+        if stripped.startswith('❌'):
+            level = logging.ERROR
+        elif stripped.startswith('⚠️'):
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
+        record = self.logger.makeRecord(self.logger.name, level, caller.f_code.co_filename,
+                                        caller.f_lineno, line, None, None, caller.f_code.co_name)
+        self.logger.handle(record)
+
+    def flush(self):
+        """Log this thread's unfinished line, if any (print(..., flush=True) without a newline)."""
+        buffer = getattr(self.local, 'buffer', '')
+        self.local.buffer = ''
+        if buffer.strip():
+            self._emit(buffer, sys._getframe(1))
+
+    def isatty(self):
+        return False
+
+    def fileno(self):
+        return self.stream.fileno()
+
+
+_listener = None
+_handler = None
+
+
+def setup_logging():
+    """Install the queue handler, rate limiter and (optionally) print routing. Safe to call twice."""
+    global _listener, _handler
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(KeyValueFormatter())
+    log_queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+    _handler = DroppingQueueHandler(log_queue)
+    _handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, config.LOG_LEVEL))
+    root.handlers[:] = [_handler]
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    if config.LOG_ROUTE_PRINTS:
+        sys.stdout = PrintToLog(logging.getLogger('print'), sys.stdout)
+
+
+def shutdown_logging():
+    """Flush queued records and restore stdout."""
+    global _listener
+    if isinstance(sys.stdout, PrintToLog):
+        sys.stdout = sys.stdout.stream
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_stats():
+    """Return dropped and rate-limited record counts."""
+    if _handler is None:
+        return {'dropped': 0, 'suppressed': 0}
+    return {'dropped': _handler.dropped, 'suppressed': _handler.filters[0].suppressed_total}
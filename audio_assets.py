@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Audio Asset Pipeline
+Converts the WAV files in audio/ to compressed OGG once, writes a manifest of
+durations and loudness, and plays them back from a RAM-budgeted cache
+
+Build the compressed assets (needs ffmpeg or oggenc):
+    python audio_assets.py build
+
+Show the manifest:
+    python audio_assets.py list
+"""
+
+import os
+import sys
+import json
+import shutil
+import subprocess
+import wave
+from collections import OrderedDict
+import numpy as np
+import config
+
+# Try to import pygame for playback - the build step works without it
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def analyze_wav(path):
+    """Return duration, format and loudness (dBFS) of a 16-bit PCM WAV file."""
+    with wave.open(path, 'rb') as wav_file:
+        channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        sample_width = wav_file.getsampwidth()
+        frames = wav_file.getnframes()
+        raw = wav_file.readframes(frames)
+
+    info = {
+        'duration': frames / float(sample_rate),
+        'sample_rate': sample_rate,
+        'channels': channels,
+        'rms_dbfs': None,
+        'peak_dbfs': None,
+    }
+
+    if sample_width == 2 and frames > 0:
+        samples = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768.0
+        rms = float(np.sqrt(np.mean(samples * samples)))
+        peak = float(np.max(np.abs(samples)))
+        info['rms_dbfs'] = round(20 * np.log10(max(rms, 1e-9)), 2)
+        info['peak_dbfs'] = round(20 * np.log10(max(peak, 1e-9)), 2)
+
+    return info
+
+
+def _find_encoder():
+    """Return the name of an available OGG encoder, or None."""
+    for encoder in ('ffmpeg', 'oggenc'):
+        if shutil.which(encoder):
+            return encoder
+    return None
+
+
+def _encode_ogg(encoder, src_path, dst_path, quality):
+    """Encode a WAV file to OGG Vorbis with the given encoder."""
+    if encoder == 'ffmpeg':
+        cmd = ['ffmpeg', '-y', '-loglevel', 'error', '-i', src_path,
+               '-c:a', 'libvorbis', '-q:a', str(quality), dst_path]
+    else:
+        cmd = ['oggenc', '--quiet', '-q', str(quality), '-o', dst_path, src_path]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"{encoder} failed")
+
+
+def build_audio_assets(src_dir=None, out_dir=None, quality=4):
+    """Convert every WAV in src_dir to OGG in out_dir and write the manifest.
+
+    Files whose OGG is already newer than the WAV are not re-encoded. If no
+    encoder is installed the manifest is still written and points at the
+    original WAV files.
+    """
+    src_dir = src_dir or _default_audio_dir()
+    out_dir = out_dir or os.path.join(src_dir, config.AUDIO_COMPRESSED_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+
+    encoder = _find_encoder()
+    if encoder is None:
+        print("⚠️ No OGG encoder found (install ffmpeg or vorbis-tools), manifest will reference WAV files")
+
+    manifest = {'version': MANIFEST_VERSION, 'assets': {}}
+    for name in sorted(os.listdir(src_dir)):
+        if not name.lower().endswith('.wav'):
+            continue
+
+        src_path = os.path.join(src_dir, name)
+        entry = analyze_wav(src_path)
+        entry['source'] = name
+        entry['file'] = os.path.relpath(src_path, out_dir)
+        entry['bytes'] = os.path.getsize(src_path)
+
+        if encoder:
+            ogg_name = os.path.splitext(name)[0] + '.ogg'
+            ogg_path = os.path.join(out_dir, ogg_name)
+            if not os.path.exists(ogg_path) or os.path.getmtime(ogg_path) < os.path.getmtime(src_path):
+                print(f"🔧 Encoding {name} -> {ogg_name}")
+                _encode_ogg(encoder, src_path, ogg_path, quality)
+            entry['file'] = ogg_name
+            entry['bytes'] = os.path.getsize(ogg_path)
+
+        manifest['assets'][name] = entry
+        print(f"✓ {name}: {entry['duration']:.2f}s, {entry['rms_dbfs']} dBFS RMS, "
+              f"{os.path.getsize(src_path) // 1024} KB -> {entry['bytes'] // 1024} KB")
+
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"✅ Wrote manifest for {len(manifest['assets'])} audio files to {out_dir}")
+    return manifest
+
+
+def _default_audio_dir():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'audio')
+
+
+class AudioAssetManager:
+    """Plays audio assets with a RAM-budgeted cache of decoded short cues.
+
+    Assets up to config.AUDIO_CUE_MAX_SECONDS long are decoded once into a
+    pygame Sound and kept in an LRU cache limited to
+    config.AUDIO_CACHE_BUDGET_MB of decoded PCM. Longer assets ("beds") are
+    streamed from disk through pygame.mixer.music and never held in RAM.
+    Paths, durations and loudness come from the manifest, so a button press
+    does not touch the file system for cached cues.
+    """
+
+    def __init__(self, audio_dir=None, budget_bytes=None, cue_max_seconds=None):
+        """Initialize the manager and load the manifest if one was built."""
+        self.audio_dir = audio_dir or _default_audio_dir()
+        self.compressed_dir = os.path.join(self.audio_dir, config.AUDIO_COMPRESSED_DIR)
+        if budget_bytes is None:
+            budget_bytes = int(config.AUDIO_CACHE_BUDGET_MB * 1024 * 1024)
+        self.budget_bytes = budget_bytes
+        self.cue_max_seconds = config.AUDIO_CUE_MAX_SECONDS if cue_max_seconds is None else cue_max_seconds
+
+        self.manifest = self._load_manifest()
+        self.cache = OrderedDict()  # name -> (Sound, decoded bytes)
+        self.cache_bytes = 0
+        self.channel = None
+
+        # Statistics
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.evictions = 0
+
+    def _load_manifest(self):
+        path = os.path.join(self.compressed_dir, MANIFEST_NAME)
+        try:
+            with open(path) as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest['assets']
+            print(f"⚠️ Audio manifest version mismatch, rebuild with: python audio_assets.py build")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read audio manifest: {e}")
+        return {}
+
+    def resolve(self, name):
+        """Return (path, manifest entry or None) for an asset, or (None, None) if missing."""
+        entry = self.manifest.get(name)
+        if entry:
+            path = os.path.join(self.compressed_dir, entry['file'])
+            if os.path.exists(path):
+                return path, entry
+
+        path = os.path.join(self.audio_dir, name)
+        if os.path.exists(path):
+            return path, entry
+        return None, None
+
+    def duration(self, name):
+        """Return the duration of an asset in seconds, or None if unknown."""
+        entry = self.manifest.get(name)
+        return entry['duration'] if entry else None
+
+    def volume_for(self, entry):
+        """Return playback volume that brings the asset towards the target loudness."""
+        if not entry or entry.get('rms_dbfs') is None:
+            return 1.0
+        gain_db = config.AUDIO_TARGET_DBFS - entry['rms_dbfs']
+        return max(0.0, min(1.0, 10 ** (gain_db / 20.0)))
+
+    def _decoded_bytes(self, sound):
+        frequency, size, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency * channels * (abs(size) // 8))
+
+    def _get_cue(self, name, path):
+        """Return a decoded Sound for a short cue, loading and caching it if needed."""
+        if name in self.cache:
+            self.cache.move_to_end(name)
+            self.cache_hits += 1
+            return self.cache[name][0]
+
+        self.cache_misses += 1
+        sound = pygame.mixer.Sound(path)
+        size = self._decoded_bytes(sound)
+        if size > self.budget_bytes:
+            return sound  # Too big to keep - play once without caching
+
+        while self.cache and self.cache_bytes + size > self.budget_bytes:
+            _, (_, evicted_size) = self.cache.popitem(last=False)
+            self.cache_bytes -= evicted_size
+            self.evictions += 1
+
+        self.cache[name] = (sound, size)
+        self.cache_bytes += size
+        return sound
+
+    def preload(self, names):
+        """Decode short cues into the cache ahead of time (e.g. at startup)."""
+        for name in names:
+            path, entry = self.resolve(name)
+            if path and entry and entry['duration'] <= self.cue_max_seconds:
+                self._get_cue(name, path)
+
+    def play(self, name, loops=0):
+        """Play an asset. Returns False if it does not exist."""
+        path, entry = self.resolve(name)
+        if path is None:
+            return False
+
+        self.stop()
+        volume = self.volume_for(entry)
+
+        duration = entry['duration'] if entry else None
+        if duration is not None and duration <= self.cue_max_seconds:
+            sound = self._get_cue(name, path)
+            sound.set_volume(volume)
+            self.channel = sound.play(loops=loops)
+        else:
+            # Long bed (or unknown length) - stream it instead of decoding into RAM
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(loops)
+        return True
+
+    def stop(self):
+        """Stop playback immediately."""
+        pygame.mixer.music.stop()
+        if self.channel:
+            self.channel.stop()
+            self.channel = None
+
+    def fadeout(self, fade_ms):
+        """Fade out whatever is playing."""
+        pygame.mixer.music.fadeout(fade_ms)
+        if self.channel:
+            self.channel.fadeout(fade_ms)
+            self.channel = None
+
+    def release(self):
+        """Stop playback and drop decoded cues (they are invalid once the mixer is closed)."""
+        self.stop()
+        self.cache.clear()
+        self.cache_bytes = 0
+
+    def get_stats(self):
+        """Return cache statistics."""
+        return {
+            'cached': len(self.cache),
+            'cache_bytes': self.cache_bytes,
+            'budget_bytes': self.budget_bytes,
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'evictions': self.evictions,
+        }
+
+
+def main():
+    """Command line entry point."""
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'build':
+        build_audio_assets()
+    elif command == 'list':
+        manager = AudioAssetManager()
+        if not manager.manifest:
+            print("No manifest found - run: python audio_assets.py build")
+        for name, entry in sorted(manager.manifest.items()):
+            print(f"{name:20s} {entry['duration']:6.2f}s  {entry['rms_dbfs']} dBFS  "
+                  f"{entry['bytes'] // 1024} KB  ({entry['file']})")
+    else:
+        print("Usage: python audio_assets.py [build|list]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
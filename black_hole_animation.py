@@ -11,6 +11,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from led_controller_exact import LEDControllerExact
+from geometry_fields import get_fields
+from quality_controller import QualityController
 import config
 
 class BlackHoleAnimation:
@@ -35,6 +37,18 @@ class BlackHoleAnimation:
         self.black_hole_radius = 3
         self.event_horizon_radius = 8
         self.accretion_disk_radius = 15
+        self.lensing_radius = 20
+        
+        # Distance and angle of every pixel from the center, computed once
+        self.fields = get_fields(self.center_x, self.center_y, self.width, self.height)
+        distance = self.fields.distance
+        self.void_mask = distance <= self.black_hole_radius
+        self.horizon_mask = ~self.void_mask & (distance <= self.event_horizon_radius)
+        self.disk_mask = self.fields.annulus(self.event_horizon_radius, self.accretion_disk_radius)
+        self.lensing_mask = self.fields.annulus(self.accretion_disk_radius, self.lensing_radius)
+        
+        # Lower levels draw fewer particles and no lensing (set by the display loops)
+        self.quality = None
         
     def create_black_hole_frame(self, time_step):
         """Create a single frame of the black hole animation."""
@@ -46,45 +60,36 @@ class BlackHoleAnimation:
         pulse_intensity = 0.5 + 0.3 * math.sin(time_step * 0.5)
         particle_phase = time_step * 0.8
         
+        distance = self.fields.distance
+        
         # Draw black hole center (void)
-        for y in range(self.height):
-            for x in range(self.width):
-                distance = math.sqrt((x - self.center_x)**2 + (y - self.center_y)**2)
-                
-                if distance <= self.black_hole_radius:
-                    # Pure black void
-                    frame[y, x] = self.colors['void']
-                
-                elif distance <= self.event_horizon_radius:
-                    # Event horizon glow
-                    intensity = int(40 * pulse_intensity * (1 - distance / self.event_horizon_radius))
-                    frame[y, x] = (intensity, 0, intensity * 2)
-                
-                elif distance <= self.accretion_disk_radius:
-                    # Accretion disk with swirling effect
-                    angle = math.atan2(y - self.center_y, x - self.center_x)
-                    swirl_offset = math.sin(angle * 3 + swirl_angle) * 2
-                    distance_with_swirl = distance + swirl_offset
-                    
-                    if distance_with_swirl <= self.accretion_disk_radius:
-                        # Create swirling hot gas effect
-                        intensity = int(255 * (1 - distance_with_swirl / self.accretion_disk_radius))
-                        red = min(255, intensity + 50)
-                        green = max(0, intensity - 100)
-                        blue = max(0, intensity - 150)
-                        frame[y, x] = (red, green, blue)
+        frame[self.void_mask] = self.colors['void']
+        
+        # Event horizon glow
+        intensity = (40 * pulse_intensity * (1 - distance[self.horizon_mask] / self.event_horizon_radius)).astype(np.int32)
+        frame[self.horizon_mask] = np.stack([intensity, np.zeros_like(intensity), intensity * 2], axis=-1)
+        
+        # Accretion disk with swirling effect
+        distance_with_swirl = distance + np.sin(self.fields.angle * 3 + swirl_angle) * 2
+        hot = self.disk_mask & (distance_with_swirl <= self.accretion_disk_radius)
+        # Create swirling hot gas effect
+        intensity = (255 * (1 - distance_with_swirl[hot] / self.accretion_disk_radius)).astype(np.int32)
+        frame[hot] = np.stack([np.minimum(255, intensity + 50),
+                               np.maximum(0, intensity - 100),
+                               np.maximum(0, intensity - 150)], axis=-1)
         
         # Add swirling particles
         self._add_swirling_particles(frame, particle_phase)
         
         # Add gravitational lensing effect
-        self._add_gravitational_lensing(frame, time_step)
+        if self.quality is None or self.quality.effects:
+            self._add_gravitational_lensing(frame, time_step)
         
         return frame
     
     def _add_swirling_particles(self, frame, phase):
         """Add swirling particles around the black hole."""
-        num_particles = 12
+        num_particles = self.quality.particles(12) if self.quality else 12
         
         for i in range(num_particles):
             # Calculate particle position in spiral
@@ -113,50 +118,38 @@ class BlackHoleAnimation:
     
     def _add_gravitational_lensing(self, frame, time_step):
         """Add gravitational lensing effect (light bending around black hole)."""
-        lensing_radius = 20
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                distance = math.sqrt((x - self.center_x)**2 + (y - self.center_y)**2)
-                
-                if self.accretion_disk_radius < distance <= lensing_radius:
-                    # Calculate lensing effect
-                    angle = math.atan2(y - self.center_y, x - self.center_x)
-                    lensing_strength = 0.3 * math.sin(time_step * 0.4 + angle * 2)
-                    
-                    # Distort the background slightly
-                    distortion_x = int(x + lensing_strength * math.cos(angle))
-                    distortion_y = int(y + lensing_strength * math.sin(angle))
-                    
-                    if 0 <= distortion_x < self.width and 0 <= distortion_y < self.height:
-                        # Blend with original pixel
-                        original = frame[y, x]
-                        distorted = frame[distortion_y, distortion_x]
-                        blend_factor = 0.7
-                        
-                        frame[y, x] = tuple(int(original[i] * blend_factor + distorted[i] * (1 - blend_factor)) 
-                                          for i in range(3))
+        mask = self.lensing_mask
+        angle = self.fields.angle[mask]
+        lensing_strength = 0.3 * np.sin(time_step * 0.4 + angle * 2)
+        
+        # Distort the background slightly (int() truncation, as the per-pixel version did)
+        distortion_x = (self.fields.dx[mask] + self.center_x + lensing_strength * np.cos(angle)).astype(np.int32)
+        distortion_y = (self.fields.dy[mask] + self.center_y + lensing_strength * np.sin(angle)).astype(np.int32)
+        
+        # Blend with the distorted pixel of the unlensed frame
+        blend_factor = 0.7
+        original = frame[mask].astype(np.float64)
+        distorted = frame[distortion_y, distortion_x].astype(np.float64)
+        frame[mask] = (original * blend_factor + distorted * (1 - blend_factor)).astype(np.uint8)
     
     def display_black_hole(self, duration=20):
         """Display the black hole animation."""
         print("Displaying Black Hole Animation...")
         print("Features: Swirling particles, gravitational lensing, event horizon glow")
         
+        self.quality = QualityController('black_hole', fps=20)  # 20 FPS for smooth animation
         start_time = time.time()
         frame_count = 0
         
         while time.time() - start_time < duration:
             # Create frame
+            self.quality.start_frame()
             frame = self.create_black_hole_frame(frame_count * 0.1)
             
             # Display frame
-            for y in range(self.height):
-                for x in range(self.width):
-                    color = frame[y, x]
-                    self.led.set_pixel(x, y, color)
-            
+            self.led.set_frame(frame)
             self.led.show()
-            time.sleep(0.05)  # 20 FPS for smooth animation
+            self.quality.end_frame()
             frame_count += 1
         
         print("Black hole animation completed!")
@@ -165,11 +158,13 @@ class BlackHoleAnimation:
         """Display black hole with varying intensity (simulating sound effects)."""
         print("Displaying Black Hole with Dynamic Effects...")
         
+        self.quality = QualityController('black_hole', fps=25)  # 25 FPS
         start_time = time.time()
         frame_count = 0
         
         while time.time() - start_time < duration:
             # Add some random intensity variations
+            self.quality.start_frame()
             time_step = frame_count * 0.1
             intensity_mod = 1.0 + 0.3 * math.sin(time_step * 0.7) + 0.1 * math.sin(time_step * 2.3)
             
@@ -177,14 +172,9 @@ class BlackHoleAnimation:
             frame = self.create_black_hole_frame(time_step)
             
             # Apply intensity modulation
-            for y in range(self.height):
-                for x in range(self.width):
-                    color = frame[y, x]
-                    modulated_color = tuple(min(255, int(c * intensity_mod)) for c in color)
-                    self.led.set_pixel(x, y, modulated_color)
-            
+            self.led.set_frame(np.minimum(255, (frame * intensity_mod).astype(np.int32)).astype(np.uint8))
             self.led.show()
-            time.sleep(0.04)  # 25 FPS
+            self.quality.end_frame()
             frame_count += 1
         
         print("Dynamic black hole animation completed!")
@@ -2,21 +2,42 @@ import time
 import threading
 import sys
 import config
+from telemetry import get_telemetry
 
 # Use mock GPIO on Windows, real GPIO on Raspberry Pi
 if sys.platform.startswith('win'):
     from mock_rpi import GPIO
     print("Using mock GPIO for Windows development")
 else:
-    import RPi.GPIO as GPIO
+    try:
+        import RPi.GPIO as GPIO
+    except ImportError:
+        print("⚠️ RPi.GPIO not found, using mock GPIO")
+        from mock_rpi import GPIO
 
+EDGE_SETTLE_TIME = 0.05  # Keep sampling this long after an edge so contact bounce settles
 class ButtonController:
-    def __init__(self):
-        """Initialize button controller for 4 buttons."""
+    def __init__(self, dispatcher=None):
+        """Initialize button controller for 4 buttons.
+
+        If a dispatcher is given, callbacks run on its worker thread instead of
+        the monitoring thread, so slow handlers never delay button sampling.
+        """
         self.buttons = {}
         self.button_callbacks = {}
         self.running = False
         self.button_thread = None
+        self.dispatcher = dispatcher
+        self.gesture_recognizer = None
+        self.gesture_callbacks = {}
+        self.activity_callbacks = []
+        self.telemetry = get_telemetry()
+        
+        # Edge-driven monitoring (see start_monitoring)
+        self.edge_detection = False
+        self.edge_event = threading.Event()
+        self.last_edge = float('-inf')
+        self.wakeups = 0  # Times the monitoring thread woke up
         
         # Setup GPIO with error handling
         try:
@@ -49,7 +70,7 @@ class ButtonController:
             self.buttons[i] = {
                 'pin': pin,
                 'state': False,
-                'last_press': 0
+                'last_press': float('-inf')
             }
             GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
     
@@ -58,43 +79,150 @@ class ButtonController:
         if 0 <= button_id < len(config.BUTTON_PINS):
             self.button_callbacks[button_id] = callback
     
+    def register_activity_callback(self, callback):
+        """Register a function called on the monitoring thread before every button callback."""
+        self.activity_callbacks.append(callback)
+    
     def start_monitoring(self):
-        """Start monitoring button presses in a separate thread."""
+        """Start monitoring button presses in a separate thread.
+
+        With config.BUTTON_EDGE_DETECTION the thread sleeps until a GPIO edge
+        (or a gesture deadline) and only samples every 10 ms while a button
+        is down; without it, or if edge detection fails, it polls at 100 Hz.
+        """
         if not self.running:
             self.running = True
+            if self.dispatcher:
+                self.dispatcher.start()
+            if config.BUTTON_EDGE_DETECTION:
+                self.edge_detection = self._add_edge_detection()
             self.button_thread = threading.Thread(target=self._monitor_buttons)
             self.button_thread.daemon = True
             self.button_thread.start()
     
+    def _add_edge_detection(self):
+        """Ask for a callback on every button edge; returns False if GPIO can't."""
+        try:
+            for button_info in self.buttons.values():
+                GPIO.add_event_detect(button_info['pin'], GPIO.BOTH, callback=self._on_edge)
+        except (RuntimeError, AttributeError) as e:
+            print(f"⚠️ Button edge detection unavailable ({e}), polling buttons instead")
+            self._remove_edge_detection()
+            return False
+        return True
+    
+    def _remove_edge_detection(self):
+        for button_info in self.buttons.values():
+            try:
+                GPIO.remove_event_detect(button_info['pin'])
+            except (RuntimeError, AttributeError):
+                pass
+    
+    def _on_edge(self, channel):
+        """GPIO edge callback: wake the monitoring thread."""
+        self.last_edge = time.monotonic()
+        self.edge_event.set()
+    
     def stop_monitoring(self):
         """Stop monitoring button presses."""
         self.running = False
+        self.edge_event.set()
         if self.button_thread:
             self.button_thread.join()
+        if self.edge_detection:
+            self._remove_edge_detection()
+            self.edge_detection = False
+        if self.dispatcher:
+            self.dispatcher.stop()
+    
+    def set_gesture_recognizer(self, recognizer):
+        """Route button edges through a GestureRecognizer.
+
+        Plain button callbacks are then driven by the recognizer's press
+        events, so presses that form a chord do not also start animations.
+        """
+        self.gesture_recognizer = recognizer
+        recognizer.add_listener(self._on_gesture)
+    
+    def register_gesture_callback(self, kind, buttons, callback):
+        """Register a callback(event) for a gesture kind on a button or chord."""
+        if isinstance(buttons, int):
+            buttons = (buttons,)
+        self.gesture_callbacks[(kind, tuple(sorted(buttons)))] = callback
+    
+    def _on_gesture(self, event):
+        """Deliver a gesture event from the recognizer to the registered callbacks."""
+        if event.kind == 'press':
+            button_info = self.buttons[event.buttons[0]]
+            # The recognizer only filters contact chatter; slower switch bounce is dropped here as without gestures
+            if event.time - button_info['last_press'] <= config.BUTTON_DEBOUNCE_TIME:
+                return
+            button_info['last_press'] = event.time
+            self._fire_callback(event.buttons[0], self.button_callbacks.get(event.buttons[0]), event.time)
+        
+        key = (event.kind, tuple(sorted(event.buttons)))
+        callback = self.gesture_callbacks.get(key)
+        if callback:
+            self._fire_callback(key, lambda: callback(event), event.time)
+    
+    def _fire_callback(self, key, callback, edge_time):
+        """Hand a callback to the dispatcher, or call it directly."""
+        if callback is None:
+            return
+        for activity_callback in self.activity_callbacks:
+            activity_callback()
+        if self.telemetry:
+            self.telemetry.note_input(edge_time)
+        if self.dispatcher:
+            self.dispatcher.dispatch(key, callback, edge_time)
+        else:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in button {key} callback: {e}")
     
     def _monitor_buttons(self):
         """Monitor button presses in a loop."""
         while self.running:
-            for button_id, button_info in self.buttons.items():
-                current_state = GPIO.input(button_info['pin']) == GPIO.LOW
-                current_time = time.time()
-                
-                # Detect button press with debouncing
-                if (current_state and not button_info['state'] and 
-                    current_time - button_info['last_press'] > config.BUTTON_DEBOUNCE_TIME):
-                    
-                    button_info['last_press'] = current_time
-                    
-                    # Call registered callback
-                    if button_id in self.button_callbacks:
-                        try:
-                            self.button_callbacks[button_id]()
-                        except Exception as e:
-                            print(f"Error in button {button_id} callback: {e}")
+            # Clear before sampling so an edge during the poll still wakes the wait below
+            self.edge_event.clear()
+            current_time = time.monotonic()
+            self.poll_buttons(current_time)
+            if self.edge_detection:
+                self.edge_event.wait(self._edge_wait_timeout(current_time))
+                self.wakeups += 1
+            else:
+                time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+                self.wakeups += 1
+    
+    def _edge_wait_timeout(self, current_time):
+        """Seconds to sleep waiting for an edge, or None to sleep until one arrives."""
+        held = any(button_info['state'] for button_info in self.buttons.values())
+        if held or current_time - self.last_edge < EDGE_SETTLE_TIME:
+            return 0.01
+        deadline = self.gesture_recognizer.next_deadline() if self.gesture_recognizer else None
+        return None if deadline is None else max(0.0, deadline - current_time)
+    
+    def poll_buttons(self, current_time):
+        """Sample all buttons once and handle edges (current_time from time.monotonic())."""
+        for button_id, button_info in self.buttons.items():
+            current_state = GPIO.input(button_info['pin']) == GPIO.LOW
+            
+            if self.gesture_recognizer:
+                if current_state != button_info['state']:
+                    self.gesture_recognizer.feed(button_id, current_state, current_time)
+            
+            # Detect button press with debouncing
+            elif (current_state and not button_info['state'] and 
+                current_time - button_info['last_press'] > config.BUTTON_DEBOUNCE_TIME):
                 
-                button_info['state'] = current_state
+                button_info['last_press'] = current_time
+                self._fire_callback(button_id, self.button_callbacks.get(button_id), current_time)
             
-            time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+            button_info['state'] = current_state
+        
+        if self.gesture_recognizer:
+            self.gesture_recognizer.update(current_time)
     
     def get_button_state(self, button_id):
         """Get the current state of a button."""
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Button Event Dispatcher
+Runs button handlers on a worker thread so the GPIO sampling loop never blocks
+"""
+
+import time
+import threading
+from collections import deque
+
+
+class ButtonDispatcher:
+    """Queue button edges from the input thread and run their handlers on a worker.
+
+    The input thread only timestamps the edge and drops it into a per-button
+    slot. If a button is pressed again before its previous press was handled,
+    the newer press replaces the older one (latest wins), so a burst of presses
+    turns into a single animation restart instead of a backlog.
+    """
+
+    def __init__(self, latency_history=256):
+        """Initialize the dispatcher."""
+        self.running = False
+        self.worker_thread = None
+        self.condition = threading.Condition()
+
+        # button_id -> (handler, edge_time); insertion order is dispatch order
+        self.pending = {}
+
+        # Statistics
+        self.latencies = deque(maxlen=latency_history)
+        self.handler_times = deque(maxlen=latency_history)
+        self.dispatched_count = 0
+        self.coalesced_count = 0
+        self.error_count = 0
+
+    def start(self):
+        """Start the worker thread."""
+        if not self.running:
+            self.running = True
+            self.worker_thread = threading.Thread(target=self._run_worker)
+            self.worker_thread.daemon = True
+            self.worker_thread.start()
+
+    def stop(self, timeout=2.0):
+        """Stop the worker thread and drop any pending presses."""
+        with self.condition:
+            self.running = False
+            self.pending.clear()
+            self.condition.notify_all()
+        if self.worker_thread and self.worker_thread is not threading.current_thread():
+            self.worker_thread.join(timeout=timeout)
+        self.worker_thread = None
+
+    def dispatch(self, button_id, handler, edge_time=None):
+        """Queue a button press. Safe to call from the input thread; never blocks on handlers."""
+        if edge_time is None:
+            edge_time = time.monotonic()
+
+        with self.condition:
+            if button_id in self.pending:
+                # Rapid repeat press - keep only the newest one
+                del self.pending[button_id]
+                self.coalesced_count += 1
+            self.pending[button_id] = (handler, edge_time)
+            self.condition.notify()
+
+    def pending_count(self):
+        """Return the number of presses waiting for the worker."""
+        with self.condition:
+            return len(self.pending)
+
+    def _next_event(self):
+        """Block until a press is pending, then remove and return it."""
+        with self.condition:
+            while self.running and not self.pending:
+                self.condition.wait()
+            if not self.running:
+                return None
+            button_id = next(iter(self.pending))
+            handler, edge_time = self.pending.pop(button_id)
+            return button_id, handler, edge_time
+
+    def _run_worker(self):
+        """Worker loop - run handlers one at a time in edge order."""
+        while self.running:
+            event = self._next_event()
+            if event is None:
+                break
+
+            button_id, handler, edge_time = event
+            start_time = time.monotonic()
+            self.latencies.append(start_time - edge_time)
+
+            try:
+                handler()
+            except Exception as e:
+                self.error_count += 1
+                print(f"Error in button {button_id} handler: {e}")
+            finally:
+                self.handler_times.append(time.monotonic() - start_time)
+                self.dispatched_count += 1
+
+    def get_stats(self):
+        """Return input-to-action latency and coalescing statistics (times in seconds)."""
+        latencies = sorted(self.latencies)
+        handler_times = list(self.handler_times)
+
+        stats = {
+            'dispatched': self.dispatched_count,
+            'coalesced': self.coalesced_count,
+            'errors': self.error_count,
+            'pending': self.pending_count(),
+            'latency_avg': 0.0,
+            'latency_p95': 0.0,
+            'latency_max': 0.0,
+            'handler_avg': 0.0,
+            'handler_max': 0.0,
+        }
+        if latencies:
+            stats['latency_avg'] = sum(latencies) / len(latencies)
+            stats['latency_p95'] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            stats['latency_max'] = latencies[-1]
+        if handler_times:
+            stats['handler_avg'] = sum(handler_times) / len(handler_times)
+            stats['handler_max'] = max(handler_times)
+        return stats
+
+    def print_stats(self):
+        """Print a one-line summary of dispatcher statistics."""
+        stats = self.get_stats()
+        print(f"🎛️ Buttons: {stats['dispatched']} handled, {stats['coalesced']} coalesced, "
+              f"latency avg {stats['latency_avg'] * 1000:.1f} ms / "
+              f"p95 {stats['latency_p95'] * 1000:.1f} ms / max {stats['latency_max'] * 1000:.1f} ms")
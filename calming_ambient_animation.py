@@ -8,6 +8,7 @@ import time
 import numpy as np
 import math
 from led_controller_fixed import LEDControllerFixed
+from quality_controller import QualityController
 import config
 
 class CalmingAmbientAnimation:
@@ -42,10 +43,14 @@ class CalmingAmbientAnimation:
         self.pulse_timer = 0
         self.aurora_timer = 0
         
+        # ~12 FPS; slower Pis draw fewer particles, skip the aurora, then go half resolution
+        self.quality = QualityController('calming_ambient', fps=12.5)
+        self.step = 1  # Pixel step of the full-screen effects (2 = half resolution)
+        
     def create_flowing_shapes(self, frame):
         """Create gentle flowing organic shapes."""
-        for y in range(self.height):
-            for x in range(self.width):
+        for y in range(0, self.height, self.step):
+            for x in range(0, self.width, self.step):
                 # Create flowing wave patterns
                 wave1 = math.sin((x + self.flow_timer * 0.3) * 0.2) * 0.5
                 wave2 = math.sin((y + self.flow_timer * 0.2) * 0.15) * 0.5
@@ -86,8 +91,8 @@ class CalmingAmbientAnimation:
     
     def create_aurora_effect(self, frame):
         """Create aurora-like flowing light effects."""
-        for y in range(self.height):
-            for x in range(self.width):
+        for y in range(0, self.height, self.step):
+            for x in range(0, self.width, self.step):
                 # Aurora wave patterns
                 aurora1 = math.sin((x + self.aurora_timer * 0.4) * 0.3) * 0.6
                 aurora2 = math.sin((y + self.aurora_timer * 0.3) * 0.2) * 0.4
@@ -107,7 +112,7 @@ class CalmingAmbientAnimation:
                         aurora_color = self.colors['aurora_purple']
                     
                     # Blend with existing frame
-                    current = frame[y, x]
+                    current = frame[y, x].tolist()  # Python ints, so blending can't wrap around uint8
                     blend_factor = (aurora_intensity - 0.2) * 0.4
                     frame[y, x] = tuple(int(c + (a - c) * blend_factor) 
                                       for c, a in zip(current, aurora_color))
@@ -133,8 +138,8 @@ class CalmingAmbientAnimation:
             color = circle_colors[i % len(circle_colors)]
             
             # Draw breathing circle
-            for y in range(self.height):
-                for x in range(self.width):
+            for y in range(0, self.height, self.step):
+                for x in range(0, self.width, self.step):
                     distance = math.sqrt((x - cx)**2 + (y - cy)**2)
                     if distance < radius:
                         intensity = 1 - (distance / radius)
@@ -147,7 +152,7 @@ class CalmingAmbientAnimation:
     
     def create_floating_particles(self, frame):
         """Create gentle floating particles."""
-        num_particles = 8
+        num_particles = self.quality.particles(8)
         for i in range(num_particles):
             # Particle movement
             particle_x = (self.width // 2 + 
@@ -180,8 +185,8 @@ class CalmingAmbientAnimation:
     
     def create_gradient_background(self, frame):
         """Create a subtle gradient background."""
-        for y in range(self.height):
-            for x in range(self.width):
+        for y in range(0, self.height, self.step):
+            for x in range(0, self.width, self.step):
                 # Vertical gradient
                 vertical_gradient = y / self.height
                 
@@ -205,11 +210,16 @@ class CalmingAmbientAnimation:
         """Create a complete calming ambient frame."""
         frame = np.full((self.height, self.width, 3), self.colors['background'], dtype=np.uint8)
         
-        # Create scene elements
+        # Create scene elements (the full-screen ones every self.step pixels)
+        self.step = self.quality.resolution_step
         self.create_gradient_background(frame)
         self.create_flowing_shapes(frame)
-        self.create_aurora_effect(frame)
+        if self.quality.effects:
+            self.create_aurora_effect(frame)
         self.create_breathing_circles(frame)
+        if self.step > 1:
+            # Upscale the sampled pixels to fill the frame
+            frame[:] = frame[::self.step, ::self.step].repeat(self.step, axis=0).repeat(self.step, axis=1)
         self.create_floating_particles(frame)
         
         return frame
@@ -224,6 +234,7 @@ class CalmingAmbientAnimation:
         
         while time.time() - start_time < duration:
             # Create the frame
+            self.quality.start_frame()
             frame = self.create_frame()
             
             # Display the frame
@@ -240,7 +251,7 @@ class CalmingAmbientAnimation:
             self.pulse_timer += 1
             self.aurora_timer += 1
             
-            time.sleep(0.08)  # ~12 FPS for smooth, calming motion
+            self.quality.end_frame()  # ~12 FPS for smooth, calming motion
         
         print("Calming ambient animation completed!")
     
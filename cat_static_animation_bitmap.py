@@ -6,8 +6,26 @@ Displays a static cat bitmap image for 5 seconds
 
 import time
 from led_controller_exact import LEDControllerExact
+from sprite_assets import load_frames
 import config
 
+# Cat bitmap data (32x48 pixels) - compiled into the sprite bundle as 'cat_bitmap'
+bitmap_hex = [
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xf9, 0xff, 0xff, 0xff, 0xf9, 0xff, 0xff, 0xff,
+    0xfb, 0xff, 0xff, 0xff, 0xfb, 0xff, 0xff, 0xff, 0xf9, 0xff, 0xff, 0xff, 0xf8, 0xff, 0xff, 0xff,
+    0xfc, 0x7f, 0xff, 0xff, 0xff, 0x3f, 0xfc, 0x7f, 0xff, 0x00, 0x78, 0x3f, 0xff, 0x00, 0x00, 0x3f,
+    0xff, 0x00, 0x00, 0xff, 0xff, 0x00, 0x01, 0xff, 0xff, 0x00, 0x01, 0xff, 0xfe, 0x00, 0x01, 0xff,
+    0xfc, 0x07, 0x81, 0xff, 0xf8, 0x8f, 0xb8, 0xff, 0xfb, 0x9f, 0x3c, 0xff, 0xfb, 0x8f, 0x7e, 0x7f,
+    0xff, 0xc7, 0x3f, 0x1f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff
+]
+
+
 class CatStaticAnimationBitmap:
     def __init__(self):
         """Initialize the cat bitmap static animation."""
@@ -15,33 +33,8 @@ class CatStaticAnimationBitmap:
         self.width = config.TOTAL_WIDTH
         self.height = config.TOTAL_HEIGHT
         
-        # Cat bitmap data (32x48 pixels)
-        bitmap_hex = [
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xf9, 0xff, 0xff, 0xff, 0xf9, 0xff, 0xff, 0xff,
-            0xfb, 0xff, 0xff, 0xff, 0xfb, 0xff, 0xff, 0xff, 0xf9, 0xff, 0xff, 0xff, 0xf8, 0xff, 0xff, 0xff,
-            0xfc, 0x7f, 0xff, 0xff, 0xff, 0x3f, 0xfc, 0x7f, 0xff, 0x00, 0x78, 0x3f, 0xff, 0x00, 0x00, 0x3f,
-            0xff, 0x00, 0x00, 0xff, 0xff, 0x00, 0x01, 0xff, 0xff, 0x00, 0x01, 0xff, 0xfe, 0x00, 0x01, 0xff,
-            0xfc, 0x07, 0x81, 0xff, 0xf8, 0x8f, 0xb8, 0xff, 0xfb, 0x9f, 0x3c, 0xff, 0xfb, 0x8f, 0x7e, 0x7f,
-            0xff, 0xc7, 0x3f, 0x1f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff
-        ]
-        
-        self.cat_pixels = []
-        for row in range(48):
-            row_data = []
-            byte_start = row * 4
-            for col in range(32):
-                byte_index = byte_start + (col // 8)
-                bit_index = 7 - (col % 8)
-                byte_value = bitmap_hex[byte_index]
-                pixel = (byte_value >> bit_index) & 1
-                row_data.append(1 - pixel)
-            self.cat_pixels.append(row_data)
+        # Decoded once into the sprite bundle (python sprite_assets.py build)
+        self.cat_pixels = load_frames('cat_bitmap')[0].tolist()
         
         self.cat_color = (255, 255, 255)
         
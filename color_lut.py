@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Color Remap LUTs
+Compiles per-pixel recoloring rules into a 3D lookup table so a whole frame
+is recolored with a single NumPy fancy-indexing operation
+
+A rule is any function (r, g, b) -> (r, g, b), such as the `if` chains the
+sprite animations use for their palettes. The compiler evaluates the rule
+chain once at the center of every cell of a quantized RGB cube
+(config.COLOR_LUT_BITS bits per channel, so 32^3 cells by default). Colors
+inside one cell share a result, which can differ from the exact rule by a
+few levels near a threshold.
+
+Animations declare their grading by name and get the compiled LUT back:
+    self.grading = get_grading('whale', replace_blue, dim_white, scale(0.6))
+    graded = self.grading.apply(frame)
+
+Benchmark the sprite animations' gradings:
+    python color_lut.py
+"""
+
+import time
+import numpy as np
+import config
+
+
+class ColorLUT:
+    """A compiled 3D color lookup table."""
+
+    def __init__(self, table, bits):
+        """Initialize from a (2^bits, 2^bits, 2^bits, 3) uint8 table."""
+        self.bits = bits
+        self.shift = 8 - bits
+        self.table = table
+        self.flat = table.reshape(-1, 3)
+
+    @classmethod
+    def compile(cls, *rules, bits=None):
+        """Evaluate a chain of rules over the quantized RGB cube."""
+        bits = bits or config.COLOR_LUT_BITS
+        size = 1 << bits
+        step = 256 // size
+        levels = [int(v) for v in np.arange(size) * step + step // 2]
+        rule = chain(*rules)
+        table = np.array([rule(r, g, b) for r in levels for g in levels for b in levels], dtype=np.float64)
+        table = np.clip(table, 0, 255).astype(np.uint8).reshape(size, size, size, 3)
+        return cls(table, bits)
+
+    def index(self, frame):
+        """Return the flat table index of every pixel of a (..., 3) uint8 frame."""
+        shifted = np.asarray(frame, dtype=np.uint8) >> self.shift
+        return ((shifted[..., 0].astype(np.intp) << self.bits | shifted[..., 1]) << self.bits) | shifted[..., 2]
+
+    def apply(self, frame):
+        """Return the recolored frame (a new uint8 array of the same shape)."""
+        return self.flat[self.index(frame)]
+
+    def apply_color(self, color):
+        """Recolor a single (r, g, b) color."""
+        r, g, b = (int(c) >> self.shift for c in color)
+        return tuple(int(c) for c in self.table[r, g, b])
+
+
+def chain(*rules):
+    """Combine rules into one that applies them in order."""
+    if len(rules) == 1:
+        return rules[0]
+
+    def chained(r, g, b):
+        for rule in rules:
+            r, g, b = rule(r, g, b)
+        return r, g, b
+    return chained
+
+
+def scale(factor):
+    """Rule that multiplies all channels by factor (truncating, like int(c * factor))."""
+    def scaled(r, g, b):
+        return int(r * factor), int(g * factor), int(b * factor)
+    return scaled
+
+
+_gradings = {}
+
+
+def get_grading(name, *rules, bits=None):
+    """Return the LUT registered as name, compiling and registering the rules on first use.
+
+    Later calls (from any instance of the animation) reuse the compiled
+    table; pass no rules to look up an existing grading.
+    """
+    lut = _gradings.get(name)
+    if lut is None:
+        if not rules:
+            raise KeyError(f"No color grading registered as '{name}'")
+        lut = _gradings[name] = ColorLUT.compile(*rules, bits=bits)
+    return lut
+
+
+def registered_gradings():
+    """Return the names of all compiled gradings."""
+    return sorted(_gradings)
+
+
+def main():
+    """Benchmark per-pixel rules against the compiled LUTs for each sprite animation."""
+    import io
+    import contextlib
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from bird_animation import BirdAnimation
+        from wale_animation import WhaleAnimation
+        bird = BirdAnimation()
+        whale = WhaleAnimation()
+
+    for name, animation, rules in (('bird', bird, bird.grading_rules()), ('whale', whale, whale.grading_rules())):
+        frames = list(animation.frames)
+        rule = chain(*rules)
+
+        start = time.perf_counter()
+        for frame in frames:
+            np.array([[rule(*(int(c) for c in pixel)) for pixel in row] for row in frame], dtype=np.uint8)
+        per_pixel = (time.perf_counter() - start) / len(frames)
+
+        start = time.perf_counter()
+        lut = ColorLUT.compile(*rules)
+        compile_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for frame in frames:
+            lut.apply(frame)
+        lookup = (time.perf_counter() - start) / len(frames)
+
+        print(f"{name}: per-pixel {per_pixel * 1000:.2f} ms/frame, LUT {lookup * 1000:.3f} ms/frame "
+              f"({per_pixel / lookup:.0f}x), compiled once in {compile_time * 1000:.0f} ms")
+
+    bird.cleanup()
+    whale.cleanup()
+
+
+if __name__ == "__main__":
+    main()
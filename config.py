@@ -7,6 +7,48 @@ LED_DMA = 10  # DMA channel
 LED_INVERT = False  # Signal inversion
 LED_CHANNEL = 0  # PWM channel
 
+# Output Backend (see output_backends.py)
+OUTPUT_BACKEND = 'auto'  # auto, ws281x, mock, recorder, udp, terminal or tap - combine with commas, e.g. 'ws281x,recorder'
+OUTPUT_RECORD_PATH = 'recordings/output.ledrec'  # File written by the recorder backend
+OUTPUT_UDP_HOST = '127.0.0.1'  # DDP receiver for the udp backend (e.g. a WLED device)
+OUTPUT_UDP_PORT = 4048  # Standard DDP port
+TERMINAL_PREVIEW_FPS = 15  # Redraw limit for the terminal preview backend
+MOCK_STRIP_TIMING = 'sleep'  # Mock strip wire time: 'sleep' (real speed), 'simulate' (count only) or 'off'
+MOCK_STRIP_CAPTURE_FRAMES = 16  # Frames kept in the mock strip's capture ring buffer
+
+# Live Frame Tap (see frame_tap.py)
+FRAME_TAP_ENABLED = False  # Publish every pushed frame to shared memory for previews and recorders
+FRAME_TAP_NAME = 'led_frame_tap'  # Name of the shared memory block readers attach to
+FRAME_TAP_SLOTS = 8  # Frames kept in the ring buffer (a reader may fall this far behind)
+FRAME_TAP_WEB_HOST = '127.0.0.1'  # Address of the `frame_tap.py web` preview (0.0.0.0 to watch from another machine)
+
+# Telemetry (see telemetry.py)
+TELEMETRY_ENABLED = False  # Record frame, input and audio timings
+TELEMETRY_HTTP_HOST = '127.0.0.1'  # Address of the Prometheus endpoint (0.0.0.0 to scrape from another machine)
+TELEMETRY_HTTP_PORT = 9108  # Port of the /metrics endpoint (0 = no endpoint)
+TELEMETRY_SUMMARY_INTERVAL = 60  # Seconds between summary log lines (0 = none)
+TELEMETRY_OVERRUN_SLACK = 1.5  # An unmarked frame overruns when it arrives this many times the scene's average interval
+
+# Logging (see app_logging.py)
+LOG_LEVEL = 'INFO'  # DEBUG, INFO, WARNING or ERROR
+LOG_RATE_LIMIT = 5  # Records per second allowed from one call site (0 = unlimited)
+LOG_RATE_BURST = 20  # Records one call site may log in a burst before the rate limit applies
+LOG_QUEUE_SIZE = 1000  # Records waiting for the writer thread; more are dropped, never blocking
+LOG_ROUTE_PRINTS = True  # Turn print() output into rate-limited log records
+
+# On-Demand Profiler (see profiler.py) - idle until SIGUSR1 or an HTTP request
+PROFILER_SECONDS = 10  # Length of a profile started by SIGUSR1
+PROFILER_INTERVAL = 0.005  # Seconds between stack samples
+PROFILER_OUTPUT_DIR = 'profiles'  # Folder for folded-stack reports
+PROFILER_HTTP_PORT = 0  # Port of the /profile trigger on 127.0.0.1 (0 = signal only)
+
+# Color Grading (see color_lut.py)
+COLOR_LUT_BITS = 5  # Bits per channel of compiled color LUTs (5 = 32^3 cells, within ~3 levels of the exact rules)
+
+# Render Worker (see render_worker.py)
+RENDER_WORKER_ENABLED = False  # Render animal/object animations in a separate process (uses a second core)
+RENDER_WORKER_STOP_TIMEOUT = 1.0  # Seconds to wait for a cancelled animation before restarting the worker
+
 # Display Configuration
 PANELS_COUNT = 6  # Number of LED panels (increased from 5 to 6)
 PANEL_WIDTH = 32  # Width of each panel
@@ -14,9 +56,10 @@ PANEL_HEIGHT = 8  # Height of each panel
 TOTAL_WIDTH = PANEL_WIDTH  # 32 pixels (width of each panel)
 TOTAL_HEIGHT = PANELS_COUNT * PANEL_HEIGHT  # 48 pixels (6 panels stacked)
 TOTAL_LEDS = TOTAL_WIDTH * TOTAL_HEIGHT  # 1536 LEDs
+DISPLAY_ORIENTATION = 'normal'  # normal, rotate_90, rotate_180, rotate_270, mirror_x or mirror_y (see display_orientation.py)
 
 # Display Settings
-BRIGHTNESS = 0.2  # Brightness level (0.0 to 1.0)
+BRIGHTNESS = 0.2  # Brightness level (0.0 to 1.0); bright frames are limited to POWER_BUDGET_MA
 DEFAULT_COLOR = (0, 0, 0)  # Default color (black)
 
 # Animation Settings
@@ -26,6 +69,15 @@ ANIMATION_SPEED = 0.1  # Animation speed multiplier
 # Button Configuration (Future Implementation)
 BUTTON_PINS = [18, 17, 27, 22]  # GPIO pins for 4 buttons
 BUTTON_DEBOUNCE_TIME = 0.2  # Button debounce time in seconds
+BUTTON_DISPATCH_ENABLED = True  # Run button handlers on a worker thread (see button_dispatcher.py)
+BUTTON_EDGE_DETECTION = True  # Sleep until a GPIO edge instead of polling at 100 Hz (falls back to polling)
+
+# Button Gestures (see gesture_recognizer.py)
+GESTURE_CHORD_WINDOW = 0.15  # Max seconds between presses that form a chord
+GESTURE_LONG_PRESS_TIME = 1.0  # Seconds held before a long press
+GESTURE_DOUBLE_TAP_WINDOW = 0.4  # Max seconds between two presses of a double tap
+GESTURE_HOLD_REPEAT_INTERVAL = 0.25  # Seconds between repeats while held after a long press
+INTERRUPTION_TOGGLE_CHORD = (0, 3)  # Buttons that toggle ALLOW_ANIMATION_INTERRUPTION together
 
 # Color Definitions
 COLORS = {
@@ -42,6 +94,46 @@ COLORS = {
     'PINK': (255, 192, 203)
 }
 
+# Audio Assets (see audio_assets.py)
+AUDIO_COMPRESSED_DIR = 'compressed'  # Subfolder of audio/ with OGG files and manifest.json
+AUDIO_CACHE_BUDGET_MB = 16  # RAM budget for decoded short cues
+AUDIO_CUE_MAX_SECONDS = 12.0  # Longer files are streamed from disk instead of cached
+AUDIO_TARGET_DBFS = -18.0  # Loudness that playback volume is normalized towards
+
+# Sprite Assets (see sprite_assets.py)
+SPRITE_BUNDLE_PATH = 'assets/sprites.bundle'  # Compiled sprite frames, built with: python sprite_assets.py build
+
+# Scenes (see scene_player.py)
+SCENES_DIR = 'scenes'  # Declarative scene files, checked with: python scene_player.py check
+
+# Transitions between animations (see transition_stage.py)
+TRANSITION_STYLE = 'crossfade'  # crossfade, wipe or dissolve
+TRANSITION_DURATION = 0.8  # Seconds to blend into the next animation (0 = cut)
+TRANSITION_FPS = 20  # Blend rate while the incoming animation draws slower than this (the strip takes ~46 ms a frame)
+
+# Power Limiting (see power_limiter.py)
+POWER_LIMIT_ENABLED = True  # Estimate every frame's current and lower the brightness to stay in budget
+POWER_BUDGET_MA = 20000  # Current the LED power supply can deliver (5 V 20 A)
+POWER_CHANNEL_MA = (20.0, 20.0, 20.0)  # mA per LED for R, G, B at value 255 and full brightness
+POWER_IDLE_MA = 1.0  # mA every LED draws even when black
+POWER_LIMIT_RELEASE = 1.0  # Seconds to return to full brightness after a frame that was limited
+
+# Adaptive Quality (see quality_controller.py)
+QUALITY_ADAPTIVE = True  # Lower heavy animations' quality when frames overrun (False = always full quality)
+QUALITY_RAISE_LOAD = 0.6  # Raise quality when render time stays under this share of the frame period
+QUALITY_SETTLE_FRAMES = 15  # Frames at a level before it can change again
+QUALITY_RETRY_SECONDS = 10.0  # Wait before retrying a level that overran
+QUALITY_LOW_FPS_SCALE = 0.6  # Frame rate multiplier at the lowest level
+
+# Idle / Low Power (see idle_manager.py)
+IDLE_TIMEOUT = 300  # Seconds with no animation and no button press before idling (0 = never)
+IDLE_AMBIENT_ENABLED = False  # Show a dim breathing glow while idle instead of a dark board
+IDLE_AMBIENT_FPS = 2  # Frame rate of the idle glow
+IDLE_AUDIO_POWER_DOWN = True  # Close the audio mixer while idle; the next button press reopens it
+
+# Frame Cache Settings
+FRAME_CACHE_BUDGET_MB = 8  # RAM budget for memoized frames of looping animations (4.5 KB per frame)
+
 # Pattern Settings
 RAINBOW_SPEED = 0.01
 WAVE_SPEED = 0.05
@@ -6,8 +6,26 @@ Displays a static deer bitmap image for 5 seconds
 
 import time
 from led_controller_exact import LEDControllerExact
+from sprite_assets import load_frames
 import config
 
+# Deer bitmap data (32x48 pixels) - compiled into the sprite bundle as 'deer_bitmap'
+bitmap_hex = [
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xbf, 0xcf, 0xff, 0xff, 0x1e, 0x8f,
+    0xff, 0xff, 0x86, 0x1f, 0xff, 0xff, 0xf6, 0x7f, 0xff, 0xff, 0xf6, 0xff, 0xff, 0xff, 0xd0, 0xbf,
+    0xff, 0xff, 0xce, 0x3f, 0xff, 0xff, 0xed, 0x7f, 0xff, 0xff, 0xdf, 0xbf, 0xf8, 0x00, 0x3c, 0x7f,
+    0xf5, 0xff, 0xfd, 0xff, 0xf7, 0xff, 0xfb, 0xff, 0xf3, 0xff, 0xff, 0xff, 0xf3, 0xff, 0xf7, 0xff,
+    0xfd, 0xef, 0x77, 0xff, 0xfd, 0xef, 0x6f, 0xff, 0xfe, 0xc0, 0x6f, 0xff, 0xfd, 0x9f, 0x6f, 0xff,
+    0xfb, 0x5f, 0x6f, 0xff, 0xfa, 0xdd, 0x6f, 0xff, 0xf8, 0x5d, 0x7f, 0xff, 0xfb, 0x5d, 0x5f, 0xff,
+    0xfb, 0xba, 0x5f, 0xff, 0xfb, 0xaa, 0x5f, 0xff, 0xf9, 0xc9, 0x9f, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
+    0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff
+]
+
+
 class DeerStaticAnimationBitmap:
     def __init__(self):
         """Initialize the deer bitmap static animation."""
@@ -15,33 +33,8 @@ class DeerStaticAnimationBitmap:
         self.width = config.TOTAL_WIDTH
         self.height = config.TOTAL_HEIGHT
         
-        # Deer bitmap data (32x48 pixels)
-        bitmap_hex = [
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xbf, 0xcf, 0xff, 0xff, 0x1e, 0x8f,
-            0xff, 0xff, 0x86, 0x1f, 0xff, 0xff, 0xf6, 0x7f, 0xff, 0xff, 0xf6, 0xff, 0xff, 0xff, 0xd0, 0xbf,
-            0xff, 0xff, 0xce, 0x3f, 0xff, 0xff, 0xed, 0x7f, 0xff, 0xff, 0xdf, 0xbf, 0xf8, 0x00, 0x3c, 0x7f,
-            0xf5, 0xff, 0xfd, 0xff, 0xf7, 0xff, 0xfb, 0xff, 0xf3, 0xff, 0xff, 0xff, 0xf3, 0xff, 0xf7, 0xff,
-            0xfd, 0xef, 0x77, 0xff, 0xfd, 0xef, 0x6f, 0xff, 0xfe, 0xc0, 0x6f, 0xff, 0xfd, 0x9f, 0x6f, 0xff,
-            0xfb, 0x5f, 0x6f, 0xff, 0xfa, 0xdd, 0x6f, 0xff, 0xf8, 0x5d, 0x7f, 0xff, 0xfb, 0x5d, 0x5f, 0xff,
-            0xfb, 0xba, 0x5f, 0xff, 0xfb, 0xaa, 0x5f, 0xff, 0xf9, 0xc9, 0x9f, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff,
-            0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff
-        ]
-        
-        self.deer_pixels = []
-        for row in range(48):
-            row_data = []
-            byte_start = row * 4
-            for col in range(32):
-                byte_index = byte_start + (col // 8)
-                bit_index = 7 - (col % 8)
-                byte_value = bitmap_hex[byte_index]
-                pixel = (byte_value >> bit_index) & 1
-                row_data.append(1 - pixel)
-            self.deer_pixels.append(row_data)
+        # Decoded once into the sprite bundle (python sprite_assets.py build)
+        self.deer_pixels = load_frames('deer_bitmap')[0].tolist()
         
         self.deer_color = (255, 255, 255)
         
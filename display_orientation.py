@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Display Orientation
+Rotations and mirrors of the whole display, applied by composing them into
+the compiled LED order instead of transforming coordinates on every draw
+
+An orientation describes how the picture an animation draws (the logical
+frame) sits on the physical board:
+
+    normal       as drawn
+    rotate_90    turned a quarter turn clockwise
+    rotate_180   upside down
+    rotate_270   turned a quarter turn counter-clockwise
+    mirror_x     flipped left to right
+    mirror_y     flipped top to bottom
+
+Quarter turns swap the logical size (a 32x48 board becomes a 48x32
+canvas), so only animations that draw to led.width x led.height fill it.
+Whole frames of any other size (most animations size theirs from
+config.TOTAL_WIDTH/TOTAL_HEIGHT) are centered on the canvas: a 32x48 frame
+loses 8 rows at the top and bottom and gets 8 black columns each side.
+
+The controller calls compose_order() once per change; after that a
+rotated frame costs exactly as much as an unrotated one.
+
+The orientation is process-wide: controllers start in current_orientation()
+(config.DISPLAY_ORIENTATION until set_orientation() is called on any
+controller), and the render worker is sent it with every animation.
+"""
+
+import numpy as np
+import config
+
+ORIENTATIONS = ('normal', 'rotate_90', 'rotate_180', 'rotate_270', 'mirror_x', 'mirror_y')
+
+
+_current_orientation = None  # Set at runtime by set_current_orientation(); None = config.DISPLAY_ORIENTATION
+
+
+def check_orientation(orientation):
+    """Raise ValueError for an unknown orientation name."""
+    if orientation not in ORIENTATIONS:
+        raise ValueError(f"Unknown display orientation '{orientation}' (choose from {', '.join(ORIENTATIONS)})")
+
+
+def current_orientation():
+    """Return the orientation new controllers start in."""
+    return _current_orientation or config.DISPLAY_ORIENTATION
+
+
+def set_current_orientation(orientation):
+    """Make orientation the one new controllers start in (None goes back to config.DISPLAY_ORIENTATION)."""
+    global _current_orientation
+    if orientation is not None:
+        check_orientation(orientation)
+    _current_orientation = orientation
+
+
+def logical_size(orientation, width, height):
+    """Return the (width, height) animations draw to on a width x height board."""
+    check_orientation(orientation)
+    if orientation in ('rotate_90', 'rotate_270'):
+        return height, width
+    return width, height
+
+
+def logical_pixel_map(orientation, width, height):
+    """Return, for every flat physical pixel (y * width + x), the flat logical pixel shown there."""
+    check_orientation(orientation)
+    py, px = np.mgrid[0:height, 0:width]
+    logical_width, _ = logical_size(orientation, width, height)
+
+    if orientation == 'rotate_90':
+        lx, ly = py, width - 1 - px
+    elif orientation == 'rotate_180':
+        lx, ly = width - 1 - px, height - 1 - py
+    elif orientation == 'rotate_270':
+        lx, ly = height - 1 - py, px
+    elif orientation == 'mirror_x':
+        lx, ly = width - 1 - px, py
+    elif orientation == 'mirror_y':
+        lx, ly = px, height - 1 - py
+    else:
+        lx, ly = px, py
+    return (ly * logical_width + lx).reshape(-1).astype(np.intp)
+
+
+def fit_slices(src_width, src_height, width, height):
+    """Return (canvas slices, frame slices) that center a src_width x src_height frame on a width x height canvas.
+
+    Each axis is cropped or padded equally on both sides, so
+    canvas[canvas_slices] = frame[frame_slices] places the overlap.
+    """
+    def axis(src, dst):
+        if src >= dst:
+            start = (src - dst) // 2
+            return slice(0, dst), slice(start, start + dst)
+        start = (dst - src) // 2
+        return slice(start, start + src), slice(0, src)
+
+    (canvas_y, frame_y), (canvas_x, frame_x) = axis(src_height, height), axis(src_width, width)
+    return (canvas_y, canvas_x), (frame_y, frame_x)
+
+
+def compose_order(physical_order, orientation, width, height):
+    """Fold an orientation into a compiled LED order.
+
+    physical_order[i] is the flat physical pixel lit by LED i; the result is
+    the flat logical pixel LED i must show.
+    """
+    return logical_pixel_map(orientation, width, height)[np.asarray(physical_order, dtype=np.intp)]
@@ -3,6 +3,10 @@ import math
 import random
 import numpy as np
 from led_controller_exact import LEDControllerExact
+from effect_kernels import (RainbowKernel, ColorWaveKernel, FireKernel, PlasmaKernel,
+                            NoiseKernel, blit_frame)
+from text_renderer import TextScroller
+from frame_cache import PeriodicFrames
 import config
 
 class DisplayPatterns:
@@ -20,15 +24,12 @@ class DisplayPatterns:
         self.running = True
         start_time = time.time()
         offset = 0
+        kernel = RainbowKernel()
+        # The rainbow repeats every kernel.period offsets, so each offset is rendered once
+        frames = PeriodicFrames('rainbow_wave', kernel.render, period=kernel.period, steps=kernel.period)
         
         while self.running and (duration is None or time.time() - start_time < duration):
-            for y in range(config.TOTAL_HEIGHT):
-                for x in range(config.TOTAL_WIDTH):
-                    # Create rainbow effect
-                    hue = (x + y + offset) / (config.TOTAL_WIDTH + config.TOTAL_HEIGHT) * 360
-                    color = self._hsv_to_rgb(hue, 1.0, 1.0)
-                    self.led.set_pixel(x, y, color)
-            
+            blit_frame(self.led, frames.frame_at(offset))
             self.led.show()
             offset += 5
             time.sleep(config.RAINBOW_SPEED)
@@ -38,16 +39,10 @@ class DisplayPatterns:
         self.running = True
         start_time = time.time()
         offset = 0
+        kernel = ColorWaveKernel(color)
         
         while self.running and (duration is None or time.time() - start_time < duration):
-            for y in range(config.TOTAL_HEIGHT):
-                for x in range(config.TOTAL_WIDTH):
-                    # Create wave effect
-                    wave = math.sin((x + offset) * 0.2) * 0.5 + 0.5
-                    brightness = int(wave * 255)
-                    wave_color = tuple(int(c * wave) for c in color)
-                    self.led.set_pixel(x, y, wave_color)
-            
+            blit_frame(self.led, kernel.render(offset))
             self.led.show()
             offset += 2
             time.sleep(config.WAVE_SPEED)
@@ -56,17 +51,17 @@ class DisplayPatterns:
         """Scroll text across the display."""
         self.running = True
         start_time = time.time()
-        text_width = len(text) * 6  # Approximate character width
-        x_offset = config.TOTAL_WIDTH
+        scroller = TextScroller(text, color, y=1)
+        frame = np.zeros((config.TOTAL_HEIGHT, config.TOTAL_WIDTH, 3), dtype=np.uint8)
+        offset = 0
         
         while self.running and (duration is None or time.time() - start_time < duration):
-            self.led.clear()
-            self.led.draw_text(text, x_offset, 1, color)
+            frame.fill(0)
+            scroller.blit(frame, offset)
+            blit_frame(self.led, frame)
             self.led.show()
             
-            x_offset -= 1
-            if x_offset < -text_width:
-                x_offset = config.TOTAL_WIDTH
+            offset = (offset + 1) % scroller.period
             
             time.sleep(config.SCROLL_SPEED)
     
@@ -105,40 +100,31 @@ class DisplayPatterns:
         """Create a fire effect."""
         self.running = True
         start_time = time.time()
-        fire_matrix = np.zeros((config.TOTAL_HEIGHT, config.TOTAL_WIDTH), dtype=np.uint8)
+        kernel = FireKernel()
         
         while self.running and (duration is None or time.time() - start_time < duration):
-            # Generate fire at bottom
-            for x in range(config.TOTAL_WIDTH):
-                fire_matrix[config.TOTAL_HEIGHT - 1, x] = random.randint(0, 255)
-            
-            # Propagate fire upward
-            for y in range(config.TOTAL_HEIGHT - 1):
-                for x in range(config.TOTAL_WIDTH):
-                    if fire_matrix[y + 1, x] > 0:
-                        # Spread fire
-                        spread = random.randint(-1, 1)
-                        new_x = max(0, min(config.TOTAL_WIDTH - 1, x + spread))
-                        fire_matrix[y, new_x] = max(0, fire_matrix[y + 1, x] - random.randint(0, 30))
-            
-            # Convert to colors
-            for y in range(config.TOTAL_HEIGHT):
-                for x in range(config.TOTAL_WIDTH):
-                    intensity = fire_matrix[y, x]
-                    if intensity > 200:
-                        color = (255, 255, 0)  # Yellow
-                    elif intensity > 100:
-                        color = (255, intensity, 0)  # Orange
-                    elif intensity > 0:
-                        color = (intensity, 0, 0)  # Red
-                    else:
-                        color = (0, 0, 0)  # Black
-                    
-                    self.led.set_pixel(x, y, color)
-            
+            blit_frame(self.led, kernel.render())
             self.led.show()
             time.sleep(0.05)
     
+    def plasma_effect(self, duration=None):
+        """Create a flowing plasma effect."""
+        self._run_timed_kernel(PlasmaKernel(), duration)
+    
+    def noise_effect(self, duration=None):
+        """Create a drifting smooth-noise effect."""
+        self._run_timed_kernel(NoiseKernel(), duration)
+    
+    def _run_timed_kernel(self, kernel, duration=None, frame_delay=1.0 / 60):
+        """Run a kernel whose render() takes elapsed time in seconds."""
+        self.running = True
+        start_time = time.time()
+        
+        while self.running and (duration is None or time.time() - start_time < duration):
+            blit_frame(self.led, kernel.render(time.time() - start_time))
+            self.led.show()
+            time.sleep(frame_delay)
+    
     def panel_sequence(self, colors, duration=None):
         """Light up panels in sequence with different colors."""
         self.running = True
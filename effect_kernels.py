@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Vectorized Effect Kernels
+Full-frame color effects computed with NumPy array operations and
+precomputed color lookup tables instead of per-pixel Python loops
+
+Every kernel renders a (height, width, 3) uint8 frame that can be pushed
+with LEDControllerExact.set_frame() (or blit_frame() for other controllers).
+"""
+
+import numpy as np
+import config
+
+
+def hsv_to_rgb_array(h, s=1.0, v=1.0):
+    """Vectorized HSV to RGB. h in degrees (any shape), returns uint8 array of shape h.shape + (3,).
+
+    Uses the same sector arithmetic as DisplayPatterns._hsv_to_rgb, so table
+    entries match the old per-pixel colors (within 1 from float rounding).
+    """
+    h = np.asarray(h, dtype=np.float64) / 360.0
+    i = np.floor(h * 6.0)
+    f = h * 6.0 - i
+    i = i.astype(np.int64) % 6
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    p = np.broadcast_to(p, h.shape)
+    vv = np.broadcast_to(v, h.shape)
+
+    r = np.choose(i, [vv, q, p, p, t, vv])
+    g = np.choose(i, [t, vv, vv, q, p, p])
+    b = np.choose(i, [p, p, t, vv, vv, q])
+    return (np.stack([r, g, b], axis=-1) * 255).astype(np.uint8)
+
+
+def hue_table(size=360):
+    """Return a (size, 3) uint8 table of fully saturated hues around the color wheel."""
+    return hsv_to_rgb_array(np.arange(size) * 360.0 / size)
+
+
+def fire_palette():
+    """Return the 256-entry heat -> color table used by the fire effect."""
+    heat = np.arange(256)
+    palette = np.zeros((256, 3), dtype=np.uint8)
+    palette[1:, 0] = heat[1:]                      # Red
+    palette[101:, 0] = 255                         # Orange
+    palette[101:, 1] = heat[101:]
+    palette[201:] = (255, 255, 0)                  # Yellow
+    return palette
+
+
+def gradient_palette(stops, size=256):
+    """Return a (size, 3) uint8 table interpolated between (position 0-1, (r, g, b)) stops."""
+    positions = np.array([p for p, _ in stops], dtype=np.float64)
+    colors = np.array([c for _, c in stops], dtype=np.float64)
+    x = np.linspace(0.0, 1.0, size)
+    table = np.stack([np.interp(x, positions, colors[:, c]) for c in range(3)], axis=-1)
+    return table.astype(np.uint8)
+
+
+def blit_frame(led, frame):
+    """Push a full frame to any LED controller, using its fast path when it has one."""
+    if hasattr(led, 'set_frame'):
+        led.set_frame(frame)
+        return
+    for y, row in enumerate(frame.tolist()):
+        for x, color in enumerate(row):
+            led.set_pixel(x, y, tuple(color))
+
+
+class EffectKernel:
+    """Base class for full-frame effect kernels."""
+
+    def __init__(self, width=None, height=None, seed=None):
+        """Initialize coordinate grids and the output frame."""
+        self.width = width or config.TOTAL_WIDTH
+        self.height = height or config.TOTAL_HEIGHT
+        self.rng = np.random.default_rng(seed)
+        self.ys, self.xs = np.mgrid[0:self.height, 0:self.width]
+        self.frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+    def render(self, t):
+        """Render the frame for step/time t and return it."""
+        raise NotImplementedError
+
+
+class RainbowKernel(EffectKernel):
+    """Diagonal rainbow: hue depends on x + y + offset."""
+
+    def __init__(self, width=None, height=None, seed=None):
+        super().__init__(width, height, seed)
+        # One full hue cycle spans width + height steps, so the table has exactly that many entries
+        self.period = self.width + self.height
+        self.table = hsv_to_rgb_array(np.arange(self.period) * 360.0 / self.period)
+        self.base = (self.xs + self.ys) % self.period
+
+    def render(self, t):
+        """t is the integer offset along the diagonal."""
+        np.take(self.table, (self.base + int(t)) % self.period, axis=0, out=self.frame)
+        return self.frame
+
+
+class ColorWaveKernel(EffectKernel):
+    """Horizontal sine wave modulating a single color."""
+
+    def __init__(self, color, width=None, height=None, seed=None):
+        super().__init__(width, height, seed)
+        self.color = np.array(color, dtype=np.float64)
+        self.columns = np.arange(self.width)
+
+    def render(self, t):
+        """t is the integer column offset of the wave."""
+        wave = np.sin((self.columns + t) * 0.2) * 0.5 + 0.5
+        row = (wave[:, None] * self.color).astype(np.uint8)
+        self.frame[:] = row[None, :, :]
+        return self.frame
+
+
+class FireKernel(EffectKernel):
+    """Heat field seeded at the bottom row and propagated upward one row per frame."""
+
+    def __init__(self, width=None, height=None, seed=None, cooling=30):
+        super().__init__(width, height, seed)
+        self.cooling = cooling
+        self.heat = np.zeros((self.height, self.width), dtype=np.int16)
+        self.palette = fire_palette()
+        self.dst_rows = self.ys[:-1]
+
+    def render(self, t=None):
+        heat = self.heat
+        heat[-1] = self.rng.integers(0, 256, self.width)
+
+        # Every cell with heat moves up one row, drifts -1/0/+1 column and cools
+        source = heat[1:].copy()
+        spread = self.rng.integers(-1, 2, source.shape)
+        cooled = source - self.rng.integers(0, self.cooling + 1, source.shape)
+        dst_x = np.clip(self.xs[1:] + spread, 0, self.width - 1)
+
+        hot = source > 0
+        heat[self.dst_rows[hot], dst_x[hot]] = np.maximum(cooled[hot], 0)
+
+        np.take(self.palette, heat, axis=0, out=self.frame)
+        return self.frame
+
+
+class PlasmaKernel(EffectKernel):
+    """Classic sum-of-sines plasma mapped through a hue table."""
+
+    def __init__(self, width=None, height=None, seed=None, scale=0.25, palette=None):
+        super().__init__(width, height, seed)
+        self.palette = hue_table(256) if palette is None else palette
+        self.fx = self.xs * scale
+        self.fy = self.ys * scale
+        cx, cy = self.width / 2.0, self.height / 2.0
+        self.radius = np.sqrt((self.xs - cx) ** 2 + (self.ys - cy) ** 2) * scale
+
+    def render(self, t):
+        """t is time in seconds."""
+        value = (np.sin(self.fx + t)
+                 + np.sin(self.fy * 0.5 + t * 1.3)
+                 + np.sin((self.fx + self.fy) * 0.5 + t * 0.7)
+                 + np.sin(self.radius - t * 2.0))
+        index = ((value + 4.0) * (len(self.palette) / 8.0)).astype(np.intp) % len(self.palette)
+        np.take(self.palette, index, axis=0, out=self.frame)
+        return self.frame
+
+
+class NoiseKernel(EffectKernel):
+    """Smooth animated value noise: a coarse random lattice, bilinearly upsampled and scrolled."""
+
+    def __init__(self, width=None, height=None, seed=None, cell=8, palette=None):
+        super().__init__(width, height, seed)
+        self.cell = cell
+        if palette is None:
+            palette = gradient_palette([(0.0, (0, 0, 40)), (0.5, (0, 120, 160)), (1.0, (180, 255, 255))])
+        self.palette = palette
+
+        # Lattice wraps around so the field can scroll forever
+        self.lattice_w = self.width // cell + 1
+        self.lattice_h = self.height // cell + 1
+        self.lattice = self.rng.random((2, self.lattice_h, self.lattice_w))
+        self.fx = self.xs / cell
+        self.fy = self.ys / cell
+
+    def _sample(self, layer, shift_x, shift_y):
+        fx = self.fx + shift_x
+        fy = self.fy + shift_y
+        x0 = np.floor(fx)
+        y0 = np.floor(fy)
+        # Smoothstep weights
+        wx = fx - x0
+        wy = fy - y0
+        wx = wx * wx * (3 - 2 * wx)
+        wy = wy * wy * (3 - 2 * wy)
+
+        x0 = x0.astype(np.intp) % self.lattice_w
+        y0 = y0.astype(np.intp) % self.lattice_h
+        x1 = (x0 + 1) % self.lattice_w
+        y1 = (y0 + 1) % self.lattice_h
+        top = layer[y0, x0] + (layer[y0, x1] - layer[y0, x0]) * wx
+        bottom = layer[y1, x0] + (layer[y1, x1] - layer[y1, x0]) * wx
+        return top + (bottom - top) * wy
+
+    def render(self, t):
+        """t is time in seconds; the two noise layers drift in different directions."""
+        a = self._sample(self.lattice[0], t * 0.5, 0.0)
+        b = self._sample(self.lattice[1], 0.0, t * 0.3)
+        blend = (np.sin(t * 0.4) + 1.0) * 0.5
+        value = a * blend + b * (1.0 - blend)
+        index = np.clip(value * (len(self.palette) - 1), 0, len(self.palette) - 1).astype(np.intp)
+        np.take(self.palette, index, axis=0, out=self.frame)
+        return self.frame
@@ -5,8 +5,9 @@ Simple fire effect that looks great
 """
 
 import time
-import random
+import numpy as np
 from .base_animation import BaseAnimation
+from effect_kernels import blit_frame
 import config
 
 class FireAnimation(BaseAnimation):
@@ -29,39 +30,28 @@ class FireAnimation(BaseAnimation):
         self.fire_intensity = 0.8
         self.spark_chance = 0.1
         
+        # Color per intensity band (black, ember, cool, warm, hot) and the band thresholds
+        self.palette = np.array([(0, 0, 0), self.colors['ember'], self.colors['cool'],
+                                 self.colors['warm'], self.colors['hot']], dtype=np.uint8)
+        self.thresholds = np.array([0.2, 0.4, 0.6, 0.8])
+        
+        # Fire intensity decreases with height
+        rows = np.arange(self.height, dtype=np.float64)[:, None]
+        self.base_intensity = np.repeat(self.fire_intensity * (1 - rows / self.height), self.width, axis=1)
+        self.rng = np.random.default_rng()
+        
     def create_fire_frame(self):
         """Create a fire frame."""
-        # Clear the display
-        self.led.clear()
+        # Add randomness
+        total_intensity = self.base_intensity + self.rng.random(self.base_intensity.shape) * 0.3
+        
+        # Choose color based on intensity
+        frame = self.palette[np.searchsorted(self.thresholds, total_intensity, side='left')]
+        
+        # Add sparks occasionally
+        frame[self.rng.random(total_intensity.shape) < self.spark_chance] = self.colors['spark']
         
-        # Create fire from bottom to top
-        for y in range(self.height):
-            for x in range(self.width):
-                # Fire intensity decreases with height
-                height_factor = y / self.height
-                intensity = self.fire_intensity * (1 - height_factor)
-                
-                # Add randomness
-                noise = random.random() * 0.3
-                total_intensity = intensity + noise
-                
-                # Choose color based on intensity
-                if total_intensity > 0.8:
-                    color = self.colors['hot']
-                elif total_intensity > 0.6:
-                    color = self.colors['warm']
-                elif total_intensity > 0.4:
-                    color = self.colors['cool']
-                elif total_intensity > 0.2:
-                    color = self.colors['ember']
-                else:
-                    color = (0, 0, 0)  # Black
-                
-                # Add sparks occasionally
-                if random.random() < self.spark_chance:
-                    color = self.colors['spark']
-                
-                self.led.set_pixel(x, y, color)
+        blit_frame(self.led, frame)
     
     def run(self, duration=30):
         """Run the fire animation."""
@@ -5,10 +5,13 @@ Simple, reliable rainbow effect that looks great
 """
 
 import time
-import math
+import numpy as np
 from .base_animation import BaseAnimation
+from effect_kernels import hue_table, blit_frame
 import config
 
+HUE_STEPS = 3600  # Hue table entries (0.1 degree each, finer than 8-bit color can show)
+
 class RainbowAnimation(BaseAnimation):
     def __init__(self, led_controller):
         """Initialize the rainbow animation."""
@@ -20,40 +23,16 @@ class RainbowAnimation(BaseAnimation):
         self.hue_offset = 0
         self.speed = 0.02
         
-    def hsv_to_rgb(self, h, s, v):
-        """Convert HSV to RGB."""
-        h = h % 360
-        c = v * s
-        x = c * (1 - abs((h / 60) % 2 - 1))
-        m = v - c
-        
-        if 0 <= h < 60:
-            r, g, b = c, x, 0
-        elif 60 <= h < 120:
-            r, g, b = x, c, 0
-        elif 120 <= h < 180:
-            r, g, b = 0, c, x
-        elif 180 <= h < 240:
-            r, g, b = 0, x, c
-        elif 240 <= h < 300:
-            r, g, b = x, 0, c
-        else:
-            r, g, b = c, 0, x
+        # Precomputed hue table and per-pixel base hue, in table steps
+        self.hues = hue_table(HUE_STEPS)
+        ys, xs = np.mgrid[0:self.height, 0:self.width]
+        self.base_hue = (xs * 10 + ys * 5) * (HUE_STEPS // 360)
         
-        return (int((r + m) * 255), int((g + m) * 255), int((b + m) * 255))
-    
     def create_rainbow_frame(self):
         """Create a rainbow frame."""
-        # Clear the display
-        self.led.clear()
-        
-        # Create rainbow pattern
-        for y in range(self.height):
-            for x in range(self.width):
-                # Calculate hue based on position and time
-                hue = (x * 10 + y * 5 + self.hue_offset) % 360
-                color = self.hsv_to_rgb(hue, 1.0, 1.0)
-                self.led.set_pixel(x, y, color)
+        # Hue from position and time; the offset moves 0.02 degrees a frame, so it is rounded, not truncated
+        hue = (self.base_hue + round(self.hue_offset * HUE_STEPS / 360)) % HUE_STEPS
+        blit_frame(self.led, self.hues[hue])
     
     def run(self, duration=30):
         """Run the rainbow animation."""
@@ -17,7 +17,7 @@ import math
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from button_controller import ButtonController
-from led_controller import LEDController
+from led_controller_exact import LEDControllerExact as LEDController
 import config
 
 class FinalLEDController:
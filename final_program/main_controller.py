@@ -16,7 +16,7 @@ import random
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from button_controller import ButtonController
-from led_controller import LEDController
+from led_controller_exact import LEDControllerExact as LEDController
 import config
 
 # Import theme animations
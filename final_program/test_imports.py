@@ -20,11 +20,11 @@ except Exception as e:
     print(f"❌ button_controller import failed: {e}")
 
 try:
-    print("Testing led_controller import...")
-    from led_controller import LEDController
-    print("✅ led_controller imported successfully")
+    print("Testing led_controller_exact import...")
+    from led_controller_exact import LEDControllerExact
+    print("✅ led_controller_exact imported successfully")
 except Exception as e:
-    print(f"❌ led_controller import failed: {e}")
+    print(f"❌ led_controller_exact import failed: {e}")
 
 try:
     print("Testing config import...")
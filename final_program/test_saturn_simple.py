@@ -10,7 +10,7 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from led_controller import LEDController
+from led_controller_exact import LEDControllerExact as LEDController
 from themes.shapes.saturn_animation import SaturnAnimation
 
 def main():
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Periodic Frame Cache
+Memoizes rendered frames of looping animations so each distinct frame is
+rendered once and replayed from RAM on later loops
+
+Frames are keyed by (animation id, parameters, quantized phase) and kept in
+an LRU cache limited to config.FRAME_CACHE_BUDGET_MB. Animations declare
+their period with PeriodicFrames, or key frames directly with
+FrameCache.get_or_render().
+
+Benchmark the cache on the whale animation:
+    python frame_cache.py
+"""
+
+import time
+from collections import OrderedDict
+import numpy as np
+import config
+
+
+def quantize_phase(t, period, steps):
+    """Map time t onto one of `steps` phase slots of a cycle `period` long."""
+    return int((t % period) / period * steps) % steps
+
+
+class FrameCache:
+    """LRU cache of rendered frames with a memory budget."""
+
+    def __init__(self, budget_bytes=None):
+        """Initialize an empty cache with the given budget (default from config)."""
+        if budget_bytes is None:
+            budget_bytes = int(config.FRAME_CACHE_BUDGET_MB * 1024 * 1024)
+        self.budget_bytes = budget_bytes
+        self.frames = OrderedDict()  # key -> read-only frame array
+        self.cache_bytes = 0
+
+        # Statistics (per animation id: [hits, misses])
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.by_animation = {}
+
+    def _count(self, key, hit):
+        counts = self.by_animation.setdefault(key[0], [0, 0])
+        if hit:
+            self.hits += 1
+            counts[0] += 1
+        else:
+            self.misses += 1
+            counts[1] += 1
+
+    def get(self, key):
+        """Return the cached frame for key, or None."""
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.frames.move_to_end(key)
+        return frame
+
+    def put(self, key, frame):
+        """Store a copy of frame under key and return the read-only cached copy."""
+        frame = np.array(frame, dtype=np.uint8)
+        frame.setflags(write=False)
+        if frame.nbytes > self.budget_bytes:
+            return frame  # Too big to keep
+
+        old = self.frames.pop(key, None)
+        if old is not None:
+            self.cache_bytes -= old.nbytes
+        while self.frames and self.cache_bytes + frame.nbytes > self.budget_bytes:
+            _, evicted = self.frames.popitem(last=False)
+            self.cache_bytes -= evicted.nbytes
+            self.evictions += 1
+
+        self.frames[key] = frame
+        self.cache_bytes += frame.nbytes
+        return frame
+
+    def get_or_render(self, key, render):
+        """Return the cached frame for key, calling render() to create it on a miss.
+
+        key is a tuple whose first item is the animation id. The returned
+        frame is read-only and shared; copy it before drawing on it.
+        """
+        frame = self.get(key)
+        self._count(key, frame is not None)
+        if frame is None:
+            frame = self.put(key, render())
+        return frame
+
+    def invalidate(self, animation_id):
+        """Drop every cached frame of one animation."""
+        for key in [k for k in self.frames if k[0] == animation_id]:
+            self.cache_bytes -= self.frames.pop(key).nbytes
+
+    def clear(self):
+        """Drop all cached frames."""
+        self.frames.clear()
+        self.cache_bytes = 0
+
+    def get_stats(self):
+        """Return hit rate and memory statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'frames': len(self.frames),
+            'cache_bytes': self.cache_bytes,
+            'budget_bytes': self.budget_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'by_animation': {name: {'hits': h, 'misses': m} for name, (h, m) in self.by_animation.items()},
+        }
+
+    def print_stats(self):
+        """Print cache statistics."""
+        stats = self.get_stats()
+        print(f"🗄️ Frame cache: {stats['frames']} frames, "
+              f"{stats['cache_bytes'] / 1024:.0f}/{stats['budget_bytes'] / 1024:.0f} KB, "
+              f"hit rate {stats['hit_rate']:.0%} ({stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['evictions']} evictions)")
+        for name, counts in sorted(stats['by_animation'].items()):
+            total = counts['hits'] + counts['misses']
+            print(f"   {name}: {counts['hits']}/{total} hits")
+
+
+class PeriodicFrames:
+    """Declares the period of a looping animation and serves its frames from the cache.
+
+    render(phase_time) draws the frame at phase_time seconds into the cycle;
+    the cycle is sampled at `steps` evenly spaced phases, so at most `steps`
+    frames per parameter set are ever rendered.
+    """
+
+    def __init__(self, animation_id, render, period, steps, params=(), cache=None):
+        """Initialize for one animation and parameter set."""
+        self.animation_id = animation_id
+        self.render = render
+        self.period = period
+        self.steps = steps
+        self.params = tuple(params)
+        self.cache = cache or get_frame_cache()
+
+    def frame_for(self, phase_index):
+        """Return the frame for a phase slot (0 <= phase_index < steps)."""
+        phase_index %= self.steps
+        key = (self.animation_id, self.params, phase_index)
+        return self.cache.get_or_render(key, lambda: self.render(phase_index * self.period / self.steps))
+
+    def frame_at(self, t):
+        """Return the frame for time t, snapped to the nearest lower phase slot."""
+        return self.frame_for(quantize_phase(t, self.period, self.steps))
+
+
+_shared_cache = None
+
+
+def get_frame_cache():
+    """Return the frame cache shared by all animations in this process."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = FrameCache()
+    return _shared_cache
+
+
+def main():
+    """Benchmark the cache by grading the whale animation's three loops."""
+    from wale_animation import WhaleAnimation
+
+    whale = WhaleAnimation()
+    sequence = list(range(len(whale.frames))) * 3
+    cache = FrameCache()
+
+    start = time.perf_counter()
+    for index in sequence:
+        whale.render_graded_frame(index)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for index in sequence:
+        cache.get_or_render(('whale', index), lambda: whale.render_graded_frame(index))
+    cached = time.perf_counter() - start
+
+    print(f"Whale, {len(sequence)} frames: {uncached * 1000:.1f} ms uncached, {cached * 1000:.1f} ms cached "
+          f"({uncached / cached:.1f}x)")
+    cache.print_stats()
+    whale.cleanup()
+
+
+if __name__ == "__main__":
+    main()
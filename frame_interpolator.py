@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Temporal Frame Interpolation
+Lets heavy scenes render keyframes at a low rate while the display is fed
+smooth in-between frames at the output rate:
+
+- crossfade() blends two frames (used between sprite-sheet frames)
+- FrameInterpolator plays keyframes with blended in-betweens
+- Sprite / draw_sprite() render a translating sprite at sub-pixel offsets
+"""
+
+import time
+import numpy as np
+import config
+from effect_kernels import blit_frame
+
+
+def crossfade(frame_a, frame_b, alpha, out=None):
+    """Blend two uint8 frames: alpha=0 gives frame_a, alpha=1 gives frame_b."""
+    weight = int(round(max(0.0, min(1.0, alpha)) * 256))
+    a = frame_a.astype(np.uint16)
+    blended = (a * (256 - weight) + frame_b.astype(np.uint16) * weight) >> 8
+    if out is None:
+        return blended.astype(np.uint8)
+    np.copyto(out, blended, casting='unsafe')
+    return out
+
+
+class FrameInterpolator:
+    """Plays keyframes on an LED controller with interpolated in-between frames."""
+
+    def __init__(self, led, output_fps=None):
+        """Initialize for an LED controller and output frame rate."""
+        self.led = led
+        self.output_fps = output_fps or config.DEFAULT_FPS
+        self.frame = np.zeros((config.TOTAL_HEIGHT, config.TOTAL_WIDTH, 3), dtype=np.uint8)
+
+        # Statistics
+        self.keyframes_rendered = 0
+        self.frames_shown = 0
+
+    def _show(self, frame):
+        blit_frame(self.led, frame)
+        self.led.show()
+        self.frames_shown += 1
+
+    def _wait_until(self, deadline):
+        delay = deadline - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def play_sequence(self, get_frame, sequence, frame_duration, should_stop=None, blend_fraction=0.5):
+        """Show sprite-sheet frames, cross-blending into each next frame.
+
+        get_frame: function(index) -> (height, width, 3) uint8 frame
+        sequence: list of frame indexes to show, each for frame_duration seconds
+        blend_fraction: part of each frame's hold spent fading into the next one
+            (0 = hard cuts, 1 = continuously blending)
+        Returns False if should_stop() ended playback early.
+        """
+        if not sequence:
+            return True
+        frame_interval = 1.0 / self.output_fps
+        hold = frame_duration * (1.0 - blend_fraction)
+        start_time = time.time()
+
+        current = get_frame(sequence[0])
+        self.keyframes_rendered += 1
+        for position, index in enumerate(sequence):
+            next_frame = None
+            if position + 1 < len(sequence):
+                next_frame = get_frame(sequence[position + 1])
+                self.keyframes_rendered += 1
+
+            frame_start = start_time + position * frame_duration
+            frame_end = frame_start + frame_duration
+            while True:
+                if should_stop and should_stop():
+                    return False
+                now = time.time()
+                if now >= frame_end:
+                    break
+
+                elapsed = now - frame_start
+                if next_frame is None or elapsed < hold or blend_fraction <= 0:
+                    self._show(current)
+                else:
+                    alpha = (elapsed - hold) / (frame_duration - hold)
+                    self._show(crossfade(current, next_frame, alpha, out=self.frame))
+
+                self._wait_until(min(now + frame_interval, frame_end))
+
+            current = next_frame
+        return True
+
+    def run(self, render_keyframe, keyframe_fps, duration, should_stop=None):
+        """Render keyframes at keyframe_fps and display blended in-betweens at the output rate.
+
+        render_keyframe: function(t) -> frame for scene time t (seconds). The
+        returned array may be reused by the caller; it is copied here.
+        The display runs one keyframe behind the renderer so every in-between
+        frame has both of its neighbours. Returns False if stopped early.
+        """
+        keyframe_interval = 1.0 / keyframe_fps
+        frame_interval = 1.0 / self.output_fps
+
+        previous = np.array(render_keyframe(0.0), dtype=np.uint8)
+        upcoming = np.array(render_keyframe(keyframe_interval), dtype=np.uint8)
+        self.keyframes_rendered += 2
+        key_index = 0
+        start_time = time.time()
+
+        while True:
+            if should_stop and should_stop():
+                return False
+            now = time.time()
+            elapsed = now - start_time
+            if elapsed >= duration:
+                return True
+
+            # Advance to the keyframe pair that brackets the current time
+            while elapsed >= (key_index + 1) * keyframe_interval:
+                key_index += 1
+                previous = upcoming
+                upcoming = np.array(render_keyframe((key_index + 1) * keyframe_interval), dtype=np.uint8)
+                self.keyframes_rendered += 1
+
+            alpha = (elapsed - key_index * keyframe_interval) / keyframe_interval
+            self._show(crossfade(previous, upcoming, alpha, out=self.frame))
+            self._wait_until(now + frame_interval)
+
+
+class Sprite:
+    """An RGB sprite with per-pixel alpha that can be drawn at fractional positions."""
+
+    def __init__(self, rgb, alpha):
+        """rgb: (h, w, 3) colors, alpha: (h, w) coverage in 0-1."""
+        self.alpha = np.asarray(alpha, dtype=np.float32)
+        # Premultiplied colors so edge pixels blend correctly when splatted
+        self.premultiplied = np.asarray(rgb, dtype=np.float32) * self.alpha[:, :, None]
+        self.height, self.width = self.alpha.shape
+
+    @classmethod
+    def from_mask(cls, mask, color):
+        """Create a single-color sprite from a 2D mask (truthy = sprite pixel)."""
+        mask = np.asarray(mask, dtype=bool)
+        rgb = np.empty(mask.shape + (3,), dtype=np.float32)
+        rgb[:] = color
+        return cls(rgb, mask)
+
+
+def draw_sprite(frame, sprite, x, y, clip_rows=None):
+    """Composite a sprite into frame with its top-left corner at fractional (x, y).
+
+    The sprite is splatted onto the four nearest whole-pixel positions with
+    bilinear weights, so motion of less than a pixel per frame still shows.
+    clip_rows limits drawing to frame rows < clip_rows (e.g. the ground line).
+    """
+    frame_h, frame_w = frame.shape[:2]
+    x0, y0 = int(np.floor(x)), int(np.floor(y))
+    fx, fy = x - x0, y - y0
+
+    # Splat onto a canvas one pixel larger than the sprite in each direction
+    h, w = sprite.height, sprite.width
+    color = np.zeros((h + 1, w + 1, 3), dtype=np.float32)
+    coverage = np.zeros((h + 1, w + 1), dtype=np.float32)
+    for dy, wy in ((0, 1.0 - fy), (1, fy)):
+        for dx, wx in ((0, 1.0 - fx), (1, fx)):
+            weight = wx * wy
+            if weight <= 0.0:
+                continue
+            color[dy:dy + h, dx:dx + w] += sprite.premultiplied * weight
+            coverage[dy:dy + h, dx:dx + w] += sprite.alpha * weight
+
+    # Clip the canvas to the frame
+    bottom = frame_h if clip_rows is None else min(frame_h, clip_rows)
+    left, top = max(x0, 0), max(y0, 0)
+    right, lower = min(x0 + w + 1, frame_w), min(y0 + h + 1, bottom)
+    if left >= right or top >= lower:
+        return frame
+
+    color = color[top - y0:lower - y0, left - x0:right - x0]
+    coverage = coverage[top - y0:lower - y0, left - x0:right - x0, None]
+    target = frame[top:lower, left:right]
+    target[:] = np.clip(target * (1.0 - coverage) + color, 0, 255).astype(np.uint8)
+    return frame
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Live Frame Tap
+Publishes every frame pushed to the LEDs into a named shared-memory ring
+buffer, so other processes can watch the board without touching the render
+loop
+
+The writer (the 'tap' output backend, added automatically when
+config.FRAME_TAP_ENABLED is True) costs one 4.6 KB memcpy per frame and
+never waits for readers. Each slot carries its sequence number, which is
+cleared while the slot is being written; readers check it before and after
+copying and simply skip a frame that was overwritten under them.
+
+Only one process publishes a tap at a time: another process with the tap
+enabled (e.g. scene_player.py while main.py runs) leaves the running
+writer's block alone and publishes nothing.
+
+Example consumers:
+    python frame_tap.py web [port]          # live preview at http://localhost:8080/ (config.FRAME_TAP_WEB_HOST)
+    python frame_tap.py gif out.gif [secs]  # record an animated GIF (needs Pillow)
+    python frame_tap.py stats               # frame rate, drops and brightness each second
+"""
+
+import os
+import sys
+import time
+import atexit
+import json
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+import config
+from output_backends import OutputBackend
+
+MAGIC = 0x4C454454  # 'LEDT'
+VERSION = 2
+HEADER_FIELDS = 9  # magic, version, led_count, width, height, slots, seq, layout_version, writer pid
+
+
+class _TapLayout:
+    """NumPy views onto the tap's shared memory block."""
+
+    def __init__(self, buf, led_count, slots):
+        offset = 0
+        self.header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += HEADER_FIELDS * 8
+        self.frame_order = np.ndarray((led_count,), dtype=np.int32, buffer=buf, offset=offset)
+        offset += (led_count * 4 + 7) // 8 * 8
+        self.slot_seq = np.ndarray((slots,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += slots * 8
+        self.slot_time = np.ndarray((slots,), dtype=np.float64, buffer=buf, offset=offset)
+        offset += slots * 8
+        self.frames = np.ndarray((slots, led_count, 3), dtype=np.uint8, buffer=buf, offset=offset)
+        self.size = offset + slots * led_count * 3
+
+    @staticmethod
+    def size_for(led_count, slots):
+        return HEADER_FIELDS * 8 + (led_count * 4 + 7) // 8 * 8 + slots * 16 + slots * led_count * 3
+
+
+def _process_alive(pid):
+    """Return True if process pid is running (always assumed on Windows, where blocks vanish with their writer)."""
+    if os.name == 'nt':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Running as another user
+    return True
+
+
+def _live_writer(shm):
+    """Return the PID of the running process that publishes shm, or None if the block is stale."""
+    if shm.size < HEADER_FIELDS * 8:
+        return None
+    header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+    magic, version, pid = int(header[0]), int(header[1]), int(header[8])
+    del header  # Release the view so the block can be closed
+    if magic != MAGIC or version != VERSION or pid <= 0:
+        return None
+    return pid if _process_alive(pid) else None
+
+
+class FrameTap:
+    """Writer side of the tap: a ring of the last config.FRAME_TAP_SLOTS pushed frames."""
+
+    def __init__(self, name=None, led_count=None, width=None, height=None, slots=None):
+        """Create (or take over a stale copy of) the named shared memory block.
+
+        Raises FileExistsError if a running process already publishes it.
+        """
+        self.name = name or config.FRAME_TAP_NAME
+        led_count = led_count or config.TOTAL_LEDS
+        slots = slots or config.FRAME_TAP_SLOTS
+        size = _TapLayout.size_for(led_count, slots)
+
+        try:
+            self.shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        except FileExistsError:
+            existing = shared_memory.SharedMemory(name=self.name)
+            writer = _live_writer(existing)
+            if writer is not None:
+                existing.close()
+                resource_tracker.unregister(existing._name, 'shared_memory')  # Not ours to unlink
+                raise FileExistsError(f"Frame tap '{self.name}' is already published by process {writer}")
+            # Left over from a previous run that did not shut down cleanly
+            existing.close()
+            existing.unlink()
+            self.shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+
+        self.views = _TapLayout(self.shm.buf, led_count, slots)
+        self.views.slot_seq[:] = 0
+        self.views.frame_order[:] = np.arange(led_count)
+        self.views.header[:] = (MAGIC, VERSION, led_count, width or config.TOTAL_WIDTH,
+                                height or config.TOTAL_HEIGHT, slots, 0, 0, os.getpid())
+        self.slots = slots
+        self.seq = 0
+        print(f"📺 Frame tap publishing to shared memory '{self.name}'")
+
+    def set_layout(self, frame_order):
+        """Publish the LED order readers need to rebuild display frames."""
+        self.views.frame_order[:] = frame_order
+        self.views.header[7] += 1
+
+    def publish(self, pixels):
+        """Copy one strip-order frame into the next slot."""
+        seq = self.seq + 1
+        slot = seq % self.slots
+        views = self.views
+        views.slot_seq[slot] = 0  # Mark the slot as being written
+        views.frames[slot] = pixels
+        views.slot_time[slot] = time.time()
+        views.slot_seq[slot] = seq
+        views.header[6] = seq
+        self.seq = seq
+
+    def close(self):
+        self.views = None
+        self.shm.close()
+        self.shm.unlink()
+
+
+_shared_tap = None
+
+
+def get_frame_tap():
+    """Return the frame tap shared by every LED controller in this process."""
+    global _shared_tap
+    if _shared_tap is None:
+        _shared_tap = FrameTap()
+        atexit.register(_shared_tap.close)
+    return _shared_tap
+
+
+class FrameTapBackend(OutputBackend):
+    """Output backend that publishes frames into the process's frame tap."""
+
+    name = 'tap'
+
+    def __init__(self, led_count=None, width=None, height=None):
+        super().__init__(led_count, width, height)
+        self.tap = get_frame_tap()
+
+    def set_layout(self, frame_order):
+        super().set_layout(frame_order)
+        self.tap.set_layout(frame_order)
+
+    def write(self, pixels):
+        self.tap.publish(pixels)
+        self.frames_written += 1
+
+
+class FrameTapReader:
+    """Reader side of the tap: attaches to the shared memory without ever blocking the writer."""
+
+    def __init__(self, name=None):
+        """Attach to a running tap. Raises FileNotFoundError if nothing is publishing."""
+        self.shm = shared_memory.SharedMemory(name=name or config.FRAME_TAP_NAME)
+        # Attaching registers the block for cleanup at exit; only the writer should unlink it
+        if _shared_tap is None or _shared_tap.name != self.shm.name.lstrip('/'):
+            resource_tracker.unregister(self.shm._name, 'shared_memory')
+
+        header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=self.shm.buf)
+        if header[0] != MAGIC or header[1] != VERSION:
+            raise ValueError("Shared memory block is not a compatible frame tap")
+        self.led_count, self.width, self.height, self.slots = (int(v) for v in header[2:6])
+        self.views = _TapLayout(self.shm.buf, self.led_count, self.slots)
+        self.layout_version = None
+        self.frame_order = None
+
+    @property
+    def seq(self):
+        """Sequence number of the newest published frame."""
+        return int(self.views.header[6])
+
+    def _frame_from(self, pixels):
+        layout_version = int(self.views.header[7])
+        if layout_version != self.layout_version:
+            self.frame_order = self.views.frame_order.astype(np.intp)
+            self.layout_version = layout_version
+        frame = np.zeros((self.height * self.width, 3), dtype=np.uint8)
+        frame[self.frame_order] = pixels
+        return frame.reshape(self.height, self.width, 3)
+
+    def read(self, seq):
+        """Return (timestamp, display frame) for frame seq, or None if it is gone or being written."""
+        slot = seq % self.slots
+        views = self.views
+        if views.slot_seq[slot] != seq:
+            return None
+        pixels = views.frames[slot].copy()
+        timestamp = float(views.slot_time[slot])
+        if views.slot_seq[slot] != seq:
+            return None  # Overwritten while copying
+        return timestamp, self._frame_from(pixels)
+
+    def read_latest(self):
+        """Return (seq, timestamp, frame) for the newest frame, or None."""
+        seq = self.seq
+        if seq == 0:
+            return None
+        result = self.read(seq)
+        return None if result is None else (seq,) + result
+
+    def frames(self, poll_interval=0.005, until=None):
+        """Yield (seq, timestamp, frame) for every frame still available, following the writer.
+
+        Stops once time.time() passes `until`, if given.
+        """
+        last = self.seq
+        while until is None or time.time() < until:
+            newest = self.seq
+            if newest < last:
+                last = newest  # Writer restarted
+            # If the reader fell more than a ring behind, skip ahead
+            for seq in range(max(last + 1, newest - self.slots + 1), newest + 1):
+                result = self.read(seq)
+                if result is not None:
+                    yield (seq,) + result
+            last = newest
+            time.sleep(poll_interval)
+
+    def close(self):
+        self.views = None
+        self.shm.close()
+
+
+WEB_PAGE = """<!DOCTYPE html>
+<html><head><title>LED Board</title>
+<style>body{background:#111;color:#aaa;font-family:sans-serif;text-align:center}
+canvas{image-rendering:pixelated;width:320px;height:480px;margin-top:20px}</style></head>
+<body><canvas id="c" width="%(width)d" height="%(height)d"></canvas><div id="s"></div>
+<script>
+const c = document.getElementById('c').getContext('2d');
+const img = c.createImageData(%(width)d, %(height)d);
+async function tick() {
+  try {
+    const r = await fetch('/frame');
+    const rgb = new Uint8Array(await r.arrayBuffer());
+    for (let i = 0, j = 0; i < rgb.length; i += 3, j += 4) {
+      img.data[j] = rgb[i]; img.data[j + 1] = rgb[i + 1]; img.data[j + 2] = rgb[i + 2]; img.data[j + 3] = 255;
+    }
+    c.putImageData(img, 0, 0);
+    document.getElementById('s').textContent = 'frame ' + r.headers.get('X-Frame-Seq');
+  } catch (e) {}
+  setTimeout(tick, 50);
+}
+tick();
+</script></body></html>
+"""
+
+
+def serve_web_preview(port=8080, host=None):
+    """Serve a live preview page that polls the newest frame as raw RGB on host (default config.FRAME_TAP_WEB_HOST)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    reader = FrameTapReader()
+    page = (WEB_PAGE % {'width': reader.width, 'height': reader.height}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/frame':
+                latest = reader.read_latest()
+                seq, frame = (latest[0], latest[2]) if latest else (0, np.zeros((reader.height, reader.width, 3), np.uint8))
+                body, content_type = frame.tobytes(), 'application/octet-stream'
+                extra = {'X-Frame-Seq': str(seq)}
+            elif self.path == '/':
+                body, content_type, extra = page, 'text/html', {}
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Cache-Control', 'no-store')
+            for key, value in extra.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    host = host or config.FRAME_TAP_WEB_HOST
+    print(f"🌐 Live preview at http://{host}:{port}/")
+    ThreadingHTTPServer((host, port), Handler).serve_forever()
+
+
+def record_gif(path, seconds=10.0, scale=8):
+    """Record the tap into an animated GIF with the frames' real timing."""
+    from PIL import Image
+
+    reader = FrameTapReader()
+    frames, times = [], []
+    print(f"⏺️ Recording {seconds:.0f} s to {path}...")
+    for seq, timestamp, frame in reader.frames(until=time.time() + seconds):
+        frames.append(Image.fromarray(frame).resize((reader.width * scale, reader.height * scale), Image.NEAREST))
+        times.append(timestamp)
+    if not frames:
+        print("No frames received")
+        return
+    durations = [max(20, int((b - a) * 1000)) for a, b in zip(times, times[1:])] + [100]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=durations, loop=0)
+    print(f"✅ Saved {len(frames)} frames to {path}")
+
+
+def print_frame_stats():
+    """Print frame rate, dropped frames and brightness once per second."""
+    reader = FrameTapReader()
+    window_start, count, missed, last_seq = time.time(), 0, 0, None
+    brightness, lit = 0.0, 0
+    for seq, timestamp, frame in reader.frames():
+        if last_seq is not None and seq > last_seq + 1:
+            missed += seq - last_seq - 1
+        last_seq = seq
+        count += 1
+        brightness = float(frame.mean())
+        lit = int(frame.any(axis=2).sum())
+        now = time.time()
+        if now - window_start >= 1.0:
+            print(json.dumps({'fps': round(count / (now - window_start), 1), 'missed': missed,
+                              'mean_level': round(brightness, 1), 'lit_pixels': lit, 'seq': seq}))
+            window_start, count, missed = now, 0, 0
+
+
+def main():
+    """Command line entry point for the example consumers."""
+    args = sys.argv[1:]
+    try:
+        if args and args[0] == 'web':
+            serve_web_preview(int(args[1]) if len(args) > 1 else 8080)
+        elif args and args[0] == 'gif' and len(args) > 1:
+            record_gif(args[1], float(args[2]) if len(args) > 2 else 10.0)
+        elif args and args[0] == 'stats':
+            print_frame_stats()
+        else:
+            print(__doc__)
+            sys.exit(1)
+    except FileNotFoundError:
+        print("❌ No frame tap running - set FRAME_TAP_ENABLED = True in config.py and start the display")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Geometry Fields
+Precomputed per-pixel coordinate fields for radial effects, so circles,
+rings, swirls and spirals become array arithmetic instead of per-pixel
+math.sqrt/math.atan2 loops
+
+get_fields(cx, cy) returns the fields for a center, memoized by center and
+display size. All arrays are (height, width) float64 and read-only:
+
+    dx, dy      x - cx, y - cy
+    distance    Euclidean distance from the center
+    angle       atan2(dy, dx) in radians (-pi..pi, 0 = right, pi/2 = down)
+    manhattan   |dx| + |dy| (diamond shapes)
+    chebyshev   max(|dx|, |dy|) (squares)
+    radius      distance normalized so the farthest pixel is 1.0
+
+Example:
+    fields = get_fields(16, 24)
+    frame[fields.disc(10)] = (255, 0, 0)
+"""
+
+from functools import lru_cache
+import numpy as np
+import config
+
+
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+class GeometryFields:
+    """Coordinate fields around one center, with vectorized shape helpers."""
+
+    def __init__(self, cx, cy, width=None, height=None):
+        """Compute the fields for center (cx, cy) on a width x height display."""
+        self.cx = cx
+        self.cy = cy
+        self.width = width or config.TOTAL_WIDTH
+        self.height = height or config.TOTAL_HEIGHT
+
+        ys, xs = np.mgrid[0:self.height, 0:self.width]
+        self.dx = _read_only(xs - cx + 0.0)
+        self.dy = _read_only(ys - cy + 0.0)
+        self.distance = _read_only(np.sqrt(self.dx * self.dx + self.dy * self.dy))
+        self.angle = _read_only(np.arctan2(self.dy, self.dx))
+        self.manhattan = _read_only(np.abs(self.dx) + np.abs(self.dy))
+        self.chebyshev = _read_only(np.maximum(np.abs(self.dx), np.abs(self.dy)))
+        max_distance = self.distance.max()
+        self.radius = _read_only(self.distance / max_distance if max_distance else self.distance.copy())
+
+    def disc(self, radius, inclusive=True):
+        """Boolean mask of pixels within radius of the center."""
+        return self.distance <= radius if inclusive else self.distance < radius
+
+    def ring(self, radius, thickness=1.0):
+        """Boolean mask of pixels within thickness/2 of the circle of the given radius."""
+        return np.abs(self.distance - radius) <= thickness / 2.0
+
+    def annulus(self, inner, outer):
+        """Boolean mask of pixels with inner < distance <= outer."""
+        return (self.distance > inner) & (self.distance <= outer)
+
+    def diamond(self, size):
+        """Boolean mask of pixels within Manhattan distance size."""
+        return self.manhattan <= size
+
+    def falloff(self, radius):
+        """1.0 at the center fading linearly to 0.0 at radius (0 beyond)."""
+        return np.clip(1.0 - self.distance / radius, 0.0, 1.0)
+
+    def spiral_phase(self, arms=1, twist=0.5, rotation=0.0):
+        """Phase (radians) of a spiral pattern: arms * angle + twist * distance + rotation.
+
+        Feed it to np.sin/np.cos or a palette lookup to draw rotating spirals.
+        """
+        return arms * self.angle + twist * self.distance + rotation
+
+
+def paste(frame, patch, mask, left, top):
+    """Copy patch pixels where mask is True into frame at (left, top), clipped to the frame.
+
+    Use with fields of a small stamp (get_fields(r, r, 2 * r + 1, 2 * r + 1))
+    to draw moving round objects without per-object fields.
+    """
+    frame_h, frame_w = frame.shape[:2]
+    h, w = mask.shape
+    x0, y0 = max(left, 0), max(top, 0)
+    x1, y1 = min(left + w, frame_w), min(top + h, frame_h)
+    if x0 >= x1 or y0 >= y1:
+        return
+    region = (slice(y0 - top, y1 - top), slice(x0 - left, x1 - left))
+    clipped = mask[region]
+    frame[y0:y1, x0:x1][clipped] = patch[region][clipped]
+
+
+@lru_cache(maxsize=64)
+def _cached_fields(cx, cy, width, height):
+    return GeometryFields(cx, cy, width, height)
+
+
+def get_fields(cx, cy, width=None, height=None):
+    """Return the (shared, read-only) geometry fields for a center, computing them once."""
+    return _cached_fields(cx, cy, width or config.TOTAL_WIDTH, height or config.TOTAL_HEIGHT)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Button Gesture Recognizer
+Turns the raw button edge stream into press, double-tap, long-press,
+hold-repeat and chord events without sleeping or polling delays
+"""
+
+from collections import namedtuple
+
+# kind: one of the GestureRecognizer kinds
+# buttons: tuple of button ids involved (one id, or the chord members)
+# time: timestamp the gesture happened at (same clock as the fed edges)
+# duration: how long the button(s) had been held, 0.0 for instantaneous gestures
+GestureEvent = namedtuple('GestureEvent', ['kind', 'buttons', 'time', 'duration'])
+
+
+class GestureRecognizer:
+    """Per-button and per-chord state machines over button edges.
+
+    Feed it edges with feed() and call update() regularly (the button
+    monitoring loop does both). Time-based gestures are emitted with the
+    exact time their deadline passed, not the time update() noticed it.
+
+    Presses are emitted immediately, so single presses cost no extra
+    latency. The only exception is buttons that belong to a registered
+    chord: their press is held back for the chord window, and if the
+    whole chord goes down inside that window a single chord event is
+    emitted instead of the individual presses.
+    """
+
+    PRESS = 'press'
+    RELEASE = 'release'
+    DOUBLE_TAP = 'double_tap'
+    LONG_PRESS = 'long_press'
+    HOLD_REPEAT = 'hold_repeat'
+    CHORD = 'chord'
+
+    def __init__(self, button_ids, chord_window=0.15, long_press_time=1.0,
+                 double_tap_window=0.4, hold_repeat_interval=0.25, debounce_time=0.02):
+        """Initialize the recognizer for the given buttons (times in seconds)."""
+        self.chord_window = chord_window
+        self.long_press_time = long_press_time
+        self.double_tap_window = double_tap_window
+        self.hold_repeat_interval = hold_repeat_interval
+        self.debounce_time = debounce_time
+
+        self.buttons = {}
+        for button_id in button_ids:
+            self.buttons[button_id] = {
+                'down': False,
+                'down_time': None,
+                'last_edge': None,
+                'last_tap': None,
+                'pending_press': None,   # deferred press time for chord members
+                'in_chord': False,       # consumed by a chord until released
+                'long_fired': False,
+                'next_repeat': None,
+            }
+
+        self.chords = []
+        self.listeners = []
+
+    def add_chord(self, buttons):
+        """Register a set of buttons that should be recognized as a chord."""
+        members = tuple(sorted(buttons))
+        for button_id in members:
+            if button_id not in self.buttons:
+                raise ValueError(f"Unknown button in chord: {button_id}")
+        if members not in [chord['buttons'] for chord in self.chords]:
+            self.chords.append({'buttons': members, 'fired': False})
+
+    def add_listener(self, listener):
+        """Register a function called with every GestureEvent."""
+        self.listeners.append(listener)
+
+    def _emit(self, kind, buttons, event_time, duration=0.0):
+        event = GestureEvent(kind, tuple(buttons), event_time, duration)
+        for listener in self.listeners:
+            listener(event)
+
+    def _is_chord_member(self, button_id):
+        return any(button_id in chord['buttons'] for chord in self.chords)
+
+    def feed(self, button_id, pressed, timestamp):
+        """Feed a button edge (pressed=True for press, False for release)."""
+        button = self.buttons.get(button_id)
+        if button is None or pressed == button['down']:
+            return
+
+        # Deadlines that expired before this edge must fire first, in order
+        self.update(timestamp)
+
+        if button['last_edge'] is not None and timestamp - button['last_edge'] < self.debounce_time:
+            return
+        button['last_edge'] = timestamp
+
+        if pressed:
+            self._on_press(button_id, button, timestamp)
+        else:
+            self._on_release(button_id, button, timestamp)
+
+    def _on_press(self, button_id, button, timestamp):
+        button['down'] = True
+        button['down_time'] = timestamp
+        button['long_fired'] = False
+        button['next_repeat'] = None
+
+        if self._check_chords(timestamp):
+            return
+
+        if self._is_chord_member(button_id):
+            button['pending_press'] = timestamp
+        else:
+            self._emit_press(button_id, button, timestamp)
+
+    def _emit_press(self, button_id, button, press_time):
+        self._emit(self.PRESS, (button_id,), press_time)
+
+        if button['last_tap'] is not None and press_time - button['last_tap'] <= self.double_tap_window:
+            self._emit(self.DOUBLE_TAP, (button_id,), press_time)
+            button['last_tap'] = None
+        else:
+            button['last_tap'] = press_time
+
+    def _on_release(self, button_id, button, timestamp):
+        # A chord member released inside the chord window still counts as a press
+        if button['pending_press'] is not None:
+            self._emit_press(button_id, button, button['pending_press'])
+            button['pending_press'] = None
+
+        held = timestamp - button['down_time']
+        button['down'] = False
+        button['next_repeat'] = None
+
+        for chord in self.chords:
+            if button_id in chord['buttons']:
+                chord['fired'] = False
+
+        if button['in_chord']:
+            button['in_chord'] = False
+        else:
+            self._emit(self.RELEASE, (button_id,), timestamp, held)
+
+    def _check_chords(self, timestamp):
+        """Emit any chord completed by a press at timestamp. Returns True if one fired."""
+        for chord in self.chords:
+            if chord['fired']:
+                continue
+
+            members = [self.buttons[b] for b in chord['buttons']]
+            if not all(m['down'] and not m['in_chord'] for m in members):
+                continue
+            if any(m['pending_press'] is None and m['down_time'] != timestamp for m in members):
+                # One of the buttons was already delivered as a plain press
+                continue
+
+            first_down = min(m['down_time'] for m in members)
+            if timestamp - first_down > self.chord_window:
+                continue
+
+            chord['fired'] = True
+            for member in members:
+                member['pending_press'] = None
+                member['in_chord'] = True
+            self._emit(self.CHORD, chord['buttons'], timestamp, timestamp - first_down)
+            return True
+        return False
+
+    def update(self, now):
+        """Emit time-based gestures whose deadline is at or before now."""
+        for button_id, button in self.buttons.items():
+            if button['pending_press'] is not None and now - button['pending_press'] > self.chord_window:
+                press_time = button['pending_press']
+                button['pending_press'] = None
+                self._emit_press(button_id, button, press_time)
+
+            if not button['down'] or button['in_chord'] or button['pending_press'] is not None:
+                continue
+
+            if not button['long_fired']:
+                long_time = button['down_time'] + self.long_press_time
+                if now < long_time:
+                    continue
+                button['long_fired'] = True
+                button['last_tap'] = None
+                button['next_repeat'] = long_time + self.hold_repeat_interval
+                self._emit(self.LONG_PRESS, (button_id,), long_time, self.long_press_time)
+
+            while button['next_repeat'] is not None and button['next_repeat'] <= now:
+                repeat_time = button['next_repeat']
+                button['next_repeat'] = repeat_time + self.hold_repeat_interval
+                self._emit(self.HOLD_REPEAT, (button_id,), repeat_time,
+                           repeat_time - button['down_time'])
+
+    def next_deadline(self):
+        """Return the earliest time update() may emit something, or None if idle."""
+        deadlines = []
+        for button in self.buttons.values():
+            if button['pending_press'] is not None:
+                deadlines.append(button['pending_press'] + self.chord_window)
+            if not button['down'] or button['in_chord']:
+                continue
+            if not button['long_fired']:
+                deadlines.append(button['down_time'] + self.long_press_time)
+            elif button['next_repeat'] is not None:
+                deadlines.append(button['next_repeat'])
+        return min(deadlines) if deadlines else None
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Golden-Frame Harness
+Runs every animation off-device with a fixed random seed and a virtual
+clock, captures the frames shown at chosen timestamps through the mock
+strip, and compares them with stored golden data
+
+Golden data lives in golden_frames/<animation module>.json: for each
+capture time a SHA-1 of the exact frame and an 8x12 thumbnail (4x4 block
+averages). Exact mode compares hashes; tolerance mode compares thumbnails
+and accepts per-channel differences up to the given amount, for intentional
+minor changes such as rounding in a vectorized rewrite.
+
+The hashes depend on NumPy's arithmetic: the stored data was recorded with
+NumPy 2.x, whose uint8 scalar rules raise on overflow where 1.x wrapped.
+Each record notes the version it was made with, and check warns when it
+runs under a different major version. Record refuses to store a run that
+raised, so an animation's golden data always covers its whole run.
+
+Usage:
+    python golden_frames.py record [animation ...]     # (re)write golden data
+    python golden_frames.py check [animation ...]      # exact comparison
+    python golden_frames.py check --tolerance 2        # thumbnail comparison
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import base64
+import random
+import hashlib
+import inspect
+import importlib
+import contextlib
+import numpy as np
+import config
+from output_backends import StripBackend
+from led_controller_exact import LEDControllerExact
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden_frames')
+DEFAULT_SEED = 1234
+DEFAULT_CAPTURE_TIMES = (0.5, 3.0, 6.0, 11.5)
+DEFAULT_TIME_LIMIT = 12.0  # Virtual seconds each animation runs for
+THUMBNAIL_BLOCK = 4
+MAX_FRAMES = 5000  # Guard against animations that never sleep
+
+
+class AnimationTimeLimit(BaseException):
+    """Raised by the virtual clock to end an animation (not caught by `except Exception`)."""
+
+
+class VirtualClock:
+    """Replaces time.time/monotonic/perf_counter/sleep so animations run instantly and repeatably."""
+
+    def __init__(self, limit=None, start=1_000_000.0):
+        """Initialize at `start`; sleeping past start + limit raises AnimationTimeLimit."""
+        self.start = start
+        self.now = start
+        self.limit = limit
+        self.saved = None
+
+    def elapsed(self):
+        return self.now - self.start
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(0.0, seconds)
+        if self.limit is not None and self.elapsed() > self.limit:
+            raise AnimationTimeLimit()
+
+    def __enter__(self):
+        self.saved = (time.time, time.monotonic, time.perf_counter, time.sleep)
+        time.time = time.monotonic = time.perf_counter = self.time
+        time.sleep = self.sleep
+        return self
+
+    def __exit__(self, *exc):
+        time.time, time.monotonic, time.perf_counter, time.sleep = self.saved
+        return False
+
+
+class FrameCapture:
+    """Collects the frame on display at each capture time from mock strip pushes."""
+
+    def __init__(self, clock, capture_times):
+        self.clock = clock
+        self.pending = sorted(capture_times)
+        self.captured = {}
+        self.latest = None
+        self.frame_count = 0
+
+    def on_frame(self, frame):
+        t = self.clock.elapsed()
+        # Capture times before this push saw the previous frame
+        while self.pending and self.pending[0] < t:
+            self.captured[self.pending.pop(0)] = self.latest
+        self.latest = frame.copy()
+        self.frame_count += 1
+        if self.frame_count > MAX_FRAMES:
+            raise AnimationTimeLimit()
+
+    def finish(self):
+        t = self.clock.elapsed()
+        for capture_time in self.pending:
+            # After the animation ended nothing is on display any more
+            self.captured[capture_time] = self.latest if capture_time <= t else None
+        self.pending = []
+        return self.captured
+
+
+@contextlib.contextmanager
+def _capturing_writes(capture):
+    """Route every frame pushed through a StripBackend to the capture."""
+    original_write = StripBackend.write
+
+    def write(backend, pixels):
+        original_write(backend, pixels)
+        capture.on_frame(backend.to_frame(pixels))
+
+    StripBackend.write = write
+    try:
+        yield
+    finally:
+        StripBackend.write = original_write
+
+
+@contextlib.contextmanager
+def _seeded(seed):
+    """Seed random and NumPy, including generators created with default_rng(None)."""
+    random.seed(seed)
+    np.random.seed(seed)
+    original_default_rng = np.random.default_rng
+    counter = [0]
+
+    def default_rng(rng_seed=None):
+        if rng_seed is None:
+            counter[0] += 1
+            rng_seed = seed + counter[0]
+        return original_default_rng(rng_seed)
+
+    np.random.default_rng = default_rng
+    try:
+        yield
+    finally:
+        np.random.default_rng = original_default_rng
+
+
+@contextlib.contextmanager
+def _mock_output():
+    """Force the mock strip with timing, its own capture buffer, the frame tap, telemetry and transitions off."""
+    saved = (config.OUTPUT_BACKEND, config.MOCK_STRIP_TIMING, config.MOCK_STRIP_CAPTURE_FRAMES,
+             config.FRAME_TAP_ENABLED, config.TELEMETRY_ENABLED, config.TRANSITION_DURATION)
+    config.OUTPUT_BACKEND = 'mock'
+    config.FRAME_TAP_ENABLED = config.TELEMETRY_ENABLED = False
+    config.TRANSITION_DURATION = 0
+    config.MOCK_STRIP_TIMING = 'off'
+    config.MOCK_STRIP_CAPTURE_FRAMES = 0
+    try:
+        yield
+    finally:
+        (config.OUTPUT_BACKEND, config.MOCK_STRIP_TIMING, config.MOCK_STRIP_CAPTURE_FRAMES,
+         config.FRAME_TAP_ENABLED, config.TELEMETRY_ENABLED, config.TRANSITION_DURATION) = saved
+
+
+def discover_animations():
+    """Return the names of all animation modules in the project root."""
+    root = os.path.dirname(os.path.abspath(__file__))
+    names = []
+    for filename in sorted(os.listdir(root)):
+        if filename.endswith(('_animation.py', '_animation_bitmap.py')) and \
+                not filename.startswith(('test_', 'run_')):
+            names.append(filename[:-3])
+    return names
+
+
+def find_entry_point(module):
+    """Return (class, method name) that plays the module's animation.
+
+    Uses the module's animation class and its run_animation() method, or
+    else the first display_*() method that needs no arguments.
+    """
+    for name, cls in inspect.getmembers(module, inspect.isclass):
+        if cls.__module__ != module.__name__ or not name.endswith(('Animation', 'AnimationBitmap')):
+            continue
+        if hasattr(cls, 'run_animation'):
+            return cls, 'run_animation'
+        methods = [m for m in cls.__dict__ if m.startswith('display_') and callable(cls.__dict__[m])]
+        methods.sort(key=lambda m: inspect.getsourcelines(cls.__dict__[m])[1])
+        for method in methods:
+            params = list(inspect.signature(cls.__dict__[method]).parameters.values())[1:]
+            if all(p.default is not p.empty for p in params):
+                return cls, method
+    return None, None
+
+
+def frame_hash(frame):
+    return hashlib.sha1(np.ascontiguousarray(frame, dtype=np.uint8).tobytes()).hexdigest()
+
+
+def thumbnail(frame):
+    """Return the 4x4 block-average thumbnail of a frame."""
+    h, w = frame.shape[0] // THUMBNAIL_BLOCK, frame.shape[1] // THUMBNAIL_BLOCK
+    blocks = frame[:h * THUMBNAIL_BLOCK, :w * THUMBNAIL_BLOCK].astype(np.float32)
+    blocks = blocks.reshape(h, THUMBNAIL_BLOCK, w, THUMBNAIL_BLOCK, 3).mean(axis=(1, 3))
+    return np.round(blocks).astype(np.uint8)
+
+
+def run_animation(name, capture_times=DEFAULT_CAPTURE_TIMES, time_limit=DEFAULT_TIME_LIMIT,
+                  seed=DEFAULT_SEED, verbose=False):
+    """Run one animation module and return its result record (see golden data format)."""
+    record = {'animation': name, 'seed': seed, 'time_limit': time_limit, 'captures': [], 'error': None,
+              'numpy': np.__version__}
+    clock = VirtualClock(limit=time_limit)
+    capture = FrameCapture(clock, capture_times)
+    quiet = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+
+    with quiet, _mock_output(), _seeded(seed), clock, _capturing_writes(capture):
+        try:
+            module = importlib.import_module(name)
+            cls, method = find_entry_point(module)
+            if cls is None:
+                record['error'] = 'no animation class found'
+                return record
+            record['entry'] = f"{cls.__name__}.{method}"
+            # A few animations take the LED controller as an argument
+            required = [p for p in list(inspect.signature(cls.__init__).parameters.values())[1:]
+                        if p.default is p.empty]
+            animation = cls(LEDControllerExact()) if required else cls()
+            try:
+                getattr(animation, method)()
+            except AnimationTimeLimit:
+                pass
+        except AnimationTimeLimit:
+            pass
+        except Exception as e:
+            record['error'] = f"{type(e).__name__}: {e}"
+
+    for capture_time, frame in sorted(capture.finish().items()):
+        if frame is None:
+            record['captures'].append({'t': capture_time, 'ended': True})
+        else:
+            record['captures'].append({
+                't': capture_time,
+                'hash': frame_hash(frame),
+                'thumb': base64.b64encode(thumbnail(frame).tobytes()).decode(),
+                'shape': list(thumbnail(frame).shape),
+            })
+    return record
+
+
+def golden_path(name):
+    return os.path.join(GOLDEN_DIR, name + '.json')
+
+
+def load_golden(name):
+    """Return the stored golden record for an animation, or None."""
+    try:
+        with open(golden_path(name)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_golden(record):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(golden_path(record['animation']), 'w') as f:
+        json.dump(record, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def compare(golden, actual, tolerance=None):
+    """Compare a run with its golden record.
+
+    Returns a list of difference messages (empty when they match). With a
+    tolerance, thumbnails may differ by up to that much per channel;
+    without one, frame hashes must be identical.
+    """
+    problems = []
+    if golden.get('error') != actual.get('error'):
+        problems.append(f"error changed: {golden.get('error')!r} -> {actual.get('error')!r}")
+
+    golden_captures = {c['t']: c for c in golden['captures']}
+    for capture in actual['captures']:
+        expected = golden_captures.get(capture['t'])
+        label = f"t={capture['t']}s"
+        if expected is None:
+            problems.append(f"{label}: no golden capture")
+        elif expected.get('ended') or capture.get('ended'):
+            if expected.get('ended') != capture.get('ended'):
+                problems.append(f"{label}: animation ended at a different time")
+        elif tolerance is None:
+            if expected['hash'] != capture['hash']:
+                problems.append(f"{label}: frame differs")
+        else:
+            a = np.frombuffer(base64.b64decode(expected['thumb']), dtype=np.uint8).astype(np.int16)
+            b = np.frombuffer(base64.b64decode(capture['thumb']), dtype=np.uint8).astype(np.int16)
+            diff = int(np.abs(a - b).max()) if a.shape == b.shape else 255
+            if diff > tolerance:
+                problems.append(f"{label}: thumbnail differs by {diff} (tolerance {tolerance})")
+    return problems
+
+
+def check_animations(names=None, tolerance=None, verbose=False):
+    """Run animations and compare them with golden data. Returns the list of failing names."""
+    failures = []
+    for name in names or discover_animations():
+        golden = load_golden(name)
+        if golden is None:
+            print(f"❓ {name}: no golden data (run: python golden_frames.py record {name})")
+            failures.append(name)
+            continue
+        recorded_with = golden.get('numpy')
+        if recorded_with and recorded_with.split('.')[0] != np.__version__.split('.')[0]:
+            print(f"⚠️ {name}: recorded with NumPy {recorded_with}, running {np.__version__} - hashes may differ")
+        actual = run_animation(name, [c['t'] for c in golden['captures']], golden['time_limit'],
+                               golden['seed'], verbose=verbose)
+        problems = compare(golden, actual, tolerance)
+        if problems:
+            failures.append(name)
+            print(f"❌ {name}:")
+            for problem in problems:
+                print(f"   {problem}")
+        else:
+            print(f"✓ {name}")
+    return failures
+
+
+def record_animations(names=None, verbose=False):
+    """Run animations and store their frames as the new golden data. Returns the list of failing names.
+
+    A run that raised is not stored: golden data records frames, not crashes.
+    """
+    failures = []
+    for name in names or discover_animations():
+        started = time.perf_counter()
+        record = run_animation(name, verbose=verbose)
+        if record['error']:
+            failures.append(name)
+            print(f"❌ {name}: not recorded, the animation failed: {record['error']}")
+            continue
+        save_golden(record)
+        print(f"💾 {name}: {len(record['captures'])} captures ({time.perf_counter() - started:.1f}s)")
+    return failures
+
+
+def main():
+    """Command line entry point."""
+    args = sys.argv[1:]
+    if not args or args[0] not in ('record', 'check'):
+        print(__doc__)
+        sys.exit(1)
+
+    command, args = args[0], args[1:]
+    verbose = '--verbose' in args
+    tolerance = None
+    if '--tolerance' in args:
+        index = args.index('--tolerance')
+        tolerance = int(args[index + 1])
+        del args[index:index + 2]
+    names = [a for a in args if not a.startswith('--')]
+
+    if command == 'record':
+        failures = record_animations(names, verbose)
+        if failures:
+            print(f"❌ {len(failures)} animation(s) failed and were not recorded")
+            sys.exit(1)
+    else:
+        failures = check_animations(names, tolerance, verbose)
+        if failures:
+            print(f"❌ {len(failures)} animation(s) differ from golden data")
+            sys.exit(1)
+        print("✅ All animations match golden data")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import time
 import numpy as np
 import math
 from led_controller_exact import LEDControllerExact
+from quality_controller import QualityController
 import config
 
 class GravityBendAnimation:
@@ -33,6 +34,9 @@ class GravityBendAnimation:
         self.particle_positions = []
         self.grid_spacing = 4
         
+        # 16 FPS; slower Pis draw fewer particles, skip the warp, then draw the glows in 2x2 blocks
+        self.quality = QualityController('gravity_bend', fps=50 / 3)
+        
     def create_gravity_frame(self, time_step):
         """Create a single frame of the gravity bend animation."""
         # Create base frame with space background
@@ -56,7 +60,8 @@ class GravityBendAnimation:
         self._draw_event_horizon(frame, gravity_center_x, gravity_center_y, time_step)
         
         # Add space-time distortion effects
-        self._add_warp_effects(frame, gravity_center_x, gravity_center_y, time_step)
+        if self.quality.effects:
+            self._add_warp_effects(frame, gravity_center_x, gravity_center_y, time_step)
         
         return frame
     
@@ -64,21 +69,22 @@ class GravityBendAnimation:
         """Draw the gravitational source (black hole/star)."""
         # Pulsing gravitational source
         pulse = 0.5 + 0.3 * math.sin(time_step * 0.8)
-        radius = int(3 * pulse)
+        radius = max(1, int(3 * pulse))  # The pulse dips to 0.2, which would round to 0
+        step = self.quality.resolution_step
         
-        for y in range(self.height):
-            for x in range(self.width):
+        for y in range(0, self.height, step):
+            for x in range(0, self.width, step):
                 distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
                 
                 if distance <= radius:
                     # Create glowing effect
                     intensity = int(255 * (1 - distance / radius) * pulse)
-                    frame[y, x] = (intensity, 0, 0)
+                    frame[y:y + step, x:x + step] = (intensity, 0, 0)
                 
                 elif distance <= radius + 2:
                     # Outer glow
                     glow_intensity = int(100 * (1 - (distance - radius) / 2) * pulse)
-                    frame[y, x] = (glow_intensity, 0, glow_intensity // 2)
+                    frame[y:y + step, x:x + step] = (glow_intensity, 0, glow_intensity // 2)
     
     def _draw_bent_grid(self, frame, center_x, center_y, time_step):
         """Draw the bent space-time grid."""
@@ -137,7 +143,7 @@ class GravityBendAnimation:
     
     def _draw_falling_particles(self, frame, center_x, center_y, time_step):
         """Draw particles falling into the gravity well."""
-        num_particles = 8
+        num_particles = self.quality.particles(8)
         
         for i in range(num_particles):
             # Calculate particle orbit
@@ -170,15 +176,16 @@ class GravityBendAnimation:
     def _draw_event_horizon(self, frame, center_x, center_y, time_step):
         """Draw the event horizon around the gravitational source."""
         event_radius = 6 + math.sin(time_step * 0.4) * 1
+        step = self.quality.resolution_step
         
-        for y in range(self.height):
-            for x in range(self.width):
+        for y in range(0, self.height, step):
+            for x in range(0, self.width, step):
                 distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
                 
                 if event_radius - 1 <= distance <= event_radius + 1:
                     # Event horizon ring
                     ring_intensity = int(150 + 100 * math.sin(time_step * 0.6 + distance * 0.5))
-                    frame[y, x] = (ring_intensity, ring_intensity // 2, 0)
+                    frame[y:y + step, x:x + step] = (ring_intensity, ring_intensity // 2, 0)
     
     def _add_warp_effects(self, frame, center_x, center_y, time_step):
         """Add space-time warp effects."""
@@ -200,7 +207,7 @@ class GravityBendAnimation:
                     original_color = frame[y, x]
                     if not np.array_equal(original_color, self.colors['space']):
                         warp_intensity = int(50 * (warp_strength + ripple))
-                        frame[y, x] = tuple(min(255, c + warp_intensity) for c in original_color)
+                        frame[y, x] = tuple(max(0, min(255, int(c) + warp_intensity)) for c in original_color)
     
     def display_gravity_bend(self, duration=25):
         """Display the gravity bend animation."""
@@ -212,6 +219,7 @@ class GravityBendAnimation:
         
         while time.time() - start_time < duration:
             # Create frame
+            self.quality.start_frame()
             frame = self.create_gravity_frame(frame_count * 0.1)
             
             # Display frame
@@ -221,7 +229,7 @@ class GravityBendAnimation:
                     self.led.set_pixel(x, y, color)
             
             self.led.show()
-            time.sleep(0.06)  # 16 FPS for smooth animation
+            self.quality.end_frame()
             frame_count += 1
         
         print("Gravity bend animation completed!")
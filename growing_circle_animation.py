@@ -6,8 +6,8 @@ A red circle that grows from small to big
 
 import time
 import numpy as np
-import math
 from led_controller_exact import LEDControllerExact
+from geometry_fields import get_fields
 import config
 
 class GrowingCircleAnimation:
@@ -37,11 +37,8 @@ class GrowingCircleAnimation:
         current_radius = int(progress * max_radius)
         
         # Draw circle
-        for y in range(self.height):
-            for x in range(self.width):
-                distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                if distance <= current_radius:
-                    frame[y, x] = self.colors['red']
+        fields = get_fields(center_x, center_y, self.width, self.height)
+        frame[fields.disc(current_radius)] = self.colors['red']
     
     def create_frame(self):
         """Create a single frame of the growing circle animation."""
@@ -66,11 +63,7 @@ class GrowingCircleAnimation:
             frame = self.create_frame()
             
             # Display the frame
-            for y in range(self.height):
-                for x in range(self.width):
-                    color = frame[y, x]
-                    self.led.set_pixel(x, y, color)
-            
+            self.led.set_frame(frame)
             self.led.show()
             
             # Update animation parameters
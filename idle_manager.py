@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Idle Manager
+Low-power state machine for the main loop: once no animation has run and
+no button has been pressed for config.IDLE_TIMEOUT seconds, the board
+fades out and the app stops doing anything until the next button press
+
+    active      an animation may be running; the main loop checks every
+                BUSY_RECHECK seconds whether it has finished
+    idle        nothing renders and the main loop blocks until a button
+                press (or draws the dim ambient glow at IDLE_AMBIENT_FPS);
+                the audio mixer is closed via the on_sleep callback
+
+Button presses call note_activity() on the button thread, which reopens the
+mixer (on_wake) before the press is dispatched, so the animation it starts
+has audio.
+
+Each idle period is reported when it ends, with the CPU the process used
+and how often it (and each registered wakeup source) woke up:
+
+    ☀️ Waking after 3600s idle: CPU 0.01%, 0 loop wakeups, 0 buttons wakeups, 12 context switches
+"""
+
+import math
+import threading
+import time
+import numpy as np
+import config
+from geometry_fields import get_fields
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BUSY_RECHECK = 10.0  # Seconds between checks whether a running animation has finished
+AMBIENT_COLOR = (40, 20, 60)  # Peak color of the idle glow
+AMBIENT_PERIOD = 8.0  # Seconds per breath of the idle glow
+
+
+def _context_switches():
+    """Voluntary context switches of this process so far (every thread's sleeps and wakeups), or None."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_nvcsw
+
+
+class IdleManager:
+    """Puts the display to sleep after a period without animations or input."""
+
+    ACTIVE = 'active'
+    IDLE = 'idle'
+
+    def __init__(self, led, is_busy, timeout=None, ambient=None, ambient_fps=None,
+                 on_sleep=None, on_wake=None):
+        """Watch is_busy() (True while an animation runs); settings default to config.IDLE_*."""
+        self.led = led
+        self.is_busy = is_busy
+        self.timeout = config.IDLE_TIMEOUT if timeout is None else timeout
+        self.ambient = config.IDLE_AMBIENT_ENABLED if ambient is None else ambient
+        self.ambient_fps = ambient_fps or config.IDLE_AMBIENT_FPS
+        self.on_sleep = on_sleep
+        self.on_wake = on_wake
+        self.wakeup_sources = {}
+
+        self.lock = threading.Lock()
+        self.power_lock = threading.Lock()  # Orders on_sleep/on_wake when a press races the timeout
+        self.wake_event = threading.Event()
+        self.state = self.ACTIVE
+        self.last_activity = time.monotonic()
+
+        # The current idle period (see _begin_period) and totals over all periods
+        self.period = None
+        self.loop_wakeups = 0
+        self.idle_periods = 0
+        self.idle_seconds = 0.0
+        self.idle_cpu_seconds = 0.0
+        self.idle_loop_wakeups = 0
+        self.last_report = {}
+
+        if self.ambient:
+            fields = get_fields((config.TOTAL_WIDTH - 1) / 2, config.TOTAL_HEIGHT - 1)
+            glow = fields.falloff(config.TOTAL_HEIGHT)
+            self.ambient_frame = (glow[:, :, None] * np.array(AMBIENT_COLOR)).astype(np.float32)
+            self.ambient_buffer = np.empty(self.ambient_frame.shape, dtype=np.uint8)
+
+    def add_wakeup_source(self, name, get_count):
+        """Report the wakeups of another thread (get_count() returns its running total) per idle period."""
+        self.wakeup_sources[name] = get_count
+
+    def note_activity(self):
+        """Record a button press; wakes the display if it is idle. Safe to call from any thread."""
+        with self.lock:
+            self.last_activity = time.monotonic()
+            was_idle = self.state == self.IDLE
+            self.state = self.ACTIVE
+            if was_idle:
+                self._end_period()
+        if was_idle and self.on_wake:
+            with self.power_lock:
+                self.on_wake()
+        self.wake_event.set()
+
+    def stop(self):
+        """Make step() return without waiting (for shutdown)."""
+        self.wake_event.set()
+
+    def step(self):
+        """Run one iteration of the main loop, blocking until there is something to do."""
+        self.wake_event.clear()
+        if self.state == self.IDLE:
+            self._idle_step()
+        elif self.timeout <= 0:
+            self._wait(None)
+        else:
+            self._active_step()
+
+    def _wait(self, timeout):
+        """Block until note_activity()/stop() or the timeout; every return counts as a wakeup."""
+        self.wake_event.wait(timeout)
+        self.loop_wakeups += 1
+
+    def _active_step(self):
+        now = time.monotonic()
+        if self.is_busy():
+            self.last_activity = now
+        idle_at = self.last_activity + self.timeout
+        if now >= idle_at:
+            self._go_idle()
+        else:
+            self._wait(min(idle_at - now, BUSY_RECHECK))
+
+    def _go_idle(self):
+        with self.lock:
+            if self.state == self.IDLE or self.wake_event.is_set():
+                return
+            self.state = self.IDLE
+        print(f"💤 No animation or button press for {self.timeout:g}s - going idle")
+        self.led.transition()
+        self.led.clear()
+        self.led.show()
+        with self.power_lock:
+            # A press while fading out has already woken us; on_wake runs after this
+            if self.on_sleep and self.state == self.IDLE:
+                self.on_sleep()
+        with self.lock:
+            if self.state == self.IDLE:
+                self._begin_period()
+
+    def _idle_step(self):
+        if not self.ambient:
+            self._wait(None)
+            return
+        with self.lock:
+            if self.state == self.IDLE:
+                self._draw_ambient()
+        self._wait(1.0 / self.ambient_fps)
+
+    def _draw_ambient(self):
+        """Draw the breathing glow: one multiply of a cached frame."""
+        breath = 0.55 + 0.45 * math.sin(2 * math.pi * time.monotonic() / AMBIENT_PERIOD)
+        np.multiply(self.ambient_frame, breath, out=self.ambient_buffer, casting='unsafe')
+        self.led.set_frame(self.ambient_buffer)
+        self.led.show()
+
+    def _begin_period(self):
+        self.period = {
+            'start': time.monotonic(),
+            'cpu': time.process_time(),
+            'loop_wakeups': self.loop_wakeups,
+            'context_switches': _context_switches(),
+            'sources': {name: get_count() for name, get_count in self.wakeup_sources.items()},
+        }
+
+    def _end_period(self):
+        """Add the idle period that just ended to the totals and print its report."""
+        period = self.period
+        self.period = None
+        if period is None:
+            return
+        seconds = time.monotonic() - period['start']
+        cpu = time.process_time() - period['cpu']
+        report = {
+            'seconds': seconds,
+            'cpu_percent': 100.0 * cpu / seconds if seconds > 0 else 0.0,
+            'loop_wakeups': self.loop_wakeups - period['loop_wakeups'],
+        }
+        for name, get_count in self.wakeup_sources.items():
+            report[f'{name}_wakeups'] = get_count() - period['sources'][name]
+        if period['context_switches'] is not None:
+            report['context_switches'] = _context_switches() - period['context_switches']
+
+        self.idle_periods += 1
+        self.idle_seconds += seconds
+        self.idle_cpu_seconds += cpu
+        self.idle_loop_wakeups += report['loop_wakeups']
+        self.last_report = report
+
+        details = ', '.join(f"{value} {name.replace('_', ' ')}" for name, value in report.items()
+                            if name not in ('seconds', 'cpu_percent'))
+        print(f"☀️ Waking after {seconds:.0f}s idle: CPU {report['cpu_percent']:.2f}%, {details}")
+
+    def get_stats(self):
+        """Return idle totals and the last idle period's report."""
+        stats = {
+            'idle': int(self.state == self.IDLE),
+            'periods': self.idle_periods,
+            'seconds': self.idle_seconds,
+            'cpu_percent': 100.0 * self.idle_cpu_seconds / self.idle_seconds if self.idle_seconds else 0.0,
+            'loop_wakeups': self.idle_loop_wakeups,
+        }
+        for name, value in self.last_report.items():
+            stats[f'last_{name}'] = value
+        return stats
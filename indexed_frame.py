@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Indexed Frames
+An 8-bit palette-indexed framebuffer: scenes draw palette indices, and fades,
+tints, day/night shifts, color cycling and crossfades rewrite the 256-entry
+palette instead of touching pixels
+
+The frame is (height, width) uint8, a third of an RGB frame. It is expanded
+to RGB only at output, by LEDControllerFixed.set_indexed_frame(), where the
+palette lookup and the LED reordering are one gather.
+
+The output palette is computed from the assigned colors, in this order:
+    mix      blend towards a second palette (crossfades between two frames)
+    levels   per-entry brightness, 0.0-1.0 (fades)
+    tint     blend every entry towards one color (day/night, warm/cold)
+and truncated to integers like int(c * level).
+
+Example:
+    frame = IndexedFrame()
+    red = frame.color_index((255, 0, 0))
+    frame.fill_rect(0, 0, 8, 12, red)
+    frame.set_level(0.5)                      # whole frame at half brightness
+    led.set_indexed_frame(frame.indices, frame.palette())
+"""
+
+import numpy as np
+import config
+
+PALETTE_SIZE = 256
+
+
+class IndexedFrame:
+    """A palette-indexed frame with palette-level fades, tints, cycling and crossfades."""
+
+    def __init__(self, width=None, height=None, background=(0, 0, 0)):
+        """Initialize with every pixel at index 0, whose color is background."""
+        self.width = width or config.TOTAL_WIDTH
+        self.height = height or config.TOTAL_HEIGHT
+        self.indices = np.zeros((self.height, self.width), dtype=np.uint8)
+
+        self.colors = np.zeros((PALETTE_SIZE, 3), dtype=np.float64)  # Assigned colors
+        self.colors[0] = background
+        self.mix_colors = None  # Second palette for crossfades
+        self.mix = 0.0
+        self.levels = np.ones(PALETTE_SIZE)
+        self.tint_color = np.zeros(3)
+        self.tint_amount = 0.0
+
+        self.index_of = {tuple(int(c) for c in background): 0}
+        self.used = 1
+        self.cached_palette = None
+
+    @classmethod
+    def from_rgb(cls, frame):
+        """Index an RGB frame with at most 256 distinct colors."""
+        frame = np.asarray(frame, dtype=np.uint8)
+        colors, indices = np.unique(frame.reshape(-1, 3), axis=0, return_inverse=True)
+        if len(colors) > PALETTE_SIZE:
+            raise ValueError(f"Frame has {len(colors)} colors, an indexed frame holds {PALETTE_SIZE}")
+        indexed = cls(frame.shape[1], frame.shape[0], background=colors[0])
+        indexed.colors[:len(colors)] = colors
+        indexed.index_of = {tuple(int(c) for c in color): i for i, color in enumerate(colors)}
+        indexed.used = len(colors)
+        indexed.indices[:] = indices.reshape(frame.shape[:2])
+        return indexed
+
+    @classmethod
+    def crossfade(cls, first, second):
+        """Return a frame that shows first at set_mix(0.0) and second at set_mix(1.0).
+
+        Every distinct (first, second) color pair gets one entry, so a whole
+        crossfade is a palette blend of at most 256 entries per frame.
+        """
+        pairs = first.indices.astype(np.uint16) * PALETTE_SIZE + second.indices
+        unique_pairs, indices = np.unique(pairs.reshape(-1), return_inverse=True)
+        if len(unique_pairs) > PALETTE_SIZE:
+            raise ValueError(f"Crossfade needs {len(unique_pairs)} color pairs, an indexed frame holds {PALETTE_SIZE}")
+        blended = cls(first.width, first.height)
+        blended.indices[:] = indices.reshape(first.indices.shape)
+        blended.colors[:len(unique_pairs)] = first.colors[unique_pairs // PALETTE_SIZE]
+        blended.mix_colors = np.zeros_like(blended.colors)
+        blended.mix_colors[:len(unique_pairs)] = second.colors[unique_pairs % PALETTE_SIZE]
+        blended.index_of = {}
+        blended.used = len(unique_pairs)
+        return blended
+
+    # Palette
+
+    def color_index(self, color):
+        """Return the palette index of color, adding it if it is new."""
+        key = tuple(int(c) for c in color)
+        index = self.index_of.get(key)
+        if index is None:
+            if self.used >= PALETTE_SIZE:
+                raise ValueError(f"Palette is full ({PALETTE_SIZE} colors)")
+            index = self.index_of[key] = self.used
+            self.used += 1
+            self.colors[index] = key
+            self.cached_palette = None
+        return index
+
+    def set_color(self, index, color):
+        """Change the color of a palette entry (every pixel using it changes with it)."""
+        self.colors[index] = color
+        self.cached_palette = None
+
+    def set_level(self, level, index=None):
+        """Set the brightness (0.0-1.0) of one entry, a sequence of entries, or all of them."""
+        if index is None:
+            self.levels[:] = level
+        else:
+            self.levels[index] = level
+        self.cached_palette = None
+
+    def set_tint(self, color, amount):
+        """Blend every entry amount (0.0-1.0) of the way towards color."""
+        self.tint_color = np.asarray(color, dtype=np.float64)
+        self.tint_amount = amount
+        self.cached_palette = None
+
+    def set_mix(self, amount):
+        """Crossfade position for frames made by crossfade(): 0.0 = first, 1.0 = second."""
+        self.mix = amount
+        self.cached_palette = None
+
+    def cycle(self, start, stop, shift=1):
+        """Rotate the colors of entries start..stop-1 by shift places (color cycling)."""
+        self.colors[start:stop] = np.roll(self.colors[start:stop], shift, axis=0)
+        self.cached_palette = None
+
+    def palette(self):
+        """Return the (256, 3) uint8 output palette with mix, levels and tint applied."""
+        if self.cached_palette is None:
+            colors = self.colors
+            if self.mix_colors is not None:
+                colors = colors * (1 - self.mix) + self.mix_colors * self.mix
+            colors = colors * self.levels[:, None]
+            if self.tint_amount:
+                colors = colors + (self.tint_color - colors) * self.tint_amount
+            self.cached_palette = np.clip(colors, 0, 255).astype(np.uint8)
+        return self.cached_palette
+
+    # Drawing (indices only - no color math)
+
+    def clear(self, index=0):
+        self.indices.fill(index)
+
+    def set_pixel(self, x, y, index):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.indices[y, x] = index
+
+    def fill_rect(self, x, y, width, height, index):
+        """Fill a rectangle, clipped to the frame."""
+        self.indices[max(y, 0):max(y + height, 0), max(x, 0):max(x + width, 0)] = index
+
+    def fill_mask(self, mask, index):
+        self.indices[mask] = index
+
+    def to_rgb(self):
+        """Return the frame expanded to (height, width, 3) RGB."""
+        return self.palette()[self.indices]
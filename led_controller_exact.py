@@ -10,12 +10,17 @@ import subprocess
 import os
 import sys
 from led_controller_fixed import LEDControllerFixed
+from text_renderer import render_text_strip
 import config
 
 class LEDControllerExact:
-    def __init__(self):
-        """Initialize the LED controller with exact mapping."""
-        self.led = LEDControllerFixed()
+    def __init__(self, backend=None, orientation=None):
+        """Initialize the LED controller with exact mapping.
+        
+        backend: output backend name(s), default config.OUTPUT_BACKEND
+        orientation: display rotation or mirror, default the process's current
+            orientation (config.DISPLAY_ORIENTATION unless changed with set_orientation())
+        """
         self.width = config.TOTAL_WIDTH  # 32
         self.height = 48  # 6 panels × 8 rows = 48
         
@@ -35,6 +40,15 @@ class LEDControllerExact:
                 self.led_to_coord_map[led_num] = (coord_x, coord_y)
                 self.coord_to_led_map[(coord_x, coord_y)] = led_num
         
+        # Compiled frame order: frame_order[i] is the flat (y * width + x) pixel shown by LED index i
+        self.frame_order = np.zeros(config.TOTAL_LEDS, dtype=np.intp)
+        for (coord_x, coord_y), led_num in self.coord_to_led_map.items():
+            self.frame_order[led_num - 1] = coord_y * self.width + coord_x
+        
+        # The strip-order frame buffer and output backend, driven in this mapping's order
+        self.led = LEDControllerFixed(frame_order=self.frame_order, backend=backend, orientation=orientation)
+        self.width, self.height = self.led.width, self.led.height
+        
         print(f"LED Controller initialized with {len(self.led_to_coord_map)} LED mappings")
     
     def led_to_coordinate(self, led_num):
@@ -81,41 +95,54 @@ class LEDControllerExact:
         
         return x, y
     
+    def set_orientation(self, orientation):
+        """Rotate or mirror the whole display, and new controllers (see display_orientation.py); free per frame."""
+        self.led.set_orientation(orientation)
+        self.width, self.height = self.led.width, self.led.height
+    
     def set_pixel(self, x, y, color):
         """Set a pixel at coordinates (x, y) to the specified color."""
-        # Check bounds
-        if x < 0 or x >= self.width or y < 0 or y >= self.height:
-            return
-        
-        # Get LED number for this coordinate
-        led_num = self.coord_to_led_map.get((x, y))
-        if led_num is None:
-            return
-        
-        # Set the LED color directly on the strip
-        r, g, b = color
-        self.led.strip.setPixelColorRGB(led_num - 1, int(r), int(g), int(b))  # Convert to 0-based LED index
+        self.led.set_pixel(x, y, color)
     
     def fill_display(self, color):
         """Fill the entire display with the specified color."""
-        r, g, b = color
-        for led_num in range(1, 1537):
-            self.led.strip.setPixelColorRGB(led_num - 1, int(r), int(g), int(b))  # Convert to 0-based LED index
+        self.led.fill_display(color)
+    
+    def fill_mask(self, mask, color):
+        """Set every pixel where the (height, width) boolean mask is True to the color."""
+        self.led.fill_mask(mask, color)
+    
+    def set_frame(self, frame):
+        """Set the whole display from a (height, width, 3) uint8 array."""
+        self.led.set_frame(frame)
+    
+    def set_indexed_frame(self, indices, palette):
+        """Set the whole display from palette indices and a (256, 3) uint8 palette (see indexed_frame.py)."""
+        self.led.set_indexed_frame(indices, palette)
     
     def clear(self):
         """Clear the display (turn off all LEDs)."""
-        self.fill_display((0, 0, 0))
+        self.led.clear()
     
     def show(self):
-        """Update the display with the current pixel data."""
+        """Push the whole frame to the output backend in compiled LED order."""
         self.led.show()
     
-    def draw_text(self, text, x, y, color):
-        """Simple text drawing - just draw a line for now."""
-        # Simple implementation - just draw a horizontal line
-        for i in range(len(text)):
-            if 0 <= x + i < self.width and 0 <= y < self.height:
-                self.set_pixel(x + i, y, color)
+    def hold_frame(self):
+        """Keep the board showing its current frame until transition() (see transition_stage.py)."""
+        self.led.hold_frame()
+    
+    def transition(self, style=None, duration=None):
+        """Blend from the held (or current) frame into the next frames shown."""
+        self.led.transition(style, duration)
+    
+    def draw_text(self, text, x, y, color, size='normal'):
+        """Draw text with its top-left corner at (x, y) ('small', 'normal' or 'large' font)."""
+        # The message is rasterized once and cached; only its lit pixels are set
+        strip = render_text_strip(text, size)
+        rows, cols = np.nonzero(strip)
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            self.set_pixel(x + col, y + row, color)
     
     def cleanup(self):
         """Clean up resources."""
@@ -5,65 +5,89 @@ Fixed LED Controller using the exact mapping from the user's script
 
 import time
 import numpy as np
-import sys
 import config
-
-# Use mock modules on Windows, real modules on Raspberry Pi
-if sys.platform.startswith('win'):
-    from mock_rpi import WS281x
-    PixelStrip = WS281x
-    Color = lambda r, g, b: (r, g, b)
-    print("Using mock Raspberry Pi modules for Windows development")
-else:
-    # Retry import with delay to handle race conditions during restart
-    PixelStrip = None
-    Color = None
-    import time
-    
-    for attempt in range(3):
-        try:
-            from rpi_ws281x import PixelStrip, Color
-            print("✅ rpi_ws281x imported successfully")
-            break
-        except ImportError as e:
-            if attempt < 2:
-                print(f"⚠️ rpi_ws281x import attempt {attempt + 1} failed, retrying...")
-                time.sleep(0.5)  # Brief delay before retry
-            else:
-                print(f"❌ Warning: rpi_ws281x not found after {attempt + 1} attempts, using mock modules")
-                print(f"   Error: {e}")
-                from mock_rpi import WS281x
-                PixelStrip = WS281x
-                Color = lambda r, g, b: (r, g, b)
+from power_limiter import create_limited_backend
+from transition_stage import TransitionStage, shared_stage
+from telemetry import get_telemetry, take_frame_mark
+import display_orientation
 
 class LEDControllerFixed:
-    def __init__(self):
-        """Initialize the LED controller for the 32x48 display."""
-        # Convert brightness to uint8 (0-255)
-        brightness_uint8 = int(config.BRIGHTNESS * 255)
+    def __init__(self, frame_order=None, backend=None, orientation=None):
+        """Initialize the LED controller for the 32x48 display.
         
-        self.strip = PixelStrip(
-            config.TOTAL_LEDS,
-            config.LED_PIN,
-            config.LED_FREQ_HZ,
-            config.LED_DMA,
-            config.LED_INVERT,
-            brightness_uint8,
-            config.LED_CHANNEL
-        )
-        self.strip.begin()
+        frame_order: optional compiled LED order (frame_order[i] is the flat
+            y * width + x pixel shown by LED i) replacing this class's own mapping
+        backend: output backend name(s), default config.OUTPUT_BACKEND
+        orientation: display rotation or mirror, default the process's current
+            orientation (config.DISPLAY_ORIENTATION unless changed with set_orientation())
+        """
+        # Frames are assembled in strip order and pushed whole by show(), through the
+        # transition stage (shared by every controller on the default backend) and power limiter
+        if backend is None:
+            self.output = shared_stage()
+        else:
+            self.output = TransitionStage(create_limited_backend(backend))
+        first_user = self.output.acquire()
+        self.telemetry = get_telemetry()
+        self.pixels = np.zeros((config.TOTAL_LEDS, 3), dtype=np.uint8)
         
-        # Create display matrix (32x48)
-        self.display_matrix = np.zeros((config.TOTAL_HEIGHT, config.TOTAL_WIDTH, 3), dtype=np.uint8)
+        # Create display matrix (32x48, or 48x32 when turned a quarter)
+        self.orientation = orientation or display_orientation.current_orientation()
+        self.width, self.height = display_orientation.logical_size(
+            self.orientation, config.TOTAL_WIDTH, config.TOTAL_HEIGHT)
+        self.display_matrix = np.zeros((self.height, self.width, 3), dtype=np.uint8)
         
         # Create LED to coordinate mapping
         self.led_to_coord_map = {}
         self.coord_to_led_map = {}
         self._create_mapping()
         
-        # Clear display on startup
+        if frame_order is None:
+            frame_order = np.zeros(config.TOTAL_LEDS, dtype=np.intp)
+            for (x, y), led_num in self.coord_to_led_map.items():
+                frame_order[led_num - 1] = y * config.TOTAL_WIDTH + x
+        self.set_frame_order(frame_order)
+        self.output.begin()
+        
+        # Clear display on startup (later controllers sharing the output leave the board as it is)
         self.clear()
-        self.show()
+        if first_user:
+            self.show()
+    
+    def set_frame_order(self, frame_order):
+        """Set the compiled (physical) LED order used to place pixels on the strip."""
+        self.physical_order = np.asarray(frame_order, dtype=np.intp)
+        # Backends rebuild what the board physically shows, so they get the unrotated order
+        self.output.set_layout(self.physical_order)
+        self._compile_order()
+    
+    def set_orientation(self, orientation):
+        """Rotate or mirror the whole display (see display_orientation.py).
+        
+        Only the compiled LED order changes, so drawing and show() cost the
+        same in every orientation. The current picture is kept unless a
+        quarter turn changes the canvas size, which clears it. Controllers
+        created afterwards, here or in the render worker, start in it too.
+        """
+        width, height = display_orientation.logical_size(orientation, config.TOTAL_WIDTH, config.TOTAL_HEIGHT)
+        display_orientation.set_current_orientation(orientation)
+        self.orientation = orientation
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self.display_matrix = np.zeros((height, width, 3), dtype=np.uint8)
+        self._compile_order()
+    
+    def _compile_order(self):
+        # frame_order[i] is the flat pixel of display_matrix shown by LED i, orientation included
+        self.frame_order = display_orientation.compose_order(
+            self.physical_order, self.orientation, config.TOTAL_WIDTH, config.TOTAL_HEIGHT)
+        # led_index[y][x] is the strip index of display pixel (x, y)
+        led_index = np.zeros(self.height * self.width, dtype=np.intp)
+        led_index[self.frame_order] = np.arange(len(self.frame_order))
+        self.led_index_array = led_index.reshape(self.height, self.width)
+        self.led_index = self.led_index_array.tolist()
+        # Re-place the current picture in the new order
+        np.take(self.display_matrix.reshape(-1, 3), self.frame_order, axis=0, out=self.pixels)
     
     def _create_mapping(self):
         """Create the LED number to coordinate mapping."""
@@ -123,29 +147,58 @@ class LEDControllerFixed:
     def clear(self):
         """Clear the entire display."""
         self.display_matrix.fill(0)
-        for i in range(config.TOTAL_LEDS):
-            self.strip.setPixelColorRGB(i, 0, 0, 0)
+        self.pixels.fill(0)
     
     def set_pixel(self, x, y, color):
         """Set a single pixel at position (x, y) with the given color."""
-        if 0 <= x < config.TOTAL_WIDTH and 0 <= y < config.TOTAL_HEIGHT:
+        if 0 <= x < self.width and 0 <= y < self.height:
             self.display_matrix[y, x] = color
-            
-            # Find the LED number for this coordinate
-            if (x, y) in self.coord_to_led_map:
-                led_num = self.coord_to_led_map[(x, y)]
-                # LED numbers are 1-based, but strip.setPixelColorRGB is 0-based
-                led_index = led_num - 1
-                r, g, b = int(color[0]), int(color[1]), int(color[2])
-                self.strip.setPixelColorRGB(led_index, r, g, b)
+            self.pixels[self.led_index[y][x]] = color
+    
+    def _fits(self, frame):
+        return frame.shape[:2] == (self.height, self.width)
+    
+    def _fit(self, frame, fill):
+        """Center a frame of another size (e.g. the physical size on a quarter-turned canvas) on the canvas."""
+        canvas = np.full((self.height, self.width) + frame.shape[2:], fill, dtype=frame.dtype)
+        canvas_slices, frame_slices = display_orientation.fit_slices(
+            frame.shape[1], frame.shape[0], self.width, self.height)
+        canvas[canvas_slices] = frame[frame_slices]
+        return canvas
+    
+    def set_frame(self, frame):
+        """Set the whole display from a (height, width, 3) uint8 array; other sizes are centered."""
+        if self._fits(frame):
+            self.display_matrix[:] = frame
+        else:
+            self.display_matrix[:] = self._fit(frame, 0)
+        # Reorder the frame into strip order in one gather
+        np.take(self.display_matrix.reshape(-1, 3), self.frame_order, axis=0, out=self.pixels)
+    
+    def set_indexed_frame(self, indices, palette):
+        """Set the whole display from (height, width) palette indices and a (256, 3) uint8 palette.
+        
+        The palette lookup and the reordering into strip order are a single
+        gather, so an indexed frame is expanded to RGB only here. Indices of
+        another size are expanded first and centered like set_frame().
+        """
+        if not self._fits(indices):
+            self.set_frame(np.take(palette, indices, axis=0))
+            return
+        np.take(palette, indices.reshape(-1)[self.frame_order], axis=0, out=self.pixels)
+        np.take(palette, indices, axis=0, out=self.display_matrix)
+    
+    def fill_mask(self, mask, color):
+        """Set every pixel where the (height, width) boolean mask is True to color; other sizes are centered."""
+        if not self._fits(mask):
+            mask = self._fit(mask, False)
+        self.display_matrix[mask] = color
+        self.pixels[self.led_index_array[mask]] = color
     
     def fill_display(self, color):
         """Fill the entire display with a color."""
-        self.display_matrix.fill(color)
-        for led_num in range(1, config.TOTAL_LEDS + 1):
-            led_index = led_num - 1
-            r, g, b = int(color[0]), int(color[1]), int(color[2])
-            self.strip.setPixelColorRGB(led_index, r, g, b)
+        self.display_matrix[:] = color
+        self.pixels[:] = color
     
     def draw_rectangle(self, x1, y1, x2, y2, color, fill=False):
         """Draw a rectangle from (x1, y1) to (x2, y2)."""
@@ -154,15 +207,29 @@ class LEDControllerFixed:
                 if fill or (x == x1 or x == x2 or y == y1 or y == y2):
                     self.set_pixel(x, y, color)
     
+    def hold_frame(self):
+        """Keep the board showing its current frame; frames shown until transition() are dropped."""
+        self.output.hold()
+    
+    def transition(self, style=None, duration=None):
+        """Blend from the held (or current) frame into the next frames shown (see transition_stage.py)."""
+        self.output.transition(style, duration)
+    
     def show(self):
-        """Update the physical LED display."""
-        self.strip.show()
+        """Push the whole frame to the output backend."""
+        if self.telemetry is None:
+            self.output.write(self.pixels)
+            return
+        start = time.perf_counter()
+        render_seconds, period = take_frame_mark(start)
+        self.output.write(self.pixels)
+        self.telemetry.frame_shown(start, time.perf_counter(), render_seconds, period)
     
     def set_brightness(self, brightness):
         """Set the brightness of all LEDs (0.0 to 1.0)."""
         brightness = max(0.0, min(1.0, brightness))
         brightness_uint8 = int(brightness * 255)
-        self.strip.setBrightness(brightness_uint8)
+        self.output.set_brightness(brightness_uint8)
     
     def cleanup(self):
         """Clean up resources."""
@@ -170,7 +237,6 @@ class LEDControllerFixed:
             self.clear()
             self.show()
             time.sleep(0.1)
-            if hasattr(self, 'strip'):
-                del self.strip
+            self.output.close()
         except Exception as e:
             print(f"Cleanup warning: {e}") 
\ No newline at end of file
@@ -4,6 +4,13 @@ Main application for Raspberry Pi LED Display Project
 Controls 6 LED panels (32x8 each) to create a 48x32 display
 """
 
+import config
+import app_logging
+
+# Route prints through the non-blocking log queue before the imports below print their status
+if __name__ == "__main__":
+    app_logging.setup_logging()
+
 import time
 import signal
 import sys
@@ -12,19 +19,34 @@ import subprocess
 import os
 import random
 import math
+import numpy as np
 # from led_controller import LEDController  # Using LEDControllerExact instead
 from display_patterns import DisplayPatterns
 from button_controller import ButtonController
+from button_dispatcher import ButtonDispatcher
+from gesture_recognizer import GestureRecognizer
+from audio_assets import AudioAssetManager
+from effect_kernels import blit_frame
+from geometry_fields import get_fields, paste
+from indexed_frame import IndexedFrame
+from frame_cache import PeriodicFrames, get_frame_cache
+from render_worker import RenderWorker, AnimationTarget
+from scene_player import load_scene, target_scene
+from idle_manager import IdleManager
+from power_limiter import get_power_limiter
+from telemetry import get_telemetry
+import profiler
 # from squares_animation import SquaresAnimation  # File not found
 from led_controller_exact import LEDControllerExact
-import config
+
+log = app_logging.get_logger('main')
 
 # Try to import pygame for audio support
 try:
     import pygame
     AUDIO_AVAILABLE = True
 except ImportError:
-    print("⚠️ Pygame not available, audio will be disabled")
+    log.warning("Pygame not available, audio will be disabled")
     AUDIO_AVAILABLE = False
     pygame = None
 
@@ -43,7 +65,19 @@ class LEDDisplayApp:
         self.patterns = DisplayPatterns(self.led)
         # self.squares_animation = SquaresAnimation(self.led)  # File not found
         print("🔧 Initializing button controller...")
-        self.button_controller = ButtonController()
+        # Handlers stop/start animations and may block for >1s, so run them off the GPIO thread
+        self.button_dispatcher = ButtonDispatcher() if config.BUTTON_DISPATCH_ENABLED else None
+        self.button_controller = ButtonController(dispatcher=self.button_dispatcher)
+        
+        # Optionally render module animations in a second process, leaving this one for input and audio
+        self.render_worker = RenderWorker(self.led.led.output) if config.RENDER_WORKER_ENABLED else None
+        
+        # Per-animation current estimates (None unless config.POWER_LIMIT_ENABLED)
+        self.power = get_power_limiter()
+        
+        # Frame, input and audio timings (None unless config.TELEMETRY_ENABLED)
+        self.telemetry = get_telemetry()
+        self.current_scene = 'idle'
         
         # Test button controller
         time.sleep(0.2)
@@ -88,37 +122,10 @@ class LEDDisplayApp:
         self.clock_animation_running = False
         self.lion_animation_running = False
         
-        # Animation interruption mode toggle tracking
-        self.last_toggle_check_time = 0
-        
         # Initialize audio system
         self.audio_available = False
-        if AUDIO_AVAILABLE:
-            try:
-                # Try different initialization methods for better compatibility
-                # First try with default settings
-                try:
-                    pygame.mixer.init()
-                    self.audio_available = True
-                    print("🔊 Audio system initialized (default settings)")
-                except:
-                    # If default fails, try with specific settings
-                    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-                    self.audio_available = True
-                    print("🔊 Audio system initialized (22050 Hz)")
-                
-                # Verify audio is actually working
-                if pygame.mixer.get_init():
-                    print(f"✅ Audio system verified: {pygame.mixer.get_init()}")
-                else:
-                    print("⚠️ Audio system initialized but get_init() returned None")
-                    self.audio_available = False
-                    
-            except Exception as e:
-                print(f"⚠️ Audio system not available: {e}")
-                import traceback
-                traceback.print_exc()
-                self.audio_available = False
+        self.audio_powered_down = False  # Mixer closed while idle (see power_down_audio)
+        self.init_audio()
         
         # Audio file mapping for animations
         # Place audio files in an 'audio' folder in the project directory
@@ -149,13 +156,76 @@ class LEDDisplayApp:
             'birds': 'birds.wav',
         }
         
+        # Compressed assets, manifest and decoded-cue cache (see audio_assets.py)
+        self.audio_assets = AudioAssetManager()
+        if self.audio_available:
+            self.audio_assets.preload(self.animation_audio.values())
+        if self.telemetry:
+            self.register_telemetry_collectors()
+        
+        # Fade out and stop everything after config.IDLE_TIMEOUT without animations or presses
+        self.idle = IdleManager(self.led, self.is_any_animation_running,
+                                on_sleep=self.power_down_audio, on_wake=self.power_up_audio)
+        self.idle.add_wakeup_source('buttons', lambda: self.button_controller.wakeups)
+        self.button_controller.register_activity_callback(self.idle.note_activity)
+        if self.telemetry:
+            self.telemetry.add_collector('idle', self.idle.get_stats)
+        
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
+        # kill -USR1 <pid> profiles the running display (see profiler.py)
+        self.profiler = profiler.install(lambda: self.current_scene)
+        
         # Register button callbacks
         self.setup_button_callbacks()
     
+    def init_audio(self):
+        """Open the audio mixer (at startup and when waking from idle)."""
+        if AUDIO_AVAILABLE:
+            try:
+                # Try different initialization methods for better compatibility
+                # First try with default settings
+                try:
+                    pygame.mixer.init()
+                    self.audio_available = True
+                    print("🔊 Audio system initialized (default settings)")
+                except:
+                    # If default fails, try with specific settings
+                    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+                    self.audio_available = True
+                    print("🔊 Audio system initialized (22050 Hz)")
+                
+                # Verify audio is actually working
+                if pygame.mixer.get_init():
+                    print(f"✅ Audio system verified: {pygame.mixer.get_init()}")
+                else:
+                    print("⚠️ Audio system initialized but get_init() returned None")
+                    self.audio_available = False
+                    
+            except Exception as e:
+                print(f"⚠️ Audio system not available: {e}")
+                import traceback
+                traceback.print_exc()
+                self.audio_available = False
+    
+    def power_down_audio(self):
+        """Close the audio mixer while idle (config.IDLE_AUDIO_POWER_DOWN)."""
+        if not (config.IDLE_AUDIO_POWER_DOWN and self.audio_available):
+            return
+        self.audio_assets.release()
+        pygame.mixer.quit()
+        self.audio_available = False
+        self.audio_powered_down = True
+        print("🔇 Audio mixer closed while idle")
+    
+    def power_up_audio(self):
+        """Reopen the audio mixer closed by power_down_audio."""
+        if self.audio_powered_down:
+            self.audio_powered_down = False
+            self.init_audio()
+    
     def setup_button_callbacks(self):
         """Setup button callbacks for the 4 buttons."""
         # Button 18 (index 0) - Shapes
@@ -166,75 +236,75 @@ class LEDDisplayApp:
         self.button_controller.register_callback(2, self.start_animals_animation)
         # Button 22 (index 3) - Objects animations
         self.button_controller.register_callback(3, self.start_objects_animation)
+        
+        # Buttons 18 + 22 (index 0 + 3) pressed together - toggle interruption mode
+        self.gestures = GestureRecognizer(
+            range(len(config.BUTTON_PINS)),
+            chord_window=config.GESTURE_CHORD_WINDOW,
+            long_press_time=config.GESTURE_LONG_PRESS_TIME,
+            double_tap_window=config.GESTURE_DOUBLE_TAP_WINDOW,
+            hold_repeat_interval=config.GESTURE_HOLD_REPEAT_INTERVAL
+        )
+        self.gestures.add_chord(config.INTERRUPTION_TOGGLE_CHORD)
+        self.button_controller.set_gesture_recognizer(self.gestures)
+        self.button_controller.register_gesture_callback(
+            GestureRecognizer.CHORD, config.INTERRUPTION_TOGGLE_CHORD, self.toggle_interruption_mode
+        )
     
-    def play_animation_audio(self, animation_name):
-        """Play audio for the specified animation."""
+    def register_telemetry_collectors(self):
+        """Export the caches', dispatcher's, render worker's and mock strip's stats as telemetry gauges."""
+        self.telemetry.add_collector('frame_cache', get_frame_cache().get_stats)
+        self.telemetry.add_collector('audio_cache', self.audio_assets.get_stats)
+        self.telemetry.add_collector('log', app_logging.get_stats)
+        if self.button_dispatcher:
+            self.telemetry.add_collector('buttons', self.button_dispatcher.get_stats)
+        if self.render_worker:
+            self.telemetry.add_collector('render_worker', self.render_worker.get_stats)
+        if self.power:
+            self.telemetry.add_collector('power', self.power.get_stats)
+        # The strip sits under the transition stage and power limiter
+        output = self.led.led.output
+        while hasattr(output, 'backend'):
+            output = output.backend
+        strip = getattr(output, 'strip', None)
+        if hasattr(strip, 'wire_wait_total'):
+            self.telemetry.add_collector('mock_strip', lambda: {
+                'wire_wait_seconds': strip.wire_wait_total,
+                'frame_wire_seconds': strip.frame_wire_time,
+                'shows': strip.show_count,
+            })
+    
+    def play_animation_audio(self, animation_name, audio_file=None, target_fps=None):
+        """Play audio for the specified animation (audio_file overrides its animation_audio entry).
+
+        target_fps is the animation's frame rate, if known, for the telemetry's overrun count.
+        """
+        # Every animation starts its audio first, so this is where frames get attributed to it
+        self.current_scene = animation_name
+        if self.telemetry:
+            self.telemetry.set_scene(animation_name, target_fps)
+        if self.power:
+            self.power.set_scene(animation_name)
         if not self.audio_available:
-            print(f"⚠️ Audio not available, skipping audio for {animation_name}")
+            log.debug("Audio not available", animation=animation_name)
             return
         
-        if animation_name in self.animation_audio:
-            audio_file = self.animation_audio[animation_name]
-            # Get the directory where this script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            audio_path = os.path.join(script_dir, 'audio', audio_file)
-            
-            if os.path.exists(audio_path):
-                try:
-                    # Stop any currently playing audio first
-                    pygame.mixer.music.stop()
-                    
-                    # Load the audio file
-                    print(f"🔊 Loading audio file: {audio_path}")
-                    pygame.mixer.music.load(audio_path)
-                    
-                    # Set volume (0.0 to 1.0)
-                    pygame.mixer.music.set_volume(1.0)
-                    
-                    # Play the audio (loop indefinitely)
-                    pygame.mixer.music.play(-1)
-                    print(f"🔊 Playing audio for {animation_name}: {audio_file}")
-                    print(f"🔊 Audio set to loop: -1 (indefinitely)")
-                    
-                    # Give it a moment to start, then verify
-                    import time
-                    time.sleep(0.1)
-                    
-                    # Verify it's actually playing
-                    if pygame.mixer.music.get_busy():
-                        print(f"✅ Audio is playing: {audio_file}")
-                    else:
-                        print(f"⚠️ Audio loaded but not playing: {audio_file}")
-                        print(f"   Check audio output device settings")
-                        print(f"   On Raspberry Pi, try: sudo raspi-config -> Advanced Options -> Audio")
-                    
-                    # Check audio file length if possible
-                    try:
-                        import wave
-                        if audio_file.endswith('.wav'):
-                            with wave.open(audio_path, 'rb') as wav_file:
-                                frames = wav_file.getnframes()
-                                sample_rate = wav_file.getframerate()
-                                duration = frames / float(sample_rate)
-                                print(f"🔊 Audio file duration: {duration:.2f} seconds")
-                                if duration < 3:
-                                    print(f"⚠️ WARNING: Audio file is very short ({duration:.2f}s). It should loop, but if it stops, the file might be corrupted.")
-                    except Exception as e:
-                        # Not a WAV file or can't read it - that's okay
-                        pass
-                except Exception as e:
-                    print(f"⚠️ Error playing audio {audio_file}: {e}")
-                    import traceback
-                    traceback.print_exc()
-            else:
-                print(f"⚠️ Audio file not found: {audio_path}")
-                print(f"   Looking for: {audio_path}")
-                print(f"   Script directory: {script_dir}")
-                print(f"   Audio directory exists: {os.path.exists(os.path.join(script_dir, 'audio'))}")
-                if os.path.exists(os.path.join(script_dir, 'audio')):
-                    print(f"   Files in audio directory: {os.listdir(os.path.join(script_dir, 'audio'))}")
+        audio_file = audio_file or self.animation_audio.get(animation_name)
+        if audio_file:
+            try:
+                # Short cues play from the decoded cache, long ones stream from disk (loop indefinitely)
+                start = time.perf_counter()
+                if self.audio_assets.play(audio_file, loops=-1):
+                    if self.telemetry:
+                        self.telemetry.audio_started(time.perf_counter() - start)
+                    log.info("Playing audio", animation=animation_name, file=audio_file)
+                else:
+                    log.warning("Audio file not found", animation=animation_name, file=audio_file,
+                                audio_dir=self.audio_assets.audio_dir)
+            except Exception:
+                log.warning("Error playing audio", animation=animation_name, file=audio_file, exc_info=True)
         else:
-            print(f"⚠️ No audio mapped for animation: {animation_name}")
+            log.warning("No audio mapped", animation=animation_name)
     
     def stop_animation_audio(self):
         """Stop any currently playing animation audio with fade out."""
@@ -242,13 +312,13 @@ class LEDDisplayApp:
         if self.audio_available:
             try:
                 # Fade out over 2000 milliseconds (2 seconds)
-                pygame.mixer.music.fadeout(2000)
-                print("🔇 Fading out animation audio (2 seconds)")
+                self.audio_assets.fadeout(2000)
+                log.debug("Fading out animation audio", fade_ms=2000)
             except Exception as e:
-                print(f"⚠️ Error stopping audio: {e}")
+                log.warning("Error stopping audio", error=str(e))
                 # Fallback to immediate stop if fadeout fails
                 try:
-                    pygame.mixer.music.stop()
+                    self.audio_assets.stop()
                 except:
                     pass
     
@@ -277,26 +347,12 @@ class LEDDisplayApp:
             self.current_shape_process = None
             print("✅ Shape animation stopped")
     
-    def check_toggle_interruption_mode(self):
-        """Check if buttons 0 and 3 are pressed together to toggle interruption mode."""
-        current_time = time.time()
-        # Debounce: only check every 0.5 seconds
-        if current_time - self.last_toggle_check_time < 0.5:
-            return
-        
-        self.last_toggle_check_time = current_time
-        
-        # Check if buttons 0 (Shapes) and 3 (Objects) are both pressed
-        button_0_pressed = self.button_controller.get_button_state(0)
-        button_3_pressed = self.button_controller.get_button_state(3)
-        
-        if button_0_pressed and button_3_pressed:
-            # Toggle the global config setting
-            config.ALLOW_ANIMATION_INTERRUPTION = not config.ALLOW_ANIMATION_INTERRUPTION
-            mode_text = "ENABLED (any click switches animation)" if config.ALLOW_ANIMATION_INTERRUPTION else "DISABLED (no interrupts during animation)"
-            print(f"🔄 Animation interruption mode: {mode_text}")
-            # Wait a bit to avoid rapid toggling
-            time.sleep(0.3)
+    def toggle_interruption_mode(self, event=None):
+        """Toggle interruption mode - called for the buttons 0 + 3 chord gesture."""
+        # Toggle the global config setting
+        config.ALLOW_ANIMATION_INTERRUPTION = not config.ALLOW_ANIMATION_INTERRUPTION
+        mode_text = "ENABLED (any click switches animation)" if config.ALLOW_ANIMATION_INTERRUPTION else "DISABLED (no interrupts during animation)"
+        print(f"🔄 Animation interruption mode: {mode_text}")
     
     def is_any_animation_running(self):
         """Check if any animation is currently running."""
@@ -312,9 +368,6 @@ class LEDDisplayApp:
     
     def start_shapes_animation(self):
         """Start shapes animation - cycles through different shapes."""
-        # Check for toggle mode (buttons 0 and 3 together)
-        self.check_toggle_interruption_mode()
-        
         # Check if any animation is currently running
         # Only block if interruption mode is disabled (uses global config setting)
         if not config.ALLOW_ANIMATION_INTERRUPTION and self.is_any_animation_running():
@@ -325,14 +378,6 @@ class LEDDisplayApp:
         print("🔷 Starting shapes animation...")
         self.stop_current_pattern()
         
-        # Clear display and ensure everything is stopped
-        if hasattr(self, 'led'):
-            self.led.clear()
-            self.led.show()
-        
-        # Small delay to ensure everything is stopped
-        time.sleep(0.2)
-        
         # Ensure we have animations available
         if not self.shape_animations:
             print("⚠️ No shape animations available")
@@ -360,9 +405,6 @@ class LEDDisplayApp:
     
     def start_nature_animation(self):
         """Start nature animation - cycles through different nature scenes."""
-        # Check for toggle mode (buttons 0 and 3 together)
-        self.check_toggle_interruption_mode()
-        
         # Check if any animation is currently running
         # Only block if interruption mode is disabled (uses global config setting)
         if not config.ALLOW_ANIMATION_INTERRUPTION and self.is_any_animation_running():
@@ -376,9 +418,6 @@ class LEDDisplayApp:
         # Stop any current animation and wait for it to fully stop
         self.stop_current_pattern()
         
-        # Small delay to ensure everything is stopped
-        time.sleep(0.15)
-        
         # Reset animation stop flag so new animation can run
         self.animation_stop_flag = False
         # Ensure nature animation flag is set BEFORE starting animation
@@ -468,58 +507,44 @@ class LEDDisplayApp:
             }
             clouds.append(cloud)
         
-        # Draw first frame immediately to prevent blinking (before entering loop)
-        # Clear first to ensure clean start
-        self.led.clear()
-        sky_color = (10, 15, 25)  # Dimmed blue sky (same as truck animation)
+        sky_color = np.array((10, 15, 25))  # Dimmed blue sky (same as truck animation)
+        cream = np.array((255, 253, 208))  # Main cloud body: creamy yellow/off-white (#FFFDD0)
+        peach = np.array((224, 176, 160))  # Cloud underside: warm peach shadow (#E0B0A0)
         
-        # Draw sky background first
-        for y in range(height):
-            for x in range(width):
-                self.led.set_pixel(x, y, sky_color)
-        
-        # Draw initial clouds
-        for cloud in clouds:
-            center_x = int(cloud['x'])
-            center_y = int(cloud['y'])
-            size = cloud['size']
-            
-            # Draw cloud with image-style colors and shape
-            for cloud_y in range(max(0, center_y - size), min(height, center_y + size)):
-                for cloud_x in range(max(0, center_x - size), min(width, center_x + size)):
-                    dx = cloud_x - center_x
-                    dy = cloud_y - center_y
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    # Create organic cloud shape (not perfect circle)
-                    cloud_radius = size * (0.7 + math.sin(cloud_x * 0.3 + cloud_y * 0.2) * 0.3)
-                    
-                    if distance <= cloud_radius:
-                        # Calculate position within cloud for color variation
-                        cloud_progress = distance / cloud_radius
-                        
-                        # Main cloud body: creamy yellow/off-white (#FFFDD0)
-                        if dy < center_y - size * 0.2:  # Top part of cloud
-                            cloud_color = (255, 253, 208)  # Creamy yellow-white
-                        # Cloud underside: warm peach shadow (#E0B0A0)
-                        elif dy > center_y + size * 0.1:  # Bottom part of cloud
-                            cloud_color = (224, 176, 160)  # Warm peach
-                        # Middle transition area
-                        else:
-                            # Blend between creamy and peach
-                            blend = (dy - (center_y - size * 0.2)) / (size * 0.3)
-                            blend = max(0, min(1, blend))
-                            cloud_color = (
-                                int(255 * (1 - blend) + 224 * blend),
-                                int(253 * (1 - blend) + 176 * blend),
-                                int(208 * (1 - blend) + 160 * blend)
-                            )
-                        
-                        # Add soft edge fade
-                        edge_fade = 1.0 - cloud_progress * 0.3
-                        cloud_color = tuple(int(c * edge_fade) for c in cloud_color)
-                        
-                        self.led.set_pixel(cloud_x, cloud_y, cloud_color)
+        def draw_frame(drift_time=None, fade_intensity=1.0):
+            """Return a frame of sky and clouds (drifted drift_time seconds in), faded by fade_intensity."""
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            frame[:] = (sky_color * fade_intensity).astype(np.uint8)
+            for cloud in clouds:
+                center_x = int(cloud['x'])
+                center_y = int(cloud['y'])
+                size = cloud['size']
+                
+                # Add gentle drift
+                if drift_time is not None:
+                    center_x += int(math.sin(cloud['drift_phase'] + drift_time * 0.02) * 2)
+                    center_y += int(math.cos(cloud['drift_phase'] + drift_time * 0.015) * 1)
+                
+                # The cloud's box [center - size, center + size), using the cached fields of a cloud-sized stamp
+                stamp = get_fields(size, size, 2 * size, 2 * size)
+                left, top = center_x - size, center_y - size
+                ys, xs = np.mgrid[top:top + 2 * size, left:left + 2 * size]
+                
+                # Create organic cloud shape (not perfect circle)
+                cloud_radius = size * (0.7 + np.sin(xs * 0.3 + ys * 0.2) * 0.3)
+                mask = stamp.distance <= cloud_radius
+                
+                # Creamy top blending into a peach underside (dy is measured against center_y, as it always was)
+                blend = np.clip((stamp.dy - (center_y - size * 0.2)) / (size * 0.3), 0, 1)[:, :, None]
+                cloud_color = np.floor(cream * (1 - blend) + peach * blend)
+                
+                # Add soft edge fade
+                edge_fade = (1.0 - stamp.distance / cloud_radius * 0.3) * fade_intensity
+                paste(frame, (cloud_color * edge_fade[:, :, None]).astype(np.uint8), mask, left, top)
+            return frame
+        
+        # Draw first frame immediately to prevent blinking (before entering loop)
+        self.led.set_frame(draw_frame())
         
         # Show first frame immediately
         self.led.show()
@@ -532,64 +557,8 @@ class LEDDisplayApp:
                 print("🌤️ Cloud animation stopped by stop flag")
                 break
             
-            # Clear display
-            self.led.clear()
-            
-            # Create sky background - use same dark sky color as truck animation
-            sky_color = (10, 15, 25)  # Dimmed blue sky (same as truck animation)
-            for y in range(height):
-                for x in range(width):
-                    self.led.set_pixel(x, y, sky_color)
-            
-            # Draw clouds
-            for cloud in clouds:
-                center_x = int(cloud['x'])
-                center_y = int(cloud['y'])
-                size = cloud['size']
-                
-                # Add gentle drift
-                drift_x = math.sin(cloud['drift_phase'] + (time.time() - start_time) * 0.02) * 2
-                drift_y = math.cos(cloud['drift_phase'] + (time.time() - start_time) * 0.015) * 1
-                
-                center_x += int(drift_x)
-                center_y += int(drift_y)
-                
-                # Draw cloud with image-style colors and shape
-                for y in range(max(0, center_y - size), min(height, center_y + size)):
-                    for x in range(max(0, center_x - size), min(width, center_x + size)):
-                        dx = x - center_x
-                        dy = y - center_y
-                        distance = math.sqrt(dx*dx + dy*dy)
-                        
-                        # Create organic cloud shape (not perfect circle)
-                        cloud_radius = size * (0.7 + math.sin(x * 0.3 + y * 0.2) * 0.3)
-                        
-                        if distance <= cloud_radius:
-                            # Calculate position within cloud for color variation
-                            cloud_progress = distance / cloud_radius
-                            
-                            # Main cloud body: creamy yellow/off-white (#FFFDD0)
-                            if dy < center_y - size * 0.2:  # Top part of cloud
-                                cloud_color = (255, 253, 208)  # Creamy yellow-white
-                            # Cloud underside: warm peach shadow (#E0B0A0)
-                            elif dy > center_y + size * 0.1:  # Bottom part of cloud
-                                cloud_color = (224, 176, 160)  # Warm peach
-                            # Middle transition area
-                            else:
-                                # Blend between creamy and peach
-                                blend = (dy - (center_y - size * 0.2)) / (size * 0.3)
-                                blend = max(0, min(1, blend))
-                                cloud_color = (
-                                    int(255 * (1 - blend) + 224 * blend),
-                                    int(253 * (1 - blend) + 176 * blend),
-                                    int(208 * (1 - blend) + 160 * blend)
-                                )
-                            
-                            # Add soft edge fade
-                            edge_fade = 1.0 - cloud_progress * 0.3
-                            cloud_color = tuple(int(c * edge_fade) for c in cloud_color)
-                            
-                            self.led.set_pixel(x, y, cloud_color)
+            # Draw sky and clouds
+            self.led.set_frame(draw_frame(time.time() - start_time))
             
             # Update cloud positions
             for cloud in clouds:
@@ -615,59 +584,8 @@ class LEDDisplayApp:
             fade_progress = elapsed_fade / fade_out_duration
             fade_intensity = 1.0 - fade_progress  # Fade from 1.0 to 0.0
             
-            # Clear display
-            self.led.clear()
-            
-            # Draw sky background with fade-out
-            sky_color = tuple(int(c * fade_intensity) for c in (10, 15, 25))
-            for y in range(height):
-                for x in range(width):
-                    self.led.set_pixel(x, y, sky_color)
-            
-            # Draw clouds with fade-out
-            for cloud in clouds:
-                center_x = int(cloud['x'])
-                center_y = int(cloud['y'])
-                size = cloud['size']
-                
-                # Add gentle drift
-                drift_x = math.sin(cloud['drift_phase'] + (time.time() - start_time) * 0.02) * 2
-                drift_y = math.cos(cloud['drift_phase'] + (time.time() - start_time) * 0.015) * 1
-                
-                center_x += int(drift_x)
-                center_y += int(drift_y)
-                
-                # Draw cloud with fade-out
-                for cloud_y in range(max(0, center_y - size), min(height, center_y + size)):
-                    for cloud_x in range(max(0, center_x - size), min(width, center_x + size)):
-                        dx = cloud_x - center_x
-                        dy = cloud_y - center_y
-                        distance = math.sqrt(dx*dx + dy*dy)
-                        
-                        cloud_radius = size * (0.7 + math.sin(cloud_x * 0.3 + cloud_y * 0.2) * 0.3)
-                        
-                        if distance <= cloud_radius:
-                            cloud_progress = distance / cloud_radius
-                            
-                            # Main cloud body: creamy yellow/off-white (#FFFDD0)
-                            if dy < center_y - size * 0.2:
-                                cloud_color = (255, 253, 208)
-                            elif dy > center_y + size * 0.1:
-                                cloud_color = (224, 176, 160)
-                            else:
-                                blend = (dy - (center_y - size * 0.2)) / (size * 0.3)
-                                blend = max(0, min(1, blend))
-                                cloud_color = (
-                                    int(255 * (1 - blend) + 224 * blend),
-                                    int(253 * (1 - blend) + 176 * blend),
-                                    int(208 * (1 - blend) + 160 * blend)
-                                )
-                            
-                            # Add soft edge fade and fade-out intensity
-                            edge_fade = (1.0 - cloud_progress * 0.3) * fade_intensity
-                            cloud_color = tuple(int(c * edge_fade) for c in cloud_color)
-                            
-                            self.led.set_pixel(cloud_x, cloud_y, cloud_color)
+            # Draw sky and clouds with fade-out
+            self.led.set_frame(draw_frame(time.time() - start_time, fade_intensity))
             
             # Update cloud positions during fade-out
             for cloud in clouds:
@@ -1192,7 +1110,7 @@ class LEDDisplayApp:
         
         while time.time() - start_time < duration and self.nature_animation_running and not getattr(self, 'animation_stop_flag', False):
             # Clear display with black background
-            self.led.clear()
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
             
             current_time = time.time() - start_time
             
@@ -1229,33 +1147,28 @@ class LEDDisplayApp:
                 size = bubble['size']
                 color = bubble['color']
                 
-                # Draw bubble with soft edges
-                for dy in range(-size, size + 1):
-                    for dx in range(-size, size + 1):
-                        distance = math.sqrt(dx*dx + dy*dy)
-                        if distance <= size:
-                            x = bubble_x + dx
-                            y = bubble_y + dy
-                            
-                            if 0 <= x < width and 0 <= y < height:
-                                # Create translucent effect
-                                intensity = 1.0 - (distance / size) * 0.5
-                                r = int(color[0] * intensity)
-                                g = int(color[1] * intensity)
-                                b = int(color[2] * intensity)
-                                
-                                # Add some sparkle effect
-                                if random.random() < 0.1:
-                                    r = min(255, r + 50)
-                                    g = min(255, g + 50)
-                                    b = min(255, b + 50)
-                                
-                                self.led.set_pixel(x, y, (r, g, b))
+                # Draw bubble with soft edges, using the cached fields of a bubble-sized stamp
+                stamp = get_fields(size, size, 2 * size + 1, 2 * size + 1)
+                left, top = bubble_x - size, bubble_y - size
+                ys, xs = np.mgrid[top:top + 2 * size + 1, left:left + 2 * size + 1]
+                mask = stamp.disc(size) & (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+                
+                # Create translucent effect
+                intensity = 1.0 - (stamp.distance / size) * 0.5
+                patch = (np.array(color) * intensity[:, :, None]).astype(np.int32)
+                
+                # Add some sparkle effect
+                sparkle = np.zeros(mask.shape, dtype=bool)
+                sparkle[mask] = [random.random() < 0.1 for _ in range(int(mask.sum()))]
+                patch[sparkle] = np.minimum(255, patch[sparkle] + 50)
+                
+                paste(frame, patch, mask, left, top)
             
             # Remove bubbles that are off screen
             for i in reversed(bubbles_to_remove):
                 bubbles.pop(i)
             
+            self.led.set_frame(frame)
             self.led.show()
             time.sleep(0.05)  # 20 FPS for smooth bubble movement
         
@@ -1539,13 +1452,6 @@ class LEDDisplayApp:
         print("🏠 Starting house animation...")
         self.stop_current_pattern()
         
-        # Clear display and ensure everything is stopped
-        if hasattr(self, 'led'):
-            self.led.clear()
-            self.led.show()
-        
-        time.sleep(0.2)  # Wait to ensure everything is stopped
-        
         # Set flags
         self.animation_stop_flag = False
         self.house_animation_running = True
@@ -1869,13 +1775,6 @@ class LEDDisplayApp:
         print("🕐 Starting clock animation...")
         self.stop_current_pattern()
         
-        # Clear display and ensure everything is stopped
-        if hasattr(self, 'led'):
-            self.led.clear()
-            self.led.show()
-        
-        time.sleep(0.2)  # Wait to ensure everything is stopped
-        
         # Set flags
         self.animation_stop_flag = False
         self.clock_animation_running = True
@@ -1911,6 +1810,7 @@ class LEDDisplayApp:
         clock_center_x = width // 2  # Center horizontally
         clock_center_y = height // 2  # Center vertically
         clock_radius = 12  # Clock radius
+        face_fields = get_fields(clock_center_x, clock_center_y)
         
         def draw_clock():
             """Draw the complete clock."""
@@ -1923,14 +1823,7 @@ class LEDDisplayApp:
                     self.led.set_pixel(x, y, dark_teal)
             
             # Draw white clock face
-            for y in range(clock_center_y - clock_radius + 2, clock_center_y + clock_radius - 1):
-                for x in range(clock_center_x - clock_radius + 2, clock_center_x + clock_radius - 1):
-                    # Check if pixel is inside the circle
-                    dx = x - clock_center_x
-                    dy = y - clock_center_y
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if distance <= clock_radius - 2:
-                        self.led.set_pixel(x, y, white_face)
+            self.led.fill_mask(face_fields.disc(clock_radius - 2), white_face)
             
             # Draw hour markers
             for hour in range(12):
@@ -1999,9 +1892,6 @@ class LEDDisplayApp:
     
     def start_animals_animation(self):
         """Start animals animation - cycles through different animal animations."""
-        # Check for toggle mode (buttons 0 and 3 together)
-        self.check_toggle_interruption_mode()
-        
         # Check if any animation is currently running
         # Only block if interruption mode is disabled (uses global config setting)
         if not config.ALLOW_ANIMATION_INTERRUPTION and self.is_any_animation_running():
@@ -2012,14 +1902,6 @@ class LEDDisplayApp:
         print("🐾 Starting animals animation...")
         self.stop_current_pattern()
         
-        # Clear display and ensure everything is stopped
-        if hasattr(self, 'led'):
-            self.led.clear()
-            self.led.show()
-        
-        # Small delay to ensure everything is stopped
-        time.sleep(0.2)
-        
         # Animals animation system
         if not self.animals_animations:
             print("🐾 No animals animations available")
@@ -2052,6 +1934,28 @@ class LEDDisplayApp:
         
         print(f"✅ Started {animal_name} animation")
     
+    def run_module_animation(self, module, class_name, should_stop, audio_key=None):
+        """Run an animation class's run_animation(should_stop), in the render worker when enabled.
+
+        Scenes play the audio cue of their scene file; other animations play audio_key, if given.
+        """
+        scene = target_scene(module, class_name)
+        plan = load_scene(scene) if scene else None
+        if plan:
+            # The cue is a key of animation_audio or a file in the audio folder
+            audio_file = self.animation_audio.get(plan.audio, plan.audio) if plan.audio else None
+            self.play_animation_audio(plan.name, audio_file, plan.fps)
+        elif audio_key:
+            self.play_animation_audio(audio_key)
+        target = AnimationTarget(module, class_name)
+        if self.render_worker:
+            self.render_worker.run(target, should_stop=should_stop)
+            self.led.transition()
+            self.led.clear()
+            self.led.show()
+        else:
+            target(should_stop)
+    
     def run_animals_animation(self):
         """Run the current animals animation."""
         try:
@@ -2060,81 +1964,23 @@ class LEDDisplayApp:
                 return not self.animals_animation_running or getattr(self, 'animation_stop_flag', False)
             
             animation_name = self.animals_animations[self.current_animals_index]
-            print(f"🐾 DEBUG: Running animation '{animation_name}' at index {self.current_animals_index}")
-            
-            # Check elephant first since it should be the default
-            if animation_name == "elephant_bitmap":
-                # Play audio for this animation
-                self.play_animation_audio('elephant')
-                
-                from elephant_bitmap_animation import ElephantBitmapAnimation
-                animation = ElephantBitmapAnimation()
-                animation.run_animation(should_stop)
-                animation.cleanup()
-            elif animation_name == "whale":
-                # Play audio for this animation
-                self.play_animation_audio('whale')
-                
-                from wale_animation import WhaleAnimation
-                animation = WhaleAnimation()
-                animation.run_animation(should_stop)
-                animation.cleanup()
-            elif animation_name == "cow":
-                # Play audio for this animation
-                self.play_animation_audio('cow')
-                
-                from cow_animation import CowAnimation
-                animation = CowAnimation()
-                animation.run_animation(should_stop)
-                animation.cleanup()
-            elif animation_name == "sheep":
-                # Play audio for this animation
-                self.play_animation_audio('sheep')
-                
-                from sheep_animation import SheepAnimation
-                animation = SheepAnimation()
-                animation.run_animation(should_stop)
-                animation.cleanup()
-            elif animation_name == "horse_bitmap":
-                # Play audio for this animation
-                self.play_animation_audio('horse')
-                
-                from horse_static_animation_bitmap import HorseStaticAnimationBitmap
-                animation = HorseStaticAnimationBitmap()
-                animation.run_animation(should_stop)
-                animation.cleanup()
-            elif animation_name == "rooster":
-                # Play audio for this animation
-                self.play_animation_audio('rooster')
-                
-                from rooster_animation import RoosterAnimation
-                animation = RoosterAnimation()
-                animation.run_animation(should_stop)
-                animation.cleanup()
-            elif animation_name == "duck":
-                # Play audio for this animation
-                self.play_animation_audio('duck')
-                
-                from duck_animation import DuckAnimation
-                animation = DuckAnimation()
-                animation.run_animation(should_stop)
-                animation.cleanup()
-            elif animation_name == "snail_bitmap":
-                # Play audio for this animation
-                self.play_animation_audio('snail')
-                
-                from snail_static_animation_bitmap import SnailStaticAnimationBitmap
-                animation = SnailStaticAnimationBitmap()
-                animation.run_animation(should_stop)
-                animation.cleanup()
-            elif animation_name == "birds_bitmap":
-                # Play audio for this animation
-                self.play_animation_audio('birds')
-                
-                from bird_animation import BirdAnimation
-                animation = BirdAnimation()
-                animation.run_animation(should_stop)
-                animation.cleanup()
+            log.debug("Running animals animation", animation=animation_name, index=self.current_animals_index)
+            
+            # Animation name -> (audio key, module, class); scenes take their cue from the scene file
+            animals = {
+                "elephant_bitmap": (None, 'elephant_bitmap_animation', 'ElephantBitmapAnimation'),
+                "whale": ('whale', 'wale_animation', 'WhaleAnimation'),
+                "cow": ('cow', 'cow_animation', 'CowAnimation'),
+                "sheep": ('sheep', 'sheep_animation', 'SheepAnimation'),
+                "horse_bitmap": (None, 'horse_static_animation_bitmap', 'HorseStaticAnimationBitmap'),
+                "rooster": ('rooster', 'rooster_animation', 'RoosterAnimation'),
+                "duck": ('duck', 'duck_animation', 'DuckAnimation'),
+                "snail_bitmap": ('snail', 'snail_static_animation_bitmap', 'SnailStaticAnimationBitmap'),
+                "birds_bitmap": ('birds', 'bird_animation', 'BirdAnimation'),
+            }
+            if animation_name in animals:
+                audio_key, module, class_name = animals[animation_name]
+                self.run_module_animation(module, class_name, should_stop, audio_key)
             else:
                 print(f"⚠️ Unknown animal: {animation_name}")
         except Exception as e:
@@ -2151,7 +1997,6 @@ class LEDDisplayApp:
         """Start lion animation."""
         print("🦁 Starting lion animation...")
         self.stop_current_pattern()
-        time.sleep(0.3)  # Longer wait to ensure everything is stopped
         
         # Set flags
         self.animation_stop_flag = False
@@ -2373,6 +2218,9 @@ class LEDDisplayApp:
         # Track which squares have appeared
         appeared_squares = {}  # {(grid_x, grid_y): (appear_time, color)}
         
+        # Each square is drawn once as its own palette entry; fades only change entry levels
+        frame = IndexedFrame(width, height)
+        
         print(f"🔲 Squares animation started")
         
         # Main animation: squares appear and fade in
@@ -2394,34 +2242,20 @@ class LEDDisplayApp:
                         pos = random.choice(available_positions)
                         color = random.choice(colors)
                         appeared_squares[pos] = (elapsed, color)
+                        entry = len(appeared_squares)
+                        frame.set_color(entry, color)
+                        frame.fill_rect(pos[0] * square_width, pos[1] * square_height,
+                                        square_width, square_height, entry)
             
-            # Clear display
-            self.led.clear()
-            
-            # Draw all appeared squares with fade-in
-            for (grid_x, grid_y), (appear_time, color) in appeared_squares.items():
+            # Fade in every appeared square
+            for entry, (appear_time, color) in enumerate(appeared_squares.values(), 1):
                 # Calculate fade-in progress (0 to 1 over 1 second)
                 square_age = elapsed - appear_time
                 fade_progress = min(1.0, square_age / 1.0)  # Fade in over 1 second
                 fade_intensity = 1.0 - (1.0 - fade_progress) ** 2  # Ease-out
-                
-                # Calculate pixel position
-                pixel_x_start = grid_x * square_width
-                pixel_y_start = grid_y * square_height
-                
-                # Draw square
-                for x in range(square_width):
-                    for y in range(square_height):
-                        px = pixel_x_start + x
-                        py = pixel_y_start + y
-                        if 0 <= px < width and 0 <= py < height:
-                            final_color = (
-                                int(color[0] * fade_intensity),
-                                int(color[1] * fade_intensity),
-                                int(color[2] * fade_intensity)
-                            )
-                            self.led.set_pixel(px, py, final_color)
+                frame.set_level(fade_intensity, entry)
             
+            self.led.set_indexed_frame(frame.indices, frame.palette())
             self.led.show()
             time.sleep(0.05)  # 20 FPS
         
@@ -2434,26 +2268,8 @@ class LEDDisplayApp:
             fade_progress = elapsed_fade / fade_out_duration
             fade_out_intensity = 1.0 - (fade_progress ** 2)  # Ease-out
             
-            # Clear display
-            self.led.clear()
-            
-            # Draw all squares with fade-out intensity
-            for (grid_x, grid_y), (_, color) in appeared_squares.items():
-                pixel_x_start = grid_x * square_width
-                pixel_y_start = grid_y * square_height
-                
-                for x in range(square_width):
-                    for y in range(square_height):
-                        px = pixel_x_start + x
-                        py = pixel_y_start + y
-                        if 0 <= px < width and 0 <= py < height:
-                            final_color = (
-                                int(color[0] * fade_out_intensity),
-                                int(color[1] * fade_out_intensity),
-                                int(color[2] * fade_out_intensity)
-                            )
-                            self.led.set_pixel(px, py, final_color)
-            
+            frame.set_level(fade_out_intensity)
+            self.led.set_indexed_frame(frame.indices, frame.palette())
             self.led.show()
             time.sleep(0.05)
     
@@ -2660,7 +2476,7 @@ class LEDDisplayApp:
         
         while time.time() - start_time < duration and self.shape_animation_running:
             # Clear display with black background
-            self.led.clear()
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
             
             current_time = time.time() - start_time
             
@@ -2697,33 +2513,28 @@ class LEDDisplayApp:
                 size = bubble['size']
                 color = bubble['color']
                 
-                # Draw bubble with soft edges
-                for dy in range(-size, size + 1):
-                    for dx in range(-size, size + 1):
-                        distance = math.sqrt(dx*dx + dy*dy)
-                        if distance <= size:
-                            x = bubble_x + dx
-                            y = bubble_y + dy
-                            
-                            if 0 <= x < width and 0 <= y < height:
-                                # Create translucent effect
-                                intensity = 1.0 - (distance / size) * 0.5
-                                r = int(color[0] * intensity)
-                                g = int(color[1] * intensity)
-                                b = int(color[2] * intensity)
-                                
-                                # Add some sparkle effect
-                                if random.random() < 0.1:
-                                    r = min(255, r + 50)
-                                    g = min(255, g + 50)
-                                    b = min(255, b + 50)
-                                
-                                self.led.set_pixel(x, y, (r, g, b))
+                # Draw bubble with soft edges, using the cached fields of a bubble-sized stamp
+                stamp = get_fields(size, size, 2 * size + 1, 2 * size + 1)
+                left, top = bubble_x - size, bubble_y - size
+                ys, xs = np.mgrid[top:top + 2 * size + 1, left:left + 2 * size + 1]
+                mask = stamp.disc(size) & (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+                
+                # Create translucent effect
+                intensity = 1.0 - (stamp.distance / size) * 0.5
+                patch = (np.array(color) * intensity[:, :, None]).astype(np.int32)
+                
+                # Add some sparkle effect
+                sparkle = np.zeros(mask.shape, dtype=bool)
+                sparkle[mask] = [random.random() < 0.1 for _ in range(int(mask.sum()))]
+                patch[sparkle] = np.minimum(255, patch[sparkle] + 50)
+                
+                paste(frame, patch, mask, left, top)
             
             # Remove bubbles that are off screen
             for i in reversed(bubbles_to_remove):
                 bubbles.pop(i)
             
+            self.led.set_frame(frame)
             self.led.show()
             time.sleep(0.05)  # 20 FPS for smooth bubble movement
         
@@ -2737,7 +2548,7 @@ class LEDDisplayApp:
             fade_progress = elapsed_fade / fade_out_duration
             fade_out_intensity = 1.0 - (fade_progress ** 2)  # Ease-out
             
-            self.led.clear()
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
             
             # Draw all remaining bubbles with fade-out
             for bubble in bubbles:
@@ -2746,21 +2557,13 @@ class LEDDisplayApp:
                 size = bubble['size']
                 color = bubble['color']
                 
-                for dy in range(-size, size + 1):
-                    for dx in range(-size, size + 1):
-                        distance = math.sqrt(dx*dx + dy*dy)
-                        if distance <= size:
-                            x = bubble_x + dx
-                            y = bubble_y + dy
-                            
-                            if 0 <= x < width and 0 <= y < height:
-                                # Combine fade-out with translucent effect
-                                intensity = (1.0 - (distance / size) * 0.5) * fade_out_intensity
-                                r = int(color[0] * intensity)
-                                g = int(color[1] * intensity)
-                                b = int(color[2] * intensity)
-                                self.led.set_pixel(x, y, (r, g, b))
+                stamp = get_fields(size, size, 2 * size + 1, 2 * size + 1)
+                # Combine fade-out with translucent effect
+                intensity = (1.0 - (stamp.distance / size) * 0.5) * fade_out_intensity
+                patch = (np.array(color) * intensity[:, :, None]).astype(np.uint8)
+                paste(frame, patch, stamp.disc(size), bubble_x - size, bubble_y - size)
             
+            self.led.set_frame(frame)
             self.led.show()
             time.sleep(0.05)
         
@@ -2932,7 +2735,6 @@ class LEDDisplayApp:
         """Start rainbow wave pattern."""
         print("Starting rainbow pattern")
         self.stop_current_pattern()
-        time.sleep(0.1)  # Ensure everything is stopped
         self.current_pattern = threading.Thread(target=self.patterns.rainbow_wave)
         self.current_pattern.daemon = False  # Don't use daemon threads
         self.current_pattern.start()
@@ -2941,7 +2743,6 @@ class LEDDisplayApp:
         """Start color wave pattern."""
         print("Starting wave pattern")
         self.stop_current_pattern()
-        time.sleep(0.1)  # Ensure everything is stopped
         self.current_pattern = threading.Thread(
             target=self.patterns.color_wave, 
             args=(config.COLORS['BLUE'],)
@@ -2953,7 +2754,6 @@ class LEDDisplayApp:
         """Start text scrolling pattern."""
         print("Starting text scroll")
         self.stop_current_pattern()
-        time.sleep(0.1)  # Ensure everything is stopped
         self.current_pattern = threading.Thread(
             target=self.patterns.scrolling_text,
             args=("HELLO RASPBERRY PI!", config.COLORS['GREEN'])
@@ -2963,9 +2763,6 @@ class LEDDisplayApp:
     
     def start_objects_animation(self):
         """Start objects animation - cycles through different objects."""
-        # Check for toggle mode (buttons 0 and 3 together)
-        self.check_toggle_interruption_mode()
-        
         # Check if any animation is currently running
         # Only block if interruption mode is disabled (uses global config setting)
         if not config.ALLOW_ANIMATION_INTERRUPTION and self.is_any_animation_running():
@@ -2976,9 +2773,6 @@ class LEDDisplayApp:
         print("🎯 Starting objects animation...")
         self.stop_current_pattern()
         
-        # Small delay to ensure everything is stopped
-        time.sleep(0.1)
-        
         # Reset flags BEFORE starting new animation
         self.animation_stop_flag = False
         self.objects_animation_running = True
@@ -3026,22 +2820,15 @@ class LEDDisplayApp:
                 self.animation_stop_flag = False
                 self.objects_animation_running = True
                 
-                # Play audio for this animation
-                self.play_animation_audio('truck')
-                
                 def should_stop():
                     # Only check animation_stop_flag - don't check objects_animation_running
                     # because it might be False from previous animation finishing
                     stop_requested = getattr(self, 'animation_stop_flag', False)
                     if stop_requested:
-                        print(f"🚚 Stop check: stop_requested={stop_requested}")
+                        log.debug("Stop requested", animation='truck')
                     return stop_requested
                 
-                from truck_animation import TruckAnimation
-                animation = TruckAnimation()
-                
-                animation.run_animation(should_stop)
-                animation.cleanup()
+                self.run_module_animation('truck_animation', 'TruckAnimation', should_stop)
             elif self.current_object_index == 1:
                 # House animation
                 # Play audio for this animation
@@ -3071,18 +2858,14 @@ class LEDDisplayApp:
                     # because it might be False from previous animation finishing
                     stop_requested = getattr(self, 'animation_stop_flag', False)
                     if stop_requested:
-                        print(f"🎈 Stop check: stop_requested={stop_requested}")
+                        log.debug("Stop requested", animation='balloon')
                     return stop_requested
                 
-                from balloon_animation import BalloonAnimation
-                animation = BalloonAnimation()
-                
                 print(f"🎈 Starting balloon animation, animation_stop_flag={self.animation_stop_flag}")
                 animation_start_time = time.time()
-                animation.run_animation(should_stop)
+                self.run_module_animation('balloon_animation', 'BalloonAnimation', should_stop)
                 animation_duration = time.time() - animation_start_time
                 print(f"🎈 Balloon animation finished after {animation_duration:.2f} seconds")
-                animation.cleanup()
             elif self.current_object_index == 3:
                 # Saturn animation
                 # Ensure flags are set before starting Saturn
@@ -3097,14 +2880,10 @@ class LEDDisplayApp:
                     # because it might be False from previous animation finishing
                     stop_requested = getattr(self, 'animation_stop_flag', False)
                     if stop_requested:
-                        print(f"🪐 Stop check: stop_requested={stop_requested}")
+                        log.debug("Stop requested", animation='saturn')
                     return stop_requested
                 
-                from saturn_animation import SaturnAnimation
-                animation = SaturnAnimation()
-                
-                animation.run_animation(should_stop)
-                animation.cleanup()
+                self.run_module_animation('saturn_animation', 'SaturnAnimation', should_stop)
             else:
                 print(f"⚠️ Unknown object index: {self.current_object_index}")
         finally:
@@ -3131,6 +2910,7 @@ class LEDDisplayApp:
         clock_center_x = width // 2
         clock_center_y = height // 2
         clock_radius = 14  # Diameter of 28 LEDs
+        face_fields = get_fields(clock_center_x, clock_center_y)
         
         # Hand parameters - don't touch border
         hand_inner_radius = 3  # Small center circle
@@ -3149,13 +2929,7 @@ class LEDDisplayApp:
                     self.led.set_pixel(x, y, white)
             
             # Draw filled clock face (#6C2498)
-            for y in range(height):
-                for x in range(width):
-                    dx = x - clock_center_x
-                    dy = y - clock_center_y
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if distance < clock_radius:
-                        self.led.set_pixel(x, y, clock_fill)
+            self.led.fill_mask(face_fields.disc(clock_radius, inclusive=False), clock_fill)
             
             # Redraw white border on top of fill
             for angle in range(0, 360, 1):
@@ -3194,14 +2968,7 @@ class LEDDisplayApp:
                         self.led.set_pixel(px, py, white)
             
             # Draw center circle (white)
-            for dy in range(-hand_inner_radius, hand_inner_radius + 1):
-                for dx in range(-hand_inner_radius, hand_inner_radius + 1):
-                    dist = math.sqrt(dx*dx + dy*dy)
-                    if dist <= hand_inner_radius:
-                        px = clock_center_x + dx
-                        py = clock_center_y + dy
-                        if 0 <= px < width and 0 <= py < height:
-                            self.led.set_pixel(px, py, white)
+            self.led.fill_mask(face_fields.disc(hand_inner_radius), white)
         
         while time.time() - start_time < duration and self.objects_animation_running and not getattr(self, 'animation_stop_flag', False):
             elapsed = time.time() - start_time
@@ -3262,10 +3029,7 @@ class LEDDisplayApp:
         yellow_light_y = fixture_y + fixture_height // 2  # Middle light
         green_light_y = fixture_y + fixture_height - light_spacing  # Bottom light
         
-        # Track which lights are on
-        current_light = None  # 'red', 'yellow', 'green', or None
-        
-        def draw_circle(center_x, center_y, radius, color):
+        def draw_circle(frame, center_x, center_y, radius, color):
             """Draw a perfect circle."""
             for dy in range(-radius, radius + 1):
                 for dx in range(-radius, radius + 1):
@@ -3276,51 +3040,39 @@ class LEDDisplayApp:
                         px = center_x + dx
                         py = center_y + dy
                         if 0 <= px < width and 0 <= py < height:
-                            self.led.set_pixel(px, py, color)
+                            frame[py, px] = color
         
-        def draw_traffic_lights(active_light):
-            """Draw traffic light fixture with active light."""
+        def draw_traffic_lights(phase_time):
+            """Draw traffic light fixture with the light that is on at phase_time."""
+            # Every 5 seconds, a different light turns on
+            light_phase = int(phase_time / 5) % 4  # 0=none, 1=red, 2=yellow, 3=green
+            active_light = [None, 'red', 'yellow', 'green'][light_phase]
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
+            
             # Draw fixture background (longer rectangle)
-            for y in range(fixture_y, fixture_y + fixture_height):
-                for x in range(fixture_x, fixture_x + fixture_width):
-                    if 0 <= x < width and 0 <= y < height:
-                        self.led.set_pixel(x, y, fixture_color)
+            frame[fixture_y:fixture_y + fixture_height, fixture_x:fixture_x + fixture_width] = fixture_color
             
             # Draw red light (top) - perfect circle
             light_color = red_light if active_light == 'red' else off_color
-            draw_circle(fixture_center_x, red_light_y, light_radius, light_color)
+            draw_circle(frame, fixture_center_x, red_light_y, light_radius, light_color)
             
             # Draw yellow light (middle) - perfect circle
             light_color = yellow_light if active_light == 'yellow' else off_color
-            draw_circle(fixture_center_x, yellow_light_y, light_radius, light_color)
+            draw_circle(frame, fixture_center_x, yellow_light_y, light_radius, light_color)
             
             # Draw green light (bottom) - perfect circle
             light_color = green_light if active_light == 'green' else off_color
-            draw_circle(fixture_center_x, green_light_y, light_radius, light_color)
+            draw_circle(frame, fixture_center_x, green_light_y, light_radius, light_color)
+            return frame
+        
+        # The light cycle repeats every 20 seconds with 4 distinct frames
+        frames = PeriodicFrames('traffic_lights', draw_traffic_lights, period=20, steps=4)
         
         while time.time() - start_time < duration and self.objects_animation_running and not getattr(self, 'animation_stop_flag', False):
             elapsed = time.time() - start_time
             
-            # Determine which light should be on based on elapsed time
-            # Every 5 seconds, a different light turns on
-            light_phase = int(elapsed / 5) % 4  # 0=none, 1=red, 2=yellow, 3=green
-            
-            if light_phase == 0:
-                current_light = None  # No lights
-            elif light_phase == 1:
-                current_light = 'red'
-            elif light_phase == 2:
-                current_light = 'yellow'
-            else:
-                current_light = 'green'
-            
-            # Clear display
-            self.led.clear()
-            
-            # Draw traffic lights
-            draw_traffic_lights(current_light)
-            
             # Show the frame
+            blit_frame(self.led, frames.frame_at(elapsed))
             self.led.show()
             
             # Frame rate
@@ -3337,6 +3089,9 @@ class LEDDisplayApp:
         """Stop the currently running pattern."""
         print("🛑 Stopping all animations...")
         
+        # Keep the last frame on the board until the next animation blends in over it
+        self.led.hold_frame()
+        
         # Set all animation stop flags FIRST
         self.animation_stop_flag = True
         self.objects_animation_running = False
@@ -3369,9 +3124,8 @@ class LEDDisplayApp:
         # Stop shape animations
         self.stop_current_shape_animation()
         
-        # Don't clear display here - new animation will handle it to avoid blinking
-        # Small delay to ensure everything is stopped
-        time.sleep(0.1)
+        # No clear and no delay: the next animation's frames blend in from the held frame
+        self.led.transition()
         
         # Reset the flag after clearing
         self.animation_stop_flag = False
@@ -3420,6 +3174,8 @@ class LEDDisplayApp:
         print(f"  Panels: {config.PANELS_COUNT} ({config.PANEL_WIDTH}x{config.PANEL_HEIGHT} each)")
         print(f"  LED Pin: {config.LED_PIN}")
         print(f"  Brightness: {config.BRIGHTNESS}")
+        if self.power:
+            print(f"  Power budget: {config.POWER_BUDGET_MA / 1000:g} A (brightness limited above it)")
         print()
         
         # Start button monitoring
@@ -3437,8 +3193,9 @@ class LEDDisplayApp:
         print("  Button 22: Objects animation")
         
         try:
+            # Blocks until a press, an animation ending or the idle timeout - no polling
             while self.running:
-                time.sleep(1)
+                self.idle.step()
         except KeyboardInterrupt:
             print("\nShutting down...")
             self.cleanup()
@@ -3446,8 +3203,20 @@ class LEDDisplayApp:
     def cleanup(self):
         """Clean up resources."""
         print("Cleaning up...")
+        self.running = False
+        self.idle.stop()
         self.stop_current_pattern()
         self.stop_current_shape_animation()
+        if self.button_dispatcher:
+            self.button_dispatcher.print_stats()
+        get_frame_cache().print_stats()
+        if self.power:
+            self.power.print_stats()
+        if self.render_worker:
+            self.render_worker.stop()
+        if self.telemetry:
+            print(self.telemetry.summary_line())
+            self.telemetry.stop()
         self.button_controller.cleanup()
         self.led.cleanup()
         print("Cleanup completed.")
@@ -3553,6 +3322,7 @@ def main():
             print("⏳ Waiting for modules to fully unload before restart...")
             time.sleep(5)  # Longer wait to ensure all modules are released and hardware is ready
             print("🔄 Restarting now...")
+            app_logging.shutdown_logging()
             # Restart the application to load new code
             import os
             import sys
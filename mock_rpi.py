@@ -5,6 +5,11 @@ This allows testing the code structure without actual hardware
 
 import time
 import random
+import numpy as np
+import config
+from app_logging import get_logger
+
+log = get_logger(__name__)
 
 class MockGPIO:
     """Mock GPIO class for Windows development"""
@@ -23,83 +28,178 @@ class MockGPIO:
     PUD_UP = 1
     PUD_DOWN = 0
     
+    # GPIO edges
+    RISING = 31
+    FALLING = 32
+    BOTH = 33
+    
     def __init__(self):
         self.pins = {}
-        print("Mock GPIO initialized (Windows development mode)")
+        self.input_levels = {}  # Injected input levels (see set_input)
+        self.edge_callbacks = {}  # pin -> callback(pin) for add_event_detect
+        log.debug("Mock GPIO initialized")
     
     def setmode(self, mode):
-        print(f"GPIO mode set to: {mode}")
+        log.debug("GPIO mode set", mode=mode)
     
     def setwarnings(self, warnings):
-        print(f"GPIO warnings set to: {warnings}")
+        log.debug("GPIO warnings set", warnings=warnings)
     
     def setup(self, pin, mode, initial=0, pull_up_down=None):
         self.pins[pin] = initial
-        pull_text = f" with pull-up" if pull_up_down == self.PUD_UP else f" with pull-down" if pull_up_down == self.PUD_DOWN else ""
-        print(f"GPIO pin {pin} setup as {'OUTPUT' if mode == self.OUT else 'INPUT'}{pull_text}")
+        pull = 'up' if pull_up_down == self.PUD_UP else 'down' if pull_up_down == self.PUD_DOWN else 'none'
+        log.debug("GPIO pin setup", pin=pin, mode='OUTPUT' if mode == self.OUT else 'INPUT', pull=pull)
     
     def output(self, pin, state):
         self.pins[pin] = state
-        print(f"GPIO pin {pin} set to {state}")
+        log.debug("GPIO pin set", pin=pin, state=state)
     
     def input(self, pin):
+        # Return the injected level if a test set one
+        if pin in self.input_levels:
+            return self.input_levels[pin]
         # Simulate button press with random chance
         return random.choice([self.HIGH, self.LOW])
     
+    def set_input(self, pin, state):
+        """Inject an input level for a pin (buttons are active LOW); fires edge callbacks on a change."""
+        changed = self.input_levels.get(pin) != state
+        self.input_levels[pin] = state
+        if changed and pin in self.edge_callbacks:
+            self.edge_callbacks[pin](pin)
+    
+    def add_event_detect(self, pin, edge, callback=None, bouncetime=None):
+        """Call callback(pin) whenever an injected level changes (edge is ignored)."""
+        self.edge_callbacks[pin] = callback
+    
+    def remove_event_detect(self, pin):
+        self.edge_callbacks.pop(pin, None)
+    
+    def press(self, pin):
+        """Simulate pressing a button wired with a pull-up."""
+        self.set_input(pin, self.LOW)
+    
+    def release(self, pin):
+        """Simulate releasing a button wired with a pull-up."""
+        self.set_input(pin, self.HIGH)
+    
     def cleanup(self):
         self.pins.clear()
-        print("GPIO cleanup completed")
+        self.input_levels.clear()
+        self.edge_callbacks.clear()
+        log.debug("GPIO cleanup completed")
 
 class MockWS281x:
-    """Mock WS281x class for Windows development"""
+    """Mock WS281x strip for development, tests and benchmarks.
+    
+    Pixels live in a preallocated (led_count, 3) uint8 array. show() models
+    the WS2812 wire time (24 bits per LED at freq_hz plus the latch reset):
+    like the real driver it waits for the previous transfer to finish, then
+    starts the next one. Timing modes:
+        'sleep'    - really wait, so the mock runs at the real strip's frame rate
+        'simulate' - only add up the time that would have been waited (wire_wait_total)
+        'off'      - no timing at all
+    The last capture_frames frames shown are kept in a ring buffer for assertions.
+    """
+    
+    RESET_TIME = 55e-6  # Latch/reset gap after each frame (seconds)
     
     def __init__(self, led_count, pin, freq_hz=800000, dma=10, invert=False, 
-                 brightness=255, channel=0, strip_type=None, gamma=None):
+                 brightness=255, channel=0, strip_type=None, gamma=None,
+                 timing=None, capture_frames=None):
         self.led_count = led_count
         self.pin = pin
         self.freq_hz = freq_hz
         self.brightness = brightness
-        self.pixels = [(0, 0, 0)] * led_count
-        print(f"Mock WS281x initialized: {led_count} LEDs on pin {pin}")
+        self.pixels = np.zeros((led_count, 3), dtype=np.uint8)
+        
+        # Wire time model
+        self.timing = timing or config.MOCK_STRIP_TIMING
+        self.frame_wire_time = led_count * 24.0 / freq_hz + self.RESET_TIME
+        self.busy_until = 0.0  # When the current transfer finishes
+        self.wire_wait_total = 0.0  # Time show() spent (or would have spent) waiting
+        self.simulated_wait = 0.0
+        self.show_count = 0
+        
+        # Ring buffer of shown frames
+        if capture_frames is None:
+            capture_frames = config.MOCK_STRIP_CAPTURE_FRAMES
+        self.captures = np.zeros((capture_frames, led_count, 3), dtype=np.uint8)
+        
+        print(f"Mock WS281x initialized: {led_count} LEDs on pin {pin} "
+              f"({self.frame_wire_time * 1000:.1f} ms per frame on the wire, timing '{self.timing}')")
     
     def begin(self):
-        print("WS281x strip begin() called")
+        log.debug("WS281x strip begin() called")
     
     def setPixelColor(self, pixel, color):
         if 0 <= pixel < self.led_count:
+            if isinstance(color, int):
+                # Packed 0xRRGGBB like rpi_ws281x.Color()
+                color = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
             self.pixels[pixel] = color
-            # Print every 100th pixel to avoid spam
-            if pixel % 100 == 0:
-                print(f"Pixel {pixel} set to color {color}")
     
     def setPixelColorRGB(self, pixel, red, green, blue, white=0):
         if 0 <= pixel < self.led_count:
             self.pixels[pixel] = (red, green, blue)
-            # No debug prints - too noisy
+    
+    def setPixels(self, pixels, start=0):
+        """Bulk setter: copy a (n, 3) uint8 array into the strip starting at LED start."""
+        self.pixels[start:start + len(pixels)] = pixels
     
     def show(self):
-        # No debug print - too noisy
-        # Simulate some delay for the display
-        time.sleep(0.01)
+        if self.timing != 'off':
+            # Simulated waits move a virtual clock ahead of the real one
+            now = time.monotonic() + self.simulated_wait
+            # Wait for the previous frame to finish clocking out
+            wait = self.busy_until - now
+            if wait > 0:
+                self.wire_wait_total += wait
+                if self.timing == 'sleep':
+                    time.sleep(wait)
+                else:
+                    self.simulated_wait += wait
+                now += wait
+            self.busy_until = now + self.frame_wire_time
+        
+        if len(self.captures):
+            self.captures[self.show_count % len(self.captures)] = self.pixels
+        self.show_count += 1
+    
+    def captured_frames(self):
+        """Return the captured frames, oldest first, as a (n, led_count, 3) array."""
+        count = min(self.show_count, len(self.captures))
+        order = [(self.show_count - count + i) % len(self.captures) for i in range(count)]
+        return self.captures[order]
+    
+    def last_frame(self):
+        """Return the last frame shown, or None."""
+        if not self.show_count or not len(self.captures):
+            return None
+        return self.captures[(self.show_count - 1) % len(self.captures)]
+    
+    def max_fps(self):
+        """Return the frame rate ceiling set by the wire time."""
+        return 1.0 / self.frame_wire_time
     
     def setBrightness(self, brightness):
         self.brightness = brightness
-        print(f"Brightness set to {brightness}")
+        log.debug("Brightness set", brightness=brightness)
     
     def numPixels(self):
         return self.led_count
     
     def getPixelColor(self, pixel):
         if 0 <= pixel < self.led_count:
-            return self.pixels[pixel]
+            return tuple(self.pixels[pixel].tolist())
         return (0, 0, 0)
     
     def clear(self):
-        self.pixels = [(0, 0, 0)] * self.led_count
-        print("All pixels cleared")
+        self.pixels.fill(0)
+        log.debug("All pixels cleared")
 
 # Create mock instances
 GPIO = MockGPIO()
 WS281x = MockWS281x
 
-print("Mock Raspberry Pi modules loaded for Windows development") 
\ No newline at end of file
+log.debug("Mock Raspberry Pi modules loaded") 
\ No newline at end of file
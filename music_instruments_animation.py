@@ -8,6 +8,7 @@ import time
 import numpy as np
 import math
 from led_controller_fixed import LEDControllerFixed
+from frame_interpolator import FrameInterpolator
 import config
 
 class MusicInstrumentsAnimation:
@@ -42,6 +43,7 @@ class MusicInstrumentsAnimation:
         self.highlight_timer = 0
         self.current_instrument = 0
         self.instrument_duration = 6  # seconds per instrument
+        self.interpolator = FrameInterpolator(self.led)
         
     def create_sousaphone(self, frame):
         """Create a large sousaphone."""
@@ -330,35 +332,31 @@ class MusicInstrumentsAnimation:
                             frame[glow_y, glow_x] = tuple(int(c + (h - c) * glow_intensity * 0.3) 
                                                         for c, h in zip(current, highlight))
     
+    def render_instrument_frame(self, instrument_func):
+        """Render one keyframe of an instrument with fresh highlights."""
+        # Create frame with current instrument
+        frame = np.full((self.height, self.width, 3), self.colors['background'], dtype=np.uint8)
+        
+        # Draw the instrument
+        instrument_func(frame)
+        
+        # Add highlights
+        self.add_highlights(frame)
+        
+        # Update animation parameters
+        self.instrument_timer += 1
+        self.highlight_timer += 1
+        
+        return frame
+    
     def display_instrument(self, instrument_name, instrument_func, duration=6):
         """Display a specific instrument for the given duration."""
         print(f"Displaying {instrument_name.upper()} for {duration} seconds...")
         
-        start_time = time.time()
-        
-        while time.time() - start_time < duration:
-            # Create frame with current instrument
-            frame = np.full((self.height, self.width, 3), self.colors['background'], dtype=np.uint8)
-            
-            # Draw the instrument
-            instrument_func(frame)
-            
-            # Add highlights
-            self.add_highlights(frame)
-            
-            # Display the frame
-            for y in range(self.height):
-                for x in range(self.width):
-                    color = frame[y, x]
-                    self.led.set_pixel(x, y, color)
-            
-            self.led.show()
-            
-            # Update animation parameters
-            self.instrument_timer += 1
-            self.highlight_timer += 1
-            
-            time.sleep(0.1)  # 10 FPS
+        # Keyframes are rendered at 10 FPS; the interpolator blends the
+        # highlights in between so the output runs at the full frame rate
+        self.interpolator.run(lambda t: self.render_instrument_frame(instrument_func),
+                              keyframe_fps=10, duration=duration)
         
         print(f"{instrument_name.capitalize()} display completed!")
     
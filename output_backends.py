@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+LED Output Backends
+Where finished frames go once the LED controller has put them in strip order
+
+Every backend receives whole frames as a (TOTAL_LEDS, 3) uint8 array in
+compiled LED order (index i is the color of strip LED i), exactly what the
+real strip is sent. The backend is chosen with config.OUTPUT_BACKEND:
+
+    auto      rpi_ws281x on a Raspberry Pi, the mock strip everywhere else
+    ws281x    the real LED strip (rpi_ws281x.PixelStrip)
+    mock      mock_rpi.MockWS281x, driven through the same code path as ws281x
+    recorder  write every frame to config.OUTPUT_RECORD_PATH
+    udp       send frames as DDP packets to config.OUTPUT_UDP_HOST (e.g. WLED)
+    terminal  live ANSI preview in the terminal, redrawing only changed pixels
+    tap       publish frames to shared memory for other processes (see
+              frame_tap.py; added automatically when config.FRAME_TAP_ENABLED)
+    shared    inside a render worker process: hand frames to the main process
+              (set automatically, see render_worker.py)
+
+Several backends can be combined with commas, e.g. 'ws281x,recorder'.
+
+Replay a recording in the terminal:
+    python output_backends.py play recordings/output.ledrec
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import struct
+import numpy as np
+import config
+from app_logging import get_logger
+
+log = get_logger(__name__)
+
+
+def _on_raspberry_pi():
+    """Return True when running on a Raspberry Pi."""
+    try:
+        with open('/proc/device-tree/model') as f:
+            return 'Raspberry Pi' in f.read()
+    except OSError:
+        return False
+
+
+def _import_pixel_strip(attempts=3):
+    """Import rpi_ws281x.PixelStrip, retrying briefly (the driver can be busy during a service restart).
+
+    Returns None if it cannot be imported.
+    """
+    for attempt in range(attempts):
+        try:
+            from rpi_ws281x import PixelStrip
+            log.debug("rpi_ws281x imported")
+            return PixelStrip
+        except ImportError as e:
+            if attempt < attempts - 1:
+                log.warning("rpi_ws281x import failed, retrying", attempt=attempt + 1)
+                time.sleep(0.5)
+            else:
+                log.error("rpi_ws281x not found, using mock strip", attempts=attempts, error=str(e))
+    return None
+
+
+class OutputBackend:
+    """Base class for output backends."""
+
+    name = 'base'
+
+    def __init__(self, led_count=None, width=None, height=None):
+        """Initialize for a strip of led_count LEDs showing a width x height display."""
+        self.led_count = led_count or config.TOTAL_LEDS
+        self.width = width or config.TOTAL_WIDTH
+        self.height = height or config.TOTAL_HEIGHT
+        # frame_order[i] is the flat (y * width + x) display pixel shown by LED i
+        self.frame_order = np.arange(self.led_count, dtype=np.intp)
+        self.frames_written = 0
+
+    def set_layout(self, frame_order):
+        """Set the LED order used to turn strip-order pixels back into a display frame."""
+        self.frame_order = np.asarray(frame_order, dtype=np.intp)
+
+    def to_frame(self, pixels):
+        """Return strip-order pixels as a (height, width, 3) display frame."""
+        frame = np.zeros((self.height * self.width, 3), dtype=np.uint8)
+        frame[self.frame_order] = pixels
+        return frame.reshape(self.height, self.width, 3)
+
+    def begin(self):
+        """Open the output."""
+
+    def write(self, pixels):
+        """Push one frame of (led_count, 3) uint8 strip-order pixels."""
+        raise NotImplementedError
+
+    def set_brightness(self, brightness):
+        """Set global brightness (0-255)."""
+
+    def close(self):
+        """Release the output."""
+
+
+class StripBackend(OutputBackend):
+    """Drives a PixelStrip-compatible object (rpi_ws281x or the mock strip).
+
+    Only LEDs whose color changed since the last frame are sent to the
+    strip's buffer, then the whole strip is latched with show(). The mock
+    strip takes the same path, so tests and benchmarks exercise it too.
+    """
+
+    def __init__(self, strip_class, led_count=None, width=None, height=None, name='ws281x'):
+        super().__init__(led_count, width, height)
+        self.name = name
+        self.strip = strip_class(
+            self.led_count,
+            config.LED_PIN,
+            config.LED_FREQ_HZ,
+            config.LED_DMA,
+            config.LED_INVERT,
+            int(config.BRIGHTNESS * 255),
+            config.LED_CHANNEL
+        )
+        self.last = None
+
+    def begin(self):
+        self.strip.begin()
+
+    def write(self, pixels):
+        if self.last is None:
+            changed = range(self.led_count)
+            self.last = pixels.copy()
+        else:
+            changed = np.flatnonzero((pixels != self.last).any(axis=1)).tolist()
+            self.last[changed] = pixels[changed]
+
+        set_color = self.strip.setPixelColorRGB
+        colors = pixels.tolist()
+        for led_index in changed:
+            r, g, b = colors[led_index]
+            set_color(led_index, r, g, b)
+        self.strip.show()
+        self.frames_written += 1
+
+    def set_brightness(self, brightness):
+        self.strip.setBrightness(brightness)
+
+
+class RecorderBackend(OutputBackend):
+    """Writes every frame with its timestamp to a recording file.
+
+    File format: the line b'LEDREC1' followed by records. A b'L' record is a
+    JSON layout (led count, size, frame order) written whenever the layout
+    changes; a b'F' record is a little-endian float64 timestamp followed by
+    led_count * 3 bytes of strip-order RGB. See read_recording().
+    """
+
+    name = 'recorder'
+    MAGIC = b'LEDREC1\n'
+
+    def __init__(self, path=None, led_count=None, width=None, height=None):
+        super().__init__(led_count, width, height)
+        self.path = path or config.OUTPUT_RECORD_PATH
+        self.file = None
+
+    def _write_layout(self):
+        layout = json.dumps({
+            'led_count': self.led_count,
+            'width': self.width,
+            'height': self.height,
+            'frame_order': self.frame_order.tolist(),
+        }).encode()
+        self.file.write(b'L' + struct.pack('<I', len(layout)) + layout)
+
+    def begin(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(self.path, 'wb')
+        self.file.write(self.MAGIC)
+        self._write_layout()
+        print(f"⏺️ Recording LED output to {self.path}")
+
+    def set_layout(self, frame_order):
+        super().set_layout(frame_order)
+        if self.file:
+            self._write_layout()
+
+    def write(self, pixels):
+        if self.file is None:
+            return
+        self.file.write(b'F' + struct.pack('<d', time.time()))
+        self.file.write(np.ascontiguousarray(pixels, dtype=np.uint8).tobytes())
+        self.frames_written += 1
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+            print(f"⏹️ Recorded {self.frames_written} frames to {self.path}")
+
+
+def read_recording(path):
+    """Yield (timestamp, pixels, frame) for every frame of a recording.
+
+    pixels is the strip-order (led_count, 3) array, frame the (height, width, 3)
+    display frame rebuilt with the recorded layout.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(RecorderBackend.MAGIC)) != RecorderBackend.MAGIC:
+            raise ValueError(f"{path} is not an LED recording")
+        layout = None
+        while True:
+            kind = f.read(1)
+            if not kind:
+                return
+            if kind == b'L':
+                size, = struct.unpack('<I', f.read(4))
+                layout = json.loads(f.read(size))
+                view = OutputBackend(layout['led_count'], layout['width'], layout['height'])
+                view.set_layout(layout['frame_order'])
+            elif kind == b'F':
+                timestamp, = struct.unpack('<d', f.read(8))
+                data = f.read(layout['led_count'] * 3)
+                pixels = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+                yield timestamp, pixels, view.to_frame(pixels)
+            else:
+                raise ValueError(f"Corrupt LED recording {path}: unknown record {kind!r}")
+
+
+class UDPBackend(OutputBackend):
+    """Sends frames over UDP using DDP (Distributed Display Protocol).
+
+    DDP is understood by WLED, xLights and most network pixel controllers,
+    so the strip-order data can drive a second display or a PC viewer.
+    Frames are split into 480-pixel packets; the last one carries the push flag.
+    """
+
+    name = 'udp'
+    FLAGS_VERSION1 = 0x40
+    FLAG_PUSH = 0x01
+    TYPE_RGB24 = 0x0B
+    DESTINATION_DISPLAY = 1
+    PIXELS_PER_PACKET = 480
+
+    def __init__(self, host=None, port=None, led_count=None, width=None, height=None):
+        super().__init__(led_count, width, height)
+        self.address = (host or config.OUTPUT_UDP_HOST, port or config.OUTPUT_UDP_PORT)
+        self.socket = None
+        self.sequence = 0
+        self.send_errors = 0
+
+    def begin(self):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        print(f"📡 Sending LED frames to {self.address[0]}:{self.address[1]} (DDP)")
+
+    def write(self, pixels):
+        data = np.ascontiguousarray(pixels, dtype=np.uint8).tobytes()
+        self.sequence = self.sequence % 15 + 1  # 1-15, 0 means "no sequence"
+        chunk = self.PIXELS_PER_PACKET * 3
+        for offset in range(0, len(data), chunk):
+            payload = data[offset:offset + chunk]
+            flags = self.FLAGS_VERSION1
+            if offset + chunk >= len(data):
+                flags |= self.FLAG_PUSH
+            header = struct.pack('!BBBBIH', flags, self.sequence, self.TYPE_RGB24,
+                                 self.DESTINATION_DISPLAY, offset, len(payload))
+            try:
+                self.socket.sendto(header + payload, self.address)
+            except OSError:
+                # Never let a slow or missing receiver stall the display
+                self.send_errors += 1
+        self.frames_written += 1
+
+    def close(self):
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+
+
+class TerminalBackend(OutputBackend):
+    """Live 24-bit color preview in an ANSI terminal.
+
+    Two display rows share one character cell (upper half block), so the
+    32x48 display takes 32x24 characters. After the first frame only cells
+    whose pixels changed are redrawn, and redraws are limited to
+    config.TERMINAL_PREVIEW_FPS.
+    """
+
+    name = 'terminal'
+    UPPER_HALF_BLOCK = '▀'
+
+    def __init__(self, stream=None, max_fps=None, led_count=None, width=None, height=None):
+        super().__init__(led_count, width, height)
+        # The real terminal: with config.LOG_ROUTE_PRINTS, sys.stdout only takes whole log lines
+        self.stream = stream or sys.__stdout__
+        self.min_interval = 1.0 / (max_fps or config.TERMINAL_PREVIEW_FPS)
+        self.last_draw = 0.0
+        self.previous = None  # Last drawn frame, padded to an even number of rows
+
+    def begin(self):
+        self.stream.write('\x1b[2J')
+        self.stream.flush()
+
+    def write(self, pixels):
+        self.frames_written += 1
+        now = time.monotonic()
+        if now - self.last_draw < self.min_interval:
+            return
+        self.last_draw = now
+
+        frame = self.to_frame(pixels)
+        if self.height % 2:
+            frame = np.concatenate([frame, np.zeros((1, self.width, 3), dtype=np.uint8)])
+        cells = frame.reshape(-1, 2, self.width, 3)
+
+        if self.previous is None:
+            changed = np.ones(cells.shape[0:1] + cells.shape[2:3], dtype=bool)
+        else:
+            changed = (cells != self.previous.reshape(cells.shape)).any(axis=(1, 3))
+        self.previous = frame
+
+        out = []
+        top, bottom = cells[:, 0].tolist(), cells[:, 1].tolist()
+        for row, col in zip(*np.nonzero(changed)):
+            (tr, tg, tb), (br, bg, bb) = top[row][col], bottom[row][col]
+            out.append(f'\x1b[{row + 1};{col + 1}H\x1b[38;2;{tr};{tg};{tb}m'
+                       f'\x1b[48;2;{br};{bg};{bb}m{self.UPPER_HALF_BLOCK}')
+        if out:
+            out.append(f'\x1b[0m\x1b[{cells.shape[0] + 1};1H')
+            self.stream.write(''.join(out))
+            self.stream.flush()
+
+    def close(self):
+        self.stream.write('\x1b[0m\n')
+        self.stream.flush()
+
+
+class TeeBackend(OutputBackend):
+    """Sends every frame to several backends."""
+
+    name = 'tee'
+
+    def __init__(self, backends):
+        first = backends[0]
+        super().__init__(first.led_count, first.width, first.height)
+        self.backends = backends
+        self.name = ','.join(backend.name for backend in backends)
+
+    def set_layout(self, frame_order):
+        super().set_layout(frame_order)
+        for backend in self.backends:
+            backend.set_layout(frame_order)
+
+    def begin(self):
+        for backend in self.backends:
+            backend.begin()
+
+    def write(self, pixels):
+        for backend in self.backends:
+            backend.write(pixels)
+        self.frames_written += 1
+
+    def set_brightness(self, brightness):
+        for backend in self.backends:
+            backend.set_brightness(brightness)
+
+    def close(self):
+        for backend in self.backends:
+            backend.close()
+
+
+def create_backend(spec=None, led_count=None, width=None, height=None):
+    """Create the output backend(s) named by spec (default config.OUTPUT_BACKEND)."""
+    names = [name.strip() for name in (spec or config.OUTPUT_BACKEND).split(',') if name.strip()]
+    if config.FRAME_TAP_ENABLED and 'tap' not in names and 'shared' not in names:
+        names.append('tap')
+    backends = []
+    for name in names:
+        if name == 'auto':
+            name = 'ws281x' if _on_raspberry_pi() else 'mock'
+
+        if name == 'ws281x':
+            strip_class = _import_pixel_strip()
+            if strip_class is None:
+                from mock_rpi import WS281x as strip_class
+                name = 'mock'
+            backends.append(StripBackend(strip_class, led_count, width, height, name=name))
+        elif name == 'mock':
+            from mock_rpi import WS281x
+            backends.append(StripBackend(WS281x, led_count, width, height, name='mock'))
+        elif name == 'recorder':
+            backends.append(RecorderBackend(led_count=led_count, width=width, height=height))
+        elif name == 'udp':
+            backends.append(UDPBackend(led_count=led_count, width=width, height=height))
+        elif name == 'terminal':
+            backends.append(TerminalBackend(led_count=led_count, width=width, height=height))
+        elif name == 'tap':
+            from frame_tap import FrameTapBackend
+            try:
+                backends.append(FrameTapBackend(led_count, width, height))
+            except FileExistsError as e:
+                print(f"⚠️ {e} - not publishing this process's frames")
+        elif name == 'shared':
+            from render_worker import create_shared_backend
+            backends.append(create_shared_backend(led_count, width, height))
+        else:
+            raise ValueError(f"Unknown output backend '{name}'")
+
+    if not backends:
+        raise ValueError("No output backend configured")
+    return backends[0] if len(backends) == 1 else TeeBackend(backends)
+
+
+def main():
+    """Command line entry point: replay a recording in the terminal."""
+    if len(sys.argv) != 3 or sys.argv[1] != 'play':
+        print("Usage: python output_backends.py play <recording>")
+        sys.exit(1)
+
+    preview = None
+    previous_time = None
+    for timestamp, pixels, frame in read_recording(sys.argv[2]):
+        if preview is None:
+            preview = TerminalBackend(max_fps=1000, width=frame.shape[1], height=frame.shape[0],
+                                      led_count=len(pixels))
+            preview.begin()
+        preview.set_layout(np.arange(len(pixels)))
+        if previous_time is not None:
+            time.sleep(max(0.0, timestamp - previous_time))
+        previous_time = timestamp
+        preview.write(frame.reshape(-1, 3))
+    if preview:
+        preview.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Power Limiter
+Estimates the current every frame draws and keeps the LEDs within the
+power supply's budget by lowering the strip brightness
+
+The estimate is the sum of each channel over the frame times
+config.POWER_CHANNEL_MA (mA per LED channel at full value), scaled by the
+strip brightness, plus config.POWER_IDLE_MA per LED. When a frame would
+go over config.POWER_BUDGET_MA the brightness drops at once to fit it;
+afterwards it climbs back to config.BRIGHTNESS over
+config.POWER_LIMIT_RELEASE seconds, so flashes don't make the board
+flicker. Only the strip brightness changes, never the pixels.
+
+So config.BRIGHTNESS no longer has to be low enough for an all-white
+frame: dark scenes run at full brightness and bright ones are limited.
+
+Peak and average current are kept per animation (see set_scene()):
+
+    python power_limiter.py [animation ...]     estimate from the golden frame thumbnails
+"""
+
+import base64
+import sys
+import threading
+import time
+import numpy as np
+import config
+from output_backends import OutputBackend, create_backend
+
+
+class PowerLimiter(OutputBackend):
+    """Wraps an output backend, estimating each frame's current and limiting brightness to the budget."""
+
+    def __init__(self, backend, budget_ma=None, channel_ma=None, idle_ma=None, release=None):
+        """Wrap backend; the model defaults to the config.POWER_* settings."""
+        super().__init__(backend.led_count, backend.width, backend.height)
+        self.backend = backend
+        self.name = backend.name
+        self.budget_ma = budget_ma or config.POWER_BUDGET_MA
+        # mA per unit of channel value at full brightness
+        self.ma_per_value = np.asarray(channel_ma or config.POWER_CHANNEL_MA, dtype=np.float64) / 255.0
+        self.idle_ma = (config.POWER_IDLE_MA if idle_ma is None else idle_ma) * self.led_count
+        self.release = config.POWER_LIMIT_RELEASE if release is None else release
+
+        self.requested = int(config.BRIGHTNESS * 255)  # Brightness asked for with set_brightness()
+        self.applied = self.requested  # Brightness the strip is set to
+        self.limit = 1.0  # Fraction of the requested brightness allowed
+        self.last_write = None
+        self.current_ma = self.idle_ma
+
+        # scene -> [frames, total mA, peak mA, limited frames, peak unlimited mA]
+        self.lock = threading.Lock()
+        self.scene = 'idle'
+        self.scenes = {}
+
+    def set_layout(self, frame_order):
+        super().set_layout(frame_order)
+        self.backend.set_layout(frame_order)
+
+    def begin(self):
+        self.backend.begin()
+
+    def close(self):
+        self.backend.close()
+
+    def set_brightness(self, brightness):
+        self.requested = brightness
+        self._apply(int(brightness * self.limit))
+
+    def _apply(self, brightness):
+        if brightness != self.applied:
+            self.applied = brightness
+            self.backend.set_brightness(brightness)
+
+    def set_scene(self, name):
+        """Attribute the following frames' current to an animation."""
+        self.scene = name
+
+    def frame_current(self, pixels):
+        """Return the current (mA) of a strip-order frame at full brightness, without idle current."""
+        return float(np.dot(pixels.sum(axis=0, dtype=np.uint32), self.ma_per_value))
+
+    def write(self, pixels):
+        now = time.monotonic()
+        full_ma = self.frame_current(pixels)
+        wanted_ma = full_ma * self.requested / 255.0
+
+        # Fraction of the requested brightness that fits the budget
+        if wanted_ma > 0 and wanted_ma + self.idle_ma > self.budget_ma:
+            target = max(0.0, (self.budget_ma - self.idle_ma) / wanted_ma)
+        else:
+            target = 1.0
+        if target < self.limit or self.last_write is None:
+            self.limit = target
+        elif self.limit < target:
+            # Recover gradually so a brief flash doesn't pump the brightness
+            step = (now - self.last_write) / self.release if self.release > 0 else 1.0
+            self.limit = min(target, self.limit + step)
+        self.last_write = now
+        self._apply(int(self.requested * self.limit))
+
+        self.current_ma = full_ma * self.applied / 255.0 + self.idle_ma
+        with self.lock:
+            stats = self.scenes.setdefault(self.scene, [0, 0.0, 0.0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += self.current_ma
+            stats[2] = max(stats[2], self.current_ma)
+            stats[3] += self.applied < self.requested
+            stats[4] = max(stats[4], wanted_ma + self.idle_ma)
+
+        self.backend.write(pixels)
+        self.frames_written += 1
+
+    def get_stats(self):
+        """Return the current estimate, limit and overall peak (numbers only, for telemetry)."""
+        with self.lock:
+            scenes = list(self.scenes.values())
+        frames = sum(stats[0] for stats in scenes)
+        return {
+            'current_ma': self.current_ma,
+            'budget_ma': self.budget_ma,
+            'limit': self.limit,
+            'brightness': self.applied,
+            'peak_ma': max((stats[2] for stats in scenes), default=0.0),
+            'average_ma': sum(stats[1] for stats in scenes) / frames if frames else 0.0,
+            'limited_frames': sum(stats[3] for stats in scenes),
+        }
+
+    def get_scene_stats(self):
+        """Return {animation: {frames, average_ma, peak_ma, limited_frames, unlimited_peak_ma}}."""
+        with self.lock:
+            return {
+                scene: {
+                    'frames': frames,
+                    'average_ma': total / frames,
+                    'peak_ma': peak,
+                    'limited_frames': limited,
+                    'unlimited_peak_ma': unlimited,
+                }
+                for scene, (frames, total, peak, limited, unlimited) in self.scenes.items()
+            }
+
+    def print_stats(self):
+        """Print per-animation current statistics."""
+        print(f"⚡ Power: budget {self.budget_ma / 1000:.1f} A at brightness {self.requested}/255")
+        for scene, stats in sorted(self.get_scene_stats().items()):
+            limited = stats['limited_frames'] / stats['frames']
+            print(f"   {scene}: avg {stats['average_ma'] / 1000:.2f} A, peak {stats['peak_ma'] / 1000:.2f} A "
+                  f"(unlimited {stats['unlimited_peak_ma'] / 1000:.2f} A), limited {limited:.0%} of frames")
+
+
+_default_limiter = None
+
+
+def create_limited_backend(spec=None):
+    """create_backend(spec) behind a PowerLimiter when config.POWER_LIMIT_ENABLED.
+
+    Render workers' 'shared' backend is left alone: its frames are limited
+    when the main process writes them to the real output.
+    """
+    global _default_limiter
+    backend = create_backend(spec)
+    if not config.POWER_LIMIT_ENABLED or 'shared' in (spec or config.OUTPUT_BACKEND):
+        return backend
+    limiter = PowerLimiter(backend)
+    if spec is None:
+        _default_limiter = limiter
+    return limiter
+
+
+def get_power_limiter():
+    """Return the limiter on this process's default output, or None if there is none yet."""
+    return _default_limiter
+
+
+def main():
+    """Estimate per-animation current from the golden frame thumbnails (no hardware needed)."""
+    import golden_frames
+    limiter = PowerLimiter(create_backend('mock'), release=0)  # Captures are seconds apart
+    for name in sys.argv[1:] or golden_frames.discover_animations():
+        record = golden_frames.load_golden(name)
+        if record is None:
+            print(f"⚠️ No golden data for {name}, record it with: python golden_frames.py record {name}")
+            continue
+        limiter.set_scene(name)
+        for capture in record['captures']:
+            if 'thumb' not in capture:
+                continue
+            # Block averages keep each channel's sum, which is all the estimate needs
+            thumb = np.frombuffer(base64.b64decode(capture['thumb']), dtype=np.uint8).reshape(capture['shape'])
+            block = golden_frames.THUMBNAIL_BLOCK
+            frame = thumb.repeat(block, axis=0).repeat(block, axis=1)
+            limiter.write(np.ascontiguousarray(frame.reshape(-1, 3)[:limiter.led_count]))
+    limiter.print_stats()
+
+
+if __name__ == "__main__":
+    main()
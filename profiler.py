@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+On-Demand Sampling Profiler
+Profiles the running display process for a few seconds when asked, without
+a restart, and writes a flamegraph-compatible report
+
+Nothing runs until a session is requested, so the idle cost is zero. A
+session starts a sampling thread that records the stack of every other
+thread every config.PROFILER_INTERVAL seconds (sys._current_frames(), so
+animation threads are covered, unlike cProfile which only sees the thread
+that enabled it). Each sample is attributed to the active animation: the
+first frame of every stack is the scene name.
+
+Reports are written to config.PROFILER_OUTPUT_DIR in the folded-stack format
+("scene;thread;module:function;... count" per line), which flamegraph.pl,
+speedscope.app and inferno read directly.
+
+Trigger a session on a running main.py:
+    kill -USR1 $(pgrep -f main.py)                        # config.PROFILER_SECONDS long
+    curl 'http://127.0.0.1:9109/profile?seconds=20'       # when PROFILER_HTTP_PORT is set
+
+Summarize a report without flamegraph tools:
+    python profiler.py report profiles/<file>.folded
+"""
+
+import os
+import sys
+import time
+import signal
+import threading
+from collections import Counter
+import config
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{os.path.splitext(os.path.basename(code.co_filename))[0]}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads and folds them per animation."""
+
+    def __init__(self, scene_provider=None, interval=None, output_dir=None):
+        """Initialize; scene_provider() returns the name of the active animation."""
+        self.scene_provider = scene_provider or (lambda: 'unknown')
+        self.interval = interval or config.PROFILER_INTERVAL
+        self.output_dir = output_dir or config.PROFILER_OUTPUT_DIR
+        self.lock = threading.Lock()
+        self.thread = None
+        self.last_report = None
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, seconds=None):
+        """Start a session in the background. Returns False if one is already running."""
+        with self.lock:
+            if self.is_running():
+                return False
+            self.done = threading.Event()
+            self.thread = threading.Thread(target=self._run, args=(seconds or config.PROFILER_SECONDS,),
+                                           name='profiler', daemon=True)
+            self.thread.start()
+        return True
+
+    def profile(self, seconds=None):
+        """Run a session and wait for it; returns the report path (None if one was already running)."""
+        if not self.start(seconds):
+            return None
+        self.done.wait()
+        return self.last_report
+
+    def _run(self, seconds):
+        print(f"🔬 Profiling for {seconds:.0f} s...")
+        stacks = Counter()
+        own_id = threading.get_ident()
+        names = {}
+        end = time.monotonic() + seconds
+        samples = 0
+        started = time.monotonic()
+
+        while time.monotonic() < end:
+            scene = self.scene_provider()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if thread_id not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)).replace(';', ':'))
+                stack.append(scene)
+                stacks[';'.join(reversed(stack))] += 1
+            samples += 1
+            time.sleep(self.interval)
+
+        self.last_report = self._write_report(stacks)
+        elapsed = time.monotonic() - started
+        print(f"🔬 Profile written to {self.last_report} ({samples} samples in {elapsed:.1f} s)")
+        self.done.set()
+
+    def _write_report(self, stacks):
+        os.makedirs(self.output_dir, exist_ok=True)
+        scene = self.scene_provider().replace(os.sep, '_')
+        path = os.path.join(self.output_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{scene}.folded")
+        with open(path, 'w') as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+        return path
+
+
+def install(scene_provider=None):
+    """Make the process profilable on demand: SIGUSR1 and, if configured, an HTTP endpoint.
+
+    Must be called from the main thread. Returns the SamplingProfiler.
+    """
+    profiler = SamplingProfiler(scene_provider)
+
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: profiler.start())
+
+    if config.PROFILER_HTTP_PORT:
+        _start_http_trigger(profiler, config.PROFILER_HTTP_PORT)
+    return profiler
+
+
+def _start_http_trigger(profiler, port):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlparse, parse_qs
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != '/profile':
+                self.send_error(404)
+                return
+            seconds = float(parse_qs(url.query).get('seconds', [config.PROFILER_SECONDS])[0])
+            path = profiler.profile(min(seconds, 300))
+            if path is None:
+                self.send_error(409, 'A profile is already running')
+                return
+            with open(path, 'rb') as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain')
+            self.send_header('X-Profile-Path', path)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    except OSError as e:
+        print(f"⚠️ Profiler endpoint not started on port {port}: {e}")
+        return
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='profiler-http', daemon=True).start()
+    print(f"🔬 Profiler trigger at http://127.0.0.1:{port}/profile?seconds=10")
+
+
+def summarize(path, top=15):
+    """Print where samples went: per scene, and the functions with the most self and total time."""
+    scenes, self_time, total_time = Counter(), Counter(), Counter()
+    total = 0
+    with open(path) as f:
+        for line in f:
+            stack, count = line.rsplit(' ', 1)
+            count = int(count)
+            frames = stack.split(';')
+            total += count
+            scenes[frames[0]] += count
+            if len(frames) > 2:
+                self_time[frames[-1]] += count
+                for name in set(frames[2:]):
+                    total_time[name] += count
+
+    print(f"{total} samples")
+    for scene, count in scenes.most_common():
+        print(f"  {scene}: {count / total:.1%}")
+    print("\nSelf time:")
+    for name, count in self_time.most_common(top):
+        print(f"  {count / total:6.1%}  {name}")
+    print("\nTotal time:")
+    for name, count in total_time.most_common(top):
+        print(f"  {count / total:6.1%}  {name}")
+
+
+def main():
+    """Command line entry point."""
+    if len(sys.argv) == 3 and sys.argv[1] == 'report':
+        summarize(sys.argv[2])
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
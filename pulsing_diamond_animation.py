@@ -8,6 +8,7 @@ import time
 import numpy as np
 import math
 from led_controller_exact import LEDControllerExact
+from frame_cache import get_frame_cache
 import config
 
 class PulsingDiamondAnimation:
@@ -26,14 +27,16 @@ class PulsingDiamondAnimation:
         # Animation parameters
         self.animation_timer = 0
         self.duration = 15  # seconds
+        self.frame_cache = get_frame_cache()
         
-    def create_pulsing_diamond(self, frame):
-        """Create a yellow diamond that pulses in size."""
-        center_x, center_y = self.width // 2, self.height // 2
-        
-        # Calculate pulse size
+    def get_pulse_size(self):
+        """Return the diamond size for the current animation step."""
         pulse_phase = (self.animation_timer % (self.duration * 20)) * 0.2
-        pulse_size = int(8 + 4 * math.sin(pulse_phase))
+        return int(8 + 4 * math.sin(pulse_phase))
+    
+    def create_pulsing_diamond(self, frame, pulse_size):
+        """Create a yellow diamond of the given pulse size."""
+        center_x, center_y = self.width // 2, self.height // 2
         
         # Define diamond points
         diamond_points = [
@@ -84,16 +87,26 @@ class PulsingDiamondAnimation:
                         if 0 <= x < self.width:
                             frame[y, x] = color
     
-    def create_frame(self):
-        """Create a single frame of the pulsing diamond animation."""
+    def render_frame(self, pulse_size):
+        """Render the diamond at one pulse size."""
         # Start with black background
         frame = np.full((self.height, self.width, 3), self.colors['background'], dtype=np.uint8)
         
         # Create pulsing diamond
-        self.create_pulsing_diamond(frame)
+        self.create_pulsing_diamond(frame, pulse_size)
         
         return frame
     
+    def create_frame(self):
+        """Create a single frame of the pulsing diamond animation.
+        
+        The pulse only takes a handful of sizes, so each size is rendered once and
+        replayed from the frame cache.
+        """
+        pulse_size = self.get_pulse_size()
+        return self.frame_cache.get_or_render(('pulsing_diamond', pulse_size),
+                                              lambda: self.render_frame(pulse_size))
+    
     def display_pulsing_diamond(self):
         """Display the pulsing diamond animation."""
         print("🟡 Pulsing Diamond Animation 🟡")
@@ -107,10 +120,7 @@ class PulsingDiamondAnimation:
             frame = self.create_frame()
             
             # Display the frame
-            for y in range(self.height):
-                for x in range(self.width):
-                    color = frame[y, x]
-                    self.led.set_pixel(x, y, color)
+            self.led.set_frame(frame)
             
             self.led.show()
             
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Adaptive Quality
+Measures how long each frame takes to render against its deadline and
+tells the animation which quality level to draw at, so heavy scenes hold
+their frame rate on slower Pis while light ones stay at full quality
+
+Levels (QualityController.level):
+    3  full quality
+    2  fewer particles, optional effects off
+    1  heavy per-pixel effects rendered at half resolution and upscaled
+    0  as 1, at config.QUALITY_LOW_FPS_SCALE times the frame rate
+
+The level drops when the average render time goes over the frame period
+and rises again once it stays under config.QUALITY_RAISE_LOAD of it. A
+level that overran is not retried for config.QUALITY_RETRY_SECONDS, so a
+scene that is simply too heavy doesn't flip back and forth.
+
+An animation's loop:
+
+    quality = QualityController('black_hole', fps=20)
+    while ...:
+        quality.start_frame()
+        frame = render(particles=quality.particles(12), step=quality.resolution_step)
+        led.set_frame(frame)
+        led.show()
+        quality.end_frame()  # Sleeps out the rest of the frame period
+
+The level, render load and overrun rate are exported as telemetry gauges
+labelled with the scene.
+"""
+
+import time
+import config
+from telemetry import get_telemetry, frame_started
+
+MAX_LEVEL = 3
+PARTICLE_SCALE = (0.4, 0.4, 0.6, 1.0)  # Share of particles drawn at each level
+LOAD_SMOOTHING = 0.2  # Weight of the newest frame in the average render load
+
+
+class QualityController:
+    """Paces one animation's frames and picks its quality level from measured render times."""
+
+    def __init__(self, name, fps):
+        """Control the animation called name, which targets fps frames per second at full quality."""
+        self.name = name
+        self.fps = fps
+        self.adaptive = config.QUALITY_ADAPTIVE
+        self.level = MAX_LEVEL
+        self.frame_start = None
+        self.frames_at_level = 0
+        self.load = 0.0  # Average render time / frame period
+        self.overrun_rate = 0.0  # Average share of frames over the period
+        self.failed_at = {}  # level -> time.monotonic() it last overran
+        self.frames = 0
+        self.overruns = 0
+
+        self.telemetry = get_telemetry()
+        if self.telemetry:
+            self.telemetry.describe('quality_level', 'gauge', f'Animation quality level (0-{MAX_LEVEL})')
+            self.telemetry.describe('quality_render_load', 'gauge', 'Average render time / frame period')
+            self.telemetry.describe('quality_overrun_rate', 'gauge', 'Average share of frames over the period')
+            self.telemetry.describe('quality_overruns_total', 'counter', 'Frames whose render overran the period')
+            self.telemetry.set_gauge('quality_level', self.level, scene=self.name)
+
+    @property
+    def period(self):
+        """Seconds per frame at the current level."""
+        fps = self.fps * config.QUALITY_LOW_FPS_SCALE if self.level == 0 else self.fps
+        return 1.0 / fps
+
+    @property
+    def effects(self):
+        """True if optional effects should be drawn."""
+        return self.level >= MAX_LEVEL
+
+    @property
+    def resolution_step(self):
+        """Pixel step for heavy per-pixel effects: 1, or 2 for half resolution."""
+        return 2 if self.level <= 1 else 1
+
+    def particles(self, count):
+        """Number of particles to draw out of count at full quality."""
+        return max(1, round(count * PARTICLE_SCALE[self.level]))
+
+    def start_frame(self):
+        """Mark the start of rendering a frame."""
+        self.frame_start = time.perf_counter()
+        frame_started(self.frame_start, self.period)
+
+    def end_frame(self):
+        """Record the frame's render time, adjust the level and sleep until the next frame is due."""
+        period = self.period
+        elapsed = time.perf_counter() - self.frame_start
+        self._record(elapsed, period)
+        time.sleep(max(0.0, period - elapsed))
+
+    def _record(self, elapsed, period):
+        overrun = elapsed > period
+        self.frames += 1
+        self.overruns += overrun
+        self.frames_at_level += 1
+        self.load += (elapsed / period - self.load) * LOAD_SMOOTHING
+        self.overrun_rate += (overrun - self.overrun_rate) * LOAD_SMOOTHING
+
+        if self.adaptive and self.frames_at_level >= config.QUALITY_SETTLE_FRAMES:
+            now = time.monotonic()
+            if self.load > 1.0 and self.level > 0:
+                self.failed_at[self.level] = now
+                self._set_level(self.level - 1, elapsed)
+            elif (self.load < config.QUALITY_RAISE_LOAD and self.level < MAX_LEVEL and
+                  now - self.failed_at.get(self.level + 1, float('-inf')) >= config.QUALITY_RETRY_SECONDS):
+                self._set_level(self.level + 1, elapsed)
+
+        if self.telemetry:
+            if overrun:
+                self.telemetry.inc('quality_overruns_total', scene=self.name)
+            self.telemetry.set_gauge('quality_render_load', self.load, scene=self.name)
+            self.telemetry.set_gauge('quality_overrun_rate', self.overrun_rate, scene=self.name)
+
+    def _set_level(self, level, elapsed):
+        print(f"🎚️ {self.name} quality {self.level} → {level} "
+              f"(render {elapsed * 1000:.0f} ms, {self.load:.0%} of the frame period)")
+        self.level = level
+        # The average carries over; settling lets it follow the new level's cost before the next change
+        self.frames_at_level = 0
+        if self.telemetry:
+            self.telemetry.set_gauge('quality_level', level, scene=self.name)
+
+    def get_stats(self):
+        """Return the level and render statistics."""
+        return {
+            'level': self.level,
+            'load': self.load,
+            'overrun_rate': self.overrun_rate,
+            'frames': self.frames,
+            'overruns': self.overruns,
+        }
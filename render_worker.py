@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Render Worker Process
+Runs animation rendering in a separate process so heavy per-pixel Python
+loops do not hold the main process's GIL, which is left free for button
+polling, audio and pushing frames to the strip
+
+The worker writes finished frames (strip order) into a shared-memory double
+buffer. Inside the worker, config.OUTPUT_BACKEND is 'shared', so existing
+animations run unchanged: their show() copies the frame into the shared
+buffer (one 4.6 KB memcpy) and publishes it. The main process hands the
+published buffer straight to its output backend without copying or pickling.
+A frame's telemetry.frame_started() mark (render time and period) is stored
+next to it in the header, so the main process's telemetry sees it too.
+
+Frame n is written into buffer n % 2, and only after the main process has
+released frame n - 2, so the worker never overwrites a frame that is being
+pushed to the strip. That release is also the worker's backpressure.
+
+Compare CPU use with and without the worker:
+    python render_worker.py [animation_module]
+"""
+
+import sys
+import time
+import importlib
+import inspect
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+import config
+import app_logging
+import display_orientation
+from output_backends import OutputBackend
+from telemetry import get_telemetry, take_frame_mark
+
+HEADER_FIELDS = 8  # published_seq, released_seq, led_count, reserved, render_ns x2, period_ns x2
+HEADER_BYTES = HEADER_FIELDS * 8
+
+
+class RenderCancelled(BaseException):
+    """Raised inside the worker to abandon the current animation (not caught by `except Exception`)."""
+
+
+class SharedFrameBuffer:
+    """Double buffer of strip-order frames in multiprocessing shared memory."""
+
+    def __init__(self, led_count=None, name=None):
+        """Create a new buffer, or attach to an existing one by name."""
+        if name is None:
+            led_count = led_count or config.TOTAL_LEDS
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER_BYTES + 2 * led_count * 3)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+
+        self.header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=self.shm.buf)
+        if self.owner:
+            self.header[:] = (0, 0, led_count, 0, -1, -1, -1, -1)
+        self.led_count = int(self.header[2])
+        self.frames = np.ndarray((2, self.led_count, 3), dtype=np.uint8,
+                                 buffer=self.shm.buf, offset=HEADER_BYTES)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def published(self):
+        """Sequence number of the newest complete frame (0 = none yet)."""
+        return int(self.header[0])
+
+    @property
+    def released(self):
+        """Newest frame the reader has finished with."""
+        return int(self.header[1])
+
+    def publish(self, seq):
+        self.header[0] = seq
+
+    def release(self, seq):
+        self.header[1] = seq
+
+    def frame(self, seq):
+        """Return the buffer holding frame seq (a view, not a copy)."""
+        return self.frames[seq % 2]
+
+    def set_frame_mark(self, seq, render_seconds, period):
+        """Store frame seq's render time and period (None = unknown) before publishing it."""
+        slot = seq % 2
+        self.header[4 + slot] = -1 if render_seconds is None else int(render_seconds * 1e9)
+        self.header[6 + slot] = -1 if period is None else int(period * 1e9)
+
+    def frame_mark(self, seq):
+        """Return frame seq's (render seconds, period), each None if unknown."""
+        slot = seq % 2
+        render_ns, period_ns = int(self.header[4 + slot]), int(self.header[6 + slot])
+        return (None if render_ns < 0 else render_ns / 1e9), (None if period_ns < 0 else period_ns / 1e9)
+
+    def close(self):
+        # Drop the NumPy views before closing the mapping
+        self.header = self.frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class SharedFrameBackend(OutputBackend):
+    """Output backend used inside the worker: publishes frames into the shared buffer."""
+
+    name = 'shared'
+
+    def __init__(self, buffer, stop_event, frame_ready, led_count=None, width=None, height=None):
+        super().__init__(led_count, width, height)
+        self.buffer = buffer
+        self.stop_event = stop_event
+        self.frame_ready = frame_ready
+
+    def write(self, pixels):
+        render_seconds, period = take_frame_mark(time.perf_counter())
+        seq = self.buffer.published + 1
+        # Wait until the main process is done with the frame that used this buffer last
+        while self.buffer.released < seq - 2:
+            if self.stop_event.is_set():
+                raise RenderCancelled()
+            time.sleep(0.001)
+        if self.stop_event.is_set():
+            raise RenderCancelled()
+
+        self.buffer.frame(seq)[:] = pixels
+        self.buffer.set_frame_mark(seq, render_seconds, period)
+        self.buffer.publish(seq)
+        self.frame_ready.set()
+        self.frames_written += 1
+
+
+# Worker-process state used by output_backends.create_backend('shared')
+_worker_buffer = None
+_worker_events = None
+
+
+def create_shared_backend(led_count=None, width=None, height=None):
+    """Return a SharedFrameBackend for the worker process's buffer."""
+    if _worker_buffer is None:
+        raise RuntimeError("The 'shared' output backend only works inside a render worker")
+    stop_event, frame_ready = _worker_events
+    return SharedFrameBackend(_worker_buffer, stop_event, frame_ready, led_count, width, height)
+
+
+class AnimationTarget:
+    """Picklable description of an animation for the worker: module, class and method to run."""
+
+    def __init__(self, module, class_name, method='run_animation', kwargs=None):
+        self.module = module
+        self.class_name = class_name
+        self.method = method
+        self.kwargs = kwargs or {}
+
+    def __call__(self, should_stop):
+        animation_class = getattr(importlib.import_module(self.module), self.class_name)
+        animation = animation_class()
+        try:
+            run = getattr(animation, self.method)
+            if 'should_stop' in inspect.signature(run).parameters:
+                run(should_stop=should_stop, **self.kwargs)
+            else:
+                run(**self.kwargs)
+        finally:
+            if hasattr(animation, 'cleanup'):
+                animation.cleanup()
+
+    def __repr__(self):
+        return f"{self.module}.{self.class_name}.{self.method}"
+
+
+def _worker_main(shm_name, commands, stop_event, frame_ready, done_event):
+    """Worker process: run animation targets from the command queue until None arrives."""
+    # The spawned interpreter skips main.py's __main__ block, so install logging here too
+    app_logging.setup_logging()
+    # Set the state on the importable module (this function may run as __mp_main__)
+    state = importlib.import_module('render_worker')
+    buffer = SharedFrameBuffer(name=shm_name)
+    state._worker_buffer = buffer
+    state._worker_events = (stop_event, frame_ready)
+    config.OUTPUT_BACKEND = 'shared'
+    config.TELEMETRY_ENABLED = False  # Frames are counted when the main process pushes them
+
+    try:
+        while True:
+            command = commands.get()
+            if command is None:
+                break
+            target, orientation = command
+            # Controllers the animation creates start in the main process's orientation
+            display_orientation.set_current_orientation(orientation)
+            try:
+                target(stop_event.is_set)
+            except RenderCancelled:
+                pass
+            except Exception as e:
+                print(f"❌ Render worker error in {target}: {e}")
+            finally:
+                done_event.set()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        buffer.close()
+
+
+class RenderWorker:
+    """Main-process side: runs animations in a worker process and pushes their frames.
+
+    Frames are taken from the shared buffer and written to `output`, the
+    main LED controller's output backend. should_stop() is checked every
+    poll; if the worker does not stop within config.RENDER_WORKER_STOP_TIMEOUT
+    it is terminated and restarted.
+    """
+
+    def __init__(self, output, led_count=None):
+        """Initialize for an output backend (e.g. led.led.output)."""
+        self.output = output
+        self.led_count = led_count or config.TOTAL_LEDS
+        # Spawn a clean interpreter rather than forking a process with running threads
+        self.context = multiprocessing.get_context('spawn')
+        self.buffer = None
+        self.process = None
+        self.last_pushed = 0
+        self.telemetry = get_telemetry()
+
+        # Statistics
+        self.frames_pushed = 0
+        self.restarts = 0
+
+    def start(self):
+        """Start the worker process (done automatically by run())."""
+        if self.process and self.process.is_alive():
+            return
+        if self.buffer is None:
+            self.buffer = SharedFrameBuffer(self.led_count)
+        self.commands = self.context.Queue()
+        self.stop_event = self.context.Event()
+        self.frame_ready = self.context.Event()
+        self.done_event = self.context.Event()
+        self.process = self.context.Process(
+            target=_worker_main, name='render-worker', daemon=True,
+            args=(self.buffer.name, self.commands, self.stop_event, self.frame_ready, self.done_event))
+        self.process.start()
+        print(f"🧵 Render worker started (pid {self.process.pid})")
+
+    def push_latest(self):
+        """Push the newest published frame to the output if it was not pushed yet."""
+        seq = self.buffer.published
+        if seq <= self.last_pushed:
+            return False
+        start = time.perf_counter()
+        self.output.write(self.buffer.frame(seq))
+        if self.telemetry:
+            self.telemetry.frame_shown(start, time.perf_counter(), *self.buffer.frame_mark(seq))
+        self.last_pushed = seq
+        self.buffer.release(seq)
+        self.frames_pushed += 1
+        return True
+
+    def run(self, target, should_stop=None):
+        """Run an animation target in the worker and display it until it finishes or is stopped.
+
+        Returns False if should_stop() ended it early.
+        """
+        self.start()
+        self.stop_event.clear()
+        self.done_event.clear()
+        self.commands.put((target, display_orientation.current_orientation()))
+
+        stop_requested_at = None
+        while not self.done_event.is_set():
+            if stop_requested_at is None and should_stop and should_stop():
+                self.stop_event.set()
+                stop_requested_at = time.monotonic()
+            if stop_requested_at is not None and \
+                    time.monotonic() - stop_requested_at > config.RENDER_WORKER_STOP_TIMEOUT:
+                print("⚠️ Render worker did not stop in time, restarting it")
+                self._restart()
+                break
+            if not self.process.is_alive():
+                print("❌ Render worker exited unexpectedly")
+                self.process = None
+                break
+
+            self.frame_ready.clear()
+            if not self.push_latest():
+                self.frame_ready.wait(0.05)
+
+        if self.process:
+            self.push_latest()
+        return stop_requested_at is None
+
+    def _restart(self):
+        self.process.terminate()
+        self.process.join()
+        self.process = None
+        self.restarts += 1
+        # Frames of the killed animation are discarded; the new worker continues the sequence
+        self.last_pushed = self.buffer.published
+        self.buffer.release(self.last_pushed)
+
+    def stop(self):
+        """Shut the worker process down and free the shared memory."""
+        if self.process and self.process.is_alive():
+            self.stop_event.set()
+            self.commands.put(None)
+            self.process.join(config.RENDER_WORKER_STOP_TIMEOUT)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.process = None
+        if self.buffer:
+            self.buffer.close()
+            self.buffer = None
+
+    def get_stats(self):
+        """Return worker statistics."""
+        return {
+            'frames_pushed': self.frames_pushed,
+            'restarts': self.restarts,
+            'alive': bool(self.process and self.process.is_alive()),
+        }
+
+
+def main():
+    """Benchmark: run an animation in-process and then in the worker, comparing CPU time per process."""
+    import os
+    import golden_frames
+    from led_controller_exact import LEDControllerExact
+
+    if len(sys.argv) > 1:
+        module = sys.argv[1]
+        cls, method = golden_frames.find_entry_point(importlib.import_module(module))
+        target = AnimationTarget(module, cls.__name__, method)
+    else:
+        target = AnimationTarget('black_hole_animation', 'BlackHoleAnimation', 'display_black_hole',
+                                 {'duration': 8})
+    led = LEDControllerExact()
+
+    start_wall, start_cpu = time.monotonic(), time.process_time()
+    target(lambda: False)
+    in_process = (time.monotonic() - start_wall, time.process_time() - start_cpu)
+
+    worker = RenderWorker(led.led.output)
+    worker.start()
+    start_wall, start_cpu = time.monotonic(), time.process_time()
+    worker.run(target)
+    in_worker = (time.monotonic() - start_wall, time.process_time() - start_cpu)
+    worker.stop()
+    child_cpu = os.times().children_user + os.times().children_system
+
+    print(f"\n{target}")
+    print(f"In-process: main process CPU {in_process[1]:.2f} s of {in_process[0]:.2f} s wall")
+    print(f"Worker:     main process CPU {in_worker[1]:.2f} s, worker CPU {child_cpu:.2f} s "
+          f"(incl. startup) of {in_worker[0]:.2f} s wall, {worker.frames_pushed} frames pushed")
+    led.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Scene Player
+Declarative scenes: a JSON file in scenes/ describes the layers, sprites,
+motion paths, fades, particle emitters and audio cue of an animation, and
+is compiled once at load time into a render plan of array operations
+
+Scene file (scenes/<name>.json):
+    name        scene name
+    duration    seconds the scene plays, before fade_out
+    fps         frames per second (default config.DEFAULT_FPS)
+    fade_in     seconds the whole frame fades in from black (default 0)
+    fade_out    seconds the whole frame fades to black after duration (default 0)
+    audio       audio cue played with the scene (a key of main.py's animation_audio,
+                or a file name in the audio folder)
+    layers      list of layers, drawn in order (later layers on top)
+
+Layers (every layer takes "clip": [x, y, width, height] to limit drawing):
+    fill      {"color": [r, g, b], "rect": [x, y, width, height]} (default the whole display)
+    disc      {"center": [x, y], "radius": r, "color": [r, g, b],
+               "falloff": 0.3} darkens the edge by 30%
+    sprite    {"sprite": name in sprite_assets.SPRITE_SOURCES, or
+               "pixels": ["..#..", ".###."],
+               "color": [r, g, b] for mask sprites (RGB sprites keep their colors, black is transparent),
+               "position": [x, y], or
+               "path": [[t, x, y], ...] with "easing": linear, ease_in, ease_out, ease_in_out
+                        and "after": hold, continue or loop,
+               "anchor": point of the sprite placed at the position, e.g. bottom_left, center (default top_left),
+               "snap": true for whole-pixel motion (default sub-pixel),
+               "wrap": [x0, x1] to wrap the x position around,
+               "frame_fps": frames per second of multi-frame sprites}
+    emitter   {"origin": [x, y], "spread": [dx, dy], "rate": particles per second,
+               "lifetime": seconds, "velocity": [vx, vy], "jitter": [jx, jy],
+               "gravity": [gx, gy], "color": [r, g, b], "fade": true,
+               "start": seconds, "stop": seconds, "seed": n}
+
+Compiling bakes every static layer (fills, discs, sprites at a fixed
+position) that no earlier moving layer can overlap into one background, so a
+frame is a copy of that background plus the moving layers. Particles are
+computed from their spawn times, so any frame can be rendered on its own.
+
+Usage:
+    python scene_player.py check [scene ...]   # validate and compile (exit 1 on errors)
+    python scene_player.py bench [scene ...]   # compile time and milliseconds per frame
+    python scene_player.py play scene          # play on the display
+"""
+
+import os
+import sys
+import json
+import importlib
+import time
+import numpy as np
+import config
+from frame_interpolator import Sprite, draw_sprite
+from geometry_fields import get_fields, paste
+from telemetry import frame_started
+
+EASINGS = {
+    'linear': lambda u: u,
+    'ease_in': lambda u: u * u,
+    'ease_out': lambda u: 1.0 - (1.0 - u) ** 2,
+    'ease_in_out': lambda u: u * u * (3.0 - 2.0 * u),
+}
+PATH_ENDS = ('hold', 'continue', 'loop')
+ANCHORS_X = {'left': 0, 'center': 1, 'right': 2}
+ANCHORS_Y = {'top': 0, 'center': 1, 'bottom': 2}
+
+
+def _project_path(path):
+    return path if os.path.isabs(path) else os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+
+
+def scene_path(name):
+    """Return the file of a scene given by name (scenes/<name>.json) or path."""
+    if name.endswith('.json'):
+        return name
+    return _project_path(os.path.join(config.SCENES_DIR, name + '.json'))
+
+
+def list_scenes():
+    """Return the names of all scenes in config.SCENES_DIR."""
+    directory = _project_path(config.SCENES_DIR)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(f[:-5] for f in os.listdir(directory) if f.endswith('.json'))
+
+
+# Validation
+
+def _fail(where, message):
+    raise ValueError(f"{where}: {message}")
+
+
+def _check_numbers(where, key, value, count):
+    if not isinstance(value, (list, tuple)) or len(value) != count or \
+            not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+        _fail(where, f"'{key}' must be a list of {count} numbers, got {value!r}")
+
+
+def _check_color(where, key, value):
+    _check_numbers(where, key, value, 3)
+    if not all(0 <= v <= 255 for v in value):
+        _fail(where, f"'{key}' values must be 0-255, got {value!r}")
+
+
+def _check_seconds(where, key, value, positive=False):
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0 or (positive and value == 0):
+        _fail(where, f"'{key}' must be a {'positive' if positive else 'non-negative'} number of seconds, got {value!r}")
+
+
+def _check_keys(where, layer, required, optional):
+    for key in required:
+        if key not in layer:
+            _fail(where, f"missing '{key}'")
+    unknown = set(layer) - set(required) - set(optional) - {'type', 'clip'}
+    if unknown:
+        _fail(where, f"unknown key(s) {', '.join(sorted(unknown))}")
+    if 'clip' in layer:
+        _check_numbers(where, 'clip', layer['clip'], 4)
+
+
+def _check_sprite_layer(where, layer):
+    from sprite_assets import SPRITE_SOURCES
+    _check_keys(where, layer, (), ('sprite', 'pixels', 'color', 'position', 'path', 'easing', 'after',
+                                   'anchor', 'snap', 'wrap', 'frame_fps'))
+    if ('sprite' in layer) == ('pixels' in layer):
+        _fail(where, "needs exactly one of 'sprite' or 'pixels'")
+    if 'sprite' in layer and layer['sprite'] not in SPRITE_SOURCES:
+        _fail(where, f"unknown sprite '{layer['sprite']}' (see SPRITE_SOURCES in sprite_assets.py)")
+    if 'pixels' in layer:
+        rows = layer['pixels']
+        if not rows or not all(isinstance(r, str) and len(r) == len(rows[0]) for r in rows):
+            _fail(where, "'pixels' must be a list of equally long strings")
+        if 'color' not in layer:
+            _fail(where, "'pixels' sprites need a 'color'")
+    if 'color' in layer:
+        _check_color(where, 'color', layer['color'])
+    if ('position' in layer) == ('path' in layer):
+        _fail(where, "needs exactly one of 'position' or 'path'")
+    if 'position' in layer:
+        _check_numbers(where, 'position', layer['position'], 2)
+    if 'path' in layer:
+        path = layer['path']
+        if not isinstance(path, list) or not path:
+            _fail(where, "'path' must be a list of [t, x, y] keyframes")
+        for keyframe in path:
+            _check_numbers(where, 'path', keyframe, 3)
+        times = [k[0] for k in path]
+        if any(b <= a for a, b in zip(times, times[1:])):
+            _fail(where, "'path' keyframe times must increase")
+    if layer.get('easing', 'linear') not in EASINGS:
+        _fail(where, f"unknown easing '{layer['easing']}' (choose from {', '.join(EASINGS)})")
+    if layer.get('after', 'hold') not in PATH_ENDS:
+        _fail(where, f"unknown path end '{layer['after']}' (choose from {', '.join(PATH_ENDS)})")
+    anchor = layer.get('anchor', 'top_left')
+    if isinstance(anchor, str):
+        y_name, _, x_name = anchor.partition('_') if '_' in anchor else (anchor, None, anchor)
+        if y_name not in ANCHORS_Y or x_name not in ANCHORS_X:
+            _fail(where, f"unknown anchor '{anchor}' (e.g. top_left, bottom_center, center)")
+    else:
+        _check_numbers(where, 'anchor', anchor, 2)
+    if 'wrap' in layer:
+        _check_numbers(where, 'wrap', layer['wrap'], 2)
+        if layer['wrap'][1] <= layer['wrap'][0]:
+            _fail(where, "'wrap' must be [x0, x1] with x1 > x0")
+    if 'frame_fps' in layer:
+        _check_seconds(where, 'frame_fps', layer['frame_fps'])
+
+
+def validate_scene(spec, where='scene'):
+    """Raise ValueError describing the first problem in a scene description."""
+    if not isinstance(spec, dict):
+        _fail(where, "a scene must be a JSON object")
+    where = f"scene '{spec.get('name', where)}'"
+    for key in ('name', 'duration', 'layers'):
+        if key not in spec:
+            _fail(where, f"missing '{key}'")
+    unknown = set(spec) - {'name', 'duration', 'fps', 'fade_in', 'fade_out', 'audio', 'layers'}
+    if unknown:
+        _fail(where, f"unknown key(s) {', '.join(sorted(unknown))}")
+    _check_seconds(where, 'duration', spec['duration'], positive=True)
+    _check_seconds(where, 'fps', spec.get('fps', config.DEFAULT_FPS), positive=True)
+    _check_seconds(where, 'fade_in', spec.get('fade_in', 0))
+    _check_seconds(where, 'fade_out', spec.get('fade_out', 0))
+    if 'audio' in spec and not isinstance(spec['audio'], str):
+        _fail(where, "'audio' must be an audio cue name")
+    if not isinstance(spec['layers'], list):
+        _fail(where, "'layers' must be a list")
+
+    for i, layer in enumerate(spec['layers']):
+        layer_type = layer.get('type') if isinstance(layer, dict) else None
+        layer_where = f"{where} layer {i} ({layer_type})"
+        if layer_type == 'fill':
+            _check_keys(layer_where, layer, ('color',), ('rect',))
+            _check_color(layer_where, 'color', layer['color'])
+            if 'rect' in layer:
+                _check_numbers(layer_where, 'rect', layer['rect'], 4)
+        elif layer_type == 'disc':
+            _check_keys(layer_where, layer, ('center', 'radius', 'color'), ('falloff',))
+            _check_numbers(layer_where, 'center', layer['center'], 2)
+            _check_numbers(layer_where, 'radius', [layer['radius']], 1)
+            _check_color(layer_where, 'color', layer['color'])
+            if not 0 <= layer.get('falloff', 0) <= 1:
+                _fail(layer_where, "'falloff' must be 0-1")
+        elif layer_type == 'sprite':
+            _check_sprite_layer(layer_where, layer)
+        elif layer_type == 'emitter':
+            _check_keys(layer_where, layer, ('origin', 'rate', 'lifetime', 'color'),
+                        ('spread', 'velocity', 'jitter', 'gravity', 'fade', 'start', 'stop', 'seed'))
+            for key in ('origin', 'spread', 'velocity', 'jitter', 'gravity'):
+                if key in layer:
+                    _check_numbers(layer_where, key, layer[key], 2)
+            _check_seconds(layer_where, 'rate', layer['rate'], positive=True)
+            _check_seconds(layer_where, 'lifetime', layer['lifetime'], positive=True)
+            _check_seconds(layer_where, 'start', layer.get('start', 0))
+            _check_seconds(layer_where, 'stop', layer.get('stop', spec['duration']))
+            _check_color(layer_where, 'color', layer['color'])
+        else:
+            _fail(layer_where, "unknown layer type (fill, disc, sprite or emitter)")
+
+
+# Compiled layers: draw(frame, t) plus the pixels they can touch
+
+def _clip_bounds(layer, width, height):
+    x, y, w, h = layer.get('clip', (0, 0, width, height))
+    return max(int(x), 0), max(int(y), 0), min(int(x + w), width), min(int(y + h), height)
+
+
+def _rect_mask(bounds, width, height):
+    mask = np.zeros((height, width), dtype=bool)
+    x0, y0, x1, y1 = bounds
+    mask[y0:y1, x0:x1] = True
+    return mask
+
+
+class FillLayer:
+    """A solid rectangle."""
+    static = True
+
+    def __init__(self, layer, width, height):
+        x, y, w, h = layer.get('rect', (0, 0, width, height))
+        x0, y0, x1, y1 = _clip_bounds(layer, width, height)
+        self.region = _rect_mask((max(int(x), x0), max(int(y), y0), min(int(x + w), x1), min(int(y + h), y1)),
+                                 width, height)
+        self.color = np.array(layer['color'], dtype=np.uint8)
+
+    def draw(self, frame, t):
+        frame[self.region] = self.color
+
+
+class DiscLayer:
+    """A filled circle, optionally darker towards the edge."""
+    static = True
+
+    def __init__(self, layer, width, height):
+        cx, cy = layer['center']
+        radius = layer['radius']
+        fields = get_fields(cx, cy, width, height)
+        self.region = fields.disc(radius) & _rect_mask(_clip_bounds(layer, width, height), width, height)
+        intensity = 1.0 - (fields.distance[self.region] / radius) * layer.get('falloff', 0.0)
+        self.colors = (np.array(layer['color'], dtype=np.float64) * intensity[:, None]).astype(np.uint8)
+
+    def draw(self, frame, t):
+        frame[self.region] = self.colors
+
+
+class SpriteLayer:
+    """A sprite from the sprite bundle or inline pixels, at a position or along a path."""
+
+    def __init__(self, layer, width, height):
+        if 'pixels' in layer:
+            frames = np.array([[[c not in '. ' for c in row] for row in layer['pixels']]], dtype=np.uint8)
+        else:
+            from sprite_assets import load_frames
+            frames = np.asarray(load_frames(layer['sprite']))
+
+        # Trim to the bounding box of all frames, so positions refer to the visible sprite
+        alpha = frames.any(axis=-1) if frames.ndim == 4 else frames > 0
+        rows, cols = np.nonzero(alpha.any(axis=0))
+        top, bottom, left, right = rows.min(), rows.max() + 1, cols.min(), cols.max() + 1
+        alpha = alpha[:, top:bottom, left:right]
+        if frames.ndim == 4:
+            self.patches = [np.ascontiguousarray(f[top:bottom, left:right]) for f in frames]
+        else:
+            self.patches = [np.full(a.shape + (3,), layer['color'], dtype=np.uint8) for a in alpha]
+        self.masks = list(alpha)
+        self.sprites = [Sprite(p, a) for p, a in zip(self.patches, self.masks)]
+        self.sprite_width, self.sprite_height = right - left, bottom - top
+        self.frame_fps = layer.get('frame_fps', 0)
+
+        anchor = layer.get('anchor', 'top_left')
+        if isinstance(anchor, str):
+            y_name, _, x_name = anchor.partition('_') if '_' in anchor else (anchor, None, anchor)
+            self.anchor = (ANCHORS_X[x_name] * self.sprite_width // 2, ANCHORS_Y[y_name] * self.sprite_height // 2)
+        else:
+            self.anchor = tuple(anchor)
+
+        path = layer.get('path', [[0] + list(layer.get('position', (0, 0)))])
+        self.times = np.array([k[0] for k in path], dtype=np.float64)
+        self.points = np.array([k[1:] for k in path], dtype=np.float64)
+        self.easing = EASINGS[layer.get('easing', 'linear')]
+        self.linear = layer.get('easing', 'linear') == 'linear'
+        self.after = layer.get('after', 'hold')
+        self.snap = layer.get('snap', False)
+        self.wrap = layer.get('wrap')
+
+        self.bounds = _clip_bounds(layer, width, height)
+        self.static = len(path) == 1 and (len(self.sprites) == 1 or not self.frame_fps)
+        self.region = _rect_mask(self.bounds, width, height)
+        if self.static:
+            # draw_sprite touches the sprite box plus one pixel for sub-pixel positions
+            left, top = self.top_left(0.0)
+            self.region &= _rect_mask((int(np.floor(left)), int(np.floor(top)),
+                                       int(np.floor(left)) + self.sprite_width + 1,
+                                       int(np.floor(top)) + self.sprite_height + 1), width, height)
+
+    def position(self, t):
+        """Return the (x, y) of the anchor at time t."""
+        times, points = self.times, self.points
+        if len(times) == 1:
+            return points[0]
+        if self.after == 'loop' and t > times[-1]:
+            t = times[0] + (t - times[0]) % (times[-1] - times[0])
+        if t <= times[0]:
+            return points[0]
+        if t >= times[-1] and self.after != 'continue':
+            return points[-1]
+        i = min(int(np.searchsorted(times, t, side='right')) - 1, len(times) - 2)
+        t0, t1, p0, p1 = times[i], times[i + 1], points[i], points[i + 1]
+        if self.linear or t >= t1:
+            # Velocity form, so 'continue' extends the last segment in a straight line
+            return (t - t0) * ((p1 - p0) / (t1 - t0)) + p0
+        return p0 + (p1 - p0) * self.easing((t - t0) / (t1 - t0))
+
+    def top_left(self, t):
+        """Return where the sprite's top-left corner goes at time t."""
+        x, y = self.position(t)
+        if self.snap:
+            x, y = np.floor(x), np.floor(y)
+        if self.wrap:
+            x = self.wrap[0] + (x - self.wrap[0]) % (self.wrap[1] - self.wrap[0])
+        return x - self.anchor[0], y - self.anchor[1]
+
+    def draw(self, frame, t):
+        left, top = self.top_left(t)
+        index = int(t * self.frame_fps) % len(self.sprites) if self.frame_fps else 0
+        x0, y0, x1, y1 = self.bounds
+        if left == int(left) and top == int(top):
+            # Whole-pixel position: the sprite is opaque, so a masked copy gives the same pixels
+            paste(frame[y0:y1, x0:x1], self.patches[index], self.masks[index], int(left) - x0, int(top) - y0)
+        else:
+            draw_sprite(frame[y0:y1, x0:x1], self.sprites[index], float(left - x0), float(top - y0))
+
+
+class EmitterLayer:
+    """Particles spawned at a steady rate, moving ballistically, computed from their spawn times."""
+    static = False
+
+    def __init__(self, layer, duration, width, height):
+        start = layer.get('start', 0)
+        stop = layer.get('stop', duration)
+        count = max(int(np.ceil((stop - start) * layer['rate'])), 0)
+        rng = np.random.default_rng(layer.get('seed', 0))
+        self.spawn_times = start + np.arange(count) / layer['rate']
+        self.lifetime = layer['lifetime']
+        self.origins = np.array(layer['origin'], dtype=np.float64) + \
+            (rng.random((count, 2)) * 2 - 1) * np.array(layer.get('spread', (0, 0)))
+        self.velocities = np.array(layer.get('velocity', (0, 0)), dtype=np.float64) + \
+            (rng.random((count, 2)) * 2 - 1) * np.array(layer.get('jitter', (0, 0)))
+        self.gravity = np.array(layer.get('gravity', (0, 0)), dtype=np.float64)
+        self.color = np.array(layer['color'], dtype=np.float64)
+        self.fade = layer.get('fade', True)
+        self.bounds = _clip_bounds(layer, width, height)
+        self.region = _rect_mask(self.bounds, width, height)
+
+    def draw(self, frame, t):
+        # Particles alive at t spawned within the last lifetime
+        first = np.searchsorted(self.spawn_times, t - self.lifetime, side='right')
+        last = np.searchsorted(self.spawn_times, t, side='right')
+        if first >= last:
+            return
+        age = t - self.spawn_times[first:last]
+        positions = self.origins[first:last] + self.velocities[first:last] * age[:, None] + \
+            0.5 * self.gravity * (age * age)[:, None]
+        xs, ys = np.floor(positions).astype(np.intp).T
+        x0, y0, x1, y1 = self.bounds
+        inside = (xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1)
+        if self.fade:
+            colors = self.color * (1.0 - age[inside] / self.lifetime)[:, None]
+        else:
+            colors = np.broadcast_to(self.color, (int(inside.sum()), 3))
+        frame[ys[inside], xs[inside]] = colors.astype(np.uint8)
+
+
+class ScenePlan:
+    """A compiled scene: a baked background plus the layers drawn every frame."""
+
+    def __init__(self, spec, width=None, height=None):
+        """Validate and compile a scene description (a dict as loaded from JSON)."""
+        validate_scene(spec)
+        self.spec = spec
+        self.name = spec['name']
+        self.width = width or config.TOTAL_WIDTH
+        self.height = height or config.TOTAL_HEIGHT
+        self.duration = spec['duration']
+        self.fps = spec.get('fps', config.DEFAULT_FPS)
+        self.fade_in = spec.get('fade_in', 0)
+        self.fade_out = spec.get('fade_out', 0)
+        self.total_duration = self.duration + self.fade_out
+        self.audio = spec.get('audio')
+
+        # Static layers go into the background unless an earlier moving layer can draw where they do
+        self.background = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        moving_region = np.zeros((self.height, self.width), dtype=bool)
+        self.steps = []
+        for layer in spec['layers']:
+            compiled = self._compile_layer(layer)
+            if compiled.static and not (compiled.region & moving_region).any():
+                compiled.draw(self.background, 0.0)
+            else:
+                self.steps.append(compiled.draw)
+                moving_region |= compiled.region
+        self.frame = np.zeros_like(self.background)
+
+    def _compile_layer(self, layer):
+        layer_type = layer['type']
+        if layer_type == 'fill':
+            return FillLayer(layer, self.width, self.height)
+        if layer_type == 'disc':
+            return DiscLayer(layer, self.width, self.height)
+        if layer_type == 'sprite':
+            return SpriteLayer(layer, self.width, self.height)
+        return EmitterLayer(layer, self.duration, self.width, self.height)
+
+    def brightness(self, t):
+        """Return the fade factor at time t (1.0 outside fades)."""
+        if self.fade_in and t < self.fade_in:
+            return t / self.fade_in
+        if self.fade_out and t >= self.duration:
+            return max(0.0, 1.0 - (t - self.duration) / self.fade_out)
+        return 1.0
+
+    def render(self, t):
+        """Render the scene at time t into a (height, width, 3) frame (reused between calls)."""
+        frame = self.frame
+        np.copyto(frame, self.background)
+        for draw in self.steps:
+            draw(frame, t)
+        brightness = self.brightness(t)
+        if brightness < 1.0:
+            np.copyto(frame, (frame * brightness).astype(np.uint8))
+        return frame
+
+
+def load_scene(name):
+    """Load and compile a scene by name (scenes/<name>.json) or path."""
+    path = scene_path(name)
+    with open(path) as f:
+        try:
+            spec = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: {e}") from e
+    return ScenePlan(spec)
+
+
+def target_scene(module, class_name):
+    """Name of the scene an animation class plays, or None if it isn't a SceneAnimation."""
+    cls = getattr(importlib.import_module(module), class_name)
+    if isinstance(cls, type) and issubclass(cls, SceneAnimation):
+        return cls.SCENE
+    return None
+
+
+class SceneAnimation:
+    """Plays a declarative scene; subclasses only set SCENE."""
+    SCENE = None
+
+    def __init__(self, scene=None, led=None):
+        """Load the scene (default the class's SCENE) and set up the display."""
+        self.plan = load_scene(scene or self.SCENE)
+        if led is None:
+            from led_controller_exact import LEDControllerExact
+            led = LEDControllerExact()
+        self.led = led
+        self.width = config.TOTAL_WIDTH
+        self.height = config.TOTAL_HEIGHT
+
+    def run_animation(self, should_stop=None):
+        """Play the scene, fades included, then clear the display."""
+        plan = self.plan
+        print(f"🎬 Starting scene '{plan.name}' ({plan.total_duration:g}s)")
+        start_time = time.time()
+
+        while True:
+            elapsed = time.time() - start_time
+            if elapsed >= plan.total_duration:
+                break
+            if should_stop and should_stop():
+                print(f"🎬 Scene '{plan.name}' stopped by user")
+                break
+
+            frame_started(period=1.0 / plan.fps)
+            self.led.set_frame(plan.render(elapsed))
+            self.led.show()
+            time.sleep(1.0 / plan.fps)
+
+        print(f"🎬 Scene '{plan.name}' completed!")
+        self.led.transition()
+        self.led.clear()
+        self.led.show()
+
+    def cleanup(self):
+        """Clean up resources."""
+        self.led.cleanup()
+
+
+def benchmark(plan, frames=200):
+    """Return the average milliseconds to render one frame, sampled across the whole scene."""
+    times = np.linspace(0, plan.total_duration, frames, endpoint=False)
+    start = time.perf_counter()
+    for t in times:
+        plan.render(t)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    """Command line entry point."""
+    command = sys.argv[1] if len(sys.argv) > 1 else 'check'
+    names = sys.argv[2:] or list_scenes()
+    if command in ('check', 'bench'):
+        failed = False
+        for name in names:
+            start = time.perf_counter()
+            try:
+                plan = load_scene(name)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"❌ {name}: {e}")
+                failed = True
+                continue
+            compile_ms = (time.perf_counter() - start) * 1000
+            if command == 'check':
+                print(f"✓ {name}: {len(plan.spec['layers'])} layers, {len(plan.steps)} drawn per frame")
+            else:
+                print(f"{name:16s} compile {compile_ms:6.1f} ms   render {benchmark(plan):6.3f} ms/frame   "
+                      f"({len(plan.steps)} of {len(plan.spec['layers'])} layers per frame)")
+        sys.exit(1 if failed else 0)
+    elif command == 'play' and len(sys.argv) > 2:
+        animation = SceneAnimation(sys.argv[2])
+        try:
+            animation.run_animation()
+        except KeyboardInterrupt:
+            print("\n⚠️ Scene interrupted by user")
+        finally:
+            animation.cleanup()
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
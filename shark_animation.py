@@ -108,7 +108,7 @@ class SharkAnimation:
             for y in range(cy, min(cy + 6, self.height)):
                 for x in range(coral_x - 1, coral_x + 2):
                     if 0 <= x < self.width and 0 <= y < self.height:
-                        coral_color = tuple(int(c * (0.9 + (y - cy) * 0.05)) for c in self.colors['coral'])
+                        coral_color = tuple(min(255, int(c * (0.9 + (y - cy) * 0.05))) for c in self.colors['coral'])
                         frame[y, x] = coral_color
     
     def create_bubbles(self, frame):
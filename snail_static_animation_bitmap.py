@@ -7,8 +7,26 @@ Displays a snail moving from left to right on light green ground with sun and cl
 import time
 import math
 from led_controller_exact import LEDControllerExact
+from sprite_assets import load_frames
 import config
 
+# Snail bitmap data (32x48 pixels) - compiled into the sprite bundle as 'snail_bitmap'
+bitmap_hex = [
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x03, 0x20, 0x00, 0x00, 0x01, 0x20, 0x00, 0x7f, 0x01, 0x20,
+    0x00, 0xe1, 0xc1, 0xe0, 0x01, 0x80, 0x61, 0xc0, 0x03, 0x00, 0x23, 0xe0, 0x06, 0x38, 0x36, 0x20,
+    0x04, 0x7c, 0x1e, 0x20, 0x04, 0x46, 0x1c, 0x60, 0x04, 0x42, 0x18, 0x40, 0x04, 0x02, 0x18, 0xc0,
+    0x04, 0x07, 0xf0, 0xc0, 0x07, 0xff, 0xe1, 0x80, 0x03, 0x00, 0x01, 0x00, 0x06, 0x00, 0x03, 0x00,
+    0x0c, 0x00, 0x06, 0x00, 0x0f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
+]
+
+
 class SnailStaticAnimationBitmap:
     def __init__(self):
         """Initialize the snail animation."""
@@ -16,35 +34,8 @@ class SnailStaticAnimationBitmap:
         self.width = config.TOTAL_WIDTH
         self.height = config.TOTAL_HEIGHT
         
-        # Snail bitmap data (32x48 pixels)
-        bitmap_hex = [
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x03, 0x20, 0x00, 0x00, 0x01, 0x20, 0x00, 0x7f, 0x01, 0x20,
-            0x00, 0xe1, 0xc1, 0xe0, 0x01, 0x80, 0x61, 0xc0, 0x03, 0x00, 0x23, 0xe0, 0x06, 0x38, 0x36, 0x20,
-            0x04, 0x7c, 0x1e, 0x20, 0x04, 0x46, 0x1c, 0x60, 0x04, 0x42, 0x18, 0x40, 0x04, 0x02, 0x18, 0xc0,
-            0x04, 0x07, 0xf0, 0xc0, 0x07, 0xff, 0xe1, 0x80, 0x03, 0x00, 0x01, 0x00, 0x06, 0x00, 0x03, 0x00,
-            0x0c, 0x00, 0x06, 0x00, 0x0f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-        ]
-        
-        # Convert bitmap to pixel array
-        self.snail_pixels = []
-        for row in range(48):
-            row_data = []
-            byte_start = row * 4
-            for col in range(32):
-                byte_index = byte_start + (col // 8)
-                bit_index = 7 - (col % 8)
-                byte_value = bitmap_hex[byte_index]
-                pixel = (byte_value >> bit_index) & 1
-                # 1 = snail pixel, 0 = background
-                row_data.append(pixel)
-            self.snail_pixels.append(row_data)
+        # Decoded once into the sprite bundle (python sprite_assets.py build)
+        self.snail_pixels = load_frames('snail_bitmap')[0].tolist()
         
         # Colors
         # Snail color: #384247 = RGB(56, 66, 71)
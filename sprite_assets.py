@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Sprite Asset Pipeline
+Compiles the sprite sources (Piskel files, C ARGB arrays, GIF/PNG images and
+the hex bitmaps of the *_bitmap.py animations) into one packed bundle of
+ready-to-blit uint8 frame stacks, which animations map into memory at startup
+
+Bundle layout (little endian, version BUNDLE_VERSION):
+    magic b'LEDSPRT1', uint32 version, uint32 index length, JSON index,
+    then 64-byte aligned arrays
+
+The index records, for every asset, its source (path, size, mtime and
+SHA-1), fps, and the offset and shape of:
+    frames    (n, height, width, 3) RGB, or (n, height, width) 0/1 for bitmaps
+    palette   (colors, 3) RGB, when the RGB frames use at most 256 colors
+    indices   (n, height, width) palette index of every pixel
+
+Loading is an mmap plus NumPy views, so no image is decoded at startup. When
+the bundle is missing or a source changed after the build, load_frames()
+decodes the source instead and says so.
+
+Build, list and verify the bundle:
+    python sprite_assets.py build                 # every asset in SPRITE_SOURCES
+    python sprite_assets.py build logo=logo.gif   # plus extra GIF/PNG/Piskel/C files
+    python sprite_assets.py list
+    python sprite_assets.py check                 # exit 1 if any source changed
+"""
+
+import os
+import re
+import io
+import ast
+import sys
+import json
+import mmap
+import base64
+import struct
+import hashlib
+import numpy as np
+import config
+
+BUNDLE_MAGIC = b'LEDSPRT1'
+BUNDLE_VERSION = 1
+ALIGNMENT = 64
+
+# name -> (source path relative to the project, decoder options)
+SPRITE_SOURCES = {
+    'whale': ('assets/wale.piskel', {}),
+    'whale_c': ('wale.c', {}),
+    'bird': ('assets/bird.piskel', {}),
+    'cat_bitmap': ('cat_static_animation_bitmap.py', {'invert': True}),
+    'deer_bitmap': ('deer_static_animation_bitmap.py', {'invert': True}),
+    'elephant_bitmap': ('elephant_bitmap_animation.py', {'invert': True}),
+    'horse_bitmap': ('horse_static_animation_bitmap.py', {}),
+    'jellyfish_bitmap': ('jellyfish_static_animation_bitmap.py', {'invert': True}),
+    'snail_bitmap': ('snail_static_animation_bitmap.py', {}),
+    'truck_bitmap': ('truck_animation.py', {'invert': True}),
+}
+
+
+def _project_path(path):
+    return path if os.path.isabs(path) else os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+
+
+# Decoders (build time, and the fallback when there is no bundle)
+
+def decode_piskel(path):
+    """Return (frames, fps) of a .piskel file, its layers alpha-composited, as an (n, h, w, 3) array."""
+    from PIL import Image
+
+    with open(path, 'r', encoding='utf-8') as f:
+        piskel = json.load(f)['piskel']
+    width, height = piskel['width'], piskel['height']
+
+    layers = []
+    for layer_str in piskel['layers']:
+        layer = json.loads(layer_str)
+        base64_png = layer['chunks'][0]['base64PNG']
+        sheet = Image.open(io.BytesIO(base64.b64decode(base64_png.split(',')[-1])))
+        sheet.load()
+        # Frames are laid out horizontally in the sprite sheet
+        layers.append([sheet.crop((i * width, 0, min((i + 1) * width, sheet.size[0]), height)).convert('RGBA')
+                       for i in range(layer['frameCount'])])
+
+    frames = []
+    for i, composite in enumerate(layers[0]):
+        for layer in layers[1:]:
+            if i < len(layer):
+                composite = Image.alpha_composite(composite, layer[i])
+        frames.append(np.asarray(composite.convert('RGB')))
+    return np.stack(frames), piskel.get('fps')
+
+
+def argb_to_rgb(argb):
+    """Convert uint32 ARGB values to uint8 RGB, scaling by alpha like int(c * (a / 255))."""
+    argb = np.asarray(argb, dtype=np.uint32)
+    alpha = ((argb >> 24) & 0xFF) / 255
+    rgb = np.stack([(argb >> shift) & 0xFF for shift in (16, 8, 0)], axis=-1)
+    return np.where((alpha < 1.0)[..., None], rgb * alpha[..., None], rgb).astype(np.uint8)
+
+
+def decode_c_array(path):
+    """Return (frames, fps) of a Piskel C export (uint32 ARGB array with *_FRAME_WIDTH/HEIGHT defines)."""
+    with open(path) as f:
+        source = f.read()
+    defines = dict(re.findall(r'#define\s+\w*?_(FRAME_COUNT|FRAME_WIDTH|FRAME_HEIGHT)\s+(\d+)', source))
+    count, width, height = (int(defines[key]) for key in ('FRAME_COUNT', 'FRAME_WIDTH', 'FRAME_HEIGHT'))
+    body = source[source.index('{'):]
+    values = np.array([int(value, 16) for value in re.findall(r'0x[0-9a-fA-F]+', body)], dtype=np.uint32)
+    return argb_to_rgb(values[:count * width * height]).reshape(count, height, width, 3), None
+
+
+def decode_image(path, frame_width=None):
+    """Return (frames, fps) of a GIF (every frame) or PNG (one frame, or a horizontal sheet of frame_width)."""
+    from PIL import Image, ImageSequence
+
+    with Image.open(path) as image:
+        if getattr(image, 'n_frames', 1) > 1:
+            frames = [np.asarray(frame.convert('RGB')) for frame in ImageSequence.Iterator(image)]
+            duration = image.info.get('duration')
+            return np.stack(frames), (1000.0 / duration if duration else None)
+        image = image.convert('RGB')
+        if frame_width and image.size[0] > frame_width:
+            frames = [np.asarray(image.crop((x, 0, x + frame_width, image.size[1])))
+                      for x in range(0, image.size[0] - frame_width + 1, frame_width)]
+            return np.stack(frames), None
+        return np.asarray(image)[None], None
+
+
+def decode_bitmap(values, width=None, height=None, invert=False):
+    """Return a (1, height, width) 0/1 mask from packed 1-bit rows (most significant bit first)."""
+    width = width or config.TOTAL_WIDTH
+    height = height or config.TOTAL_HEIGHT
+    bits = np.unpackbits(np.asarray(values, dtype=np.uint8))[:width * height].reshape(1, height, width)
+    return 1 - bits if invert else bits
+
+
+def decode_bitmap_module(path, invert=False):
+    """Return (mask, None) from the bitmap_hex literal of a *_bitmap.py animation, without importing it."""
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'bitmap_hex' for t in node.targets):
+            return decode_bitmap(ast.literal_eval(node.value), invert=invert), None
+    raise ValueError(f"{path} has no bitmap_hex literal")
+
+
+def decode_source(path, **options):
+    """Decode any supported sprite source by its extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.piskel':
+        return decode_piskel(path)
+    if extension in ('.c', '.h'):
+        return decode_c_array(path)
+    if extension in ('.gif', '.png'):
+        return decode_image(path, options.get('frame_width'))
+    if extension == '.py':
+        return decode_bitmap_module(path, options.get('invert', False))
+    raise ValueError(f"Unsupported sprite source {path}")
+
+
+# Bundle
+
+def _source_info(path):
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        sha1 = hashlib.sha1(f.read()).hexdigest()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': sha1}
+
+
+def build_bundle(sources=None, out_path=None):
+    """Decode every source and write the bundle. Returns the index."""
+    sources = SPRITE_SOURCES if sources is None else sources
+    out_path = _project_path(out_path or config.SPRITE_BUNDLE_PATH)
+
+    index = {}
+    blobs = []
+    offset = 0
+
+    def add_array(array):
+        nonlocal offset
+        array = np.ascontiguousarray(array, dtype=np.uint8)
+        offset += -offset % ALIGNMENT
+        blobs.append((offset, array))
+        entry = [offset, list(array.shape)]
+        offset += array.nbytes
+        return entry
+
+    for name, (path, options) in sorted(sources.items()):
+        source_path = _project_path(path)
+        frames, fps = decode_source(source_path, **options)
+        entry = {'source': path, 'options': options, 'fps': fps, **_source_info(source_path),
+                 'frames': add_array(frames), 'palette': None, 'indices': None}
+
+        if frames.ndim == 4:
+            palette, indices = np.unique(frames.reshape(-1, 3), axis=0, return_inverse=True)
+            if len(palette) <= 256:
+                entry['palette'] = add_array(palette)
+                entry['indices'] = add_array(indices.reshape(frames.shape[:3]))
+        index[name] = entry
+        print(f"✓ {name}: {frames.shape[0]} x {frames.shape[2]}x{frames.shape[1]} from {path}"
+              + (f", {entry['palette'][1][0]} colors" if entry['palette'] else ''))
+
+    header = json.dumps({'assets': index}).encode()
+    data_start = len(BUNDLE_MAGIC) + 8 + len(header)
+    data_start += -data_start % ALIGNMENT
+
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(BUNDLE_MAGIC + struct.pack('<II', BUNDLE_VERSION, len(header)) + header)
+        for blob_offset, array in blobs:
+            f.seek(data_start + blob_offset)
+            f.write(array.tobytes())
+    os.replace(tmp_path, out_path)
+
+    print(f"✅ Wrote {len(index)} sprites ({os.path.getsize(out_path) // 1024} KB) to {out_path}")
+    return index
+
+
+class SpriteAsset:
+    """One asset in a bundle: read-only NumPy views into the mapped file."""
+
+    def __init__(self, name, entry, frames, palette=None, indices=None):
+        self.name = name
+        self.entry = entry
+        self.frames = frames
+        self.palette = palette
+        self.indices = indices
+        self.fps = entry.get('fps')
+
+    def is_stale(self):
+        """Return True if the source file changed (by size or modification time) since the build."""
+        try:
+            stat = os.stat(_project_path(self.entry['source']))
+        except OSError:
+            return False  # Source not deployed - the bundle is all there is
+        return stat.st_size != self.entry['size'] or stat.st_mtime_ns != self.entry['mtime_ns']
+
+
+class SpriteBundle:
+    """A compiled sprite bundle mapped into memory."""
+
+    def __init__(self, path=None):
+        """Map the bundle; raises ValueError if the file is not a bundle of this version."""
+        self.path = _project_path(path or config.SPRITE_BUNDLE_PATH)
+        with open(self.path, 'rb') as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.mmap[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            raise ValueError(f"{self.path} is not a sprite bundle")
+        version, header_size = struct.unpack_from('<II', self.mmap, len(BUNDLE_MAGIC))
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"{self.path} is bundle version {version}, expected {BUNDLE_VERSION}")
+        header_start = len(BUNDLE_MAGIC) + 8
+        self.index = json.loads(self.mmap[header_start:header_start + header_size])['assets']
+        self.data_start = header_start + header_size
+        self.data_start += -self.data_start % ALIGNMENT
+
+    def _view(self, entry):
+        if entry is None:
+            return None
+        offset, shape = entry
+        return np.ndarray(tuple(shape), dtype=np.uint8, buffer=self.mmap, offset=self.data_start + offset)
+
+    def names(self):
+        return sorted(self.index)
+
+    def get(self, name):
+        """Return the SpriteAsset called name, or None."""
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+        return SpriteAsset(name, entry, self._view(entry['frames']),
+                           self._view(entry['palette']), self._view(entry['indices']))
+
+
+_shared_bundle = None
+_bundle_checked = False
+
+
+def get_bundle():
+    """Return the process's SpriteBundle, or None if it has not been built."""
+    global _shared_bundle, _bundle_checked
+    if not _bundle_checked:
+        _bundle_checked = True
+        try:
+            _shared_bundle = SpriteBundle()
+        except FileNotFoundError:
+            print("⚠️ No sprite bundle, decoding sprite sources - build it with: python sprite_assets.py build")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not map sprite bundle ({e}), decoding sprite sources")
+    return _shared_bundle
+
+
+def load_frames(name):
+    """Return the frame stack of an asset, from the bundle when it is up to date, else from its source."""
+    bundle = get_bundle()
+    asset = bundle.get(name) if bundle else None
+    if asset is None:
+        path, options = SPRITE_SOURCES[name]
+    elif asset.is_stale():
+        print(f"⚠️ Sprite '{name}' changed since the bundle was built, decoding it - rebuild with: python sprite_assets.py build")
+        path, options = asset.entry['source'], asset.entry['options']
+    else:
+        return asset.frames
+    return decode_source(_project_path(path), **options)[0]
+
+
+def check_bundle(path=None):
+    """Return the names of assets that are missing, or whose source changed (content or timestamp) since the build."""
+    bundle = SpriteBundle(path)
+    stale = []
+    for name in bundle.names():
+        entry = bundle.index[name]
+        source_path = _project_path(entry['source'])
+        if bundle.get(name).is_stale() or (os.path.exists(source_path)
+                                            and _source_info(source_path)['sha1'] != entry['sha1']):
+            stale.append(name)
+    missing = sorted(set(SPRITE_SOURCES) - set(bundle.names()))
+    return stale + missing
+
+
+def main():
+    """Command line entry point."""
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'build':
+        sources = dict(SPRITE_SOURCES)
+        for arg in sys.argv[2:]:
+            name, _, path = arg.partition('=')
+            if not path:
+                print(f"❌ Expected name=path, got {arg}")
+                sys.exit(1)
+            sources[name] = (path, {})
+        build_bundle(sources)
+    elif command == 'list':
+        bundle = SpriteBundle(sys.argv[2] if len(sys.argv) > 2 else None)
+        for name in bundle.names():
+            asset = bundle.get(name)
+            colors = f"{len(asset.palette)} colors" if asset.palette is not None else 'mask' if asset.frames.ndim == 3 else 'RGB'
+            print(f"{name:18s} {asset.frames.shape[0]:3d} x {asset.frames.shape[2]}x{asset.frames.shape[1]}  "
+                  f"{colors:10s} {asset.fps or '-'} fps  ({asset.entry['source']})")
+    elif command == 'check':
+        try:
+            stale = check_bundle()
+        except (OSError, ValueError) as e:
+            print(f"❌ No usable sprite bundle ({e}) - build it with: python sprite_assets.py build")
+            sys.exit(1)
+        if stale:
+            print(f"❌ Out of date: {', '.join(stale)} - rebuild with: python sprite_assets.py build")
+            sys.exit(1)
+        print("✅ Sprite bundle is up to date")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -95,7 +95,7 @@ class StarAnimation:
                             if (0 <= glow_x < self.width and 0 <= glow_y < self.height and 
                                 (dx != 0 or dy != 0)):
                                 glow_intensity = twinkle * 0.3 * (1 - (abs(dx) + abs(dy)) * 0.3)
-                                current = frame[glow_y, glow_x]
+                                current = frame[glow_y, glow_x].tolist()  # Python ints, so blending can't wrap around uint8
                                 frame[glow_y, glow_x] = tuple(int(c + (col - c) * glow_intensity) 
                                                             for c, col in zip(current, final_color))
     
@@ -116,7 +116,7 @@ class StarAnimation:
                 if 0 <= trail_x < self.width and 0 <= trail_y < self.height:
                     # Trail fades out
                     trail_intensity = 1 - (i / trail_length)
-                    trail_intensity *= (star['max_life'] - star['life']) / star['max_life']
+                    trail_intensity *= max(0, star['max_life'] - star['life']) / star['max_life']
                     
                     if i == 0:  # Bright head
                         trail_color = self.colors['shooting_star']
@@ -209,7 +209,7 @@ class StarAnimation:
                         intensity = max(0, intensity * 0.3)  # Subtle effect
                         
                         # Blend with existing frame
-                        current = frame[y, x]
+                        current = frame[y, x].tolist()
                         frame[y, x] = tuple(int(c + (n - c) * intensity) 
                                           for c, n in zip(current, nebula_color))
     
@@ -236,7 +236,7 @@ class StarAnimation:
                         aurora_color = self.colors['aurora_purple']
                     
                     # Blend with existing frame
-                    current = frame[y, x]
+                    current = frame[y, x].tolist()
                     blend_factor = (aurora_intensity - 0.1) * 0.3
                     frame[y, x] = tuple(int(c + (a - c) * blend_factor) 
                                       for c, a in zip(current, aurora_color))
@@ -259,7 +259,7 @@ class StarAnimation:
                     moon_color = tuple(int(c * intensity) for c in self.colors['moon'])
                     
                     # Blend with existing frame
-                    current = frame[y, x]
+                    current = frame[y, x].tolist()
                     frame[y, x] = tuple(int(c + (m - c) * 0.6) 
                                       for c, m in zip(current, moon_color))
     
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Runtime Telemetry
+Counters, gauges and histograms for the LED and app layers, served in
+Prometheus text format on a local HTTP endpoint and summarized in a
+periodic log line
+
+Recorded automatically once config.TELEMETRY_ENABLED is True:
+    led_frames_total / led_show_seconds / led_frame_interval_seconds  per scene
+    led_render_seconds (frame start to show(), marked frames only)    per scene
+    led_fps and led_target_fps (achieved vs. target rate)             per scene
+    led_frame_overruns_total                                          per scene
+    input_to_first_frame_seconds  button edge to the new scene's first frame
+    audio_start_seconds / input_to_audio_seconds
+    threads, plus any stats registered with add_collector() (frame cache,
+    button dispatcher, render worker, audio cache, mock strip wire time)
+
+The scene is whatever set_scene() was last called with; main.py sets it
+when an animation starts, with the scene's frame rate where it knows it.
+
+Render time is only known for frames whose animation marks the start of
+drawing with frame_started() (QualityController and SceneAnimation do; in
+the render worker the mark travels with the frame). A marked frame
+overruns when drawing and showing it took longer than its period. The
+time between shows includes the animation's sleep, so an unmarked frame
+only counts as an overrun when it arrives config.TELEMETRY_OVERRUN_SLACK
+times later than the scene's average interval.
+
+Scrape it:
+    curl http://localhost:9108/metrics
+"""
+
+import time
+import bisect
+import threading
+import config
+
+# Bucket upper bounds in seconds, from a fast show() to a slow scene change
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.02, 0.035, 0.05, 0.075, 0.1, 0.25, 0.5, 1.0, 2.5)
+INTERVAL_SMOOTHING = 0.1  # Weight of the newest interval in a scene's average frame interval
+
+# (perf_counter() render start, period) of the frame being drawn, set by frame_started()
+_frame_mark = None
+
+
+def frame_started(start=None, period=None):
+    """Mark the start of drawing the next frame, due period seconds after start.
+
+    Works with telemetry off, so the render worker can forward the mark to the main process.
+    """
+    global _frame_mark
+    _frame_mark = (time.perf_counter() if start is None else start, period)
+
+
+def take_frame_mark(show_start):
+    """Return (render seconds, period) of the frame about to be shown, or (None, None) if unmarked."""
+    global _frame_mark
+    mark, _frame_mark = _frame_mark, None
+    if mark is None:
+        return None, None
+    start, period = mark
+    return max(0.0, show_start - start), period
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets=TIME_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in items) + '}'
+
+
+class Telemetry:
+    """Process-wide metrics registry plus the LED/app specific recording helpers."""
+
+    def __init__(self, target_fps=None):
+        """Initialize empty metrics (target_fps for scenes that don't give their own)."""
+        self.lock = threading.Lock()
+        self.counters = {}    # (name, labels) -> value
+        self.gauges = {}      # (name, labels) -> value
+        self.histograms = {}  # (name, labels) -> Histogram
+        self.help = {}        # name -> (type, help text)
+        self.collectors = []  # (prefix, callable returning a stats dict)
+
+        self.default_target_fps = target_fps
+        self.scene = 'idle'
+        self.target_fps = self.default_target_fps  # None = not known, overruns judged on the intervals
+        self.last_show_end = None
+        self.average_interval = None
+        self.pending_input = None   # Edge time of a button press not yet followed by a scene change
+        self.scene_input = None     # Edge time that led to the current scene, until its first frame
+        self.fps_window_start = time.perf_counter()
+        self.fps_window_frames = 0
+
+        self.describe('led_frames_total', 'counter', 'Frames pushed to the LEDs')
+        self.describe('led_show_seconds', 'histogram', 'Time spent in show() pushing a frame')
+        self.describe('led_render_seconds', 'histogram', 'Time from the start of drawing a frame to show()')
+        self.describe('led_frame_interval_seconds', 'histogram', 'Time between the end of one show() and the next')
+        self.describe('led_frame_overruns_total', 'counter', 'Frames that missed their period')
+        self.describe('led_fps', 'gauge', 'Achieved frames per second')
+        self.describe('led_target_fps', 'gauge', 'Target frames per second')
+        self.describe('input_to_first_frame_seconds', 'histogram', 'Button edge to first frame of the new scene')
+        self.describe('audio_start_seconds', 'histogram', 'Time taken to start animation audio')
+        self.describe('input_to_audio_seconds', 'histogram', 'Button edge to animation audio starting')
+        self.describe('threads', 'gauge', 'Live Python threads')
+
+        self.server = None
+        self.summary_thread = None
+        self.summary_totals = {}
+
+    # Generic metrics
+
+    def describe(self, name, kind, help_text):
+        self.help[name] = (kind, help_text)
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set_gauge(self, name, value, **labels):
+        with self.lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def add_collector(self, prefix, get_stats):
+        """Export the numeric values of get_stats() as gauges named <prefix>_<key> on every scrape."""
+        self.collectors.append((prefix, get_stats))
+
+    # LED and app events
+
+    def set_scene(self, name, target_fps=None):
+        """Attribute the following frames to a scene (called when an animation starts)."""
+        with self.lock:
+            self.scene = name
+            self.target_fps = target_fps or self.default_target_fps
+            self.last_show_end = None
+            self.average_interval = None
+            self.scene_input, self.pending_input = self.pending_input, None
+            self.fps_window_start = time.perf_counter()
+            self.fps_window_frames = 0
+        if self.target_fps:
+            self.set_gauge('led_target_fps', self.target_fps, scene=name)
+
+    def note_input(self, edge_time=None):
+        """Record a button edge (time.monotonic()) for the latency metrics."""
+        self.pending_input = time.monotonic() if edge_time is None else edge_time
+
+    def frame_shown(self, show_start, show_end, render_seconds=None, period=None):
+        """Record one frame pushed to the LEDs (times from time.perf_counter()).
+
+        render_seconds and period come from the frame's frame_started() mark, if it had one.
+        """
+        scene = self.scene
+        show_seconds = show_end - show_start
+        self.inc('led_frames_total', scene=scene)
+        self.observe('led_show_seconds', show_seconds, scene=scene)
+        if render_seconds is not None:
+            self.observe('led_render_seconds', render_seconds, scene=scene)
+            period = period or (1.0 / self.target_fps if self.target_fps else None)
+            if period and render_seconds + show_seconds > period:
+                self.inc('led_frame_overruns_total', scene=scene)
+        if self.last_show_end is not None:
+            interval = show_end - self.last_show_end
+            self.observe('led_frame_interval_seconds', interval, scene=scene)
+            if self.average_interval is None:
+                self.average_interval = interval
+            else:
+                if render_seconds is None and interval > self.average_interval * config.TELEMETRY_OVERRUN_SLACK:
+                    self.inc('led_frame_overruns_total', scene=scene)
+                self.average_interval += (interval - self.average_interval) * INTERVAL_SMOOTHING
+        self.last_show_end = show_end
+
+        if self.scene_input is not None:
+            self.observe('input_to_first_frame_seconds', time.monotonic() - self.scene_input, scene=scene)
+            self.scene_input = None
+
+        self.fps_window_frames += 1
+        elapsed = show_end - self.fps_window_start
+        if elapsed >= 1.0:
+            self.set_gauge('led_fps', self.fps_window_frames / elapsed, scene=scene)
+            self.fps_window_start = show_end
+            self.fps_window_frames = 0
+
+    def audio_started(self, call_seconds):
+        """Record how long starting the animation audio took."""
+        self.observe('audio_start_seconds', call_seconds, scene=self.scene)
+        edge_time = self.scene_input or self.pending_input
+        if edge_time is not None:
+            self.observe('input_to_audio_seconds', time.monotonic() - edge_time, scene=self.scene)
+
+    # Export
+
+    def _collect(self):
+        self.set_gauge('threads', threading.active_count())
+        for prefix, get_stats in self.collectors:
+            try:
+                stats = get_stats()
+            except Exception:
+                continue
+            for key, value in stats.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    self.set_gauge(f'{prefix}_{key}', value)
+
+    def prometheus_text(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        self._collect()
+        with self.lock:
+            series = {}
+            for (name, labels), value in self.counters.items():
+                series.setdefault(name, []).append(f'{name}{_format_labels(labels)} {value}')
+            for (name, labels), value in self.gauges.items():
+                series.setdefault(name, []).append(f'{name}{_format_labels(labels)} {value}')
+            for (name, labels), histogram in self.histograms.items():
+                lines = series.setdefault(name, [])
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{_format_labels(labels, ("le", bound))} {cumulative}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {histogram.sum}')
+                lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+
+        out = []
+        for name in sorted(series):
+            kind, help_text = self.help.get(name, ('gauge', name.replace('_', ' ')))
+            out.append(f'# HELP {name} {help_text}')
+            out.append(f'# TYPE {name} {kind}')
+            out.extend(series[name])
+        return '\n'.join(out) + '\n'
+
+    def summary_line(self):
+        """Return a one-line summary of the current scene since the previous summary."""
+        scene = self.scene
+        labels = (('scene', scene),)
+        with self.lock:
+            frames = self.counters.get(('led_frames_total', labels), 0)
+            overruns = self.counters.get(('led_frame_overruns_total', labels), 0)
+            render = self.histograms.get(('led_render_seconds', labels))
+            show = self.histograms.get(('led_show_seconds', labels))
+            totals = (frames, overruns, render.sum if render else 0.0, render.count if render else 0,
+                      show.sum if show else 0.0, show.count if show else 0)
+        previous = self.summary_totals.get(scene, (0, 0, 0.0, 0, 0.0, 0))
+        self.summary_totals[scene] = totals
+        frames, overruns, render_sum, render_count, show_sum, show_count = (
+            now - before for now, before in zip(totals, previous))
+
+        fps = self.gauges.get(('led_fps', labels), 0.0)
+        target = f"{self.target_fps:g}" if self.target_fps else '?'
+        render_ms = render_sum / render_count * 1000 if render_count else 0.0
+        show_ms = show_sum / show_count * 1000 if show_count else 0.0
+        return (f"📊 {scene}: {fps:.1f}/{target} fps, {frames} frames, {overruns} overruns, "
+                f"render {render_ms:.1f} ms, show {show_ms:.1f} ms, {threading.active_count()} threads")
+
+    def start(self, port=None, summary_interval=None):
+        """Start the HTTP endpoint and the periodic summary (each skipped if its setting is 0)."""
+        port = config.TELEMETRY_HTTP_PORT if port is None else port
+        summary_interval = config.TELEMETRY_SUMMARY_INTERVAL if summary_interval is None else summary_interval
+        if port and self.server is None:
+            self._start_server(port)
+        if summary_interval and self.summary_thread is None:
+            self.summary_thread = threading.Thread(target=self._run_summary, args=(summary_interval,),
+                                                   name='telemetry-summary', daemon=True)
+            self.summary_thread.start()
+
+    def _start_server(self, port):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        telemetry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != '/metrics':
+                    self.send_error(404)
+                    return
+                body = telemetry.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            self.server = ThreadingHTTPServer((config.TELEMETRY_HTTP_HOST, port), Handler)
+        except OSError as e:
+            print(f"⚠️ Telemetry endpoint not started on port {port}: {e}")
+            return
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name='telemetry-http', daemon=True).start()
+        print(f"📈 Telemetry at http://{config.TELEMETRY_HTTP_HOST}:{port}/metrics")
+
+    def _run_summary(self, interval):
+        while True:
+            time.sleep(interval)
+            print(self.summary_line())
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+_shared_telemetry = None
+
+
+def get_telemetry():
+    """Return the process's Telemetry, or None when config.TELEMETRY_ENABLED is False."""
+    global _shared_telemetry
+    if _shared_telemetry is None and config.TELEMETRY_ENABLED:
+        _shared_telemetry = Telemetry()
+        _shared_telemetry.start()
+    return _shared_telemetry
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for display orientation
+Draws on the mock strip in every orientation and checks what the board
+physically shows - no hardware needed
+"""
+
+import numpy as np
+import config
+import golden_frames
+import display_orientation
+from led_controller_exact import LEDControllerExact
+
+
+def physical_frame(led):
+    """Return what the board shows, rebuilt from the strip with the unrotated layout."""
+    return led.led.output.to_frame(led.led.pixels)
+
+
+def test_orientations_transform_the_picture():
+    """Each orientation shows the drawn picture rotated or mirrored, via set_pixel and set_frame alike."""
+    led = LEDControllerExact(backend='mock')
+    rng = np.random.default_rng(1)
+    expected = {
+        'normal': lambda f: f,
+        'rotate_90': lambda f: np.rot90(f, -1),
+        'rotate_180': lambda f: np.rot90(f, 2),
+        'rotate_270': lambda f: np.rot90(f, 1),
+        'mirror_x': lambda f: f[:, ::-1],
+        'mirror_y': lambda f: f[::-1],
+    }
+    try:
+        for orientation, transform in expected.items():
+            led.set_orientation(orientation)
+            frame = rng.integers(0, 256, (led.height, led.width, 3), dtype=np.uint8)
+            led.set_frame(frame)
+            assert (physical_frame(led) == transform(frame)).all(), orientation
+
+            led.clear()
+            led.set_pixel(1, 2, (255, 0, 0))
+            marker = np.zeros_like(frame)
+            marker[2, 1] = (255, 0, 0)
+            assert (physical_frame(led) == transform(marker)).all(), orientation
+    finally:
+        led.cleanup()
+        display_orientation.set_current_orientation(None)
+
+
+def test_board_sized_frames_on_quarter_turns():
+    """A frame sized from config.TOTAL_WIDTH/TOTAL_HEIGHT is centered on a quarter-turned canvas."""
+    led = LEDControllerExact(backend='mock')
+    rng = np.random.default_rng(2)
+    frame = rng.integers(1, 256, (config.TOTAL_HEIGHT, config.TOTAL_WIDTH, 3), dtype=np.uint8)
+    margin = (config.TOTAL_HEIGHT - config.TOTAL_WIDTH) // 2
+    try:
+        led.set_orientation('rotate_90')
+        led.set_frame(frame)
+        canvas = np.zeros((led.height, led.width, 3), dtype=np.uint8)
+        canvas[:, margin:margin + config.TOTAL_WIDTH] = frame[margin:margin + config.TOTAL_WIDTH]
+        assert (physical_frame(led) == np.rot90(canvas, -1)).all()
+
+        led.set_indexed_frame(frame[:, :, 0], np.repeat(np.arange(256, dtype=np.uint8)[:, None], 3, axis=1))
+        assert (physical_frame(led)[:, :, 0] == np.rot90(canvas, -1)[:, :, 0]).all()
+    finally:
+        led.cleanup()
+        display_orientation.set_current_orientation(None)
+
+    # A whole animation that draws with set_frame runs rotated
+    saved = config.DISPLAY_ORIENTATION
+    config.DISPLAY_ORIENTATION = 'rotate_90'
+    try:
+        record = golden_frames.run_animation('growing_circle_animation', capture_times=(0.5,), time_limit=1.0)
+    finally:
+        config.DISPLAY_ORIENTATION = saved
+    assert record['error'] is None and 'hash' in record['captures'][0]
+
+
+def test_new_controllers_follow_runtime_orientation():
+    """Controllers created after set_orientation() start in it, as animations build their own."""
+    led = LEDControllerExact(backend='mock')
+    try:
+        led.set_orientation('rotate_90')
+        fresh = LEDControllerExact(backend='mock')
+        try:
+            assert fresh.led.orientation == 'rotate_90'
+            assert (fresh.width, fresh.height) == (config.TOTAL_HEIGHT, config.TOTAL_WIDTH)
+            frame = np.zeros((fresh.height, fresh.width, 3), dtype=np.uint8)
+            frame[2, 1] = (255, 0, 0)
+            fresh.set_frame(frame)
+            assert (physical_frame(fresh) == np.rot90(frame, -1)).all()
+        finally:
+            fresh.cleanup()
+    finally:
+        led.cleanup()
+        display_orientation.set_current_orientation(None)
+    assert LEDControllerExact(backend='mock').led.orientation == config.DISPLAY_ORIENTATION
+
+
+def main():
+    """Run the orientation tests."""
+    test_orientations_transform_the_picture()
+    test_board_sized_frames_on_quarter_turns()
+    test_new_controllers_follow_runtime_orientation()
+    print("All orientations map correctly!")
+
+
+if __name__ == "__main__":
+    main()
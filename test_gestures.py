@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for button gestures
+Injects button edge sequences into the mock GPIO - no hardware needed
+"""
+
+import button_controller
+from button_controller import ButtonController
+from gesture_recognizer import GestureRecognizer
+from mock_rpi import GPIO as MockGPIO
+import config
+
+# Always drive the mock, even on the Pi
+button_controller.GPIO = MockGPIO
+
+
+def make_controller(events):
+    """Create a button controller with all buttons released and gestures enabled."""
+    for pin in config.BUTTON_PINS:
+        MockGPIO.release(pin)
+    controller = ButtonController()
+    recognizer = GestureRecognizer(range(len(config.BUTTON_PINS)), chord_window=0.15,
+                                   long_press_time=1.0, double_tap_window=0.4,
+                                   hold_repeat_interval=0.25)
+    recognizer.add_chord((0, 3))
+    recognizer.add_listener(events.append)
+    controller.set_gesture_recognizer(recognizer)
+    controller.poll_buttons(0.0)
+    return controller
+
+
+def run_sequence(controller, edges, until):
+    """Apply (time, button_id, pressed) edges while polling every 10 ms up to `until`."""
+    edges = sorted(edges)
+    t = 0.0
+    while t <= until:
+        while edges and edges[0][0] <= t:
+            _, button_id, pressed = edges.pop(0)
+            pin = config.BUTTON_PINS[button_id]
+            if pressed:
+                MockGPIO.press(pin)
+            else:
+                MockGPIO.release(pin)
+        controller.poll_buttons(t)
+        t = round(t + 0.01, 2)
+
+
+def kinds(events):
+    return [(e.kind, e.buttons) for e in events]
+
+
+def test_single_press():
+    """A short press gives a press and a release."""
+    events = []
+    controller = make_controller(events)
+    calls = []
+    controller.register_callback(1, lambda: calls.append(1))
+    run_sequence(controller, [(0.1, 1, True), (0.2, 1, False)], 1.0)
+    assert kinds(events) == [('press', (1,)), ('release', (1,))]
+    assert calls == [1]
+
+
+def test_bounced_press_fires_once():
+    """A second press within BUTTON_DEBOUNCE_TIME is bounce: the button callback runs once."""
+    events = []
+    controller = make_controller(events)
+    calls = []
+    controller.register_callback(1, lambda: calls.append(1))
+    run_sequence(controller, [(0.1, 1, True), (0.13, 1, False), (0.16, 1, True), (0.3, 1, False),
+                              (0.6, 1, True), (0.7, 1, False)], 1.0)
+    assert kinds(events).count(('press', (1,))) == 3
+    assert calls == [1, 1]
+
+
+def test_double_tap():
+    """Two quick presses give a double tap on the second press."""
+    events = []
+    controller = make_controller(events)
+    run_sequence(controller, [(0.1, 2, True), (0.2, 2, False),
+                              (0.3, 2, True), (0.4, 2, False)], 1.0)
+    assert ('double_tap', (2,)) in kinds(events)
+    assert kinds(events).count(('press', (2,))) == 2
+
+
+def test_long_press_and_repeat():
+    """Holding a button gives a long press at exactly 1 s then repeats every 0.25 s."""
+    events = []
+    controller = make_controller(events)
+    run_sequence(controller, [(0.1, 1, True), (1.65, 1, False)], 2.0)
+    long_presses = [e for e in events if e.kind == 'long_press']
+    repeats = [e for e in events if e.kind == 'hold_repeat']
+    assert len(long_presses) == 1
+    assert abs(long_presses[0].time - 1.1) < 1e-9
+    assert len(repeats) == 2
+
+
+def test_chord():
+    """Buttons 0 and 3 inside the chord window give one chord and no presses."""
+    events = []
+    controller = make_controller(events)
+    calls = []
+    controller.register_callback(0, lambda: calls.append(0))
+    controller.register_callback(3, lambda: calls.append(3))
+    run_sequence(controller, [(0.1, 0, True), (0.15, 3, True),
+                              (0.5, 0, False), (0.5, 3, False)], 1.0)
+    assert kinds(events) == [('chord', (0, 3))]
+    assert calls == []
+
+
+def test_chord_member_alone():
+    """A chord member pressed alone is delivered once the chord window passes."""
+    events = []
+    controller = make_controller(events)
+    run_sequence(controller, [(0.1, 0, True), (0.6, 0, False)], 1.0)
+    presses = [e for e in events if e.kind == 'press']
+    assert kinds(events) == [('press', (0,)), ('release', (0,))]
+    assert presses[0].time == 0.1
+
+
+def main():
+    """Run all gesture tests."""
+    tests = [test_single_press, test_bounced_press_fires_once, test_double_tap,
+             test_long_press_and_repeat, test_chord, test_chord_member_alone]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print("All gesture tests passed!")
+
+
+if __name__ == "__main__":
+    main()
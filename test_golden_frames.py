@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Test script for golden frames
+Runs every animation off-device with a virtual clock and compares the
+frames with the golden data in golden_frames/ - no hardware needed
+
+After an intentional visual change, re-record with:
+    python golden_frames.py record <animation>
+"""
+
+from golden_frames import check_animations
+
+
+def test_animations_match_golden_frames():
+    """Every animation shows exactly the golden frames."""
+    failures = check_animations()
+    assert failures == [], f"Animations differ from golden data: {failures}"
+
+
+def main():
+    """Run the golden frame test."""
+    test_animations_match_golden_frames()
+    print("All animations match golden frames!")
+
+
+if __name__ == "__main__":
+    main()
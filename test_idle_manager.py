@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for the idle low-power mode
+Checks that the display idles after the timeout, wakes on a button press,
+and that nothing wakes up while idle - no hardware needed
+"""
+
+import threading
+import time
+import button_controller
+from button_controller import ButtonController
+from idle_manager import IdleManager
+from led_controller_exact import LEDControllerExact
+from mock_rpi import GPIO as MockGPIO
+import config
+
+# Always drive the mock, even on the Pi
+button_controller.GPIO = MockGPIO
+
+
+def run_loop(idle, until):
+    """Call idle.step() on a thread until until() is True; returns the thread."""
+    def loop():
+        while not until():
+            idle.step()
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_idle_and_wake():
+    """Idle starts once the animation has ended and the timeout passed, powers down, and a press wakes it."""
+    led = LEDControllerExact(backend='mock')
+    busy = [True]
+    calls = []
+    done = [False]
+    idle = IdleManager(led, lambda: busy[0], timeout=0.2,
+                       on_sleep=lambda: calls.append('sleep'), on_wake=lambda: calls.append('wake'))
+    thread = run_loop(idle, lambda: done[0])
+    try:
+        time.sleep(0.3)
+        assert idle.state == IdleManager.ACTIVE  # Still busy
+        busy[0] = False
+        time.sleep(0.6)
+        assert idle.state == IdleManager.IDLE and calls == ['sleep']
+        assert not led.led.output.shown.any()
+
+        # Nothing wakes the main loop while idle
+        time.sleep(0.3)
+        idle.note_activity()
+        assert idle.state == IdleManager.ACTIVE and calls == ['sleep', 'wake']
+        stats = idle.get_stats()
+        assert stats['periods'] == 1 and stats['last_loop_wakeups'] == 0
+        assert stats['seconds'] >= 0.3
+    finally:
+        done[0] = True
+        idle.stop()
+        thread.join(timeout=1)
+        led.cleanup()
+
+
+def test_edge_monitoring_sleeps_until_press():
+    """With edge detection, the button thread does not wake until a button changes."""
+    for pin in config.BUTTON_PINS:
+        MockGPIO.release(pin)
+    controller = ButtonController()
+    presses = []
+    activity = []
+    controller.register_callback(2, lambda: presses.append(2))
+    controller.register_activity_callback(lambda: activity.append(1))
+    controller.start_monitoring()
+    try:
+        assert controller.edge_detection
+        time.sleep(0.3)
+        # The first edge-settle samples after startup at most
+        assert controller.wakeups <= 6, controller.wakeups
+        MockGPIO.press(config.BUTTON_PINS[2])
+        time.sleep(0.05)
+        MockGPIO.release(config.BUTTON_PINS[2])
+        time.sleep(0.1)
+        assert presses == [2] and activity == [1]
+        before = controller.wakeups
+        time.sleep(0.3)
+        assert controller.wakeups - before <= 6, controller.wakeups - before
+    finally:
+        controller.stop_monitoring()
+
+
+def main():
+    """Run the idle mode tests."""
+    test_idle_and_wake()
+    test_edge_monitoring_sleeps_until_press()
+    print("Idle mode sleeps and wakes correctly!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script for indexed frames
+Checks that palette fades and crossfades match the per-pixel color math
+they replace, and that the controller expands indices the same as set_frame
+"""
+
+import numpy as np
+from indexed_frame import IndexedFrame
+from led_controller_exact import LEDControllerExact
+
+
+def test_palette_fades_match_pixel_math():
+    """Levels and crossfades give exactly int(c * level) and int(c1 * (1 - t) + c2 * t)."""
+    rng = np.random.default_rng(2)
+    first = rng.integers(0, 256, (4, 3), dtype=np.uint8)[rng.integers(0, 4, (48, 32))]
+    second = rng.integers(0, 256, (5, 3), dtype=np.uint8)[rng.integers(0, 5, (48, 32))]
+    a, b = IndexedFrame.from_rgb(first), IndexedFrame.from_rgb(second)
+    blend = IndexedFrame.crossfade(a, b)
+
+    for t in rng.random(20):
+        a.set_level(t)
+        assert (a.to_rgb() == (first * t).astype(np.uint8)).all()
+        blend.set_mix(t)
+        assert (blend.to_rgb() == (first * (1 - t) + second * t).astype(np.uint8)).all()
+
+
+def test_indexed_frame_on_controller():
+    """set_indexed_frame shows the same strip as set_frame of the expanded frame."""
+    led = LEDControllerExact(backend='mock')
+    frame = IndexedFrame()
+    frame.fill_rect(0, 0, 8, 12, frame.color_index((240, 135, 135)))
+    frame.fill_rect(24, 36, 20, 20, frame.color_index((78, 215, 241)))
+    frame.set_level(0.5, 1)
+    try:
+        led.set_frame(frame.to_rgb())
+        expected = led.led.pixels.copy()
+        led.clear()
+        led.set_indexed_frame(frame.indices, frame.palette())
+        assert (led.led.pixels == expected).all()
+        assert (led.led.display_matrix == frame.to_rgb()).all()
+    finally:
+        led.cleanup()
+
+
+def main():
+    """Run the indexed frame tests."""
+    test_palette_fades_match_pixel_math()
+    test_indexed_frame_on_controller()
+    print("Indexed frames match pixel math!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test script for output backends
+Checks that the strip backend's changed-LED path leaves the strip exactly
+as a full write would, through the mock strip - no hardware needed
+"""
+
+import numpy as np
+import config
+from output_backends import create_backend
+
+
+def test_strip_diff_matches_full_write():
+    """Only changed LEDs are sent, and the strip always ends up holding the whole frame."""
+    backend = create_backend('mock')
+    backend.begin()
+    strip = backend.strip
+    sent = []
+    set_color = strip.setPixelColorRGB
+
+    def counting_set_color(led_index, r, g, b):
+        sent.append(led_index)
+        set_color(led_index, r, g, b)
+
+    strip.setPixelColorRGB = counting_set_color
+    rng = np.random.default_rng(3)
+    frame = rng.integers(0, 256, (config.TOTAL_LEDS, 3), dtype=np.uint8)
+    try:
+        backend.write(frame)
+        assert len(sent) == config.TOTAL_LEDS and (strip.pixels == frame).all()
+
+        for _ in range(5):
+            frame = frame.copy()
+            changed = rng.choice(config.TOTAL_LEDS, 50, replace=False)
+            frame[changed] = rng.integers(0, 256, (50, 3), dtype=np.uint8)
+            sent.clear()
+            backend.write(frame)
+            assert set(sent) <= set(changed.tolist())
+            assert (strip.pixels == frame).all() and (backend.last == frame).all()
+    finally:
+        backend.close()
+
+
+def main():
+    """Run the output backend tests."""
+    test_strip_diff_matches_full_write()
+    print("Strip backend sends only what changed!")
+
+
+if __name__ == "__main__":
+    main()
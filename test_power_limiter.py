@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the power limiter
+Checks the current estimate, that bright frames are held to the budget
+through the strip brightness, and the per-animation statistics
+"""
+
+import time
+import numpy as np
+from output_backends import create_backend
+from power_limiter import PowerLimiter
+
+
+def _frame(color):
+    return np.tile(np.array(color, dtype=np.uint8), (1536, 1))
+
+
+def make_limiter(budget_ma=10000, release=0.2):
+    limiter = PowerLimiter(create_backend('mock'), budget_ma=budget_ma, channel_ma=(20, 20, 20),
+                           idle_ma=1.0, release=release)
+    limiter.begin()
+    limiter.set_brightness(255)
+    return limiter
+
+
+def test_estimate():
+    """Current is channel sum times mA per channel, scaled by brightness, plus idle current."""
+    limiter = make_limiter(budget_ma=200000)
+    assert limiter.frame_current(_frame((255, 255, 255))) == 1536 * 60
+    limiter.set_brightness(51)
+    limiter.write(_frame((255, 0, 0)))
+    assert abs(limiter.current_ma - (1536 * 20 * 51 / 255 + 1536)) < 1e-6
+    limiter.close()
+
+
+def test_bright_frames_are_limited():
+    """White at full brightness is cut to the budget at once, then released gradually."""
+    limiter = make_limiter()
+    strip = limiter.backend.strip
+    limiter.write(_frame((255, 255, 255)))
+    assert limiter.current_ma <= limiter.budget_ma
+    assert strip.brightness == limiter.applied < 255
+    # Pixels are never touched
+    assert (strip.pixels == 255).all()
+
+    limited = limiter.applied
+    limiter.write(_frame((10, 10, 10)))
+    assert limiter.applied < 255  # Not straight back up
+    time.sleep(0.25)
+    limiter.write(_frame((10, 10, 10)))
+    assert limiter.applied == 255 and strip.brightness == 255
+    assert limited < 255
+    limiter.close()
+
+
+def test_scene_stats():
+    """Peak and average current are kept per animation."""
+    limiter = make_limiter(release=0)
+    limiter.set_scene('dark')
+    limiter.write(_frame((0, 0, 0)))
+    limiter.write(_frame((0, 0, 51)))
+    limiter.set_scene('white')
+    limiter.write(_frame((255, 255, 255)))
+    stats = limiter.get_scene_stats()
+    assert stats['dark']['frames'] == 2 and stats['dark']['limited_frames'] == 0
+    assert stats['dark']['peak_ma'] == 1536 * 4 + 1536
+    assert stats['dark']['average_ma'] == (1536 + 1536 * 4 + 1536) / 2
+    assert stats['white']['limited_frames'] == 1
+    assert stats['white']['unlimited_peak_ma'] == 1536 * 61
+    assert stats['white']['peak_ma'] <= 10000
+    limiter.close()
+
+
+def main():
+    """Run the power limiter tests."""
+    test_estimate()
+    test_bright_frames_are_limited()
+    test_scene_stats()
+    print("Power limiter keeps frames in budget!")
+
+
+if __name__ == "__main__":
+    main()
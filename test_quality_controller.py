@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for adaptive quality
+Feeds render times to the quality controller and checks that it drops the
+level on overruns, raises it when frames are light, and doesn't flip back
+to a level that just overran
+"""
+
+import numpy as np
+import config
+from gravity_bend_animation import GravityBendAnimation
+from quality_controller import MAX_LEVEL, QualityController
+
+
+def feed(quality, render_seconds, frames):
+    """Record frames that each took render_seconds to render."""
+    for _ in range(frames):
+        quality._record(render_seconds, quality.period)
+
+
+def test_overruns_lower_quality():
+    """Steady overruns step the level down, and the lowest level lowers the frame rate."""
+    quality = QualityController('test', fps=20)
+    assert quality.level == MAX_LEVEL and quality.particles(12) == 12 and quality.effects
+    feed(quality, 0.08, config.QUALITY_SETTLE_FRAMES)
+    assert quality.level == MAX_LEVEL - 1
+    assert quality.particles(12) < 12 and not quality.effects and quality.resolution_step == 1
+    feed(quality, 0.08, 5 * config.QUALITY_SETTLE_FRAMES)
+    assert quality.level == 0 and quality.resolution_step == 2
+    assert quality.period == 1.0 / (20 * config.QUALITY_LOW_FPS_SCALE)
+    # 80 ms frames fit the lower frame rate
+    assert quality.overrun_rate < 0.1 and quality.overruns == 3 * config.QUALITY_SETTLE_FRAMES
+
+
+def test_light_frames_raise_quality():
+    """Once frames are light again, quality climbs back, but not straight into a level that overran."""
+    quality = QualityController('test', fps=20)
+    feed(quality, 0.08, config.QUALITY_SETTLE_FRAMES)
+    assert quality.level == MAX_LEVEL - 1
+    feed(quality, 0.01, 3 * config.QUALITY_SETTLE_FRAMES)
+    assert quality.level == MAX_LEVEL - 1  # Level 3 overran moments ago
+    quality.failed_at[MAX_LEVEL] -= config.QUALITY_RETRY_SECONDS
+    feed(quality, 0.01, 3 * config.QUALITY_SETTLE_FRAMES)
+    assert quality.level == MAX_LEVEL
+
+
+def test_fixed_quality():
+    """With adaptation off the level never changes."""
+    quality = QualityController('test', fps=20)
+    quality.adaptive = False
+    feed(quality, 1.0, 5 * config.QUALITY_SETTLE_FRAMES)
+    assert quality.level == MAX_LEVEL and quality.overrun_rate > 0.9
+
+
+def test_gravity_bend_levels():
+    """gravity_bend renders at every level; lower levels drop the warp and draw the glow in 2x2 blocks."""
+    animation = GravityBendAnimation()
+    try:
+        frames = {}
+        for level in range(MAX_LEVEL + 1):
+            animation.quality.level = level
+            frames[level] = [animation.create_gravity_frame(t * 0.1) for t in range(0, 200, 10)]
+        # The golden frames only cover full quality (the virtual clock never overruns)
+        assert any(not np.array_equal(a, b) for a, b in zip(frames[MAX_LEVEL], frames[MAX_LEVEL - 1]))
+        # At level 1 the source glow is drawn in 2x2 blocks
+        animation.quality.level = 1
+        glow = np.zeros_like(frames[1][0])
+        animation._draw_gravity_source(glow, config.TOTAL_WIDTH // 2, config.TOTAL_HEIGHT // 2, 0)
+        assert glow.any() and np.array_equal(glow, glow[::2, ::2].repeat(2, axis=0).repeat(2, axis=1))
+    finally:
+        animation.led.cleanup()
+
+
+def main():
+    """Run the adaptive quality tests."""
+    test_overruns_lower_quality()
+    test_light_frames_raise_quality()
+    test_fixed_quality()
+    test_gravity_bend_levels()
+    print("Quality adapts to render times!")
+
+
+if __name__ == "__main__":
+    main()
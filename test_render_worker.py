@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for the render worker
+Runs a target in the worker process and checks that its print() output
+goes through the logging queue like the main process's, and that the
+controllers it builds start in the main process's orientation - no
+hardware needed
+"""
+
+import re
+import subprocess
+import sys
+
+MARKER = 'render worker print check'
+
+RUN_WORKER = f"""
+from led_controller_exact import LEDControllerExact
+from render_worker import AnimationTarget, RenderWorker
+led = LEDControllerExact(backend='mock')
+led.set_orientation('mirror_x')
+worker = RenderWorker(led.led.output)
+worker.run(AnimationTarget('test_render_worker', 'PrintingAnimation', 'run'))
+worker.stop()
+led.cleanup()
+"""
+
+
+class PrintingAnimation:
+    """Target that only prints (runs inside the worker)."""
+
+    def run(self):
+        print(MARKER)
+        from led_controller_exact import LEDControllerExact
+        led = LEDControllerExact()
+        print(f"orientation {led.led.orientation}")
+        led.cleanup()
+
+
+def test_worker_prints_are_logged():
+    """A print() in the worker comes out as a formatted log record, not a raw stdout write."""
+    result = subprocess.run([sys.executable, '-c', RUN_WORKER], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert re.search(rf"^\d\d:\d\d:\d\d INFO print: {MARKER}$", result.stdout, re.M), result.stdout
+
+
+def test_worker_uses_runtime_orientation():
+    """Controllers built in the worker start in the orientation set in the main process."""
+    result = subprocess.run([sys.executable, '-c', RUN_WORKER], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert 'INFO print: orientation mirror_x' in result.stdout, result.stdout
+
+
+def main():
+    """Run the render worker test."""
+    test_worker_prints_are_logged()
+    test_worker_uses_runtime_orientation()
+    print("Render worker logs through the queue and follows the orientation!")
+
+
+if __name__ == "__main__":
+    main()
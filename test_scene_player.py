@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for declarative scenes
+Compiles every scene in scenes/, checks validation errors, and checks that
+baking static layers gives the same frames as drawing every layer in order,
+and checks that scene animations resolve their audio cue
+"""
+
+import numpy as np
+from scene_player import ScenePlan, list_scenes, load_scene, target_scene
+
+
+SCENE = {
+    'name': 'test',
+    'duration': 4,
+    'fade_out': 1,
+    'layers': [
+        {'type': 'fill', 'color': [10, 20, 30]},
+        {'type': 'sprite', 'pixels': ['.#.', '###', '.#.'], 'color': [255, 255, 255],
+         'anchor': 'center', 'path': [[0, 0, 10], [4, 31, 10]], 'easing': 'ease_in_out', 'clip': [0, 0, 32, 44]},
+        {'type': 'disc', 'center': [16, 10], 'radius': 4, 'color': [255, 200, 50], 'falloff': 0.3},
+        {'type': 'fill', 'color': [34, 139, 34], 'rect': [0, 44, 32, 4]},
+        {'type': 'emitter', 'origin': [16, 40], 'spread': [4, 0], 'rate': 30, 'lifetime': 1,
+         'velocity': [0, -10], 'jitter': [3, 2], 'gravity': [0, 5], 'color': [100, 150, 255]},
+    ],
+}
+
+
+def test_scenes_compile():
+    """Every scene file validates and renders across its whole length."""
+    names = list_scenes()
+    assert names
+    for name in names:
+        plan = load_scene(name)
+        for t in np.linspace(0, plan.total_duration, 10, endpoint=False):
+            assert plan.render(t).shape == (plan.height, plan.width, 3)
+
+
+def test_baked_layers_match_layer_order():
+    """Only layers nothing moving can cover are baked, so frames equal drawing each layer in turn."""
+    plan = ScenePlan(SCENE)
+    # The ground is baked; the disc, which the sprite passes behind, is drawn per frame
+    assert len(plan.steps) == 3
+    layers = [plan._compile_layer(layer) for layer in SCENE['layers']]
+    for t in (0.0, 0.7, 1.93, 2.5, 3.99, 4.5):
+        expected = np.zeros((plan.height, plan.width, 3), dtype=np.uint8)
+        for layer in layers:
+            layer.draw(expected, t)
+        expected = (expected * plan.brightness(t)).astype(np.uint8)
+        assert (plan.render(t) == expected).all(), t
+    assert plan.render(4.999).max() <= 1
+
+
+def test_invalid_scenes_are_rejected():
+    """Mistakes are reported with the scene, layer and key."""
+    bad_layers = [
+        ({'type': 'fill', 'color': [0, 0, 300]}, "'color' values must be 0-255"),
+        ({'type': 'sprite', 'sprite': 'unicorn', 'position': [0, 0]}, "unknown sprite 'unicorn'"),
+        ({'type': 'sprite', 'pixels': ['#'], 'color': [1, 2, 3], 'path': [[1, 0, 0], [0, 1, 1]]},
+         "times must increase"),
+        ({'type': 'sprite', 'pixels': ['#'], 'color': [1, 2, 3], 'position': [0, 0], 'easing': 'bounce'},
+         "unknown easing 'bounce'"),
+        ({'type': 'laser'}, "unknown layer type"),
+    ]
+    for layer, message in bad_layers:
+        try:
+            ScenePlan({'name': 'bad', 'duration': 1, 'layers': [layer]})
+        except ValueError as e:
+            assert "scene 'bad' layer 0" in str(e) and message in str(e), str(e)
+        else:
+            raise AssertionError(f"accepted {layer}")
+
+
+def test_scene_classes_carry_audio():
+    """Scene animation classes resolve to their scene, whose file names the audio cue."""
+    assert target_scene('truck_animation', 'TruckAnimation') == 'truck'
+    assert load_scene('truck').audio == 'truck'
+    assert target_scene('horse_static_animation_bitmap', 'HorseStaticAnimationBitmap') == 'horse'
+    assert load_scene('horse').audio == 'horse'
+    # Hand-written animations keep their audio key in main.py
+    assert target_scene('cow_animation', 'CowAnimation') is None
+
+
+def main():
+    """Run the scene tests."""
+    test_scenes_compile()
+    test_baked_layers_match_layer_order()
+    test_invalid_scenes_are_rejected()
+    test_scene_classes_carry_audio()
+    print("Scenes compile and render correctly!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test script for the sprite asset bundle
+Builds a bundle into a temporary file and checks that the mapped frames
+match the decoded sources - no hardware needed
+"""
+
+import os
+import tempfile
+import sprite_assets
+from sprite_assets import SPRITE_SOURCES, SpriteBundle, build_bundle, decode_source
+
+
+def test_bundle_matches_sources():
+    """Every bundled stack equals its decoded source, and palettes rebuild the RGB frames."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sprites.bundle')
+        build_bundle(out_path=path)
+        bundle = SpriteBundle(path)
+        assert bundle.names() == sorted(SPRITE_SOURCES)
+
+        for name, (source, options) in SPRITE_SOURCES.items():
+            asset = bundle.get(name)
+            expected, _ = decode_source(sprite_assets._project_path(source), **options)
+            assert (asset.frames == expected).all(), name
+            assert not asset.frames.flags.writeable, name
+            assert not asset.is_stale(), name
+            if asset.palette is not None:
+                assert (asset.palette[asset.indices] == asset.frames).all(), name
+
+
+def main():
+    """Run the sprite bundle test."""
+    test_bundle_matches_sources()
+    print("Sprite bundle matches its sources!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for telemetry
+Feeds frame times to the telemetry and checks that render time is measured
+from the frame's start mark, that the sleep between frames doesn't count as
+an overrun, and that marks survive the render worker's shared buffer
+"""
+
+from telemetry import Telemetry, frame_started, take_frame_mark
+from render_worker import SharedFrameBuffer
+
+
+def counter(metrics, name, scene):
+    return metrics.counters.get((name, (('scene', scene),)), 0)
+
+
+def histogram(metrics, name, scene):
+    return metrics.histograms.get((name, (('scene', scene),)))
+
+
+def test_marked_frames():
+    """Render time runs from frame_started() to show(); only frames over their period overrun."""
+    metrics = Telemetry()
+    metrics.set_scene('marked', target_fps=20)
+    now = 100.0
+    for render in (0.01, 0.01, 0.08, 0.01):
+        frame_started(now, 0.05)
+        show_start = now + render
+        metrics.frame_shown(show_start, show_start + 0.005, *take_frame_mark(show_start))
+        now = show_start + 0.005 + 0.05  # The animation sleeps a whole period after show()
+    render = histogram(metrics, 'led_render_seconds', 'marked')
+    assert render.count == 4 and abs(render.sum - 0.11) < 1e-9
+    assert counter(metrics, 'led_frame_overruns_total', 'marked') == 1
+    assert metrics.gauges[('led_target_fps', (('scene', 'marked'),))] == 20
+    assert take_frame_mark(now) == (None, None)
+
+
+def test_unmarked_frames():
+    """Without marks, a frame only overruns when it arrives well behind the scene's usual interval."""
+    metrics = Telemetry()
+    metrics.set_scene('unmarked')
+    now = 100.0
+    for interval in [0.06] * 20 + [0.2] + [0.06] * 5:
+        now += interval
+        metrics.frame_shown(now - 0.005, now)
+    assert histogram(metrics, 'led_render_seconds', 'unmarked') is None
+    assert histogram(metrics, 'led_frame_interval_seconds', 'unmarked').count == 25
+    assert counter(metrics, 'led_frame_overruns_total', 'unmarked') == 1
+    assert '/? fps' in metrics.summary_line()
+
+
+def test_marks_cross_the_shared_buffer():
+    """The worker stores each frame's mark with it, for the main process to read back."""
+    buffer = SharedFrameBuffer(led_count=4)
+    try:
+        assert buffer.frame_mark(1) == (None, None)
+        buffer.set_frame_mark(1, 0.012, 0.05)
+        buffer.set_frame_mark(2, None, None)
+        render_seconds, period = buffer.frame_mark(1)
+        assert abs(render_seconds - 0.012) < 1e-9 and abs(period - 0.05) < 1e-9
+        assert buffer.frame_mark(2) == (None, None)
+    finally:
+        buffer.close()
+
+
+def main():
+    """Run the telemetry tests."""
+    test_marked_frames()
+    test_unmarked_frames()
+    test_marks_cross_the_shared_buffer()
+    print("Telemetry measures render time and overruns correctly!")
+
+
+if __name__ == "__main__":
+    main()
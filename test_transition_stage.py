@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the transition stage
+Checks that held frames drop writes, that every style starts at the old
+frame and ends at the new one, and that the board lands on the incoming frame
+"""
+
+import time
+import numpy as np
+import config
+from output_backends import OutputBackend
+from transition_stage import STYLES, TransitionStage
+
+
+class ListBackend(OutputBackend):
+    """Keeps every frame written to it."""
+
+    def __init__(self):
+        super().__init__(config.TOTAL_LEDS, config.TOTAL_WIDTH, config.TOTAL_HEIGHT)
+        self.frames = []
+
+    def write(self, pixels):
+        self.frames.append(np.array(pixels, dtype=np.uint8))
+
+
+def _frame(value):
+    return np.full((config.TOTAL_LEDS, 3), value, dtype=np.uint8)
+
+
+def test_hold_drops_frames():
+    """While holding, written frames never reach the backend."""
+    backend = ListBackend()
+    stage = TransitionStage(backend, duration=0.2)
+    stage.acquire()
+    stage.write(_frame(200))
+    stage.hold()
+    stage.write(_frame(0))
+    stage.write(_frame(0))
+    assert len(backend.frames) == 1
+    stage.close()
+
+
+def test_styles_start_and_end_on_frames():
+    """Every style shows all of the old frame at progress 0 and all of the new one at 1."""
+    stage = TransitionStage(ListBackend())
+    for style in STYLES:
+        stage.active_style = style
+        assert np.all(np.asarray(stage._weights(0.0)) == 0.0), style
+        assert np.all(np.asarray(stage._weights(1.0)) == 1.0), style
+    stage.active_style = 'crossfade'
+    assert stage._weights(0.5) == 0.5
+    stage.active_style = 'wipe'
+    halfway = stage._weights(0.5)[:, 0]
+    # The left edge is already switched over, the right edge not yet
+    assert halfway[stage.columns == 0].min() == 1.0
+    assert halfway[stage.columns == stage.width - 1].max() == 0.0
+
+
+def test_transition_lands_on_incoming():
+    """A transition blends between the frames and ends on the last incoming one, even with no new writes."""
+    backend = ListBackend()
+    stage = TransitionStage(backend, style='crossfade', duration=0.2, fps=100)
+    stage.acquire()
+    stage.write(_frame(200))
+    stage.hold()
+    stage.transition()
+    stage.write(_frame(0))
+    time.sleep(0.4)
+    try:
+        assert not stage.transitioning
+        values = [int(frame[0, 0]) for frame in backend.frames]
+        assert values[0] == 200 and values[-1] == 0
+        assert any(0 < value < 200 for value in values), values
+        assert values == sorted(values, reverse=True), values
+    finally:
+        stage.close()
+
+
+def test_ticker_leaves_fast_scenes_alone():
+    """A scene writing faster than the ticker rate gets the strip to itself during the blend."""
+    backend = ListBackend()
+    stage = TransitionStage(backend, duration=0.3, fps=20)
+    stage.acquire()
+    stage.write(_frame(200))
+    stage.transition()
+    writes = 0
+    try:
+        while writes == 0 or stage.transitioning:
+            stage.write(_frame(0))
+            writes += 1
+            time.sleep(0.01)
+        # The first frame plus one blend per scene write, at most one tick racing the first write
+        assert len(backend.frames) <= 1 + writes + 1, (len(backend.frames), writes)
+    finally:
+        stage.close()
+
+
+def test_unknown_style_rejected():
+    """A misspelled style is an error, not a silent cut."""
+    stage = TransitionStage(ListBackend())
+    try:
+        stage.transition(style='spin')
+    except ValueError as e:
+        assert "spin" in str(e)
+    else:
+        raise AssertionError("accepted style 'spin'")
+
+
+def main():
+    """Run the transition stage tests."""
+    test_hold_drops_frames()
+    test_styles_start_and_end_on_frames()
+    test_transition_lands_on_incoming()
+    test_ticker_leaves_fast_scenes_alone()
+    test_unknown_style_rejected()
+    print("Transitions blend correctly!")
+
+
+if __name__ == "__main__":
+    main()
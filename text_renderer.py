@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Glyph Atlas Text Renderer
+Fonts are compiled once into NumPy bitmaps, and each message is rasterized
+once into a cached text strip. Drawing or scrolling text is then a slice
+of that strip and one masked assignment into the frame.
+"""
+
+from collections import OrderedDict
+import numpy as np
+import config
+
+# Glyphs are rows of '#' (lit) and '.' (off). Glyph widths vary, which gives
+# proportional spacing. Lowercase letters are drawn with the uppercase glyphs.
+FONT_5X7 = {
+    'A': ['.###.', '#...#', '#...#', '#####', '#...#', '#...#', '#...#'],
+    'B': ['####.', '#...#', '#...#', '####.', '#...#', '#...#', '####.'],
+    'C': ['.###.', '#...#', '#....', '#....', '#....', '#...#', '.###.'],
+    'D': ['####.', '#...#', '#...#', '#...#', '#...#', '#...#', '####.'],
+    'E': ['#####', '#....', '#....', '####.', '#....', '#....', '#####'],
+    'F': ['#####', '#....', '#....', '####.', '#....', '#....', '#....'],
+    'G': ['.###.', '#...#', '#....', '#.###', '#...#', '#...#', '.####'],
+    'H': ['#...#', '#...#', '#...#', '#####', '#...#', '#...#', '#...#'],
+    'I': ['###', '.#.', '.#.', '.#.', '.#.', '.#.', '###'],
+    'J': ['..###', '...#.', '...#.', '...#.', '...#.', '#..#.', '.##..'],
+    'K': ['#...#', '#..#.', '#.#..', '##...', '#.#..', '#..#.', '#...#'],
+    'L': ['#....', '#....', '#....', '#....', '#....', '#....', '#####'],
+    'M': ['#...#', '##.##', '#.#.#', '#.#.#', '#...#', '#...#', '#...#'],
+    'N': ['#...#', '#...#', '##..#', '#.#.#', '#..##', '#...#', '#...#'],
+    'O': ['.###.', '#...#', '#...#', '#...#', '#...#', '#...#', '.###.'],
+    'P': ['####.', '#...#', '#...#', '####.', '#....', '#....', '#....'],
+    'Q': ['.###.', '#...#', '#...#', '#...#', '#.#.#', '#..#.', '.##.#'],
+    'R': ['####.', '#...#', '#...#', '####.', '#.#..', '#..#.', '#...#'],
+    'S': ['.####', '#....', '#....', '.###.', '....#', '....#', '####.'],
+    'T': ['#####', '..#..', '..#..', '..#..', '..#..', '..#..', '..#..'],
+    'U': ['#...#', '#...#', '#...#', '#...#', '#...#', '#...#', '.###.'],
+    'V': ['#...#', '#...#', '#...#', '#...#', '#...#', '.#.#.', '..#..'],
+    'W': ['#...#', '#...#', '#...#', '#.#.#', '#.#.#', '#.#.#', '.#.#.'],
+    'X': ['#...#', '#...#', '.#.#.', '..#..', '.#.#.', '#...#', '#...#'],
+    'Y': ['#...#', '#...#', '.#.#.', '..#..', '..#..', '..#..', '..#..'],
+    'Z': ['#####', '....#', '...#.', '..#..', '.#...', '#....', '#####'],
+    '0': ['.###.', '#...#', '#..##', '#.#.#', '##..#', '#...#', '.###.'],
+    '1': ['.#.', '##.', '.#.', '.#.', '.#.', '.#.', '###'],
+    '2': ['.###.', '#...#', '....#', '...#.', '..#..', '.#...', '#####'],
+    '3': ['#####', '...#.', '..#..', '...#.', '....#', '#...#', '.###.'],
+    '4': ['...#.', '..##.', '.#.#.', '#..#.', '#####', '...#.', '...#.'],
+    '5': ['#####', '#....', '####.', '....#', '....#', '#...#', '.###.'],
+    '6': ['..##.', '.#...', '#....', '####.', '#...#', '#...#', '.###.'],
+    '7': ['#####', '....#', '...#.', '..#..', '.#...', '.#...', '.#...'],
+    '8': ['.###.', '#...#', '#...#', '.###.', '#...#', '#...#', '.###.'],
+    '9': ['.###.', '#...#', '#...#', '.####', '....#', '...#.', '.##..'],
+    ' ': ['...', '...', '...', '...', '...', '...', '...'],
+    '!': ['#', '#', '#', '#', '#', '.', '#'],
+    '?': ['.###.', '#...#', '....#', '...#.', '..#..', '.....', '..#..'],
+    '.': ['.', '.', '.', '.', '.', '.', '#'],
+    ',': ['..', '..', '..', '..', '..', '.#', '#.'],
+    ':': ['.', '.', '#', '.', '.', '#', '.'],
+    '-': ['...', '...', '...', '###', '...', '...', '...'],
+    '+': ['...', '...', '.#.', '###', '.#.', '...', '...'],
+    "'": ['#', '#', '.', '.', '.', '.', '.'],
+    '/': ['....#', '...#.', '...#.', '..#..', '.#...', '.#...', '#....'],
+}
+
+FONT_3X5 = {
+    'A': ['.#.', '#.#', '###', '#.#', '#.#'],
+    'B': ['##.', '#.#', '##.', '#.#', '##.'],
+    'C': ['.##', '#..', '#..', '#..', '.##'],
+    'D': ['##.', '#.#', '#.#', '#.#', '##.'],
+    'E': ['###', '#..', '##.', '#..', '###'],
+    'F': ['###', '#..', '##.', '#..', '#..'],
+    'G': ['.##', '#..', '#.#', '#.#', '.##'],
+    'H': ['#.#', '#.#', '###', '#.#', '#.#'],
+    'I': ['###', '.#.', '.#.', '.#.', '###'],
+    'J': ['..#', '..#', '..#', '#.#', '.#.'],
+    'K': ['#.#', '#.#', '##.', '#.#', '#.#'],
+    'L': ['#..', '#..', '#..', '#..', '###'],
+    'M': ['#...#', '##.##', '#.#.#', '#...#', '#...#'],
+    'N': ['#..#', '##.#', '#.##', '#..#', '#..#'],
+    'O': ['.#.', '#.#', '#.#', '#.#', '.#.'],
+    'P': ['##.', '#.#', '##.', '#..', '#..'],
+    'Q': ['.#.', '#.#', '#.#', '##.', '.##'],
+    'R': ['##.', '#.#', '##.', '#.#', '#.#'],
+    'S': ['.##', '#..', '.#.', '..#', '##.'],
+    'T': ['###', '.#.', '.#.', '.#.', '.#.'],
+    'U': ['#.#', '#.#', '#.#', '#.#', '###'],
+    'V': ['#.#', '#.#', '#.#', '#.#', '.#.'],
+    'W': ['#...#', '#...#', '#.#.#', '##.##', '#...#'],
+    'X': ['#.#', '#.#', '.#.', '#.#', '#.#'],
+    'Y': ['#.#', '#.#', '.#.', '.#.', '.#.'],
+    'Z': ['###', '..#', '.#.', '#..', '###'],
+    '0': ['###', '#.#', '#.#', '#.#', '###'],
+    '1': ['.#.', '##.', '.#.', '.#.', '###'],
+    '2': ['###', '..#', '###', '#..', '###'],
+    '3': ['###', '..#', '###', '..#', '###'],
+    '4': ['#.#', '#.#', '###', '..#', '..#'],
+    '5': ['###', '#..', '###', '..#', '###'],
+    '6': ['###', '#..', '###', '#.#', '###'],
+    '7': ['###', '..#', '..#', '..#', '..#'],
+    '8': ['###', '#.#', '###', '#.#', '###'],
+    '9': ['###', '#.#', '###', '..#', '###'],
+    ' ': ['..', '..', '..', '..', '..'],
+    '!': ['#', '#', '#', '.', '#'],
+    '?': ['###', '..#', '.##', '...', '.#.'],
+    '.': ['.', '.', '.', '.', '#'],
+    ',': ['.', '.', '.', '#', '#'],
+    ':': ['.', '#', '.', '#', '.'],
+    '-': ['...', '...', '###', '...', '...'],
+    '+': ['...', '.#.', '###', '.#.', '...'],
+    "'": ['#', '#', '.', '.', '.'],
+    '/': ['..#', '..#', '.#.', '#..', '#..'],
+}
+
+
+class GlyphAtlas:
+    """A font compiled into boolean NumPy glyph bitmaps."""
+
+    def __init__(self, font, scale=1):
+        """Compile a glyph table ({char: [row strings]}) at an integer scale."""
+        self.glyphs = {}
+        for char, rows in font.items():
+            bitmap = np.array([[c == '#' for c in row] for row in rows], dtype=bool)
+            if scale > 1:
+                bitmap = bitmap.repeat(scale, axis=0).repeat(scale, axis=1)
+            self.glyphs[char] = bitmap
+        self.height = self.glyphs[' '].shape[0]
+        self.scale = scale
+        self.fallback = self.glyphs['?']
+
+    def glyph(self, char):
+        """Return the bitmap for a character (uppercase glyph, '?' if unknown)."""
+        return self.glyphs.get(char, self.glyphs.get(char.upper(), self.fallback))
+
+    def text_width(self, text, spacing=1):
+        """Return the width in pixels of text rendered with this atlas."""
+        if not text:
+            return 0
+        gap = spacing * self.scale
+        return sum(self.glyph(c).shape[1] for c in text) + gap * (len(text) - 1)
+
+    def render(self, text, spacing=1):
+        """Rasterize text into a (height, width) boolean strip."""
+        strip = np.zeros((self.height, self.text_width(text, spacing)), dtype=bool)
+        gap = spacing * self.scale
+        x = 0
+        for char in text:
+            bitmap = self.glyph(char)
+            strip[:, x:x + bitmap.shape[1]] = bitmap
+            x += bitmap.shape[1] + gap
+        return strip
+
+
+ATLASES = {
+    'small': GlyphAtlas(FONT_3X5),
+    'normal': GlyphAtlas(FONT_5X7),
+    'large': GlyphAtlas(FONT_5X7, scale=2),
+}
+
+_strip_cache = OrderedDict()
+STRIP_CACHE_SIZE = 32
+
+
+def get_atlas(size='normal'):
+    """Return the glyph atlas for a font size ('small', 'normal' or 'large')."""
+    return ATLASES[size]
+
+
+def render_text_strip(text, size='normal', spacing=1):
+    """Return the cached (read-only) boolean strip for a message."""
+    key = (text, size, spacing)
+    strip = _strip_cache.get(key)
+    if strip is not None:
+        _strip_cache.move_to_end(key)
+        return strip
+
+    strip = ATLASES[size].render(text, spacing)
+    strip.flags.writeable = False
+    _strip_cache[key] = strip
+    if len(_strip_cache) > STRIP_CACHE_SIZE:
+        _strip_cache.popitem(last=False)
+    return strip
+
+
+def blit_mask(frame, mask, x, y, color):
+    """Paint color into frame wherever mask is set, with (x, y) the mask's top-left corner."""
+    frame_h, frame_w = frame.shape[:2]
+    mask_h, mask_w = mask.shape
+
+    # Clip the mask rectangle to the frame
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + mask_w, frame_w), min(y + mask_h, frame_h)
+    if x0 >= x1 or y0 >= y1:
+        return
+    window = mask[y0 - y:y1 - y, x0 - x:x1 - x]
+    frame[y0:y1, x0:x1][window] = color
+
+
+def draw_text(frame, text, x, y, color, size='normal', spacing=1):
+    """Draw text into a (height, width, 3) frame at (x, y)."""
+    blit_mask(frame, render_text_strip(text, size, spacing), x, y, color)
+
+
+class TextScroller:
+    """Scrolls one message across the display by slicing a window out of its strip."""
+
+    def __init__(self, text, color, y=None, size='normal', spacing=1, width=None):
+        """Pre-rasterize the message with a display-width blank lead-in and lead-out."""
+        self.width = width or config.TOTAL_WIDTH
+        self.color = color
+        text_strip = render_text_strip(text, size, spacing)
+        self.height = text_strip.shape[0]
+        self.y = (config.TOTAL_HEIGHT - self.height) // 2 if y is None else y
+
+        self.strip = np.zeros((self.height, text_strip.shape[1] + 2 * self.width), dtype=bool)
+        self.strip[:, self.width:self.width + text_strip.shape[1]] = text_strip
+        # Offsets 0..period-1 scroll the text fully in from the right and out to the left
+        self.period = self.width + text_strip.shape[1]
+
+    def window(self, offset):
+        """Return the visible (height, width) mask for a scroll offset."""
+        offset = int(offset) % self.period
+        return self.strip[:, offset:offset + self.width]
+
+    def blit(self, frame, offset):
+        """Paint the visible part of the message into frame."""
+        blit_mask(frame, self.window(offset), 0, self.y, self.color)
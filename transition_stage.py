@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Transition Stage
+The last stage of the output pipeline: blends from the frame on the board
+into the next scene's frames, so switching animations never goes dark
+
+    led.hold_frame()     keep showing the current frame; frames written
+                         after this (the old scene's last frames, clears)
+                         are dropped
+    led.transition()     the next frames written blend in from the held
+                         frame over config.TRANSITION_DURATION seconds
+
+transition() on its own holds whatever is on the board at that moment, so
+`led.transition(); led.clear(); led.show()` fades a finished scene to black.
+
+Styles (config.TRANSITION_STYLE):
+    crossfade   the whole board blends at once
+    wipe        the new scene sweeps in from the left with a soft edge
+    dissolve    LEDs switch over in random order
+
+The blend starts with the first incoming frame and every incoming frame
+is blended as it is written. In between, a small ticker thread re-blends
+the newest one at config.TRANSITION_FPS, so scenes that draw rarely (or
+only once) still get a smooth transition; it skips its tick when the
+scene wrote within the last 1/TRANSITION_FPS seconds, so a scene drawing
+fast enough on its own doesn't share the strip's wire time with it.
+
+Module animations create their own LED controller, so every controller on
+the default backend shares one stage per process (shared_stage()): the
+app's hold_frame() holds what any of them shows.
+"""
+
+import time
+import threading
+import numpy as np
+import config
+from output_backends import OutputBackend
+from power_limiter import create_limited_backend
+
+STYLES = ('crossfade', 'wipe', 'dissolve')
+WIPE_EDGE = 6.0  # Width of the wipe's soft edge, in pixels
+DISSOLVE_EDGE = 0.15  # Fraction of the transition each LED takes to switch over
+
+
+class TransitionStage(OutputBackend):
+    """Wraps an output backend and blends held frames into incoming ones."""
+
+    def __init__(self, backend, style=None, duration=None, fps=None):
+        """Wrap backend; style, duration and fps default to the config.TRANSITION_* settings."""
+        super().__init__(backend.led_count, backend.width, backend.height)
+        self.backend = backend
+        self.name = backend.name
+        self.style = style
+        self.duration = duration
+        self.fps = fps or config.TRANSITION_FPS
+        self.users = 0  # Controllers sharing this stage; the backend closes with the last one
+        self.begun = False
+
+        self.lock = threading.RLock()
+        self.shown = np.zeros((self.led_count, 3), dtype=np.uint8)  # Last frame sent to the backend
+        self.outgoing = np.zeros((self.led_count, 3), dtype=np.float32)
+        self.incoming = np.zeros((self.led_count, 3), dtype=np.uint8)
+        self.blended = np.zeros((self.led_count, 3), dtype=np.float32)
+        self.state = 'idle'  # idle, holding, waiting (for the first incoming frame) or blending
+        self.active_style = 'crossfade'
+        self.active_duration = 0.0
+        self.started_at = None
+        self.last_write = 0.0  # When the incoming scene last wrote a frame
+        self.ticker = None
+        self.ticking = False
+        self.closed = threading.Event()
+        # Per-LED switch-over thresholds for dissolve (fixed so every dissolve looks the same)
+        self.dissolve_order = np.random.default_rng(7).random(self.led_count).astype(np.float32)
+        self._update_columns()
+
+    def _update_columns(self):
+        # Board column of every LED, for wipes
+        self.columns = (self.frame_order % self.width).astype(np.float32)
+
+    def set_layout(self, frame_order):
+        super().set_layout(frame_order)
+        self.backend.set_layout(frame_order)
+        self._update_columns()
+
+    def acquire(self):
+        """Register one more controller; returns True for the first one."""
+        self.users += 1
+        return self.users == 1
+
+    def begin(self):
+        if not self.begun:
+            self.begun = True
+            self.backend.begin()
+
+    def set_brightness(self, brightness):
+        self.backend.set_brightness(brightness)
+
+    def close(self):
+        """Release one controller's use; the last one lets a running blend finish and closes the backend."""
+        self.users -= 1
+        if self.users > 0:
+            return
+        with _shared_lock:
+            for key, stage in list(_shared.items()):
+                if stage is self:
+                    del _shared[key]
+        if self.ticker and self.ticker.is_alive():
+            self.ticker.join(timeout=self.active_duration)
+        self.closed.set()
+        with self.lock:
+            if self.state == 'blending':
+                self._send(self.incoming)
+            self.state = 'idle'
+        self.backend.close()
+
+    @property
+    def transitioning(self):
+        """True while a frame is held or a blend is running."""
+        return self.state != 'idle'
+
+    def hold(self):
+        """Keep the current frame on the board and drop written frames until transition()."""
+        with self.lock:
+            self.outgoing[:] = self.shown
+            self.state = 'holding'
+
+    def transition(self, style=None, duration=None):
+        """Blend the held frame (or the current one) into the frames written next."""
+        with self.lock:
+            if self.state in ('idle', 'blending'):
+                self.outgoing[:] = self.shown
+            self.active_style = style or self.style or config.TRANSITION_STYLE
+            for value in (duration, self.duration, config.TRANSITION_DURATION):
+                if value is not None:
+                    self.active_duration = value
+                    break
+            if self.active_style not in STYLES:
+                raise ValueError(f"Unknown transition style '{self.active_style}' (choose from {', '.join(STYLES)})")
+            # A zero-length transition just lets the next frame through
+            self.state = 'waiting' if self.active_duration > 0 else 'idle'
+
+    def write(self, pixels):
+        with self.lock:
+            self.frames_written += 1
+            if self.state == 'idle':
+                self._send(pixels)
+            elif self.state == 'holding':
+                return
+            else:
+                self.incoming[:] = pixels
+                self.last_write = time.monotonic()
+                if self.state == 'waiting':
+                    self.state = 'blending'
+                    self.started_at = time.monotonic()
+                    self._start_ticker()
+                self._blend_step()
+
+    def _send(self, pixels):
+        self.backend.write(pixels)
+        self.shown[:] = pixels
+
+    def _weights(self, progress):
+        """Return how much of the incoming frame each LED shows (scalar or per-LED column)."""
+        if self.active_style == 'wipe':
+            front = progress * (self.width + WIPE_EDGE)
+            return np.clip((front - self.columns) / WIPE_EDGE, 0.0, 1.0)[:, None]
+        if self.active_style == 'dissolve':
+            front = progress * (1.0 + DISSOLVE_EDGE)
+            return np.clip((front - self.dissolve_order) / DISSOLVE_EDGE, 0.0, 1.0)[:, None]
+        return progress * progress * (3.0 - 2.0 * progress)  # Smoothstep crossfade
+
+    def _blend_step(self):
+        """Show the blend for the current time; returns False once the transition is over."""
+        progress = (time.monotonic() - self.started_at) / self.active_duration
+        if progress >= 1.0:
+            self.state = 'idle'
+            self._send(self.incoming)
+            return False
+        # outgoing + (incoming - outgoing) * weight, in place
+        np.subtract(self.incoming, self.outgoing, out=self.blended)
+        np.multiply(self.blended, self._weights(progress), out=self.blended)
+        np.add(self.blended, self.outgoing, out=self.blended)
+        self._send(self.blended.astype(np.uint8))
+        return True
+
+    def _start_ticker(self):
+        # Called with the lock held; the ticker clears self.ticking under the lock when it stops
+        if self.ticking:
+            return
+        self.ticking = True
+        self.ticker = threading.Thread(target=self._tick, name='transition', daemon=True)
+        self.ticker.start()
+
+    def _tick(self):
+        # Keep blending while the incoming scene draws slowly or not at all
+        interval = 1.0 / self.fps
+        while not self.closed.wait(interval):
+            with self.lock:
+                if self.state == 'blending' and time.monotonic() - self.last_write < interval:
+                    continue  # The scene's own write just blended
+                if self.state == 'idle' or (self.state == 'blending' and not self._blend_step()):
+                    self.ticking = False
+                    return
+        self.ticking = False
+
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def shared_stage(spec=None):
+    """Return this process's stage for backend spec (default config.OUTPUT_BACKEND), creating it on first use."""
+    key = spec or config.OUTPUT_BACKEND
+    with _shared_lock:
+        stage = _shared.get(key)
+        if stage is None:
+            stage = _shared[key] = TransitionStage(create_limited_backend(spec))
+        return stage
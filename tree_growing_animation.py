@@ -117,7 +117,7 @@ class TreeGrowingAnimation:
                                 leaf_color = self.colors['leaves']
                             
                             # Blend with existing frame
-                            current = frame[y, x]
+                            current = frame[y, x].tolist()  # Python ints, so blending can't wrap around uint8
                             frame[y, x] = tuple(int(c + (l - c) * 0.8) for c, l in zip(current, leaf_color))
     
     def create_branches(self, frame, current_height):
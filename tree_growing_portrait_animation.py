@@ -15,7 +15,7 @@ import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from led_controller import LEDController
+from led_controller_exact import LEDControllerExact
 import config
 
 class TreeGrowingPortraitAnimation:
@@ -224,7 +224,7 @@ def main():
     """Test the tree growing animation."""
     try:
         # Initialize LED controller
-        led = LEDController()
+        led = LEDControllerExact()
         
         # Create and run the animation
         animation = TreeGrowingPortraitAnimation(led)
@@ -60,6 +60,16 @@ def git_pull():
         print(f"❌ Error during git update: {e}")
         return False
 
+def build_sprite_bundle():
+    """Rebuild the sprite bundle if it is missing or older than its sources."""
+    check = subprocess.run(['python', 'sprite_assets.py', 'check'], capture_output=True, text=True, cwd=os.getcwd())
+    if check.returncode == 0:
+        return
+    print("🎨 Building sprite bundle...")
+    result = subprocess.run(['python', 'sprite_assets.py', 'build'], capture_output=True, text=True, cwd=os.getcwd())
+    if result.returncode != 0:
+        print(f"⚠️ Sprite bundle build failed, animations will decode their sources: {result.stderr.strip()}")
+
 def run_main_app():
     """Run the main application."""
     try:
@@ -83,6 +93,9 @@ def main():
         print("\n🔄 Updates found! Restarting with new code...")
         time.sleep(2)
     
+    # Sprites are compiled on the device, not stored in git
+    build_sprite_bundle()
+    
     # Run the main application
     print("\n" + "=" * 50)
     exit_code = run_main_app()